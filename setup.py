@@ -39,6 +39,7 @@ tests_require = [
     'pyasn1',
     'pymongo',
     'python-memcached == 1.51',
+    'redis',
     'pytest',
     'mako',
     #'pytest-coverage',
@@ -18,7 +18,10 @@
 """
 
 
+import hashlib
 import logging
+import re
+import threading
 from saml2.validate import valid_instance
 
 try:
@@ -34,6 +37,11 @@ except ImportError:
     except ImportError:
         from elementtree import ElementTree
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
 root_logger = logging.getLogger(__name__)
 root_logger.level = logging.NOTSET
 
@@ -68,6 +76,141 @@ def class_name(instance):
     return "%s:%s" % (instance.c_namespace, instance.c_tag)
 
 
+# Parse with lxml if it is installed. The signature verifier of the xmlsec
+# library backend can then use the same tree.
+USE_LXML = lxml_etree is not None
+
+_parsers = threading.local()
+
+
+def _lxml_parser():
+    # lxml parsers should not be shared between threads
+    try:
+        return _parsers.lxml
+    except AttributeError:
+        # No DTDs are loaded, no entities expanded and nothing is fetched
+        # over the network. Comments and processing instructions are
+        # dropped as ElementTree does.
+        _parsers.lxml = lxml_etree.XMLParser(
+            resolve_entities=False, no_network=True, load_dtd=False,
+            remove_comments=True, remove_pis=True)
+        return _parsers.lxml
+
+
+def _forbid_dtd(*args):
+    raise XMLParseError("Document type declarations are not allowed")
+
+
+def parse_xml(xml_string, use_lxml=None):
+    """ Parses a XML document.
+
+    SAML messages and metadata have no use for document type declarations,
+    so documents with one are refused. That way no entities can be declared
+    and no expansion of them has to be guarded against.
+
+    :param xml_string: The XML document as a string
+    :param use_lxml: Whether to parse with lxml, by default USE_LXML
+    :return: The root element of the document. With lxml it is a lxml
+        element.
+    """
+    if use_lxml is None:
+        use_lxml = USE_LXML
+
+    if use_lxml:
+        if isinstance(xml_string, unicode):
+            xml_string = xml_string.encode("utf-8")
+        try:
+            root = lxml_etree.fromstring(xml_string, _lxml_parser())
+        except lxml_etree.XMLSyntaxError, exc:
+            raise XMLParseError("%s" % exc)
+        if root.getroottree().docinfo.doctype:
+            _forbid_dtd()
+        return root
+
+    parser = ElementTree.XMLParser()
+    try:
+        parser.parser.StartDoctypeDeclHandler = _forbid_dtd
+    except AttributeError:
+        # cElementTree doesn't give access to the expat parser
+        pass
+    try:
+        parser.feed(xml_string)
+        return parser.close()
+    except XMLParseError:
+        raise
+    except SyntaxError, exc:
+        raise XMLParseError("%s" % exc)
+
+
+class XMLDocument(object):
+    """
+    A received XML document that is parsed at most once. The text, the
+    parsed tree and an index of the elements by identifier are kept
+    together, so they can be handed from the mapping to instances on to the
+    verification of the signatures in the document.
+    """
+
+    def __init__(self, xml, tree=None):
+        """
+        :param xml: The document as a string
+        :param tree: The root element of the document, if it already has
+            been parsed by parse_xml
+        """
+        self.xml = xml
+        self._tree = tree
+        # id_attr -> {(tag, identifier): element}
+        self._ids = {}
+        self._digest = None
+        # Used by the xmlsec1 backend, the document written to a file
+        self.tmp_file = None
+
+    @property
+    def tree(self):
+        """ The root element of the document, parsed by parse_xml """
+        if self._tree is None:
+            self._tree = parse_xml(self.xml)
+        return self._tree
+
+    def element(self, tag, node_id, id_attr):
+        """ Find an element by its identifier.
+
+        :param tag: The name of the element in ElementTree notation
+        :param node_id: The identifier
+        :param id_attr: The name of the identifier attribute
+        :return: The first element in the document with that name and
+            identifier or None if there is none
+        """
+        try:
+            index = self._ids[id_attr]
+        except KeyError:
+            index = self._ids[id_attr] = {}
+            for elem in self.tree.iter():
+                value = elem.get(id_attr)
+                if value is not None:
+                    index.setdefault((elem.tag, value), elem)
+        return index.get((tag, node_id))
+
+    def digest(self):
+        """ The SHA-256 digest of the text as a hex string """
+        if self._digest is None:
+            xml = self.xml
+            if isinstance(xml, unicode):
+                xml = xml.encode("utf-8")
+            self._digest = hashlib.sha256(xml).hexdigest()
+        return self._digest
+
+
+def xml_document(xml):
+    """ The XMLDocument for a document
+
+    :param xml: The document as a string or an XMLDocument
+    :return: A XMLDocument instance
+    """
+    if isinstance(xml, XMLDocument):
+        return xml
+    return XMLDocument(xml)
+
+
 def create_class_from_xml_string(target_class, xml_string):
     """Creates an instance of the target class from a string.
 
@@ -76,13 +219,18 @@ def create_class_from_xml_string(target_class, xml_string):
         c_namespace class variable.
     :param xml_string: A string which contains valid XML. The root element
         of the XML string should match the tag and namespace of the desired
-        class.
+        class. Can also be the root element of a document parsed by
+        parse_xml, so the same document can be tried against several classes
+        without being parsed again.
 
     :return: An instance of the target class with members assigned according to
         the contents of the XML - or None if the root XML tag and namespace did
         not match those of the target class.
     """
-    tree = ElementTree.fromstring(xml_string)
+    if isinstance(xml_string, basestring):
+        tree = parse_xml(xml_string)
+    else:
+        tree = xml_string
     return create_class_from_element_tree(target_class, tree)
 
 
@@ -107,11 +255,15 @@ def create_class_from_element_tree(target_class, tree, namespace=None,
     :return: An instance of the target class - or None if the tag and namespace
         of the XML tree's root node did not match the desired namespace and tag.
     """
-    if namespace is None:
-        namespace = target_class.c_namespace
-    if tag is None:
-        tag = target_class.c_tag
-    if tree.tag == '{%s}%s' % (namespace, tag):
+    if namespace is None and tag is None:
+        qname = target_class.c_qname()
+    else:
+        if namespace is None:
+            namespace = target_class.c_namespace
+        if tag is None:
+            tag = target_class.c_tag
+        qname = '{%s}%s' % (namespace, tag)
+    if tree.tag == qname:
         target = target_class()
         target.harvest_element_tree(tree)
         return target
@@ -119,6 +271,173 @@ def create_class_from_element_tree(target_class, tree, namespace=None,
         return None
 
 
+# to_string writes XML byte for byte as ElementTree.tostring does, with
+# this encoding
+ENCODING = "UTF-8"
+XML_DECLARATION = "<?xml version='1.0' encoding='%s'?>\n" % ENCODING
+
+# Prefixes ElementTree.register_namespace does not accept
+RESERVED_PREFIX = re.compile(r"ns\d+$")
+
+
+def _serialization_error(text):
+    raise TypeError("cannot serialize %r (type %s)" % (text,
+                                                      type(text).__name__))
+
+
+def _escape_cdata(text):
+    try:
+        if "&" in text:
+            text = text.replace("&", "&amp;")
+        if "<" in text:
+            text = text.replace("<", "&lt;")
+        if ">" in text:
+            text = text.replace(">", "&gt;")
+        return text.encode(ENCODING, "xmlcharrefreplace")
+    except (TypeError, AttributeError):
+        _serialization_error(text)
+
+
+def _escape_attrib(text):
+    try:
+        if "&" in text:
+            text = text.replace("&", "&amp;")
+        if "<" in text:
+            text = text.replace("<", "&lt;")
+        if ">" in text:
+            text = text.replace(">", "&gt;")
+        if "\"" in text:
+            text = text.replace("\"", "&quot;")
+        if "\n" in text:
+            text = text.replace("\n", "&#10;")
+        return text.encode(ENCODING, "xmlcharrefreplace")
+    except (TypeError, AttributeError):
+        _serialization_error(text)
+
+
+def namespace_map(nspair=None):
+    """ The prefixes to use for namespaces.
+
+    :param nspair: A dictionary of prefixes and uris that should be used
+        instead of the ones registered with ElementTree.register_namespace
+    :return: A dictionary with uris as keys and prefixes as values
+    """
+    try:
+        nsmap = ElementTree._namespace_map
+    except AttributeError:
+        nsmap = {}
+    if not nspair:
+        return nsmap
+
+    nsmap = nsmap.copy()
+    # The same as ElementTree.register_namespace, just not global
+    for prefix, uri in nspair.items():
+        if RESERVED_PREFIX.match(prefix):
+            continue
+        for key, val in nsmap.items():
+            if key == uri or val == prefix:
+                del nsmap[key]
+        nsmap[uri] = prefix
+    return nsmap
+
+
+class XMLWriter(object):
+    """ Writes XML directly from SamlBase instances and extension elements.
+
+    The output is the same as that of ElementTree.tostring on the element
+    tree that would have been built from them. Namespaces gets the same
+    prefixes and are all declared on the root element.
+    """
+
+    def __init__(self, nsmap=None):
+        """
+        :param nsmap: Dictionary with prefixes to use for namespaces, uris
+            as keys. Other namespaces gets prefixes like 'ns0'.
+        """
+        if nsmap is None:
+            nsmap = namespace_map()
+        self.nsmap = nsmap
+        # The namespaces used, uri -> prefix
+        self.namespaces = {}
+        self.qnames = {}
+        self.data = []
+        self._root_at = None
+
+    def qname(self, name):
+        """ The prefixed name of an element or attribute
+
+        :param name: The name in ElementTree notation '{uri}tag'
+        """
+        try:
+            return self.qnames[name]
+        except KeyError:
+            pass
+        try:
+            if name[:1] == "{":
+                uri, tag = name[1:].rsplit("}", 1)
+                prefix = self.namespaces.get(uri)
+                if prefix is None:
+                    prefix = self.nsmap.get(uri)
+                    if prefix is None:
+                        prefix = "ns%d" % len(self.namespaces)
+                    if prefix != "xml":
+                        self.namespaces[uri] = prefix
+                if prefix:
+                    res = ("%s:%s" % (prefix, tag)).encode(ENCODING)
+                else:
+                    res = tag.encode(ENCODING)
+            else:
+                res = name.encode(ENCODING)
+        except (TypeError, AttributeError):
+            _serialization_error(name)
+        self.qnames[name] = res
+        return res
+
+    def element(self, tag, attrib, text, children):
+        """ Writes one element.
+
+        :param tag: The name of the element in ElementTree notation
+        :param attrib: Dictionary with the attributes of the element
+        :param text: The text of the element or None
+        :param children: The child elements, objects with a _write_xml
+            method
+        """
+        write = self.data.append
+        tag = self.qname(tag)
+        # Prefixes are given out in the order ElementTree does it
+        for key in attrib:
+            self.qname(key)
+
+        write("<" + tag)
+        if self._root_at is None:
+            # Where the namespace declarations goes
+            self._root_at = len(self.data)
+            write("")
+        for key, value in sorted(attrib.items()):
+            write(" %s=\"%s\"" % (self.qnames[key], _escape_attrib(value)))
+        if text or children:
+            write(">")
+            if text:
+                write(_escape_cdata(text))
+            for child in children:
+                child._write_xml(self)
+            write("</" + tag + ">")
+        else:
+            write(" />")
+
+    def getvalue(self):
+        if self._root_at is not None:
+            decl = []
+            for uri, prefix in sorted(self.namespaces.items(),
+                                      key=lambda x: x[1]):
+                if prefix:
+                    prefix = ":" + prefix
+                decl.append(" xmlns%s=\"%s\"" % (prefix.encode(ENCODING),
+                                                  _escape_attrib(uri)))
+            self.data[self._root_at] = "".join(decl)
+        return XML_DECLARATION + "".join(self.data)
+
+
 class Error(Exception):
     """Exception class thrown by this module."""
     pass
@@ -128,6 +447,13 @@ class SAMLError(Exception):
     pass
 
 
+class XMLParseError(SAMLError, getattr(ElementTree, "ParseError",
+                                       SyntaxError)):
+    """ The document could not be parsed or has a document type
+    declaration """
+    pass
+
+
 class ExtensionElement(object):
     """XML which is not part of the SAML specification,
     these are called extension elements. If a classes parser
@@ -162,6 +488,20 @@ class ExtensionElement(object):
         element_tree = self.transfer_to_element_tree()
         return ElementTree.tostring(element_tree, encoding="UTF-8")
 
+    def _write_xml(self, writer):
+        if self.tag is None:
+            return
+        if self.namespace is not None:
+            tag = '{%s}%s' % (self.namespace, self.tag)
+        else:
+            tag = self.tag
+        # A new dictionary to get the same attribute order as
+        # transfer_to_element_tree
+        attrib = {}
+        for key, value in self.attributes.iteritems():
+            attrib[key] = value
+        writer.element(tag, attrib, self.text, self.children)
+
     def transfer_to_element_tree(self):
         if self.tag is None:
             return None
@@ -264,7 +604,7 @@ class ExtensionElement(object):
 
 
 def extension_element_from_string(xml_string):
-    element_tree = ElementTree.fromstring(xml_string)
+    element_tree = parse_xml(xml_string)
     return _extension_element_from_element_tree(element_tree)
 
 
@@ -286,6 +626,11 @@ def _extension_element_from_element_tree(element_tree):
 
 
 class ExtensionContainer(object):
+    # The schema classes has slots to keep down the memory used by large
+    # documents, like federation metadata. Other attributes can still be
+    # set, the __dict__ they are kept in is only created when needed.
+    __slots__ = ["text", "extension_elements", "extension_attributes",
+                 "__dict__"]
 
     c_tag = ""
     c_namespace = ""
@@ -297,6 +642,51 @@ class ExtensionContainer(object):
         self.extension_elements = extension_elements or []
         self.extension_attributes = extension_attributes or {}
 
+    @classmethod
+    def c_slots(cls):
+        """ The names of the slots of the class and all its superiors """
+        try:
+            return cls.__dict__["_c_slots"]
+        except KeyError:
+            pass
+        names = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get("__slots__", []):
+                if name != "__dict__" and name not in names:
+                    names.append(name)
+        cls._c_slots = names
+        return names
+
+    def members(self):
+        """ The names and values of all the members that are set, both the
+        ones in slots and the ones in __dict__
+
+        :return: list of (name, value) tuples
+        """
+        res = []
+        for name in self.c_slots():
+            try:
+                res.append((name, getattr(self, name)))
+            except AttributeError:
+                pass
+        extra = self.__dict__
+        if extra:
+            res.extend(extra.items())
+        else:
+            # Reading __dict__ created it, an empty one is not kept
+            del self.__dict__
+        return res
+
+    # Slots are not pickled by the older pickle protocols unless the class
+    # says how
+    def __getstate__(self):
+        return dict(self.members())
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            # Not through __setattr__, some classes check values there
+            object.__setattr__(self, name, value)
+
     # Three methods to create an object from an ElementTree
     def harvest_element_tree(self, tree):
         # Fill in the instance members from the contents of the XML tree.
@@ -441,6 +831,8 @@ class SamlBase(ExtensionContainer):
     nodes into ExtensionElements.
     """
 
+    __slots__ = []
+
     c_children = {}
     c_attributes = {}
     c_attribute_type = {}
@@ -459,37 +851,120 @@ class SamlBase(ExtensionContainer):
             for _, values in self.__class__.c_children.iteritems():
                 yield values[0]
 
-    def _convert_element_tree_to_member(self, child_tree):
-        # Find the element's tag in this class's list of child members
-        if child_tree.tag in self.__class__.c_children:
-            member_name = self.__class__.c_children[child_tree.tag][0]
-            member_class = self.__class__.c_children[child_tree.tag][1]
-            # If the class member is supposed to contain a list, make sure the
-            # matching member is set to a list, then append the new member
-            # instance to the list.
-            if isinstance(member_class, list):
-                if getattr(self, member_name) is None:
-                    setattr(self, member_name, [])
-                getattr(self, member_name).append(
-                    create_class_from_element_tree(member_class[0], child_tree))
+    @classmethod
+    def c_qname(cls):
+        """ The tag of the element in ElementTree notation '{namespace}tag' """
+        try:
+            return cls.__dict__["_c_qname"]
+        except KeyError:
+            cls._c_qname = '{%s}%s' % (cls.c_namespace, cls.c_tag)
+            return cls._c_qname
+
+    @classmethod
+    def c_parse_table(cls):
+        """ The tables used when an instance is filled in from an element
+        tree. They are built from c_children and c_attributes the first time
+        an instance of the class is parsed. If c_children or c_attributes
+        grows after that, the tables are rebuilt.
+
+        :return: A 2-tuple. The first item is a dictionary with element tags
+            as keys and (member name, member class, is list) tuples as
+            values. Member class is None if elements with that tag can never
+            become instances of it. The second item is a dictionary with
+            attribute names as keys and member names as values.
+        """
+        try:
+            sizes, children, attributes = cls.__dict__["_c_parse_table"]
+            if sizes == (len(cls.c_children), len(cls.c_attributes)):
+                return children, attributes
+        except KeyError:
+            pass
+
+        children = {}
+        for tag, (member_name, member_class) in cls.c_children.items():
+            is_list = isinstance(member_class, list)
+            if is_list:
+                member_class = member_class[0]
+            if member_class.c_qname() != tag:
+                # create_class_from_element_tree would return None
+                member_class = None
+            children[tag] = (member_name, member_class, is_list)
+        attributes = dict([(attr, spec[0]) for attr, spec in
+                           cls.c_attributes.items()])
+        cls._c_parse_table = ((len(cls.c_children), len(cls.c_attributes)),
+                              children, attributes)
+        return children, attributes
+
+    def harvest_element_tree(self, tree):
+        # Fill in the instance members from the contents of the XML tree.
+        children, attributes = self.c_parse_table()
+        for child in tree:
+            try:
+                member_name, member_class, is_list = children[child.tag]
+            except KeyError:
+                self.extension_elements.append(
+                    _extension_element_from_element_tree(child))
+                continue
+            # Same as _set_member, without the extra call per element
+            if member_class is None:
+                member = None
+            else:
+                member = member_class()
+                member.harvest_element_tree(child)
+            if is_list:
+                _list = getattr(self, member_name)
+                if _list is None:
+                    _list = []
+                    setattr(self, member_name, _list)
+                _list.append(member)
             else:
-                setattr(self, member_name,
-                        create_class_from_element_tree(member_class,
-                                                       child_tree))
+                setattr(self, member_name, member)
+        for attribute, value in tree.attrib.iteritems():
+            try:
+                setattr(self, attributes[attribute], value)
+            except KeyError:
+                self.extension_attributes[attribute] = value
+        self.text = tree.text
+
+    def _set_member(self, member_name, member_class, is_list, child_tree):
+        if member_class is None:
+            member = None
+        else:
+            member = member_class()
+            member.harvest_element_tree(child_tree)
+        # If the class member is supposed to contain a list, make sure the
+        # matching member is set to a list, then append the new member
+        # instance to the list.
+        if is_list:
+            _list = getattr(self, member_name)
+            if _list is None:
+                _list = []
+                setattr(self, member_name, _list)
+            _list.append(member)
         else:
+            setattr(self, member_name, member)
+
+    def _convert_element_tree_to_member(self, child_tree):
+        # Find the element's tag in this class's list of child members
+        try:
+            member_name, member_class, is_list = \
+                self.c_parse_table()[0][child_tree.tag]
+        except KeyError:
             ExtensionContainer._convert_element_tree_to_member(self, child_tree)
+        else:
+            self._set_member(member_name, member_class, is_list, child_tree)
 
     def _convert_element_attribute_to_member(self, attribute, value):
-        # Find the attribute in this class's list of attributes.
-        if attribute in self.__class__.c_attributes:
-            # Find the member of this class which corresponds to the XML
-            # attribute(lookup in current_class.c_attributes) and set this
-            # member to the desired value (using self.__dict__).
-            setattr(self, self.__class__.c_attributes[attribute][0], value)
-        else:
+        # Find the member of this class which corresponds to the XML
+        # attribute and set this member to the desired value.
+        try:
+            member_name = self.c_parse_table()[1][attribute]
+        except KeyError:
             # If it doesn't appear in the attribute list it's an extension
             ExtensionContainer._convert_element_attribute_to_member(
                 self, attribute, value)
+        else:
+            setattr(self, member_name, value)
 
     # Three methods to create an ElementTree from an object
     def _add_members_to_element_tree(self, tree):
@@ -541,9 +1016,64 @@ class SamlBase(ExtensionContainer):
         self._add_members_to_element_tree(new_tree)
         return new_tree
 
+    @classmethod
+    def c_write_table(cls):
+        """ What to_string needs to know about the class. Built the first time
+        an instance is serialized and rebuilt if c_children or c_attributes
+        grows after that.
+
+        :return: A 3-tuple: the tag in ElementTree notation, the names of the
+            members that are child elements in the order they should be
+            written and a list of (attribute name, member name) tuples.
+        """
+        try:
+            sizes, table = cls.__dict__["_c_write_table"]
+            if sizes == (len(cls.c_children), len(cls.c_attributes)):
+                return table
+        except KeyError:
+            pass
+
+        if cls.c_child_order:
+            children = list(cls.c_child_order)
+        else:
+            children = [v[0] for v in cls.c_children.itervalues()]
+        attributes = [(attr, spec[0]) for attr, spec in
+                      cls.c_attributes.iteritems()]
+        table = (cls.c_qname(), children, attributes)
+        cls._c_write_table = ((len(cls.c_children), len(cls.c_attributes)),
+                              table)
+        return table
+
+    def _write_xml(self, writer):
+        qname, children_order, attributes = self.c_write_table()
+        # Built in the same order as by _add_members_to_element_tree
+        attrib = {}
+        for xml_attribute, member_name in attributes:
+            member = getattr(self, member_name)
+            if member is not None:
+                attrib[xml_attribute] = member
+        for attribute, value in self.extension_attributes.iteritems():
+            attrib[attribute] = value
+
+        children = []
+        for member_name in children_order:
+            member = getattr(self, member_name)
+            if member is None:
+                pass
+            elif isinstance(member, list):
+                children.extend(member)
+            else:
+                children.append(member)
+        children.extend(self.extension_elements)
+
+        writer.element(qname, attrib, self.text, children)
+
     def to_string(self, nspair=None):
         """Converts the Saml object to a string containing XML.
 
+        The XML is written directly from the object, no element tree is
+        built. The result is the same as ElementTree.tostring would give.
+
         :param nspair: A dictionary of prefixes and uris to use when
             constructing the text representation.
         :return: String representation of the object
@@ -551,17 +1081,9 @@ class SamlBase(ExtensionContainer):
         if not nspair and self.c_ns_prefix:
             nspair = self.c_ns_prefix
 
-        if nspair:
-            for prefix, uri in nspair.items():
-                try:
-                    ElementTree.register_namespace(prefix, uri)
-                except AttributeError:
-                    # Backwards compatibility with ET < 1.3
-                    ElementTree._namespace_map[uri] = prefix
-                except ValueError:
-                    pass
-
-        return ElementTree.tostring(self._to_element_tree(), encoding="UTF-8")
+        writer = XMLWriter(namespace_map(nspair))
+        self._write_xml(writer)
+        return writer.getvalue()
 
     def __str__(self):
         return self.to_string()
@@ -571,7 +1093,7 @@ class SamlBase(ExtensionContainer):
 
         :return: list of keys
         """
-        return [key for key, val in self.__dict__.items() if val]
+        return [key for key, val in self.members() if val]
 
     def keys(self):
         """ Return all the keys that represent possible attributes and
@@ -698,8 +1220,8 @@ class SamlBase(ExtensionContainer):
         for key in self.keyswv():
             if key in ["_extatt"]:
                 continue
-            svals = self.__dict__[key]
-            ovals = other.__dict__[key]
+            svals = getattr(self, key)
+            ovals = getattr(other, key, None)
             if isinstance(svals, basestring):
                 if svals != ovals:
                     return False
@@ -9,6 +9,7 @@ to do attribute aggregation.
 import logging
 #from saml2 import client
 from saml2 import BINDING_SOAP
+from saml2.parallel import wait
 
 logger = logging.getLogger(__name__)
 
@@ -22,28 +23,43 @@ class AttributeResolver(object):
         self.saml2client = saml2client
         self.metadata = saml2client.config.metadata
 
-    def extend(self, name_id, issuer, vo_members):
+    def extend(self, name_id, issuer, vo_members, nameid_format=None,
+               timeout=None):
         """
+        The attribute authorities are asked concurrently.
+
         :param name_id: The identifier by which the subject is know
             among all the participents of the VO
         :param issuer: Who am I the poses the query
         :param vo_members: The entity IDs of the IdP who I'm going to ask
             for extra attributes
-        :return: A dictionary with all the collected information about the
-            subject
+        :param nameid_format: The format of name_id
+        :param timeout: Seconds to wait for the answers. Members that
+            haven't answered by then are skipped.
+        :return: A list of session_infos, one per member that answered
         """
-        result = []
+        calls = []
         for member in vo_members:
-            for ass in self.metadata.attribute_consuming_service(member):
-                for attr_serv in ass.attribute_service:
-                    logger.info(
-                        "Send attribute request to %s" % attr_serv.location)
-                    if attr_serv.binding != BINDING_SOAP:
-                        continue
-                    # attribute query assumes SOAP binding
-                    session_info = self.saml2client.attribute_query(
-                        name_id, attr_serv.location, issuer_id=issuer,
-)
-                    if session_info:
-                        result.append(session_info)
+            logger.info("Send attribute request to %s" % member)
+            # attribute query assumes SOAP binding
+            calls.append((member, self.saml2client.do_attribute_query_async(
+                member, name_id, nameid_format=nameid_format,
+                binding=DEFAULT_BINDING, timeout=timeout)))
+
+        wait([c for _, c in calls], timeout)
+
+        result = []
+        for member, call in calls:
+            if not call.done():
+                logger.info("No answer from %s in %s seconds" % (member,
+                                                                 timeout))
+                continue
+            try:
+                response = call.result()
+            except Exception, exc:
+                logger.info("Attribute query to %s failed: %s" % (member,
+                                                                  exc))
+                continue
+            if response:
+                result.append(response.session_info())
         return result
@@ -21,6 +21,7 @@ NAMESPACE = 'urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract'
 class PhysicalVerification(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:PhysicalVerification element """
 
+    __slots__ = ['credential_level']
     c_tag = 'PhysicalVerification'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -50,6 +51,7 @@ def physical_verification_from_string(xml_string):
 class Generation(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:Generation element """
 
+    __slots__ = ['mechanism']
     c_tag = 'Generation'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -79,6 +81,7 @@ def generation_from_string(xml_string):
 class NymType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:nymType element """
 
+    __slots__ = []
     c_tag = 'nymType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN',
@@ -96,6 +99,7 @@ def nym_type__from_string(xml_string):
 class GoverningAgreementRefType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:GoverningAgreementRefType element """
 
+    __slots__ = ['governing_agreement_ref']
     c_tag = 'GoverningAgreementRefType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -127,6 +131,7 @@ def governing_agreement_ref_type__from_string(xml_string):
 class KeySharingType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:KeySharingType element """
 
+    __slots__ = ['sharing']
     c_tag = 'KeySharingType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -156,6 +161,7 @@ def key_sharing_type__from_string(xml_string):
 class RestrictedLengthType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:RestrictedLengthType element """
 
+    __slots__ = ['min', 'max']
     c_tag = 'RestrictedLengthType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -188,6 +194,7 @@ def restricted_length_type__from_string(xml_string):
 class AlphabetType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:AlphabetType element """
 
+    __slots__ = ['required_chars', 'excluded_chars', 'case']
     c_tag = 'AlphabetType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -223,6 +230,7 @@ def alphabet_type__from_string(xml_string):
 class DeviceTypeType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:DeviceTypeType element """
 
+    __slots__ = []
     c_tag = 'DeviceTypeType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN',
@@ -240,6 +248,7 @@ def device_type_type__from_string(xml_string):
 class BooleanType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:booleanType element """
 
+    __slots__ = []
     c_tag = 'booleanType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN', 'enumeration': ['true', 'false']}
@@ -256,6 +265,7 @@ def boolean_type__from_string(xml_string):
 class TimeSyncTokenType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:TimeSyncTokenType element """
 
+    __slots__ = ['device_type', 'seed_length', 'device_in_hand']
     c_tag = 'TimeSyncTokenType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -291,6 +301,7 @@ def time_sync_token_type__from_string(xml_string):
 class ActivationLimitDurationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ActivationLimitDurationType element """
 
+    __slots__ = ['duration']
     c_tag = 'ActivationLimitDurationType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -321,6 +332,7 @@ def activation_limit_duration_type__from_string(xml_string):
 class ActivationLimitUsagesType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ActivationLimitUsagesType element """
 
+    __slots__ = ['number']
     c_tag = 'ActivationLimitUsagesType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -351,6 +363,7 @@ def activation_limit_usages_type__from_string(xml_string):
 class ActivationLimitSessionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ActivationLimitSessionType element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitSessionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -367,6 +380,7 @@ def activation_limit_session_type__from_string(xml_string):
 class LengthType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:LengthType element """
 
+    __slots__ = ['min', 'max']
     c_tag = 'LengthType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -399,6 +413,7 @@ def length_type__from_string(xml_string):
 class MediumType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:mediumType element """
 
+    __slots__ = []
     c_tag = 'mediumType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN',
@@ -417,6 +432,7 @@ def medium_type__from_string(xml_string):
 class ExtensionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ExtensionType element """
 
+    __slots__ = []
     c_tag = 'ExtensionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -432,6 +448,7 @@ def extension_type__from_string(xml_string):
 class KeyStorageType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:KeyStorageType element """
 
+    __slots__ = ['medium']
     c_tag = 'KeyStorageType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -461,6 +478,7 @@ def key_storage_type__from_string(xml_string):
 class KeySharing(KeySharingType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:KeySharing element """
 
+    __slots__ = []
     c_tag = 'KeySharing'
     c_namespace = NAMESPACE
     c_children = KeySharingType_.c_children.copy()
@@ -476,6 +494,7 @@ def key_sharing_from_string(xml_string):
 class KeyStorage(KeyStorageType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:KeyStorage element """
 
+    __slots__ = []
     c_tag = 'KeyStorage'
     c_namespace = NAMESPACE
     c_children = KeyStorageType_.c_children.copy()
@@ -491,6 +510,7 @@ def key_storage_from_string(xml_string):
 class TimeSyncToken(TimeSyncTokenType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:TimeSyncToken element """
 
+    __slots__ = []
     c_tag = 'TimeSyncToken'
     c_namespace = NAMESPACE
     c_children = TimeSyncTokenType_.c_children.copy()
@@ -506,6 +526,7 @@ def time_sync_token_from_string(xml_string):
 class Length(LengthType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:Length element """
 
+    __slots__ = []
     c_tag = 'Length'
     c_namespace = NAMESPACE
     c_children = LengthType_.c_children.copy()
@@ -521,6 +542,7 @@ def length_from_string(xml_string):
 class GoverningAgreementRef(GoverningAgreementRefType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:GoverningAgreementRef element """
 
+    __slots__ = []
     c_tag = 'GoverningAgreementRef'
     c_namespace = NAMESPACE
     c_children = GoverningAgreementRefType_.c_children.copy()
@@ -536,6 +558,7 @@ def governing_agreement_ref_from_string(xml_string):
 class GoverningAgreementsType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:GoverningAgreementsType element """
 
+    __slots__ = ['governing_agreement_ref']
     c_tag = 'GoverningAgreementsType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -568,6 +591,8 @@ def governing_agreements_type__from_string(xml_string):
 
 
 class RestrictedPasswordType_Length(RestrictedLengthType_):
+    __slots__ = []
+
     c_tag = 'Length'
     c_namespace = NAMESPACE
     c_children = RestrictedLengthType_.c_children.copy()
@@ -584,6 +609,7 @@ def restricted_password_type__length_from_string(xml_string):
 class Alphabet(AlphabetType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:Alphabet element """
 
+    __slots__ = []
     c_tag = 'Alphabet'
     c_namespace = NAMESPACE
     c_children = AlphabetType_.c_children.copy()
@@ -599,6 +625,7 @@ def alphabet_from_string(xml_string):
 class ActivationLimitDuration(ActivationLimitDurationType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ActivationLimitDuration element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitDuration'
     c_namespace = NAMESPACE
     c_children = ActivationLimitDurationType_.c_children.copy()
@@ -615,6 +642,7 @@ def activation_limit_duration_from_string(xml_string):
 class ActivationLimitUsages(ActivationLimitUsagesType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ActivationLimitUsages element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitUsages'
     c_namespace = NAMESPACE
     c_children = ActivationLimitUsagesType_.c_children.copy()
@@ -630,6 +658,7 @@ def activation_limit_usages_from_string(xml_string):
 class ActivationLimitSession(ActivationLimitSessionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ActivationLimitSession element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitSession'
     c_namespace = NAMESPACE
     c_children = ActivationLimitSessionType_.c_children.copy()
@@ -646,6 +675,7 @@ def activation_limit_session_from_string(xml_string):
 class Extension(ExtensionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:Extension element """
 
+    __slots__ = []
     c_tag = 'Extension'
     c_namespace = NAMESPACE
     c_children = ExtensionType_.c_children.copy()
@@ -661,6 +691,7 @@ def extension_from_string(xml_string):
 class SharedSecretChallengeResponseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:SharedSecretChallengeResponseType element """
 
+    __slots__ = ['method', 'extension']
     c_tag = 'SharedSecretChallengeResponseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -698,6 +729,7 @@ def shared_secret_challenge_response_type__from_string(xml_string):
 class PublicKeyType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:PublicKeyType element """
 
+    __slots__ = ['key_validation', 'extension']
     c_tag = 'PublicKeyType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -734,6 +766,7 @@ def public_key_type__from_string(xml_string):
 class GoverningAgreements(GoverningAgreementsType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:GoverningAgreements element """
 
+    __slots__ = []
     c_tag = 'GoverningAgreements'
     c_namespace = NAMESPACE
     c_children = GoverningAgreementsType_.c_children.copy()
@@ -749,6 +782,8 @@ def governing_agreements_from_string(xml_string):
 class PasswordType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:PasswordType element """
 
+    __slots__ = ['external_verification', 'length', 'alphabet', 'generation',
+                 'extension']
     c_tag = 'PasswordType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -804,6 +839,7 @@ def password_type__from_string(xml_string):
 class RestrictedPasswordType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:RestrictedPasswordType element """
 
+    __slots__ = ['external_verification', 'length', 'generation', 'extension']
     c_tag = 'RestrictedPasswordType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -853,6 +889,7 @@ def restricted_password_type__from_string(xml_string):
 class TokenType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:TokenType element """
 
+    __slots__ = ['time_sync_token', 'extension']
     c_tag = 'TokenType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -891,6 +928,8 @@ def token_type__from_string(xml_string):
 class ActivationLimitType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ActivationLimitType element """
 
+    __slots__ = ['activation_limit_duration', 'activation_limit_usages',
+                 'activation_limit_session']
     c_tag = 'ActivationLimitType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -938,6 +977,7 @@ def activation_limit_type__from_string(xml_string):
 class ExtensionOnlyType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ExtensionOnlyType element """
 
+    __slots__ = ['extension']
     c_tag = 'ExtensionOnlyType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -971,6 +1011,7 @@ def extension_only_type__from_string(xml_string):
 class WrittenConsent(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:WrittenConsent element """
 
+    __slots__ = []
     c_tag = 'WrittenConsent'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -986,6 +1027,7 @@ def written_consent_from_string(xml_string):
 class SubscriberLineNumber(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:SubscriberLineNumber element """
 
+    __slots__ = []
     c_tag = 'SubscriberLineNumber'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1001,6 +1043,7 @@ def subscriber_line_number_from_string(xml_string):
 class UserSuffix(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:UserSuffix element """
 
+    __slots__ = []
     c_tag = 'UserSuffix'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1016,6 +1059,7 @@ def user_suffix_from_string(xml_string):
 class Password(PasswordType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:Password element """
 
+    __slots__ = []
     c_tag = 'Password'
     c_namespace = NAMESPACE
     c_children = PasswordType_.c_children.copy()
@@ -1031,6 +1075,7 @@ def password_from_string(xml_string):
 class Token(TokenType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:Token element """
 
+    __slots__ = []
     c_tag = 'Token'
     c_namespace = NAMESPACE
     c_children = TokenType_.c_children.copy()
@@ -1046,6 +1091,7 @@ def token_from_string(xml_string):
 class Smartcard(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:Smartcard element """
 
+    __slots__ = []
     c_tag = 'Smartcard'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1061,6 +1107,7 @@ def smartcard_from_string(xml_string):
 class ActivationLimit(ActivationLimitType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ActivationLimit element """
 
+    __slots__ = []
     c_tag = 'ActivationLimit'
     c_namespace = NAMESPACE
     c_children = ActivationLimitType_.c_children.copy()
@@ -1076,6 +1123,7 @@ def activation_limit_from_string(xml_string):
 class PreviousSession(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:PreviousSession element """
 
+    __slots__ = []
     c_tag = 'PreviousSession'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1091,6 +1139,7 @@ def previous_session_from_string(xml_string):
 class ResumeSession(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ResumeSession element """
 
+    __slots__ = []
     c_tag = 'ResumeSession'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1106,6 +1155,7 @@ def resume_session_from_string(xml_string):
 class ZeroKnowledge(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ZeroKnowledge element """
 
+    __slots__ = []
     c_tag = 'ZeroKnowledge'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1121,6 +1171,7 @@ def zero_knowledge_from_string(xml_string):
 class SharedSecretChallengeResponse(SharedSecretChallengeResponseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:SharedSecretChallengeResponse element """
 
+    __slots__ = []
     c_tag = 'SharedSecretChallengeResponse'
     c_namespace = NAMESPACE
     c_children = SharedSecretChallengeResponseType_.c_children.copy()
@@ -1137,6 +1188,7 @@ def shared_secret_challenge_response_from_string(xml_string):
 class DigSig(PublicKeyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:DigSig element """
 
+    __slots__ = []
     c_tag = 'DigSig'
     c_namespace = NAMESPACE
     c_children = PublicKeyType_.c_children.copy()
@@ -1152,6 +1204,7 @@ def dig_sig_from_string(xml_string):
 class AsymmetricDecryption(PublicKeyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:AsymmetricDecryption element """
 
+    __slots__ = []
     c_tag = 'AsymmetricDecryption'
     c_namespace = NAMESPACE
     c_children = PublicKeyType_.c_children.copy()
@@ -1167,6 +1220,7 @@ def asymmetric_decryption_from_string(xml_string):
 class AsymmetricKeyAgreement(PublicKeyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:AsymmetricKeyAgreement element """
 
+    __slots__ = []
     c_tag = 'AsymmetricKeyAgreement'
     c_namespace = NAMESPACE
     c_children = PublicKeyType_.c_children.copy()
@@ -1183,6 +1237,7 @@ def asymmetric_key_agreement_from_string(xml_string):
 class IPAddress(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:IPAddress element """
 
+    __slots__ = []
     c_tag = 'IPAddress'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1198,6 +1253,7 @@ def ip_address_from_string(xml_string):
 class SharedSecretDynamicPlaintext(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:SharedSecretDynamicPlaintext element """
 
+    __slots__ = []
     c_tag = 'SharedSecretDynamicPlaintext'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1214,6 +1270,7 @@ def shared_secret_dynamic_plaintext_from_string(xml_string):
 class HTTP(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:HTTP element """
 
+    __slots__ = []
     c_tag = 'HTTP'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1229,6 +1286,7 @@ def http_from_string(xml_string):
 class IPSec(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:IPSec element """
 
+    __slots__ = []
     c_tag = 'IPSec'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1244,6 +1302,7 @@ def ip_sec_from_string(xml_string):
 class WTLS(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:WTLS element """
 
+    __slots__ = []
     c_tag = 'WTLS'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1259,6 +1318,7 @@ def wtls_from_string(xml_string):
 class MobileNetworkNoEncryption(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:MobileNetworkNoEncryption element """
 
+    __slots__ = []
     c_tag = 'MobileNetworkNoEncryption'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1275,6 +1335,7 @@ def mobile_network_no_encryption_from_string(xml_string):
 class MobileNetworkRadioEncryption(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:MobileNetworkRadioEncryption element """
 
+    __slots__ = []
     c_tag = 'MobileNetworkRadioEncryption'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1291,6 +1352,7 @@ def mobile_network_radio_encryption_from_string(xml_string):
 class MobileNetworkEndToEndEncryption(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:MobileNetworkEndToEndEncryption element """
 
+    __slots__ = []
     c_tag = 'MobileNetworkEndToEndEncryption'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1307,6 +1369,7 @@ def mobile_network_end_to_end_encryption_from_string(xml_string):
 class SSL(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:SSL element """
 
+    __slots__ = []
     c_tag = 'SSL'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1322,6 +1385,7 @@ def ssl_from_string(xml_string):
 class PSTN(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:PSTN element """
 
+    __slots__ = []
     c_tag = 'PSTN'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1337,6 +1401,7 @@ def pstn_from_string(xml_string):
 class ISDN(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ISDN element """
 
+    __slots__ = []
     c_tag = 'ISDN'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1352,6 +1417,7 @@ def isdn_from_string(xml_string):
 class ADSL(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ADSL element """
 
+    __slots__ = []
     c_tag = 'ADSL'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1367,6 +1433,7 @@ def adsl_from_string(xml_string):
 class SwitchAudit(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:SwitchAudit element """
 
+    __slots__ = []
     c_tag = 'SwitchAudit'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1382,6 +1449,7 @@ def switch_audit_from_string(xml_string):
 class DeactivationCallCenter(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:DeactivationCallCenter element """
 
+    __slots__ = []
     c_tag = 'DeactivationCallCenter'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1398,6 +1466,7 @@ def deactivation_call_center_from_string(xml_string):
 class RestrictedPassword(RestrictedPasswordType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:RestrictedPassword element """
 
+    __slots__ = []
     c_tag = 'RestrictedPassword'
     c_namespace = NAMESPACE
     c_children = RestrictedPasswordType_.c_children.copy()
@@ -1413,6 +1482,8 @@ def restricted_password_from_string(xml_string):
 class ActivationPinType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ActivationPinType element """
 
+    __slots__ = ['length', 'alphabet', 'generation', 'activation_limit',
+                 'extension']
     c_tag = 'ActivationPinType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1471,6 +1542,8 @@ def activation_pin_type__from_string(xml_string):
 class ComplexAuthenticatorType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ComplexAuthenticatorType element """
 
+    __slots__ = ['shared_secret_challenge_response',
+                 'shared_secret_dynamic_plaintext', 'password']
     c_tag = 'ComplexAuthenticatorType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1518,6 +1591,9 @@ def complex_authenticator_type__from_string(xml_string):
 class AuthenticatorTransportProtocolType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:AuthenticatorTransportProtocolType element """
 
+    __slots__ = ['ssl', 'mobile_network_no_encryption',
+                 'mobile_network_radio_encryption',
+                 'mobile_network_end_to_end_encryption', 'wtls', 'extension']
     c_tag = 'AuthenticatorTransportProtocolType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1585,6 +1661,7 @@ def authenticator_transport_protocol_type__from_string(xml_string):
 class SecurityAuditType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:SecurityAuditType element """
 
+    __slots__ = ['switch_audit', 'extension']
     c_tag = 'SecurityAuditType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1623,6 +1700,8 @@ def security_audit_type__from_string(xml_string):
 class IdentificationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:IdentificationType element """
 
+    __slots__ = ['nym', 'physical_verification', 'written_consent',
+                 'governing_agreements', 'extension']
     c_tag = 'IdentificationType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1676,6 +1755,7 @@ def identification_type__from_string(xml_string):
 class Identification(IdentificationType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:Identification element """
 
+    __slots__ = []
     c_tag = 'Identification'
     c_namespace = NAMESPACE
     c_children = IdentificationType_.c_children.copy()
@@ -1691,6 +1771,7 @@ def identification_from_string(xml_string):
 class ActivationPin(ActivationPinType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ActivationPin element """
 
+    __slots__ = []
     c_tag = 'ActivationPin'
     c_namespace = NAMESPACE
     c_children = ActivationPinType_.c_children.copy()
@@ -1706,6 +1787,7 @@ def activation_pin_from_string(xml_string):
 class ComplexAuthenticator(ComplexAuthenticatorType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:ComplexAuthenticator element """
 
+    __slots__ = []
     c_tag = 'ComplexAuthenticator'
     c_namespace = NAMESPACE
     c_children = ComplexAuthenticatorType_.c_children.copy()
@@ -1721,6 +1803,7 @@ def complex_authenticator_from_string(xml_string):
 class AuthenticatorTransportProtocol(AuthenticatorTransportProtocolType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:AuthenticatorTransportProtocol element """
 
+    __slots__ = []
     c_tag = 'AuthenticatorTransportProtocol'
     c_namespace = NAMESPACE
     c_children = AuthenticatorTransportProtocolType_.c_children.copy()
@@ -1737,6 +1820,7 @@ def authenticator_transport_protocol_from_string(xml_string):
 class SecurityAudit(SecurityAuditType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:SecurityAudit element """
 
+    __slots__ = []
     c_tag = 'SecurityAudit'
     c_namespace = NAMESPACE
     c_children = SecurityAuditType_.c_children.copy()
@@ -1752,6 +1836,8 @@ def security_audit_from_string(xml_string):
 class PrincipalAuthenticationMechanismType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:PrincipalAuthenticationMechanismType element """
 
+    __slots__ = ['preauth', 'password', 'restricted_password', 'token',
+                 'smartcard', 'activation_pin', 'extension']
     c_tag = 'PrincipalAuthenticationMechanismType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1821,6 +1907,7 @@ def principal_authentication_mechanism_type__from_string(xml_string):
 class KeyActivationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:KeyActivationType element """
 
+    __slots__ = ['activation_pin', 'extension']
     c_tag = 'KeyActivationType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1860,6 +1947,11 @@ def key_activation_type__from_string(xml_string):
 class AuthenticatorBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:AuthenticatorBaseType element """
 
+    __slots__ = ['dig_sig', 'zero_knowledge',
+                 'shared_secret_challenge_response',
+                 'shared_secret_dynamic_plaintext', 'asymmetric_decryption',
+                 'asymmetric_key_agreement', 'complex_authenticator',
+                 'extension']
     c_tag = 'AuthenticatorBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1939,6 +2031,7 @@ def authenticator_base_type__from_string(xml_string):
 class OperationalProtectionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:OperationalProtectionType element """
 
+    __slots__ = ['security_audit', 'deactivation_call_center', 'extension']
     c_tag = 'OperationalProtectionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1984,6 +2077,7 @@ def operational_protection_type__from_string(xml_string):
 class KeyActivation(KeyActivationType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:KeyActivation element """
 
+    __slots__ = []
     c_tag = 'KeyActivation'
     c_namespace = NAMESPACE
     c_children = KeyActivationType_.c_children.copy()
@@ -1999,6 +2093,7 @@ def key_activation_from_string(xml_string):
 class PrincipalAuthenticationMechanism(PrincipalAuthenticationMechanismType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:PrincipalAuthenticationMechanism element """
 
+    __slots__ = []
     c_tag = 'PrincipalAuthenticationMechanism'
     c_namespace = NAMESPACE
     c_children = PrincipalAuthenticationMechanismType_.c_children.copy()
@@ -2015,6 +2110,7 @@ def principal_authentication_mechanism_from_string(xml_string):
 class Authenticator(AuthenticatorBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:Authenticator element """
 
+    __slots__ = []
     c_tag = 'Authenticator'
     c_namespace = NAMESPACE
     c_children = AuthenticatorBaseType_.c_children.copy()
@@ -2030,6 +2126,7 @@ def authenticator_from_string(xml_string):
 class OperationalProtection(OperationalProtectionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:OperationalProtection element """
 
+    __slots__ = []
     c_tag = 'OperationalProtection'
     c_namespace = NAMESPACE
     c_children = OperationalProtectionType_.c_children.copy()
@@ -2045,6 +2142,8 @@ def operational_protection_from_string(xml_string):
 class AuthnMethodBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:AuthnMethodBaseType element """
 
+    __slots__ = ['principal_authentication_mechanism', 'authenticator',
+                 'authenticator_transport_protocol', 'extension']
     c_tag = 'AuthnMethodBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2096,6 +2195,7 @@ def authn_method_base_type__from_string(xml_string):
 class PrivateKeyProtectionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:PrivateKeyProtectionType element """
 
+    __slots__ = ['key_activation', 'key_storage', 'extension']
     c_tag = 'PrivateKeyProtectionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2140,6 +2240,7 @@ def private_key_protection_type__from_string(xml_string):
 class SecretKeyProtectionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:SecretKeyProtectionType element """
 
+    __slots__ = ['key_activation', 'key_storage', 'extension']
     c_tag = 'SecretKeyProtectionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2185,6 +2286,7 @@ def secret_key_protection_type__from_string(xml_string):
 class SecretKeyProtection(SecretKeyProtectionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:SecretKeyProtection element """
 
+    __slots__ = []
     c_tag = 'SecretKeyProtection'
     c_namespace = NAMESPACE
     c_children = SecretKeyProtectionType_.c_children.copy()
@@ -2200,6 +2302,7 @@ def secret_key_protection_from_string(xml_string):
 class PrivateKeyProtection(PrivateKeyProtectionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:PrivateKeyProtection element """
 
+    __slots__ = []
     c_tag = 'PrivateKeyProtection'
     c_namespace = NAMESPACE
     c_children = PrivateKeyProtectionType_.c_children.copy()
@@ -2215,6 +2318,7 @@ def private_key_protection_from_string(xml_string):
 class AuthnMethod(AuthnMethodBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:AuthnMethod element """
 
+    __slots__ = []
     c_tag = 'AuthnMethod'
     c_namespace = NAMESPACE
     c_children = AuthnMethodBaseType_.c_children.copy()
@@ -2230,6 +2334,8 @@ def authn_method_from_string(xml_string):
 class TechnicalProtectionBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:TechnicalProtectionBaseType element """
 
+    __slots__ = ['private_key_protection', 'secret_key_protection',
+                 'extension']
     c_tag = 'TechnicalProtectionBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2277,6 +2383,7 @@ def technical_protection_base_type__from_string(xml_string):
 class TechnicalProtection(TechnicalProtectionBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:TechnicalProtection element """
 
+    __slots__ = []
     c_tag = 'TechnicalProtection'
     c_namespace = NAMESPACE
     c_children = TechnicalProtectionBaseType_.c_children.copy()
@@ -2292,6 +2399,9 @@ def technical_protection_from_string(xml_string):
 class AuthnContextDeclarationBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:AuthnContextDeclarationBaseType element """
 
+    __slots__ = ['id', 'identification', 'technical_protection',
+                 'operational_protection', 'authn_method',
+                 'governing_agreements', 'extension']
     c_tag = 'AuthnContextDeclarationBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2360,6 +2470,7 @@ def authn_context_declaration_base_type__from_string(xml_string):
 class AuthenticationContextDeclaration(AuthnContextDeclarationBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:MobileTwoFactorContract:AuthenticationContextDeclaration element """
 
+    __slots__ = []
     c_tag = 'AuthenticationContextDeclaration'
     c_namespace = NAMESPACE
     c_children = AuthnContextDeclarationBaseType_.c_children.copy()
@@ -18,6 +18,7 @@ NAMESPACE = 'urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport'
 class PhysicalVerification(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:PhysicalVerification element """
 
+    __slots__ = ['credential_level']
     c_tag = 'PhysicalVerification'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -47,6 +48,7 @@ def physical_verification_from_string(xml_string):
 class Generation(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:Generation element """
 
+    __slots__ = ['mechanism']
     c_tag = 'Generation'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -76,6 +78,7 @@ def generation_from_string(xml_string):
 class NymType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:nymType element """
 
+    __slots__ = []
     c_tag = 'nymType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN',
@@ -93,6 +96,7 @@ def nym_type__from_string(xml_string):
 class GoverningAgreementRefType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:GoverningAgreementRefType element """
 
+    __slots__ = ['governing_agreement_ref']
     c_tag = 'GoverningAgreementRefType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -124,6 +128,7 @@ def governing_agreement_ref_type__from_string(xml_string):
 class KeySharingType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:KeySharingType element """
 
+    __slots__ = ['sharing']
     c_tag = 'KeySharingType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -153,6 +158,7 @@ def key_sharing_type__from_string(xml_string):
 class RestrictedLengthType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:RestrictedLengthType element """
 
+    __slots__ = ['min', 'max']
     c_tag = 'RestrictedLengthType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -185,6 +191,7 @@ def restricted_length_type__from_string(xml_string):
 class AlphabetType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:AlphabetType element """
 
+    __slots__ = ['required_chars', 'excluded_chars', 'case']
     c_tag = 'AlphabetType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -220,6 +227,7 @@ def alphabet_type__from_string(xml_string):
 class DeviceTypeType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:DeviceTypeType element """
 
+    __slots__ = []
     c_tag = 'DeviceTypeType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN',
@@ -237,6 +245,7 @@ def device_type_type__from_string(xml_string):
 class BooleanType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:booleanType element """
 
+    __slots__ = []
     c_tag = 'booleanType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN', 'enumeration': ['true', 'false']}
@@ -253,6 +262,7 @@ def boolean_type__from_string(xml_string):
 class TimeSyncTokenType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:TimeSyncTokenType element """
 
+    __slots__ = ['device_type', 'seed_length', 'device_in_hand']
     c_tag = 'TimeSyncTokenType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -288,6 +298,7 @@ def time_sync_token_type__from_string(xml_string):
 class ActivationLimitDurationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ActivationLimitDurationType element """
 
+    __slots__ = ['duration']
     c_tag = 'ActivationLimitDurationType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -318,6 +329,7 @@ def activation_limit_duration_type__from_string(xml_string):
 class ActivationLimitUsagesType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ActivationLimitUsagesType element """
 
+    __slots__ = ['number']
     c_tag = 'ActivationLimitUsagesType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -348,6 +360,7 @@ def activation_limit_usages_type__from_string(xml_string):
 class ActivationLimitSessionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ActivationLimitSessionType element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitSessionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -364,6 +377,7 @@ def activation_limit_session_type__from_string(xml_string):
 class LengthType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:LengthType element """
 
+    __slots__ = ['min', 'max']
     c_tag = 'LengthType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -396,6 +410,7 @@ def length_type__from_string(xml_string):
 class MediumType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:mediumType element """
 
+    __slots__ = []
     c_tag = 'mediumType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN',
@@ -414,6 +429,7 @@ def medium_type__from_string(xml_string):
 class KeyStorageType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:KeyStorageType element """
 
+    __slots__ = ['medium']
     c_tag = 'KeyStorageType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -443,6 +459,7 @@ def key_storage_type__from_string(xml_string):
 class ExtensionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ExtensionType element """
 
+    __slots__ = []
     c_tag = 'ExtensionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -458,6 +475,7 @@ def extension_type__from_string(xml_string):
 class KeySharing(KeySharingType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:KeySharing element """
 
+    __slots__ = []
     c_tag = 'KeySharing'
     c_namespace = NAMESPACE
     c_children = KeySharingType_.c_children.copy()
@@ -473,6 +491,7 @@ def key_sharing_from_string(xml_string):
 class KeyStorage(KeyStorageType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:KeyStorage element """
 
+    __slots__ = []
     c_tag = 'KeyStorage'
     c_namespace = NAMESPACE
     c_children = KeyStorageType_.c_children.copy()
@@ -488,6 +507,7 @@ def key_storage_from_string(xml_string):
 class TimeSyncToken(TimeSyncTokenType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:TimeSyncToken element """
 
+    __slots__ = []
     c_tag = 'TimeSyncToken'
     c_namespace = NAMESPACE
     c_children = TimeSyncTokenType_.c_children.copy()
@@ -503,6 +523,7 @@ def time_sync_token_from_string(xml_string):
 class Length(LengthType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:Length element """
 
+    __slots__ = []
     c_tag = 'Length'
     c_namespace = NAMESPACE
     c_children = LengthType_.c_children.copy()
@@ -518,6 +539,7 @@ def length_from_string(xml_string):
 class GoverningAgreementRef(GoverningAgreementRefType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:GoverningAgreementRef element """
 
+    __slots__ = []
     c_tag = 'GoverningAgreementRef'
     c_namespace = NAMESPACE
     c_children = GoverningAgreementRefType_.c_children.copy()
@@ -533,6 +555,7 @@ def governing_agreement_ref_from_string(xml_string):
 class GoverningAgreementsType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:GoverningAgreementsType element """
 
+    __slots__ = ['governing_agreement_ref']
     c_tag = 'GoverningAgreementsType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -565,6 +588,8 @@ def governing_agreements_type__from_string(xml_string):
 
 
 class RestrictedPasswordType_Length(RestrictedLengthType_):
+    __slots__ = []
+
     c_tag = 'Length'
     c_namespace = NAMESPACE
     c_children = RestrictedLengthType_.c_children.copy()
@@ -581,6 +606,7 @@ def restricted_password_type__length_from_string(xml_string):
 class Alphabet(AlphabetType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:Alphabet element """
 
+    __slots__ = []
     c_tag = 'Alphabet'
     c_namespace = NAMESPACE
     c_children = AlphabetType_.c_children.copy()
@@ -596,6 +622,7 @@ def alphabet_from_string(xml_string):
 class ActivationLimitDuration(ActivationLimitDurationType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ActivationLimitDuration element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitDuration'
     c_namespace = NAMESPACE
     c_children = ActivationLimitDurationType_.c_children.copy()
@@ -612,6 +639,7 @@ def activation_limit_duration_from_string(xml_string):
 class ActivationLimitUsages(ActivationLimitUsagesType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ActivationLimitUsages element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitUsages'
     c_namespace = NAMESPACE
     c_children = ActivationLimitUsagesType_.c_children.copy()
@@ -627,6 +655,7 @@ def activation_limit_usages_from_string(xml_string):
 class ActivationLimitSession(ActivationLimitSessionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ActivationLimitSession element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitSession'
     c_namespace = NAMESPACE
     c_children = ActivationLimitSessionType_.c_children.copy()
@@ -643,6 +672,7 @@ def activation_limit_session_from_string(xml_string):
 class Extension(ExtensionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:Extension element """
 
+    __slots__ = []
     c_tag = 'Extension'
     c_namespace = NAMESPACE
     c_children = ExtensionType_.c_children.copy()
@@ -658,6 +688,7 @@ def extension_from_string(xml_string):
 class SharedSecretChallengeResponseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:SharedSecretChallengeResponseType element """
 
+    __slots__ = ['method', 'extension']
     c_tag = 'SharedSecretChallengeResponseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -695,6 +726,7 @@ def shared_secret_challenge_response_type__from_string(xml_string):
 class PublicKeyType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:PublicKeyType element """
 
+    __slots__ = ['key_validation', 'extension']
     c_tag = 'PublicKeyType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -731,6 +763,7 @@ def public_key_type__from_string(xml_string):
 class GoverningAgreements(GoverningAgreementsType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:GoverningAgreements element """
 
+    __slots__ = []
     c_tag = 'GoverningAgreements'
     c_namespace = NAMESPACE
     c_children = GoverningAgreementsType_.c_children.copy()
@@ -746,6 +779,8 @@ def governing_agreements_from_string(xml_string):
 class PasswordType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:PasswordType element """
 
+    __slots__ = ['external_verification', 'length', 'alphabet', 'generation',
+                 'extension']
     c_tag = 'PasswordType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -801,6 +836,7 @@ def password_type__from_string(xml_string):
 class RestrictedPasswordType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:RestrictedPasswordType element """
 
+    __slots__ = ['external_verification', 'length', 'generation', 'extension']
     c_tag = 'RestrictedPasswordType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -850,6 +886,7 @@ def restricted_password_type__from_string(xml_string):
 class TokenType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:TokenType element """
 
+    __slots__ = ['time_sync_token', 'extension']
     c_tag = 'TokenType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -888,6 +925,8 @@ def token_type__from_string(xml_string):
 class ActivationLimitType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ActivationLimitType element """
 
+    __slots__ = ['activation_limit_duration', 'activation_limit_usages',
+                 'activation_limit_session']
     c_tag = 'ActivationLimitType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -935,6 +974,7 @@ def activation_limit_type__from_string(xml_string):
 class ExtensionOnlyType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ExtensionOnlyType element """
 
+    __slots__ = ['extension']
     c_tag = 'ExtensionOnlyType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -968,6 +1008,7 @@ def extension_only_type__from_string(xml_string):
 class WrittenConsent(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:WrittenConsent element """
 
+    __slots__ = []
     c_tag = 'WrittenConsent'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -983,6 +1024,7 @@ def written_consent_from_string(xml_string):
 class SubscriberLineNumber(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:SubscriberLineNumber element """
 
+    __slots__ = []
     c_tag = 'SubscriberLineNumber'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -998,6 +1040,7 @@ def subscriber_line_number_from_string(xml_string):
 class UserSuffix(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:UserSuffix element """
 
+    __slots__ = []
     c_tag = 'UserSuffix'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1013,6 +1056,7 @@ def user_suffix_from_string(xml_string):
 class Password(PasswordType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:Password element """
 
+    __slots__ = []
     c_tag = 'Password'
     c_namespace = NAMESPACE
     c_children = PasswordType_.c_children.copy()
@@ -1028,6 +1072,7 @@ def password_from_string(xml_string):
 class Token(TokenType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:Token element """
 
+    __slots__ = []
     c_tag = 'Token'
     c_namespace = NAMESPACE
     c_children = TokenType_.c_children.copy()
@@ -1043,6 +1088,7 @@ def token_from_string(xml_string):
 class Smartcard(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:Smartcard element """
 
+    __slots__ = []
     c_tag = 'Smartcard'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1058,6 +1104,7 @@ def smartcard_from_string(xml_string):
 class ActivationLimit(ActivationLimitType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ActivationLimit element """
 
+    __slots__ = []
     c_tag = 'ActivationLimit'
     c_namespace = NAMESPACE
     c_children = ActivationLimitType_.c_children.copy()
@@ -1073,6 +1120,7 @@ def activation_limit_from_string(xml_string):
 class PreviousSession(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:PreviousSession element """
 
+    __slots__ = []
     c_tag = 'PreviousSession'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1088,6 +1136,7 @@ def previous_session_from_string(xml_string):
 class ResumeSession(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ResumeSession element """
 
+    __slots__ = []
     c_tag = 'ResumeSession'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1103,6 +1152,7 @@ def resume_session_from_string(xml_string):
 class ZeroKnowledge(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ZeroKnowledge element """
 
+    __slots__ = []
     c_tag = 'ZeroKnowledge'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1118,6 +1168,7 @@ def zero_knowledge_from_string(xml_string):
 class SharedSecretChallengeResponse(SharedSecretChallengeResponseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:SharedSecretChallengeResponse element """
 
+    __slots__ = []
     c_tag = 'SharedSecretChallengeResponse'
     c_namespace = NAMESPACE
     c_children = SharedSecretChallengeResponseType_.c_children.copy()
@@ -1134,6 +1185,7 @@ def shared_secret_challenge_response_from_string(xml_string):
 class DigSig(PublicKeyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:DigSig element """
 
+    __slots__ = []
     c_tag = 'DigSig'
     c_namespace = NAMESPACE
     c_children = PublicKeyType_.c_children.copy()
@@ -1149,6 +1201,7 @@ def dig_sig_from_string(xml_string):
 class AsymmetricDecryption(PublicKeyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:AsymmetricDecryption element """
 
+    __slots__ = []
     c_tag = 'AsymmetricDecryption'
     c_namespace = NAMESPACE
     c_children = PublicKeyType_.c_children.copy()
@@ -1164,6 +1217,7 @@ def asymmetric_decryption_from_string(xml_string):
 class AsymmetricKeyAgreement(PublicKeyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:AsymmetricKeyAgreement element """
 
+    __slots__ = []
     c_tag = 'AsymmetricKeyAgreement'
     c_namespace = NAMESPACE
     c_children = PublicKeyType_.c_children.copy()
@@ -1180,6 +1234,7 @@ def asymmetric_key_agreement_from_string(xml_string):
 class IPAddress(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:IPAddress element """
 
+    __slots__ = []
     c_tag = 'IPAddress'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1195,6 +1250,7 @@ def ip_address_from_string(xml_string):
 class SharedSecretDynamicPlaintext(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:SharedSecretDynamicPlaintext element """
 
+    __slots__ = []
     c_tag = 'SharedSecretDynamicPlaintext'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1211,6 +1267,7 @@ def shared_secret_dynamic_plaintext_from_string(xml_string):
 class HTTP(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:HTTP element """
 
+    __slots__ = []
     c_tag = 'HTTP'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1226,6 +1283,7 @@ def http_from_string(xml_string):
 class IPSec(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:IPSec element """
 
+    __slots__ = []
     c_tag = 'IPSec'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1241,6 +1299,7 @@ def ip_sec_from_string(xml_string):
 class WTLS(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:WTLS element """
 
+    __slots__ = []
     c_tag = 'WTLS'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1256,6 +1315,7 @@ def wtls_from_string(xml_string):
 class MobileNetworkNoEncryption(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:MobileNetworkNoEncryption element """
 
+    __slots__ = []
     c_tag = 'MobileNetworkNoEncryption'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1272,6 +1332,7 @@ def mobile_network_no_encryption_from_string(xml_string):
 class MobileNetworkRadioEncryption(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:MobileNetworkRadioEncryption element """
 
+    __slots__ = []
     c_tag = 'MobileNetworkRadioEncryption'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1288,6 +1349,7 @@ def mobile_network_radio_encryption_from_string(xml_string):
 class MobileNetworkEndToEndEncryption(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:MobileNetworkEndToEndEncryption element """
 
+    __slots__ = []
     c_tag = 'MobileNetworkEndToEndEncryption'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1304,6 +1366,7 @@ def mobile_network_end_to_end_encryption_from_string(xml_string):
 class SSL(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:SSL element """
 
+    __slots__ = []
     c_tag = 'SSL'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1319,6 +1382,7 @@ def ssl_from_string(xml_string):
 class PSTN(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:PSTN element """
 
+    __slots__ = []
     c_tag = 'PSTN'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1334,6 +1398,7 @@ def pstn_from_string(xml_string):
 class ISDN(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ISDN element """
 
+    __slots__ = []
     c_tag = 'ISDN'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1349,6 +1414,7 @@ def isdn_from_string(xml_string):
 class ADSL(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ADSL element """
 
+    __slots__ = []
     c_tag = 'ADSL'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1364,6 +1430,7 @@ def adsl_from_string(xml_string):
 class SwitchAudit(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:SwitchAudit element """
 
+    __slots__ = []
     c_tag = 'SwitchAudit'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1379,6 +1446,7 @@ def switch_audit_from_string(xml_string):
 class DeactivationCallCenter(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:DeactivationCallCenter element """
 
+    __slots__ = []
     c_tag = 'DeactivationCallCenter'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1395,6 +1463,8 @@ def deactivation_call_center_from_string(xml_string):
 class IdentificationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:IdentificationType element """
 
+    __slots__ = ['nym', 'physical_verification', 'written_consent',
+                 'governing_agreements', 'extension']
     c_tag = 'IdentificationType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1451,6 +1521,7 @@ def identification_type__from_string(xml_string):
 class RestrictedPassword(RestrictedPasswordType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:RestrictedPassword element """
 
+    __slots__ = []
     c_tag = 'RestrictedPassword'
     c_namespace = NAMESPACE
     c_children = RestrictedPasswordType_.c_children.copy()
@@ -1466,6 +1537,8 @@ def restricted_password_from_string(xml_string):
 class ActivationPinType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ActivationPinType element """
 
+    __slots__ = ['length', 'alphabet', 'generation', 'activation_limit',
+                 'extension']
     c_tag = 'ActivationPinType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1524,6 +1597,7 @@ def activation_pin_type__from_string(xml_string):
 class SecurityAuditType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:SecurityAuditType element """
 
+    __slots__ = ['switch_audit', 'extension']
     c_tag = 'SecurityAuditType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1563,6 +1637,7 @@ def security_audit_type__from_string(xml_string):
 class AuthenticatorBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:AuthenticatorBaseType element """
 
+    __slots__ = ['restricted_password']
     c_tag = 'AuthenticatorBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1596,6 +1671,9 @@ def authenticator_base_type__from_string(xml_string):
 class AuthenticatorTransportProtocolType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:AuthenticatorTransportProtocolType element """
 
+    __slots__ = ['ssl', 'mobile_network_radio_encryption',
+                 'mobile_network_end_to_end_encryption', 'wtls', 'ip_sec',
+                 'extension']
     c_tag = 'AuthenticatorTransportProtocolType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1662,6 +1740,7 @@ def authenticator_transport_protocol_type__from_string(xml_string):
 class Identification(IdentificationType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:Identification element """
 
+    __slots__ = []
     c_tag = 'Identification'
     c_namespace = NAMESPACE
     c_children = IdentificationType_.c_children.copy()
@@ -1677,6 +1756,7 @@ def identification_from_string(xml_string):
 class ActivationPin(ActivationPinType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ActivationPin element """
 
+    __slots__ = []
     c_tag = 'ActivationPin'
     c_namespace = NAMESPACE
     c_children = ActivationPinType_.c_children.copy()
@@ -1692,6 +1772,7 @@ def activation_pin_from_string(xml_string):
 class Authenticator(AuthenticatorBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:Authenticator element """
 
+    __slots__ = []
     c_tag = 'Authenticator'
     c_namespace = NAMESPACE
     c_children = AuthenticatorBaseType_.c_children.copy()
@@ -1707,6 +1788,7 @@ def authenticator_from_string(xml_string):
 class AuthenticatorTransportProtocol(AuthenticatorTransportProtocolType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:AuthenticatorTransportProtocol element """
 
+    __slots__ = []
     c_tag = 'AuthenticatorTransportProtocol'
     c_namespace = NAMESPACE
     c_children = AuthenticatorTransportProtocolType_.c_children.copy()
@@ -1723,6 +1805,7 @@ def authenticator_transport_protocol_from_string(xml_string):
 class SecurityAudit(SecurityAuditType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:SecurityAudit element """
 
+    __slots__ = []
     c_tag = 'SecurityAudit'
     c_namespace = NAMESPACE
     c_children = SecurityAuditType_.c_children.copy()
@@ -1738,6 +1821,7 @@ def security_audit_from_string(xml_string):
 class OperationalProtectionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:OperationalProtectionType element """
 
+    __slots__ = ['security_audit', 'deactivation_call_center', 'extension']
     c_tag = 'OperationalProtectionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1785,6 +1869,8 @@ def operational_protection_type__from_string(xml_string):
 class PrincipalAuthenticationMechanismType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:PrincipalAuthenticationMechanismType element """
 
+    __slots__ = ['preauth', 'password', 'restricted_password', 'token',
+                 'smartcard', 'activation_pin', 'extension']
     c_tag = 'PrincipalAuthenticationMechanismType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1854,6 +1940,7 @@ def principal_authentication_mechanism_type__from_string(xml_string):
 class KeyActivationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:KeyActivationType element """
 
+    __slots__ = ['activation_pin', 'extension']
     c_tag = 'KeyActivationType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1893,6 +1980,7 @@ def key_activation_type__from_string(xml_string):
 class KeyActivation(KeyActivationType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:KeyActivation element """
 
+    __slots__ = []
     c_tag = 'KeyActivation'
     c_namespace = NAMESPACE
     c_children = KeyActivationType_.c_children.copy()
@@ -1908,6 +1996,7 @@ def key_activation_from_string(xml_string):
 class PrincipalAuthenticationMechanism(PrincipalAuthenticationMechanismType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:PrincipalAuthenticationMechanism element """
 
+    __slots__ = []
     c_tag = 'PrincipalAuthenticationMechanism'
     c_namespace = NAMESPACE
     c_children = PrincipalAuthenticationMechanismType_.c_children.copy()
@@ -1924,6 +2013,7 @@ def principal_authentication_mechanism_from_string(xml_string):
 class OperationalProtection(OperationalProtectionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:OperationalProtection element """
 
+    __slots__ = []
     c_tag = 'OperationalProtection'
     c_namespace = NAMESPACE
     c_children = OperationalProtectionType_.c_children.copy()
@@ -1939,6 +2029,7 @@ def operational_protection_from_string(xml_string):
 class PrivateKeyProtectionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:PrivateKeyProtectionType element """
 
+    __slots__ = ['key_activation', 'key_storage', 'key_sharing', 'extension']
     c_tag = 'PrivateKeyProtectionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1994,6 +2085,7 @@ def private_key_protection_type__from_string(xml_string):
 class SecretKeyProtectionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:SecretKeyProtectionType element """
 
+    __slots__ = ['key_activation', 'key_storage', 'extension']
     c_tag = 'SecretKeyProtectionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2040,6 +2132,8 @@ def secret_key_protection_type__from_string(xml_string):
 class AuthnMethodBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:AuthnMethodBaseType element """
 
+    __slots__ = ['principal_authentication_mechanism', 'authenticator',
+                 'authenticator_transport_protocol', 'extension']
     c_tag = 'AuthnMethodBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2090,6 +2184,7 @@ def authn_method_base_type__from_string(xml_string):
 class SecretKeyProtection(SecretKeyProtectionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:SecretKeyProtection element """
 
+    __slots__ = []
     c_tag = 'SecretKeyProtection'
     c_namespace = NAMESPACE
     c_children = SecretKeyProtectionType_.c_children.copy()
@@ -2105,6 +2200,7 @@ def secret_key_protection_from_string(xml_string):
 class PrivateKeyProtection(PrivateKeyProtectionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:PrivateKeyProtection element """
 
+    __slots__ = []
     c_tag = 'PrivateKeyProtection'
     c_namespace = NAMESPACE
     c_children = PrivateKeyProtectionType_.c_children.copy()
@@ -2120,6 +2216,7 @@ def private_key_protection_from_string(xml_string):
 class AuthnMethod(AuthnMethodBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:AuthnMethod element """
 
+    __slots__ = []
     c_tag = 'AuthnMethod'
     c_namespace = NAMESPACE
     c_children = AuthnMethodBaseType_.c_children.copy()
@@ -2135,6 +2232,8 @@ def authn_method_from_string(xml_string):
 class TechnicalProtectionBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:TechnicalProtectionBaseType element """
 
+    __slots__ = ['private_key_protection', 'secret_key_protection',
+                 'extension']
     c_tag = 'TechnicalProtectionBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2183,6 +2282,7 @@ def technical_protection_base_type__from_string(xml_string):
 class TechnicalProtection(TechnicalProtectionBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:TechnicalProtection element """
 
+    __slots__ = []
     c_tag = 'TechnicalProtection'
     c_namespace = NAMESPACE
     c_children = TechnicalProtectionBaseType_.c_children.copy()
@@ -2198,6 +2298,9 @@ def technical_protection_from_string(xml_string):
 class AuthnContextDeclarationBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:AuthnContextDeclarationBaseType element """
 
+    __slots__ = ['id', 'identification', 'technical_protection',
+                 'operational_protection', 'authn_method',
+                 'governing_agreements', 'extension']
     c_tag = 'AuthnContextDeclarationBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2266,6 +2369,7 @@ def authn_context_declaration_base_type__from_string(xml_string):
 class AuthenticationContextDeclaration(AuthnContextDeclarationBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:AuthenticationContextDeclaration element """
 
+    __slots__ = []
     c_tag = 'AuthenticationContextDeclaration'
     c_namespace = NAMESPACE
     c_children = AuthnContextDeclarationBaseType_.c_children.copy()
@@ -2282,6 +2386,13 @@ def authentication_context_declaration_from_string(xml_string):
 class ComplexAuthenticatorType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ComplexAuthenticatorType element """
 
+    __slots__ = ['previous_session', 'resume_session', 'dig_sig', 'password',
+                 'restricted_password', 'zero_knowledge',
+                 'shared_secret_challenge_response',
+                 'shared_secret_dynamic_plaintext', 'ip_address',
+                 'asymmetric_decryption', 'asymmetric_key_agreement',
+                 'subscriber_line_number', 'user_suffix',
+                 'complex_authenticator', 'extension']
     c_tag = 'ComplexAuthenticatorType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2404,6 +2515,7 @@ def complex_authenticator_type__from_string(xml_string):
 class ComplexAuthenticator(ComplexAuthenticatorType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:PasswordProtectedTransport:ComplexAuthenticator element """
 
+    __slots__ = []
     c_tag = 'ComplexAuthenticator'
     c_namespace = NAMESPACE
     c_children = ComplexAuthenticatorType_.c_children.copy()
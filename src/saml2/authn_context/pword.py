@@ -20,6 +20,7 @@ NAMESPACE = 'urn:oasis:names:tc:SAML:2.0:ac:classes:Password'
 class PhysicalVerification(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:PhysicalVerification element """
 
+    __slots__ = ['credential_level']
     c_tag = 'PhysicalVerification'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -49,6 +50,7 @@ def physical_verification_from_string(xml_string):
 class Generation(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:Generation element """
 
+    __slots__ = ['mechanism']
     c_tag = 'Generation'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -78,6 +80,7 @@ def generation_from_string(xml_string):
 class NymType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:nymType element """
 
+    __slots__ = []
     c_tag = 'nymType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN',
@@ -95,6 +98,7 @@ def nym_type__from_string(xml_string):
 class GoverningAgreementRefType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:GoverningAgreementRefType element """
 
+    __slots__ = ['governing_agreement_ref']
     c_tag = 'GoverningAgreementRefType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -126,6 +130,7 @@ def governing_agreement_ref_type__from_string(xml_string):
 class KeySharingType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:KeySharingType element """
 
+    __slots__ = ['sharing']
     c_tag = 'KeySharingType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -155,6 +160,7 @@ def key_sharing_type__from_string(xml_string):
 class RestrictedLengthType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:RestrictedLengthType element """
 
+    __slots__ = ['min', 'max']
     c_tag = 'RestrictedLengthType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -187,6 +193,7 @@ def restricted_length_type__from_string(xml_string):
 class AlphabetType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:AlphabetType element """
 
+    __slots__ = ['required_chars', 'excluded_chars', 'case']
     c_tag = 'AlphabetType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -222,6 +229,7 @@ def alphabet_type__from_string(xml_string):
 class DeviceTypeType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:DeviceTypeType element """
 
+    __slots__ = []
     c_tag = 'DeviceTypeType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN',
@@ -239,6 +247,7 @@ def device_type_type__from_string(xml_string):
 class BooleanType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:booleanType element """
 
+    __slots__ = []
     c_tag = 'booleanType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN', 'enumeration': ['true', 'false']}
@@ -255,6 +264,7 @@ def boolean_type__from_string(xml_string):
 class TimeSyncTokenType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:TimeSyncTokenType element """
 
+    __slots__ = ['device_type', 'seed_length', 'device_in_hand']
     c_tag = 'TimeSyncTokenType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -290,6 +300,7 @@ def time_sync_token_type__from_string(xml_string):
 class ActivationLimitDurationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ActivationLimitDurationType element """
 
+    __slots__ = ['duration']
     c_tag = 'ActivationLimitDurationType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -320,6 +331,7 @@ def activation_limit_duration_type__from_string(xml_string):
 class ActivationLimitUsagesType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ActivationLimitUsagesType element """
 
+    __slots__ = ['number']
     c_tag = 'ActivationLimitUsagesType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -350,6 +362,7 @@ def activation_limit_usages_type__from_string(xml_string):
 class ActivationLimitSessionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ActivationLimitSessionType element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitSessionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -366,6 +379,7 @@ def activation_limit_session_type__from_string(xml_string):
 class LengthType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:LengthType element """
 
+    __slots__ = ['min', 'max']
     c_tag = 'LengthType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -398,6 +412,7 @@ def length_type__from_string(xml_string):
 class MediumType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:mediumType element """
 
+    __slots__ = []
     c_tag = 'mediumType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN',
@@ -416,6 +431,7 @@ def medium_type__from_string(xml_string):
 class KeyStorageType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:KeyStorageType element """
 
+    __slots__ = ['medium']
     c_tag = 'KeyStorageType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -445,6 +461,7 @@ def key_storage_type__from_string(xml_string):
 class ExtensionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ExtensionType element """
 
+    __slots__ = []
     c_tag = 'ExtensionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -460,6 +477,7 @@ def extension_type__from_string(xml_string):
 class KeySharing(KeySharingType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:KeySharing element """
 
+    __slots__ = []
     c_tag = 'KeySharing'
     c_namespace = NAMESPACE
     c_children = KeySharingType_.c_children.copy()
@@ -475,6 +493,7 @@ def key_sharing_from_string(xml_string):
 class KeyStorage(KeyStorageType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:KeyStorage element """
 
+    __slots__ = []
     c_tag = 'KeyStorage'
     c_namespace = NAMESPACE
     c_children = KeyStorageType_.c_children.copy()
@@ -490,6 +509,7 @@ def key_storage_from_string(xml_string):
 class TimeSyncToken(TimeSyncTokenType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:TimeSyncToken element """
 
+    __slots__ = []
     c_tag = 'TimeSyncToken'
     c_namespace = NAMESPACE
     c_children = TimeSyncTokenType_.c_children.copy()
@@ -505,6 +525,7 @@ def time_sync_token_from_string(xml_string):
 class Length(LengthType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:Length element """
 
+    __slots__ = []
     c_tag = 'Length'
     c_namespace = NAMESPACE
     c_children = LengthType_.c_children.copy()
@@ -520,6 +541,7 @@ def length_from_string(xml_string):
 class GoverningAgreementRef(GoverningAgreementRefType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:GoverningAgreementRef element """
 
+    __slots__ = []
     c_tag = 'GoverningAgreementRef'
     c_namespace = NAMESPACE
     c_children = GoverningAgreementRefType_.c_children.copy()
@@ -535,6 +557,7 @@ def governing_agreement_ref_from_string(xml_string):
 class GoverningAgreementsType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:GoverningAgreementsType element """
 
+    __slots__ = ['governing_agreement_ref']
     c_tag = 'GoverningAgreementsType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -567,6 +590,8 @@ def governing_agreements_type__from_string(xml_string):
 
 
 class RestrictedPasswordType_Length(RestrictedLengthType_):
+    __slots__ = []
+
     c_tag = 'Length'
     c_namespace = NAMESPACE
     c_children = RestrictedLengthType_.c_children.copy()
@@ -583,6 +608,7 @@ def restricted_password_type__length_from_string(xml_string):
 class Alphabet(AlphabetType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:Alphabet element """
 
+    __slots__ = []
     c_tag = 'Alphabet'
     c_namespace = NAMESPACE
     c_children = AlphabetType_.c_children.copy()
@@ -598,6 +624,7 @@ def alphabet_from_string(xml_string):
 class ActivationLimitDuration(ActivationLimitDurationType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ActivationLimitDuration element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitDuration'
     c_namespace = NAMESPACE
     c_children = ActivationLimitDurationType_.c_children.copy()
@@ -614,6 +641,7 @@ def activation_limit_duration_from_string(xml_string):
 class ActivationLimitUsages(ActivationLimitUsagesType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ActivationLimitUsages element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitUsages'
     c_namespace = NAMESPACE
     c_children = ActivationLimitUsagesType_.c_children.copy()
@@ -629,6 +657,7 @@ def activation_limit_usages_from_string(xml_string):
 class ActivationLimitSession(ActivationLimitSessionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ActivationLimitSession element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitSession'
     c_namespace = NAMESPACE
     c_children = ActivationLimitSessionType_.c_children.copy()
@@ -645,6 +674,7 @@ def activation_limit_session_from_string(xml_string):
 class Extension(ExtensionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:Extension element """
 
+    __slots__ = []
     c_tag = 'Extension'
     c_namespace = NAMESPACE
     c_children = ExtensionType_.c_children.copy()
@@ -660,6 +690,7 @@ def extension_from_string(xml_string):
 class SharedSecretChallengeResponseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:SharedSecretChallengeResponseType element """
 
+    __slots__ = ['method', 'extension']
     c_tag = 'SharedSecretChallengeResponseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -696,6 +727,7 @@ def shared_secret_challenge_response_type__from_string(xml_string):
 class PublicKeyType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:PublicKeyType element """
 
+    __slots__ = ['key_validation', 'extension']
     c_tag = 'PublicKeyType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -731,6 +763,7 @@ def public_key_type__from_string(xml_string):
 class GoverningAgreements(GoverningAgreementsType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:GoverningAgreements element """
 
+    __slots__ = []
     c_tag = 'GoverningAgreements'
     c_namespace = NAMESPACE
     c_children = GoverningAgreementsType_.c_children.copy()
@@ -746,6 +779,8 @@ def governing_agreements_from_string(xml_string):
 class PasswordType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:PasswordType element """
 
+    __slots__ = ['external_verification', 'length', 'alphabet', 'generation',
+                 'extension']
     c_tag = 'PasswordType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -798,6 +833,7 @@ def password_type__from_string(xml_string):
 class RestrictedPasswordType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:RestrictedPasswordType element """
 
+    __slots__ = ['external_verification', 'length', 'generation', 'extension']
     c_tag = 'RestrictedPasswordType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -845,6 +881,7 @@ def restricted_password_type__from_string(xml_string):
 class TokenType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:TokenType element """
 
+    __slots__ = ['time_sync_token', 'extension']
     c_tag = 'TokenType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -882,6 +919,8 @@ def token_type__from_string(xml_string):
 class ActivationLimitType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ActivationLimitType element """
 
+    __slots__ = ['activation_limit_duration', 'activation_limit_usages',
+                 'activation_limit_session']
     c_tag = 'ActivationLimitType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -929,6 +968,7 @@ def activation_limit_type__from_string(xml_string):
 class ExtensionOnlyType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ExtensionOnlyType element """
 
+    __slots__ = ['extension']
     c_tag = 'ExtensionOnlyType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -961,6 +1001,7 @@ def extension_only_type__from_string(xml_string):
 class WrittenConsent(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:WrittenConsent element """
 
+    __slots__ = []
     c_tag = 'WrittenConsent'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -976,6 +1017,7 @@ def written_consent_from_string(xml_string):
 class SubscriberLineNumber(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:SubscriberLineNumber element """
 
+    __slots__ = []
     c_tag = 'SubscriberLineNumber'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -991,6 +1033,7 @@ def subscriber_line_number_from_string(xml_string):
 class UserSuffix(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:UserSuffix element """
 
+    __slots__ = []
     c_tag = 'UserSuffix'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1006,6 +1049,7 @@ def user_suffix_from_string(xml_string):
 class Password(PasswordType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:Password element """
 
+    __slots__ = []
     c_tag = 'Password'
     c_namespace = NAMESPACE
     c_children = PasswordType_.c_children.copy()
@@ -1021,6 +1065,7 @@ def password_from_string(xml_string):
 class Token(TokenType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:Token element """
 
+    __slots__ = []
     c_tag = 'Token'
     c_namespace = NAMESPACE
     c_children = TokenType_.c_children.copy()
@@ -1036,6 +1081,7 @@ def token_from_string(xml_string):
 class Smartcard(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:Smartcard element """
 
+    __slots__ = []
     c_tag = 'Smartcard'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1051,6 +1097,7 @@ def smartcard_from_string(xml_string):
 class ActivationLimit(ActivationLimitType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ActivationLimit element """
 
+    __slots__ = []
     c_tag = 'ActivationLimit'
     c_namespace = NAMESPACE
     c_children = ActivationLimitType_.c_children.copy()
@@ -1066,6 +1113,7 @@ def activation_limit_from_string(xml_string):
 class PreviousSession(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:PreviousSession element """
 
+    __slots__ = []
     c_tag = 'PreviousSession'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1081,6 +1129,7 @@ def previous_session_from_string(xml_string):
 class ResumeSession(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ResumeSession element """
 
+    __slots__ = []
     c_tag = 'ResumeSession'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1096,6 +1145,7 @@ def resume_session_from_string(xml_string):
 class ZeroKnowledge(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ZeroKnowledge element """
 
+    __slots__ = []
     c_tag = 'ZeroKnowledge'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1111,6 +1161,7 @@ def zero_knowledge_from_string(xml_string):
 class SharedSecretChallengeResponse(SharedSecretChallengeResponseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:SharedSecretChallengeResponse element """
 
+    __slots__ = []
     c_tag = 'SharedSecretChallengeResponse'
     c_namespace = NAMESPACE
     c_children = SharedSecretChallengeResponseType_.c_children.copy()
@@ -1127,6 +1178,7 @@ def shared_secret_challenge_response_from_string(xml_string):
 class DigSig(PublicKeyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:DigSig element """
 
+    __slots__ = []
     c_tag = 'DigSig'
     c_namespace = NAMESPACE
     c_children = PublicKeyType_.c_children.copy()
@@ -1142,6 +1194,7 @@ def dig_sig_from_string(xml_string):
 class AsymmetricDecryption(PublicKeyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:AsymmetricDecryption element """
 
+    __slots__ = []
     c_tag = 'AsymmetricDecryption'
     c_namespace = NAMESPACE
     c_children = PublicKeyType_.c_children.copy()
@@ -1157,6 +1210,7 @@ def asymmetric_decryption_from_string(xml_string):
 class AsymmetricKeyAgreement(PublicKeyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:AsymmetricKeyAgreement element """
 
+    __slots__ = []
     c_tag = 'AsymmetricKeyAgreement'
     c_namespace = NAMESPACE
     c_children = PublicKeyType_.c_children.copy()
@@ -1173,6 +1227,7 @@ def asymmetric_key_agreement_from_string(xml_string):
 class IPAddress(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:IPAddress element """
 
+    __slots__ = []
     c_tag = 'IPAddress'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1188,6 +1243,7 @@ def ip_address_from_string(xml_string):
 class SharedSecretDynamicPlaintext(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:SharedSecretDynamicPlaintext element """
 
+    __slots__ = []
     c_tag = 'SharedSecretDynamicPlaintext'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1204,6 +1260,7 @@ def shared_secret_dynamic_plaintext_from_string(xml_string):
 class HTTP(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:HTTP element """
 
+    __slots__ = []
     c_tag = 'HTTP'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1219,6 +1276,7 @@ def http_from_string(xml_string):
 class IPSec(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:IPSec element """
 
+    __slots__ = []
     c_tag = 'IPSec'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1234,6 +1292,7 @@ def ip_sec_from_string(xml_string):
 class WTLS(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:WTLS element """
 
+    __slots__ = []
     c_tag = 'WTLS'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1249,6 +1308,7 @@ def wtls_from_string(xml_string):
 class MobileNetworkNoEncryption(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:MobileNetworkNoEncryption element """
 
+    __slots__ = []
     c_tag = 'MobileNetworkNoEncryption'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1265,6 +1325,7 @@ def mobile_network_no_encryption_from_string(xml_string):
 class MobileNetworkRadioEncryption(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:MobileNetworkRadioEncryption element """
 
+    __slots__ = []
     c_tag = 'MobileNetworkRadioEncryption'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1281,6 +1342,7 @@ def mobile_network_radio_encryption_from_string(xml_string):
 class MobileNetworkEndToEndEncryption(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:MobileNetworkEndToEndEncryption element """
 
+    __slots__ = []
     c_tag = 'MobileNetworkEndToEndEncryption'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1297,6 +1359,7 @@ def mobile_network_end_to_end_encryption_from_string(xml_string):
 class SSL(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:SSL element """
 
+    __slots__ = []
     c_tag = 'SSL'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1312,6 +1375,7 @@ def ssl_from_string(xml_string):
 class PSTN(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:PSTN element """
 
+    __slots__ = []
     c_tag = 'PSTN'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1327,6 +1391,7 @@ def pstn_from_string(xml_string):
 class ISDN(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ISDN element """
 
+    __slots__ = []
     c_tag = 'ISDN'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1342,6 +1407,7 @@ def isdn_from_string(xml_string):
 class ADSL(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ADSL element """
 
+    __slots__ = []
     c_tag = 'ADSL'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1357,6 +1423,7 @@ def adsl_from_string(xml_string):
 class SwitchAudit(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:SwitchAudit element """
 
+    __slots__ = []
     c_tag = 'SwitchAudit'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1372,6 +1439,7 @@ def switch_audit_from_string(xml_string):
 class DeactivationCallCenter(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:DeactivationCallCenter element """
 
+    __slots__ = []
     c_tag = 'DeactivationCallCenter'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1388,6 +1456,8 @@ def deactivation_call_center_from_string(xml_string):
 class IdentificationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:IdentificationType element """
 
+    __slots__ = ['nym', 'physical_verification', 'written_consent',
+                 'governing_agreements', 'extension']
     c_tag = 'IdentificationType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1443,6 +1513,10 @@ def identification_type__from_string(xml_string):
 class AuthenticatorTransportProtocolType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:AuthenticatorTransportProtocolType element """
 
+    __slots__ = ['http', 'ssl', 'mobile_network_no_encryption',
+                 'mobile_network_radio_encryption',
+                 'mobile_network_end_to_end_encryption', 'wtls', 'ip_sec',
+                 'pstn', 'isdn', 'adsl', 'extension']
     c_tag = 'AuthenticatorTransportProtocolType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1532,6 +1606,7 @@ def authenticator_transport_protocol_type__from_string(xml_string):
 class RestrictedPassword(RestrictedPasswordType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:RestrictedPassword element """
 
+    __slots__ = []
     c_tag = 'RestrictedPassword'
     c_namespace = NAMESPACE
     c_children = RestrictedPasswordType_.c_children.copy()
@@ -1547,6 +1622,8 @@ def restricted_password_from_string(xml_string):
 class ActivationPinType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ActivationPinType element """
 
+    __slots__ = ['length', 'alphabet', 'generation', 'activation_limit',
+                 'extension']
     c_tag = 'ActivationPinType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1602,6 +1679,7 @@ def activation_pin_type__from_string(xml_string):
 class SecurityAuditType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:SecurityAuditType element """
 
+    __slots__ = ['switch_audit', 'extension']
     c_tag = 'SecurityAuditType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1640,6 +1718,7 @@ def security_audit_type__from_string(xml_string):
 class AuthenticatorBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:AuthenticatorBaseType element """
 
+    __slots__ = ['restricted_password']
     c_tag = 'AuthenticatorBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1674,6 +1753,7 @@ def authenticator_base_type__from_string(xml_string):
 class Identification(IdentificationType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:Identification element """
 
+    __slots__ = []
     c_tag = 'Identification'
     c_namespace = NAMESPACE
     c_children = IdentificationType_.c_children.copy()
@@ -1689,6 +1769,7 @@ def identification_from_string(xml_string):
 class ActivationPin(ActivationPinType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ActivationPin element """
 
+    __slots__ = []
     c_tag = 'ActivationPin'
     c_namespace = NAMESPACE
     c_children = ActivationPinType_.c_children.copy()
@@ -1704,6 +1785,7 @@ def activation_pin_from_string(xml_string):
 class Authenticator(AuthenticatorBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:Authenticator element """
 
+    __slots__ = []
     c_tag = 'Authenticator'
     c_namespace = NAMESPACE
     c_children = AuthenticatorBaseType_.c_children.copy()
@@ -1719,6 +1801,7 @@ def authenticator_from_string(xml_string):
 class AuthenticatorTransportProtocol(AuthenticatorTransportProtocolType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:AuthenticatorTransportProtocol element """
 
+    __slots__ = []
     c_tag = 'AuthenticatorTransportProtocol'
     c_namespace = NAMESPACE
     c_children = AuthenticatorTransportProtocolType_.c_children.copy()
@@ -1735,6 +1818,7 @@ def authenticator_transport_protocol_from_string(xml_string):
 class SecurityAudit(SecurityAuditType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:SecurityAudit element """
 
+    __slots__ = []
     c_tag = 'SecurityAudit'
     c_namespace = NAMESPACE
     c_children = SecurityAuditType_.c_children.copy()
@@ -1750,6 +1834,7 @@ def security_audit_from_string(xml_string):
 class OperationalProtectionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:OperationalProtectionType element """
 
+    __slots__ = ['security_audit', 'deactivation_call_center', 'extension']
     c_tag = 'OperationalProtectionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1796,6 +1881,8 @@ def operational_protection_type__from_string(xml_string):
 class PrincipalAuthenticationMechanismType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:PrincipalAuthenticationMechanismType element """
 
+    __slots__ = ['preauth', 'password', 'restricted_password', 'token',
+                 'smartcard', 'activation_pin', 'extension']
     c_tag = 'PrincipalAuthenticationMechanismType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1861,6 +1948,7 @@ def principal_authentication_mechanism_type__from_string(xml_string):
 class KeyActivationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:KeyActivationType element """
 
+    __slots__ = ['activation_pin', 'extension']
     c_tag = 'KeyActivationType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1899,6 +1987,7 @@ def key_activation_type__from_string(xml_string):
 class KeyActivation(KeyActivationType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:KeyActivation element """
 
+    __slots__ = []
     c_tag = 'KeyActivation'
     c_namespace = NAMESPACE
     c_children = KeyActivationType_.c_children.copy()
@@ -1914,6 +2003,7 @@ def key_activation_from_string(xml_string):
 class PrincipalAuthenticationMechanism(PrincipalAuthenticationMechanismType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:PrincipalAuthenticationMechanism element """
 
+    __slots__ = []
     c_tag = 'PrincipalAuthenticationMechanism'
     c_namespace = NAMESPACE
     c_children = PrincipalAuthenticationMechanismType_.c_children.copy()
@@ -1930,6 +2020,7 @@ def principal_authentication_mechanism_from_string(xml_string):
 class OperationalProtection(OperationalProtectionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:OperationalProtection element """
 
+    __slots__ = []
     c_tag = 'OperationalProtection'
     c_namespace = NAMESPACE
     c_children = OperationalProtectionType_.c_children.copy()
@@ -1945,6 +2036,7 @@ def operational_protection_from_string(xml_string):
 class PrivateKeyProtectionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:PrivateKeyProtectionType element """
 
+    __slots__ = ['key_activation', 'key_storage', 'key_sharing', 'extension']
     c_tag = 'PrivateKeyProtectionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1997,6 +2089,7 @@ def private_key_protection_type__from_string(xml_string):
 class SecretKeyProtectionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:SecretKeyProtectionType element """
 
+    __slots__ = ['key_activation', 'key_storage', 'extension']
     c_tag = 'SecretKeyProtectionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2042,6 +2135,8 @@ def secret_key_protection_type__from_string(xml_string):
 class AuthnMethodBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:AuthnMethodBaseType element """
 
+    __slots__ = ['principal_authentication_mechanism', 'authenticator',
+                 'authenticator_transport_protocol', 'extension']
     c_tag = 'AuthnMethodBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2093,6 +2188,7 @@ def authn_method_base_type__from_string(xml_string):
 class SecretKeyProtection(SecretKeyProtectionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:SecretKeyProtection element """
 
+    __slots__ = []
     c_tag = 'SecretKeyProtection'
     c_namespace = NAMESPACE
     c_children = SecretKeyProtectionType_.c_children.copy()
@@ -2108,6 +2204,7 @@ def secret_key_protection_from_string(xml_string):
 class PrivateKeyProtection(PrivateKeyProtectionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:PrivateKeyProtection element """
 
+    __slots__ = []
     c_tag = 'PrivateKeyProtection'
     c_namespace = NAMESPACE
     c_children = PrivateKeyProtectionType_.c_children.copy()
@@ -2123,6 +2220,7 @@ def private_key_protection_from_string(xml_string):
 class AuthnMethod(AuthnMethodBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:AuthnMethod element """
 
+    __slots__ = []
     c_tag = 'AuthnMethod'
     c_namespace = NAMESPACE
     c_children = AuthnMethodBaseType_.c_children.copy()
@@ -2138,6 +2236,8 @@ def authn_method_from_string(xml_string):
 class TechnicalProtectionBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:TechnicalProtectionBaseType element """
 
+    __slots__ = ['private_key_protection', 'secret_key_protection',
+                 'extension']
     c_tag = 'TechnicalProtectionBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2184,6 +2284,7 @@ def technical_protection_base_type__from_string(xml_string):
 class TechnicalProtection(TechnicalProtectionBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:TechnicalProtection element """
 
+    __slots__ = []
     c_tag = 'TechnicalProtection'
     c_namespace = NAMESPACE
     c_children = TechnicalProtectionBaseType_.c_children.copy()
@@ -2199,6 +2300,9 @@ def technical_protection_from_string(xml_string):
 class AuthnContextDeclarationBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:AuthnContextDeclarationBaseType element """
 
+    __slots__ = ['id', 'identification', 'technical_protection',
+                 'operational_protection', 'authn_method',
+                 'governing_agreements', 'extension']
     c_tag = 'AuthnContextDeclarationBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2266,6 +2370,7 @@ def authn_context_declaration_base_type__from_string(xml_string):
 class AuthenticationContextDeclaration(AuthnContextDeclarationBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:AuthenticationContextDeclaration element """
 
+    __slots__ = []
     c_tag = 'AuthenticationContextDeclaration'
     c_namespace = NAMESPACE
     c_children = AuthnContextDeclarationBaseType_.c_children.copy()
@@ -2284,6 +2389,13 @@ def authentication_context_declaration_from_string(xml_string):
 class ComplexAuthenticatorType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ComplexAuthenticatorType element """
 
+    __slots__ = ['previous_session', 'resume_session', 'dig_sig', 'password',
+                 'restricted_password', 'zero_knowledge',
+                 'shared_secret_challenge_response',
+                 'shared_secret_dynamic_plaintext', 'ip_address',
+                 'asymmetric_decryption', 'asymmetric_key_agreement',
+                 'subscriber_line_number', 'user_suffix',
+                 'complex_authenticator', 'extension']
     c_tag = 'ComplexAuthenticatorType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2402,6 +2514,7 @@ def complex_authenticator_type__from_string(xml_string):
 class ComplexAuthenticator(ComplexAuthenticatorType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:Password:ComplexAuthenticator element """
 
+    __slots__ = []
     c_tag = 'ComplexAuthenticator'
     c_namespace = NAMESPACE
     c_children = ComplexAuthenticatorType_.c_children.copy()
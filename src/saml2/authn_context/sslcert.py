@@ -19,6 +19,7 @@ NAMESPACE = 'urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient'
 class PhysicalVerification(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:PhysicalVerification element """
 
+    __slots__ = ['credential_level']
     c_tag = 'PhysicalVerification'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -48,6 +49,7 @@ def physical_verification_from_string(xml_string):
 class Generation(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:Generation element """
 
+    __slots__ = ['mechanism']
     c_tag = 'Generation'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -77,6 +79,7 @@ def generation_from_string(xml_string):
 class NymType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:nymType element """
 
+    __slots__ = []
     c_tag = 'nymType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN',
@@ -94,6 +97,7 @@ def nym_type__from_string(xml_string):
 class GoverningAgreementRefType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:GoverningAgreementRefType element """
 
+    __slots__ = ['governing_agreement_ref']
     c_tag = 'GoverningAgreementRefType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -125,6 +129,7 @@ def governing_agreement_ref_type__from_string(xml_string):
 class KeySharingType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:KeySharingType element """
 
+    __slots__ = ['sharing']
     c_tag = 'KeySharingType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -154,6 +159,7 @@ def key_sharing_type__from_string(xml_string):
 class RestrictedLengthType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:RestrictedLengthType element """
 
+    __slots__ = ['min', 'max']
     c_tag = 'RestrictedLengthType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -186,6 +192,7 @@ def restricted_length_type__from_string(xml_string):
 class AlphabetType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:AlphabetType element """
 
+    __slots__ = ['required_chars', 'excluded_chars', 'case']
     c_tag = 'AlphabetType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -221,6 +228,7 @@ def alphabet_type__from_string(xml_string):
 class DeviceTypeType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:DeviceTypeType element """
 
+    __slots__ = []
     c_tag = 'DeviceTypeType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN',
@@ -238,6 +246,7 @@ def device_type_type__from_string(xml_string):
 class BooleanType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:booleanType element """
 
+    __slots__ = []
     c_tag = 'booleanType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN', 'enumeration': ['true', 'false']}
@@ -254,6 +263,7 @@ def boolean_type__from_string(xml_string):
 class TimeSyncTokenType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:TimeSyncTokenType element """
 
+    __slots__ = ['device_type', 'seed_length', 'device_in_hand']
     c_tag = 'TimeSyncTokenType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -289,6 +299,7 @@ def time_sync_token_type__from_string(xml_string):
 class ActivationLimitDurationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ActivationLimitDurationType element """
 
+    __slots__ = ['duration']
     c_tag = 'ActivationLimitDurationType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -319,6 +330,7 @@ def activation_limit_duration_type__from_string(xml_string):
 class ActivationLimitUsagesType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ActivationLimitUsagesType element """
 
+    __slots__ = ['number']
     c_tag = 'ActivationLimitUsagesType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -349,6 +361,7 @@ def activation_limit_usages_type__from_string(xml_string):
 class ActivationLimitSessionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ActivationLimitSessionType element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitSessionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -365,6 +378,7 @@ def activation_limit_session_type__from_string(xml_string):
 class LengthType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:LengthType element """
 
+    __slots__ = ['min', 'max']
     c_tag = 'LengthType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -397,6 +411,7 @@ def length_type__from_string(xml_string):
 class MediumType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:mediumType element """
 
+    __slots__ = []
     c_tag = 'mediumType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:NMTOKEN',
@@ -415,6 +430,7 @@ def medium_type__from_string(xml_string):
 class KeyStorageType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:KeyStorageType element """
 
+    __slots__ = ['medium']
     c_tag = 'KeyStorageType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -444,6 +460,7 @@ def key_storage_type__from_string(xml_string):
 class ExtensionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ExtensionType element """
 
+    __slots__ = []
     c_tag = 'ExtensionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -459,6 +476,7 @@ def extension_type__from_string(xml_string):
 class PublicKeyType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:PublicKeyType element """
 
+    __slots__ = []
     c_tag = 'PublicKeyType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -485,6 +503,7 @@ def public_key_type__from_string(xml_string):
 class KeySharing(KeySharingType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:KeySharing element """
 
+    __slots__ = []
     c_tag = 'KeySharing'
     c_namespace = NAMESPACE
     c_children = KeySharingType_.c_children.copy()
@@ -500,6 +519,7 @@ def key_sharing_from_string(xml_string):
 class KeyStorage(KeyStorageType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:KeyStorage element """
 
+    __slots__ = []
     c_tag = 'KeyStorage'
     c_namespace = NAMESPACE
     c_children = KeyStorageType_.c_children.copy()
@@ -515,6 +535,7 @@ def key_storage_from_string(xml_string):
 class TimeSyncToken(TimeSyncTokenType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:TimeSyncToken element """
 
+    __slots__ = []
     c_tag = 'TimeSyncToken'
     c_namespace = NAMESPACE
     c_children = TimeSyncTokenType_.c_children.copy()
@@ -530,6 +551,7 @@ def time_sync_token_from_string(xml_string):
 class Length(LengthType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:Length element """
 
+    __slots__ = []
     c_tag = 'Length'
     c_namespace = NAMESPACE
     c_children = LengthType_.c_children.copy()
@@ -545,6 +567,7 @@ def length_from_string(xml_string):
 class DigSig(PublicKeyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:DigSig element """
 
+    __slots__ = []
     c_tag = 'DigSig'
     c_namespace = NAMESPACE
     c_children = PublicKeyType_.c_children.copy()
@@ -560,6 +583,7 @@ def dig_sig_from_string(xml_string):
 class AsymmetricDecryption(PublicKeyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:AsymmetricDecryption element """
 
+    __slots__ = []
     c_tag = 'AsymmetricDecryption'
     c_namespace = NAMESPACE
     c_children = PublicKeyType_.c_children.copy()
@@ -575,6 +599,7 @@ def asymmetric_decryption_from_string(xml_string):
 class AsymmetricKeyAgreement(PublicKeyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:AsymmetricKeyAgreement element """
 
+    __slots__ = []
     c_tag = 'AsymmetricKeyAgreement'
     c_namespace = NAMESPACE
     c_children = PublicKeyType_.c_children.copy()
@@ -591,6 +616,7 @@ def asymmetric_key_agreement_from_string(xml_string):
 class GoverningAgreementRef(GoverningAgreementRefType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:GoverningAgreementRef element """
 
+    __slots__ = []
     c_tag = 'GoverningAgreementRef'
     c_namespace = NAMESPACE
     c_children = GoverningAgreementRefType_.c_children.copy()
@@ -606,6 +632,7 @@ def governing_agreement_ref_from_string(xml_string):
 class GoverningAgreementsType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:GoverningAgreementsType element """
 
+    __slots__ = ['governing_agreement_ref']
     c_tag = 'GoverningAgreementsType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -638,6 +665,8 @@ def governing_agreements_type__from_string(xml_string):
 
 
 class RestrictedPasswordType_Length(RestrictedLengthType_):
+    __slots__ = []
+
     c_tag = 'Length'
     c_namespace = NAMESPACE
     c_children = RestrictedLengthType_.c_children.copy()
@@ -654,6 +683,7 @@ def restricted_password_type__length_from_string(xml_string):
 class Alphabet(AlphabetType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:Alphabet element """
 
+    __slots__ = []
     c_tag = 'Alphabet'
     c_namespace = NAMESPACE
     c_children = AlphabetType_.c_children.copy()
@@ -669,6 +699,7 @@ def alphabet_from_string(xml_string):
 class ActivationLimitDuration(ActivationLimitDurationType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ActivationLimitDuration element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitDuration'
     c_namespace = NAMESPACE
     c_children = ActivationLimitDurationType_.c_children.copy()
@@ -685,6 +716,7 @@ def activation_limit_duration_from_string(xml_string):
 class ActivationLimitUsages(ActivationLimitUsagesType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ActivationLimitUsages element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitUsages'
     c_namespace = NAMESPACE
     c_children = ActivationLimitUsagesType_.c_children.copy()
@@ -700,6 +732,7 @@ def activation_limit_usages_from_string(xml_string):
 class ActivationLimitSession(ActivationLimitSessionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ActivationLimitSession element """
 
+    __slots__ = []
     c_tag = 'ActivationLimitSession'
     c_namespace = NAMESPACE
     c_children = ActivationLimitSessionType_.c_children.copy()
@@ -716,6 +749,7 @@ def activation_limit_session_from_string(xml_string):
 class Extension(ExtensionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:Extension element """
 
+    __slots__ = []
     c_tag = 'Extension'
     c_namespace = NAMESPACE
     c_children = ExtensionType_.c_children.copy()
@@ -731,6 +765,7 @@ def extension_from_string(xml_string):
 class AuthenticatorBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:AuthenticatorBaseType element """
 
+    __slots__ = ['dig_sig']
     c_tag = 'AuthenticatorBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -763,6 +798,7 @@ def authenticator_base_type__from_string(xml_string):
 class Authenticator(AuthenticatorBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:Authenticator element """
 
+    __slots__ = []
     c_tag = 'Authenticator'
     c_namespace = NAMESPACE
     c_children = AuthenticatorBaseType_.c_children.copy()
@@ -778,6 +814,7 @@ def authenticator_from_string(xml_string):
 class SharedSecretChallengeResponseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:SharedSecretChallengeResponseType element """
 
+    __slots__ = ['method', 'extension']
     c_tag = 'SharedSecretChallengeResponseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -815,6 +852,7 @@ def shared_secret_challenge_response_type__from_string(xml_string):
 class GoverningAgreements(GoverningAgreementsType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:GoverningAgreements element """
 
+    __slots__ = []
     c_tag = 'GoverningAgreements'
     c_namespace = NAMESPACE
     c_children = GoverningAgreementsType_.c_children.copy()
@@ -830,6 +868,8 @@ def governing_agreements_from_string(xml_string):
 class PasswordType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:PasswordType element """
 
+    __slots__ = ['external_verification', 'length', 'alphabet', 'generation',
+                 'extension']
     c_tag = 'PasswordType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -883,6 +923,7 @@ def password_type__from_string(xml_string):
 class RestrictedPasswordType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:RestrictedPasswordType element """
 
+    __slots__ = ['external_verification', 'length', 'generation', 'extension']
     c_tag = 'RestrictedPasswordType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -931,6 +972,7 @@ def restricted_password_type__from_string(xml_string):
 class TokenType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:TokenType element """
 
+    __slots__ = ['time_sync_token', 'extension']
     c_tag = 'TokenType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -969,6 +1011,8 @@ def token_type__from_string(xml_string):
 class ActivationLimitType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ActivationLimitType element """
 
+    __slots__ = ['activation_limit_duration', 'activation_limit_usages',
+                 'activation_limit_session']
     c_tag = 'ActivationLimitType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1016,6 +1060,7 @@ def activation_limit_type__from_string(xml_string):
 class ExtensionOnlyType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ExtensionOnlyType element """
 
+    __slots__ = ['extension']
     c_tag = 'ExtensionOnlyType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1049,6 +1094,7 @@ def extension_only_type__from_string(xml_string):
 class WrittenConsent(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:WrittenConsent element """
 
+    __slots__ = []
     c_tag = 'WrittenConsent'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1064,6 +1110,7 @@ def written_consent_from_string(xml_string):
 class SubscriberLineNumber(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:SubscriberLineNumber element """
 
+    __slots__ = []
     c_tag = 'SubscriberLineNumber'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1079,6 +1126,7 @@ def subscriber_line_number_from_string(xml_string):
 class UserSuffix(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:UserSuffix element """
 
+    __slots__ = []
     c_tag = 'UserSuffix'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1094,6 +1142,7 @@ def user_suffix_from_string(xml_string):
 class Password(PasswordType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:Password element """
 
+    __slots__ = []
     c_tag = 'Password'
     c_namespace = NAMESPACE
     c_children = PasswordType_.c_children.copy()
@@ -1109,6 +1158,7 @@ def password_from_string(xml_string):
 class Token(TokenType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:Token element """
 
+    __slots__ = []
     c_tag = 'Token'
     c_namespace = NAMESPACE
     c_children = TokenType_.c_children.copy()
@@ -1124,6 +1174,7 @@ def token_from_string(xml_string):
 class Smartcard(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:Smartcard element """
 
+    __slots__ = []
     c_tag = 'Smartcard'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1139,6 +1190,7 @@ def smartcard_from_string(xml_string):
 class ActivationLimit(ActivationLimitType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ActivationLimit element """
 
+    __slots__ = []
     c_tag = 'ActivationLimit'
     c_namespace = NAMESPACE
     c_children = ActivationLimitType_.c_children.copy()
@@ -1154,6 +1206,7 @@ def activation_limit_from_string(xml_string):
 class PreviousSession(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:PreviousSession element """
 
+    __slots__ = []
     c_tag = 'PreviousSession'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1169,6 +1222,7 @@ def previous_session_from_string(xml_string):
 class ResumeSession(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ResumeSession element """
 
+    __slots__ = []
     c_tag = 'ResumeSession'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1184,6 +1238,7 @@ def resume_session_from_string(xml_string):
 class ZeroKnowledge(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ZeroKnowledge element """
 
+    __slots__ = []
     c_tag = 'ZeroKnowledge'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1199,6 +1254,7 @@ def zero_knowledge_from_string(xml_string):
 class SharedSecretChallengeResponse(SharedSecretChallengeResponseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:SharedSecretChallengeResponse element """
 
+    __slots__ = []
     c_tag = 'SharedSecretChallengeResponse'
     c_namespace = NAMESPACE
     c_children = SharedSecretChallengeResponseType_.c_children.copy()
@@ -1215,6 +1271,7 @@ def shared_secret_challenge_response_from_string(xml_string):
 class IPAddress(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:IPAddress element """
 
+    __slots__ = []
     c_tag = 'IPAddress'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1230,6 +1287,7 @@ def ip_address_from_string(xml_string):
 class SharedSecretDynamicPlaintext(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:SharedSecretDynamicPlaintext element """
 
+    __slots__ = []
     c_tag = 'SharedSecretDynamicPlaintext'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1246,6 +1304,7 @@ def shared_secret_dynamic_plaintext_from_string(xml_string):
 class HTTP(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:HTTP element """
 
+    __slots__ = []
     c_tag = 'HTTP'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1261,6 +1320,7 @@ def http_from_string(xml_string):
 class IPSec(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:IPSec element """
 
+    __slots__ = []
     c_tag = 'IPSec'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1276,6 +1336,7 @@ def ip_sec_from_string(xml_string):
 class WTLS(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:WTLS element """
 
+    __slots__ = []
     c_tag = 'WTLS'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1291,6 +1352,7 @@ def wtls_from_string(xml_string):
 class MobileNetworkNoEncryption(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:MobileNetworkNoEncryption element """
 
+    __slots__ = []
     c_tag = 'MobileNetworkNoEncryption'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1307,6 +1369,7 @@ def mobile_network_no_encryption_from_string(xml_string):
 class MobileNetworkRadioEncryption(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:MobileNetworkRadioEncryption element """
 
+    __slots__ = []
     c_tag = 'MobileNetworkRadioEncryption'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1323,6 +1386,7 @@ def mobile_network_radio_encryption_from_string(xml_string):
 class MobileNetworkEndToEndEncryption(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:MobileNetworkEndToEndEncryption element """
 
+    __slots__ = []
     c_tag = 'MobileNetworkEndToEndEncryption'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1339,6 +1403,7 @@ def mobile_network_end_to_end_encryption_from_string(xml_string):
 class SSL(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:SSL element """
 
+    __slots__ = []
     c_tag = 'SSL'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1354,6 +1419,7 @@ def ssl_from_string(xml_string):
 class PSTN(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:PSTN element """
 
+    __slots__ = []
     c_tag = 'PSTN'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1369,6 +1435,7 @@ def pstn_from_string(xml_string):
 class ISDN(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ISDN element """
 
+    __slots__ = []
     c_tag = 'ISDN'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1384,6 +1451,7 @@ def isdn_from_string(xml_string):
 class ADSL(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ADSL element """
 
+    __slots__ = []
     c_tag = 'ADSL'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1399,6 +1467,7 @@ def adsl_from_string(xml_string):
 class SwitchAudit(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:SwitchAudit element """
 
+    __slots__ = []
     c_tag = 'SwitchAudit'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1414,6 +1483,7 @@ def switch_audit_from_string(xml_string):
 class DeactivationCallCenter(ExtensionOnlyType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:DeactivationCallCenter element """
 
+    __slots__ = []
     c_tag = 'DeactivationCallCenter'
     c_namespace = NAMESPACE
     c_children = ExtensionOnlyType_.c_children.copy()
@@ -1430,6 +1500,8 @@ def deactivation_call_center_from_string(xml_string):
 class IdentificationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:IdentificationType element """
 
+    __slots__ = ['nym', 'physical_verification', 'written_consent',
+                 'governing_agreements', 'extension']
     c_tag = 'IdentificationType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1486,6 +1558,7 @@ def identification_type__from_string(xml_string):
 class RestrictedPassword(RestrictedPasswordType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:RestrictedPassword element """
 
+    __slots__ = []
     c_tag = 'RestrictedPassword'
     c_namespace = NAMESPACE
     c_children = RestrictedPasswordType_.c_children.copy()
@@ -1501,6 +1574,8 @@ def restricted_password_from_string(xml_string):
 class ActivationPinType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ActivationPinType element """
 
+    __slots__ = ['length', 'alphabet', 'generation', 'activation_limit',
+                 'extension']
     c_tag = 'ActivationPinType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1557,6 +1632,7 @@ def activation_pin_type__from_string(xml_string):
 class SecurityAuditType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:SecurityAuditType element """
 
+    __slots__ = ['switch_audit', 'extension']
     c_tag = 'SecurityAuditType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1596,6 +1672,7 @@ def security_audit_type__from_string(xml_string):
 class PrincipalAuthenticationMechanismType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:PrincipalAuthenticationMechanismType element """
 
+    __slots__ = ['preauth', 'restricted_password']
     c_tag = 'PrincipalAuthenticationMechanismType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1632,6 +1709,7 @@ def principal_authentication_mechanism_type__from_string(xml_string):
 class AuthenticatorTransportProtocolType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:AuthenticatorTransportProtocolType element """
 
+    __slots__ = ['ssl', 'wtls', 'extension']
     c_tag = 'AuthenticatorTransportProtocolType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1676,6 +1754,7 @@ def authenticator_transport_protocol_type__from_string(xml_string):
 class Identification(IdentificationType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:Identification element """
 
+    __slots__ = []
     c_tag = 'Identification'
     c_namespace = NAMESPACE
     c_children = IdentificationType_.c_children.copy()
@@ -1691,6 +1770,7 @@ def identification_from_string(xml_string):
 class ActivationPin(ActivationPinType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ActivationPin element """
 
+    __slots__ = []
     c_tag = 'ActivationPin'
     c_namespace = NAMESPACE
     c_children = ActivationPinType_.c_children.copy()
@@ -1706,6 +1786,7 @@ def activation_pin_from_string(xml_string):
 class PrincipalAuthenticationMechanism(PrincipalAuthenticationMechanismType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:PrincipalAuthenticationMechanism element """
 
+    __slots__ = []
     c_tag = 'PrincipalAuthenticationMechanism'
     c_namespace = NAMESPACE
     c_children = PrincipalAuthenticationMechanismType_.c_children.copy()
@@ -1722,6 +1803,7 @@ def principal_authentication_mechanism_from_string(xml_string):
 class AuthenticatorTransportProtocol(AuthenticatorTransportProtocolType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:AuthenticatorTransportProtocol element """
 
+    __slots__ = []
     c_tag = 'AuthenticatorTransportProtocol'
     c_namespace = NAMESPACE
     c_children = AuthenticatorTransportProtocolType_.c_children.copy()
@@ -1738,6 +1820,7 @@ def authenticator_transport_protocol_from_string(xml_string):
 class SecurityAudit(SecurityAuditType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:SecurityAudit element """
 
+    __slots__ = []
     c_tag = 'SecurityAudit'
     c_namespace = NAMESPACE
     c_children = SecurityAuditType_.c_children.copy()
@@ -1753,6 +1836,7 @@ def security_audit_from_string(xml_string):
 class OperationalProtectionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:OperationalProtectionType element """
 
+    __slots__ = ['security_audit', 'deactivation_call_center', 'extension']
     c_tag = 'OperationalProtectionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1800,6 +1884,7 @@ def operational_protection_type__from_string(xml_string):
 class KeyActivationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:KeyActivationType element """
 
+    __slots__ = ['activation_pin', 'extension']
     c_tag = 'KeyActivationType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1839,6 +1924,8 @@ def key_activation_type__from_string(xml_string):
 class AuthnMethodBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:AuthnMethodBaseType element """
 
+    __slots__ = ['principal_authentication_mechanism', 'authenticator',
+                 'authenticator_transport_protocol', 'extension']
     c_tag = 'AuthnMethodBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1889,6 +1976,7 @@ def authn_method_base_type__from_string(xml_string):
 class KeyActivation(KeyActivationType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:KeyActivation element """
 
+    __slots__ = []
     c_tag = 'KeyActivation'
     c_namespace = NAMESPACE
     c_children = KeyActivationType_.c_children.copy()
@@ -1904,6 +1992,7 @@ def key_activation_from_string(xml_string):
 class AuthnMethod(AuthnMethodBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:AuthnMethod element """
 
+    __slots__ = []
     c_tag = 'AuthnMethod'
     c_namespace = NAMESPACE
     c_children = AuthnMethodBaseType_.c_children.copy()
@@ -1919,6 +2008,7 @@ def authn_method_from_string(xml_string):
 class OperationalProtection(OperationalProtectionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:OperationalProtection element """
 
+    __slots__ = []
     c_tag = 'OperationalProtection'
     c_namespace = NAMESPACE
     c_children = OperationalProtectionType_.c_children.copy()
@@ -1934,6 +2024,7 @@ def operational_protection_from_string(xml_string):
 class PrivateKeyProtectionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:PrivateKeyProtectionType element """
 
+    __slots__ = ['key_activation', 'key_storage', 'key_sharing', 'extension']
     c_tag = 'PrivateKeyProtectionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1987,6 +2078,7 @@ def private_key_protection_type__from_string(xml_string):
 class SecretKeyProtectionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:SecretKeyProtectionType element """
 
+    __slots__ = ['key_activation', 'key_storage', 'extension']
     c_tag = 'SecretKeyProtectionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2033,6 +2125,7 @@ def secret_key_protection_type__from_string(xml_string):
 class SecretKeyProtection(SecretKeyProtectionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:SecretKeyProtection element """
 
+    __slots__ = []
     c_tag = 'SecretKeyProtection'
     c_namespace = NAMESPACE
     c_children = SecretKeyProtectionType_.c_children.copy()
@@ -2048,6 +2141,7 @@ def secret_key_protection_from_string(xml_string):
 class PrivateKeyProtection(PrivateKeyProtectionType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:PrivateKeyProtection element """
 
+    __slots__ = []
     c_tag = 'PrivateKeyProtection'
     c_namespace = NAMESPACE
     c_children = PrivateKeyProtectionType_.c_children.copy()
@@ -2063,6 +2157,8 @@ def private_key_protection_from_string(xml_string):
 class TechnicalProtectionBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:TechnicalProtectionBaseType element """
 
+    __slots__ = ['private_key_protection', 'secret_key_protection',
+                 'extension']
     c_tag = 'TechnicalProtectionBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2110,6 +2206,7 @@ def technical_protection_base_type__from_string(xml_string):
 class TechnicalProtection(TechnicalProtectionBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:TechnicalProtection element """
 
+    __slots__ = []
     c_tag = 'TechnicalProtection'
     c_namespace = NAMESPACE
     c_children = TechnicalProtectionBaseType_.c_children.copy()
@@ -2125,6 +2222,9 @@ def technical_protection_from_string(xml_string):
 class AuthnContextDeclarationBaseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:AuthnContextDeclarationBaseType element """
 
+    __slots__ = ['id', 'identification', 'technical_protection',
+                 'operational_protection', 'authn_method',
+                 'governing_agreements', 'extension']
     c_tag = 'AuthnContextDeclarationBaseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2193,6 +2293,7 @@ def authn_context_declaration_base_type__from_string(xml_string):
 class AuthenticationContextDeclaration(AuthnContextDeclarationBaseType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:AuthenticationContextDeclaration element """
 
+    __slots__ = []
     c_tag = 'AuthenticationContextDeclaration'
     c_namespace = NAMESPACE
     c_children = AuthnContextDeclarationBaseType_.c_children.copy()
@@ -2211,6 +2312,13 @@ def authentication_context_declaration_from_string(xml_string):
 class ComplexAuthenticatorType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ComplexAuthenticatorType element """
 
+    __slots__ = ['previous_session', 'resume_session', 'dig_sig', 'password',
+                 'restricted_password', 'zero_knowledge',
+                 'shared_secret_challenge_response',
+                 'shared_secret_dynamic_plaintext', 'ip_address',
+                 'asymmetric_decryption', 'asymmetric_key_agreement',
+                 'subscriber_line_number', 'user_suffix',
+                 'complex_authenticator', 'extension']
     c_tag = 'ComplexAuthenticatorType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -2330,6 +2438,7 @@ def complex_authenticator_type__from_string(xml_string):
 class ComplexAuthenticator(ComplexAuthenticatorType_):
     """The urn:oasis:names:tc:SAML:2.0:ac:classes:TLSClient:ComplexAuthenticator element """
 
+    __slots__ = []
     c_tag = 'ComplexAuthenticator'
     c_namespace = NAMESPACE
     c_children = ComplexAuthenticatorType_.c_children.copy()
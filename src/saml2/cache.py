@@ -1,12 +1,24 @@
 #!/usr/bin/env python
 
+import calendar
+import heapq
 import shelve
+import threading
+import time
 from saml2.ident import code, decode
 from saml2 import time_util, SAMLError
 import logging
 
 logger = logging.getLogger(__name__)
 
+# ShelveCache writes to disc after this many changes
+FLUSH_EVERY = 100
+# or when this many seconds has passed since the last time it did
+FLUSH_INTERVAL = 5
+
+# Max number of expired entries sweep() removes when called from set()
+SWEEP_LIMIT = 10
+
 # The assumption is that any subject may consist of data
 # gathered from several different sources, all with their own
 # timeout time.
@@ -20,6 +32,19 @@ class CacheError(SAMLError):
     pass
 
 
+def expiry_time(not_on_or_after):
+    """
+    :param not_on_or_after: A time as seconds since the epoch, a
+        time.struct_time in UTC or a time string
+    :return: The time as seconds since the epoch
+    """
+    if isinstance(not_on_or_after, basestring):
+        not_on_or_after = time_util.str_to_time(not_on_or_after)
+    if isinstance(not_on_or_after, time.struct_time):
+        return calendar.timegm(not_on_or_after)
+    return not_on_or_after
+
+
 class Cache(object):
     def __init__(self, filename=None):
         if filename:
@@ -28,6 +53,58 @@ class Cache(object):
         else:
             self._db = {}
             self._sync = False
+        # (expiry time, coded name_id, entity_id) of every entry, may
+        # contain entries that have since been changed or removed
+        self._expiry = []
+        for cni in self._db.keys():
+            for entity_id, (timestamp, _) in self._db[cni].items():
+                self._index(cni, entity_id, timestamp)
+
+    def _index(self, cni, entity_id, not_on_or_after):
+        # A reset entry (not_on_or_after == 0) is kept
+        if not_on_or_after:
+            heapq.heappush(self._expiry, (expiry_time(not_on_or_after), cni,
+                                          entity_id))
+
+    def _timestamp(self, cni, entity_id):
+        return self._db[cni][entity_id][0]
+
+    def _remove(self, cni, entity_id):
+        del self._db[cni][entity_id]
+        if not self._db[cni]:
+            del self._db[cni]
+
+    def sweep(self, limit=None):
+        """ Remove expired session information from the cache, the ones
+        that expired first are removed first.
+
+        :param limit: The max number of index entries to look at, None
+            means go on until there are no expired entries left.
+        :return: The number of entries removed
+        """
+        now = time.time()
+        removed = 0
+        looked_at = 0
+        while self._expiry and self._expiry[0][0] < now:
+            if limit is not None and looked_at >= limit:
+                break
+            looked_at += 1
+            (expires, cni, entity_id) = heapq.heappop(self._expiry)
+            try:
+                timestamp = self._timestamp(cni, entity_id)
+            except KeyError:
+                continue
+            # It may have been given a new time since
+            if timestamp and expiry_time(timestamp) == expires:
+                self._remove(cni, entity_id)
+                removed += 1
+
+        if removed and self._sync:
+            try:
+                self._db.sync()
+            except AttributeError:
+                pass
+        return removed
 
     def delete(self, name_id):
         """
@@ -56,8 +133,7 @@ class Cache(object):
         """
         if not entities:
             try:
-                cni = code(name_id)
-                entities = self._db[cni].keys()
+                entities = self.entities(name_id)
             except KeyError:
                 return {}, []
 
@@ -115,6 +191,8 @@ class Cache(object):
             self._db[cni] = {}
 
         self._db[cni][entity_id] = (not_on_or_after, info)
+        self._index(cni, entity_id, not_on_or_after)
+        self.sweep(SWEEP_LIMIT)
         if self._sync:
             try:
                 self._db.sync()
@@ -171,3 +249,148 @@ class Cache(object):
         :return: list of subject identifiers
         """
         return [decode(c) for c in self._db.keys()]
+
+
+class ShelveCache(Cache):
+    """
+    A Cache that keeps the session information in a shelve file.
+
+    Every (subject, entity) pair is its own entry in the shelve and there
+    is one entry per subject listing its entities, so a change only
+    pickles what was changed. Changes are collected in memory and written
+    together, when FLUSH_EVERY changes has been made, at the first change
+    after FLUSH_INTERVAL seconds or when flush() or close() is called.
+    Changes that haven't been written are lost if the process dies.
+    """
+
+    _deleted = object()
+
+    def __init__(self, filename, flush_every=FLUSH_EVERY,
+                 flush_interval=FLUSH_INTERVAL):
+        Cache.__init__(self)
+        self._db = shelve.open(filename)
+        self._pending = {}
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._flushed = time.time()
+        self.lock = threading.RLock()
+        for key in self._db.keys():
+            if " " in key:
+                cni, entity_id = key.split(" ", 1)
+                self._index(cni, entity_id, self._db[key][0])
+
+    @staticmethod
+    def _key(cni, entity_id=None):
+        if entity_id is None:
+            key = cni
+        else:
+            # A coded NameID never contains a space
+            key = "%s %s" % (cni, entity_id)
+        if isinstance(key, unicode):
+            key = key.encode("utf-8")
+        return key
+
+    def _timestamp(self, cni, entity_id):
+        return self._read(self._key(cni, entity_id))[0]
+
+    def _remove(self, cni, entity_id):
+        with self.lock:
+            self._write(self._key(cni, entity_id), self._deleted)
+            entities = [e for e in self._read(self._key(cni))
+                        if e != entity_id]
+            if entities:
+                self._write(self._key(cni), entities)
+            else:
+                self._write(self._key(cni), self._deleted)
+
+    def sweep(self, limit=None):
+        with self.lock:
+            return Cache.sweep(self, limit)
+
+    def _read(self, key):
+        with self.lock:
+            try:
+                val = self._pending[key]
+            except KeyError:
+                return self._db[key]
+        if val is self._deleted:
+            raise KeyError(key)
+        return val
+
+    def _write(self, key, val):
+        with self.lock:
+            self._pending[key] = val
+            if len(self._pending) >= self.flush_every or \
+                    time.time() - self._flushed >= self.flush_interval:
+                self.flush()
+
+    def flush(self):
+        """ Write all pending changes to the shelve """
+        with self.lock:
+            for key, val in self._pending.items():
+                if val is self._deleted:
+                    try:
+                        del self._db[key]
+                    except KeyError:
+                        pass
+                else:
+                    self._db[key] = val
+            self._pending = {}
+            self._db.sync()
+            self._flushed = time.time()
+
+    def close(self):
+        self.flush()
+        self._db.close()
+
+    def delete(self, name_id):
+        cni = code(name_id)
+        with self.lock:
+            for entity_id in self._read(self._key(cni)):
+                self._write(self._key(cni, entity_id), self._deleted)
+            self._write(self._key(cni), self._deleted)
+
+    def get(self, name_id, entity_id, check_not_on_or_after=True):
+        (timestamp, info) = self._read(self._key(code(name_id), entity_id))
+        if check_not_on_or_after and time_util.after(timestamp):
+            raise ToOld("past %s" % timestamp)
+
+        return info or None
+
+    def set(self, name_id, entity_id, info, not_on_or_after=0):
+        cni = code(name_id)
+        with self.lock:
+            try:
+                entities = self._read(self._key(cni))
+            except KeyError:
+                entities = []
+            if entity_id not in entities:
+                self._write(self._key(cni), entities + [entity_id])
+            self._write(self._key(cni, entity_id), (not_on_or_after, info))
+            self._index(cni, entity_id, not_on_or_after)
+            self.sweep(SWEEP_LIMIT)
+
+    def entities(self, name_id):
+        return list(self._read(self._key(code(name_id))))
+
+    def active(self, name_id, entity_id):
+        try:
+            (timestamp, info) = self._read(self._key(code(name_id),
+                                                     entity_id))
+        except KeyError:
+            return False
+
+        if not info:
+            return False
+        else:
+            return time_util.not_on_or_after(timestamp)
+
+    def subjects(self):
+        with self.lock:
+            keys = set(self._db.keys())
+            for key, val in self._pending.items():
+                if val is self._deleted:
+                    keys.discard(key)
+                else:
+                    keys.add(key)
+        return [decode(key) for key in keys if " " not in key]
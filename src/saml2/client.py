@@ -18,7 +18,9 @@ from saml2.httpbase import HTTPError
 from saml2.s_utils import sid
 from saml2.s_utils import status_message_factory
 from saml2.s_utils import success_status_factory
+from saml2.samlp import STATUS_PARTIAL_LOGOUT
 from saml2.samlp import STATUS_REQUEST_DENIED
+from saml2.samlp import STATUS_SUCCESS
 from saml2.samlp import STATUS_UNKNOWN_PRINCIPAL
 from saml2.time_util import not_on_or_after
 from saml2.saml import AssertionIDRef
@@ -26,6 +28,8 @@ from saml2.client_base import Base
 from saml2.client_base import LogoutError
 from saml2.client_base import NoServiceDefined
 from saml2.mdstore import destinations
+from saml2.parallel import CallPool
+from saml2.parallel import wait
 
 try:
     from urlparse import parse_qs
@@ -38,6 +42,21 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def logout_status(responses):
+    """
+    Sums up the result of a logout done by Saml2Client.do_logout().
+
+    :param responses: What do_logout() returned
+    :return: STATUS_SUCCESS if all the SOAP bound logouts succeeded
+        otherwise STATUS_PARTIAL_LOGOUT. Logouts done over the front-channel
+        bindings haven't happened yet so they are not counted.
+    """
+    for response in responses.values():
+        if response is None:
+            return STATUS_PARTIAL_LOGOUT
+    return STATUS_SUCCESS
+
+
 class Saml2Client(Base):
     """ The basic pySAML2 service provider class """
 
@@ -79,7 +98,8 @@ class Saml2Client(Base):
 
         return reqid, info
 
-    def global_logout(self, name_id, reason="", expire=None, sign=None):
+    def global_logout(self, name_id, reason="", expire=None, sign=None,
+                      timeout=None):
         """ More or less a layer of indirection :-/
         Bootstrapping the whole thing by finding all the IdPs that should
         be notified.
@@ -91,6 +111,8 @@ class Saml2Client(Base):
             If this time has passed don't bother.
         :param sign: Whether the request should be signed or not.
             This also depends on what binding is used.
+        :param timeout: If given the SOAP bound logouts are done
+            concurrently, see do_logout()
         :return: Depends on which binding is used:
             If the HTTP redirect binding then a HTTP redirect,
             if SOAP binding has been used the just the result of that
@@ -104,10 +126,11 @@ class Saml2Client(Base):
 
         # find out which IdPs/AAs I should notify
         entity_ids = self.users.issuers_of_info(name_id)
-        return self.do_logout(name_id, entity_ids, reason, expire, sign)
+        return self.do_logout(name_id, entity_ids, reason, expire, sign,
+                              timeout=timeout)
 
     def do_logout(self, name_id, entity_ids, reason, expire, sign=None,
-                  expected_binding=None):
+                  expected_binding=None, timeout=None):
         """
 
         :param name_id: Identifier of the Subject (a NameID instance)
@@ -118,7 +141,15 @@ class Saml2Client(Base):
         :param sign: Whether to sign the request or not
         :param expected_binding: Specify the expected binding then not try it
             all
-        :return:
+        :param timeout: If given all the SOAP bound logout requests are
+            sent at the same time and this is the number of seconds to
+            wait for all of them to be answered. The entities that don't
+            answer in time, or don't answer with a successful
+            LogoutResponse, are given None as response instead of a
+            LogoutError being raised. Use logout_status() on the result
+            to find out whether the logout was complete.
+        :return: Dictionary with the response, or HTTP information for the
+            front-channel bindings, per entity ID
         """
         # check time
         if not not_on_or_after(expire):  # I've run out of time
@@ -128,6 +159,7 @@ class Saml2Client(Base):
 
         not_done = entity_ids[:]
         responses = {}
+        calls = []
 
         for entity_id in entity_ids:
             logger.debug("Logout from '%s'" % entity_id)
@@ -170,7 +202,11 @@ class Saml2Client(Base):
                 http_info = self.apply_binding(binding, srequest, destination,
                                                relay_state)
 
-                if binding == BINDING_SOAP:
+                if binding == BINDING_SOAP and timeout is not None:
+                    calls.append((entity_id, self.call_pool.submit(
+                        self._soap_logout, destination, http_info, timeout)))
+                    not_done.remove(entity_id)
+                elif binding == BINDING_SOAP:
                     response = self.send(**http_info)
 
                     if response and response.status_code == 200:
@@ -197,12 +233,37 @@ class Saml2Client(Base):
                 # only try one binding
                 break
 
+        if calls:
+            wait([c for _, c in calls], timeout)
+            for entity_id, call in calls:
+                if not call.done():
+                    logger.info("No logout response from '%s' in %s "
+                                "seconds" % (entity_id, timeout))
+                    responses[entity_id] = None
+                    continue
+                try:
+                    responses[entity_id] = call.result()
+                except Exception, exc:
+                    logger.info("Logout from '%s' failed: %s" % (entity_id,
+                                                                 exc))
+                    responses[entity_id] = None
+
         if not_done:
             # upstream should try later
             raise LogoutError("%s" % (entity_ids,))
 
         return responses
 
+    def _soap_logout(self, destination, http_info, timeout):
+        response = self.send(timeout=timeout, **http_info)
+        if response.status_code == 200:
+            logger.info("Response: %s" % response.text)
+            return self.parse_logout_request_response(response.text,
+                                                      BINDING_SOAP)
+        else:
+            logger.info("NOT OK response from %s" % destination)
+            return None
+
     def local_logout(self, name_id):
         """ Remove the user from the cache, equals local logout
 
@@ -243,7 +304,20 @@ class Saml2Client(Base):
                                   status["reason"], status["not_on_or_after"],
                                   status["sign"])
 
-    def _use_soap(self, destination, query_type, **kwargs):
+    @property
+    def call_pool(self):
+        """
+        The worker threads that runs the *_async methods. Created when
+        first used.
+        """
+        with self.lock:
+            try:
+                return self._call_pool
+            except AttributeError:
+                self._call_pool = CallPool()
+                return self._call_pool
+
+    def _use_soap(self, destination, query_type, timeout=None, **kwargs):
         _create_func = getattr(self, "create_%s" % query_type)
         _response_func = getattr(self, "parse_%s_response" % query_type)
         try:
@@ -254,7 +328,7 @@ class Saml2Client(Base):
 
         qid, query = _create_func(destination, **kwargs)
 
-        response = self.send_using_soap(query, destination)
+        response = self.send_using_soap(query, destination, timeout=timeout)
 
         if response.status_code == 200:
             if not response_args:
@@ -285,7 +359,8 @@ class Saml2Client(Base):
                                 evidence=None, resource=None,
                                 sp_name_qualifier=None,
                                 name_qualifier=None,
-                                consent=None, extensions=None, sign=False):
+                                consent=None, extensions=None, sign=False,
+                                timeout=None):
 
         subject = saml.Subject(
             name_id=saml.NameID(text=subject_id, format=nameid_format,
@@ -296,14 +371,16 @@ class Saml2Client(Base):
         for dest in destinations(srvs):
             resp = self._use_soap(dest, "authz_decision_query",
                                   action=action, evidence=evidence,
-                                  resource=resource, subject=subject)
+                                  resource=resource, subject=subject,
+                                  timeout=timeout)
             if resp:
                 return resp
 
         return None
 
     def do_assertion_id_request(self, assertion_ids, entity_id,
-                                consent=None, extensions=None, sign=False):
+                                consent=None, extensions=None, sign=False,
+                                timeout=None):
 
         srvs = self.metadata.assertion_id_request_service(entity_id,
                                                           BINDING_SOAP)
@@ -319,20 +396,23 @@ class Saml2Client(Base):
         for destination in destinations(srvs):
             res = self._use_soap(destination, "assertion_id_request",
                                  assertion_id_refs=_id_refs, consent=consent,
-                                 extensions=extensions, sign=sign)
+                                 extensions=extensions, sign=sign,
+                                 timeout=timeout)
             if res:
                 return res
 
         return None
 
     def do_authn_query(self, entity_id,
-                       consent=None, extensions=None, sign=False):
+                       consent=None, extensions=None, sign=False,
+                       timeout=None):
 
         srvs = self.metadata.authn_request_service(entity_id, BINDING_SOAP)
 
         for destination in destinations(srvs):
             resp = self._use_soap(destination, "authn_query", consent=consent,
-                                  extensions=extensions, sign=sign)
+                                  extensions=extensions, sign=sign,
+                                  timeout=timeout)
             if resp:
                 return resp
 
@@ -342,7 +422,7 @@ class Saml2Client(Base):
                            attribute=None, sp_name_qualifier=None,
                            name_qualifier=None, nameid_format=None,
                            real_id=None, consent=None, extensions=None,
-                           sign=False, binding=BINDING_SOAP):
+                           sign=False, binding=BINDING_SOAP, timeout=None):
         """ Does a attribute request to an attribute authority, this is
         by default done over SOAP.
 
@@ -359,6 +439,8 @@ class Saml2Client(Base):
         :param real_id: The identifier which is the key to this entity in the
             identity database
         :param binding: Which binding to use
+        :param timeout: Seconds to wait for the attribute authority, only
+            used with BINDING_SOAP
         :return: The attributes returned if BINDING_SOAP was used.
             HTTP args if BINDING_HTT_POST was used.
         """
@@ -388,7 +470,8 @@ class Saml2Client(Base):
                                   sp_name_qualifier=sp_name_qualifier,
                                   name_qualifier=name_qualifier,
                                   nameid_format=nameid_format,
-                                  response_args=response_args)
+                                  response_args=response_args,
+                                  timeout=timeout)
         elif binding == BINDING_HTTP_POST:
             mid = sid()
             query = self.create_attribute_query(destination, subject_id,
@@ -404,6 +487,26 @@ class Saml2Client(Base):
         else:
             raise SAMLError("Unsupported binding")
 
+    # The *_async methods take the same arguments as the methods they are
+    # named after but return at once with a saml2.parallel.Call. Its
+    # result() method returns what the synchronous method would have
+    # returned.
+
+    def do_authz_decision_query_async(self, *args, **kwargs):
+        return self.call_pool.submit(self.do_authz_decision_query, *args,
+                                     **kwargs)
+
+    def do_assertion_id_request_async(self, *args, **kwargs):
+        return self.call_pool.submit(self.do_assertion_id_request, *args,
+                                     **kwargs)
+
+    def do_authn_query_async(self, *args, **kwargs):
+        return self.call_pool.submit(self.do_authn_query, *args, **kwargs)
+
+    def do_attribute_query_async(self, *args, **kwargs):
+        return self.call_pool.submit(self.do_attribute_query, *args,
+                                     **kwargs)
+
     def handle_logout_request(self, request, name_id, binding, sign=False,
                               relay_state=""):
         """
@@ -139,12 +139,14 @@ class Base(Entity):
 
         # get the idp location from the metadata. If there is more than one
         # IdP in the configuration raise exception
-        eids = self.metadata.with_descriptor("idpsso")
+        # Only the entity ids, lazy metadata sources need not convert any
+        # entity to answer
+        eids = self.metadata.identity_providers()
         if len(eids) > 1:
             raise IdpUnspecified("Too many IdPs to choose from: %s" % eids)
 
         try:
-            srvs = self.metadata.single_sign_on_service(eids.keys()[0], binding)
+            srvs = self.metadata.single_sign_on_service(eids[0], binding)
             return destinations(srvs)[0]
         except IndexError:
             raise IdpUnspecified("No IdP to send to given the premises")
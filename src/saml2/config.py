@@ -18,6 +18,7 @@ from saml2 import BINDING_HTTP_POST
 from saml2 import BINDING_HTTP_ARTIFACT
 
 from saml2.attribute_converter import ac_factory
+from saml2.httpbase import POOL_MAXSIZE
 from saml2.assertion import Policy
 from saml2.mdstore import MetadataStore
 from saml2.virtual_org import VirtualOrg
@@ -63,6 +64,16 @@ COMMON_ARGS = [
     "session_storage",
     "entity_category",
     "xmlsec_path",
+    "crypto_backend",
+    "xmlsec_pool_size",
+    "cert_cache_size",
+    "verify_cache_size",
+    "verify_cache_ttl",
+    "metadata_stream",
+    "metadata_lazy",
+    "metadata_refresh_interval",
+    "http_pool_maxsize",
+    "http_timeout",
     "extension_schemas",
     "cert_handler_extra_class",
     "generate_cert_func",
@@ -214,6 +225,15 @@ class Config(object):
         self.name_qualifier = ""
         self.entity_category = ""
         self.crypto_backend = 'xmlsec1'
+        self.xmlsec_pool_size = 0
+        self.cert_cache_size = None
+        self.verify_cache_size = None
+        self.verify_cache_ttl = None
+        self.metadata_stream = False
+        self.metadata_lazy = False
+        self.metadata_refresh_interval = 0
+        self.http_pool_maxsize = POOL_MAXSIZE
+        self.http_timeout = None
         self.scope = ""
         self.allow_unknown_attributes = False
         self.allow_unsolicited = False
@@ -393,9 +413,12 @@ class Config(object):
 
         mds = MetadataStore(
             ONTS.values(), acs, self, ca_certs,
-            disable_ssl_certificate_validation=disable_validation)
+            disable_ssl_certificate_validation=disable_validation,
+            stream=self.metadata_stream, lazy=self.metadata_lazy)
 
         mds.imp(metadata_conf)
+        if self.metadata_refresh_interval:
+            mds.start_refresh(self.metadata_refresh_interval)
 
         return mds
 
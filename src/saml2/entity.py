@@ -59,6 +59,7 @@ from saml2.sigver import security_context
 from saml2.sigver import response_factory
 from saml2.sigver import SigverError
 from saml2.sigver import CryptoBackendXmlSec1
+from saml2.sigver import CryptoBackendXMLSecurity
 from saml2.sigver import make_temp
 from saml2.sigver import pre_encryption_part
 from saml2.sigver import pre_signature_part
@@ -135,7 +136,9 @@ class Entity(HTTPBase):
 
         HTTPBase.__init__(self, self.config.verify_ssl_cert,
                           self.config.ca_certs, self.config.key_file,
-                          self.config.cert_file)
+                          self.config.cert_file,
+                          pool_maxsize=self.config.http_pool_maxsize,
+                          timeout=self.config.http_timeout)
 
         if self.config.vorg:
             for vo in self.config.vorg.values():
@@ -527,7 +530,11 @@ class Entity(HTTPBase):
             if sign:
                 response.signature = pre_signature_part(response.id,
                                                         self.sec.my_cert, 1)
-            cbxs = CryptoBackendXmlSec1(self.config.xmlsec_binary)
+            if isinstance(self.sec.crypto, CryptoBackendXMLSecurity):
+                # pyXMLSecurity can not encrypt
+                cbxs = CryptoBackendXmlSec1(self.config.xmlsec_binary)
+            else:
+                cbxs = self.sec.crypto
             _, cert_file = make_temp("%s" % encrypt_cert, decode=False)
             response = cbxs.encrypt_assertion(response, cert_file,
                                               pre_encryption_part())
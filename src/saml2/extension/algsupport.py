@@ -15,6 +15,7 @@ class DigestMethodType_(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:algsupport:DigestMethodType
     element """
 
+    __slots__ = ['algorithm']
     c_tag = 'DigestMethodType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -43,6 +44,7 @@ class SigningMethodType_(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:algsupport:SigningMethodType
     element """
 
+    __slots__ = ['algorithm', 'min_key_size', 'max_key_size']
     c_tag = 'SigningMethodType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -76,6 +78,7 @@ def signing_method_type__from_string(xml_string):
 class DigestMethod(DigestMethodType_):
     """The urn:oasis:names:tc:SAML:metadata:algsupport:DigestMethod element """
 
+    __slots__ = []
     c_tag = 'DigestMethod'
     c_namespace = NAMESPACE
     c_children = DigestMethodType_.c_children.copy()
@@ -91,6 +94,7 @@ def digest_method_from_string(xml_string):
 class SigningMethod(SigningMethodType_):
     """The urn:oasis:names:tc:SAML:metadata:algsupport:SigningMethod element """
 
+    __slots__ = []
     c_tag = 'SigningMethod'
     c_namespace = NAMESPACE
     c_children = SigningMethodType_.c_children.copy()
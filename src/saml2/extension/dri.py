@@ -15,6 +15,7 @@ NAMESPACE = 'urn:oasis:names:tc:SAML:2.0:metadata:dri'
 class CreationInstant(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:dri:CreationInstant element """
 
+    __slots__ = []
     c_tag = 'CreationInstant'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'datetime'}
@@ -31,6 +32,7 @@ def creation_instant_from_string(xml_string):
 class SerialNumber(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:dri:SerialNumber element """
 
+    __slots__ = []
     c_tag = 'SerialNumber'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -47,6 +49,7 @@ def serial_number_from_string(xml_string):
 class UsagePolicy(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:dri:UsagePolicy element """
 
+    __slots__ = []
     c_tag = 'UsagePolicy'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -63,6 +66,7 @@ def usage_policy_from_string(xml_string):
 class PublisherType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:dri:PublisherType element """
 
+    __slots__ = ['publisher_id', 'creation_instant', 'serial_number']
     c_tag = 'PublisherType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -99,6 +103,7 @@ class RegistrationAuthority(md.EntityIDType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:dri:RegistrationAuthority
     element """
 
+    __slots__ = []
     c_tag = 'RegistrationAuthority'
     c_namespace = NAMESPACE
     c_children = md.EntityIDType_.c_children.copy()
@@ -115,6 +120,7 @@ class RegistrationInstant(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:dri:RegistrationInstant
     element """
 
+    __slots__ = []
     c_tag = 'RegistrationInstant'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'datetime'}
@@ -132,6 +138,7 @@ class RegistrationPolicy(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:dri:RegistrationPolicy
     element """
 
+    __slots__ = []
     c_tag = 'RegistrationPolicy'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -148,6 +155,7 @@ def registration_policy_from_string(xml_string):
 class Publisher(PublisherType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:dri:Publisher element """
 
+    __slots__ = []
     c_tag = 'Publisher'
     c_namespace = NAMESPACE
     c_children = PublisherType_.c_children.copy()
@@ -164,6 +172,8 @@ class RegistrationInfoType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:dri:RegistrationInfoType
     element """
 
+    __slots__ = ['registration_authority', 'registration_instant',
+                 'registration_policy']
     c_tag = 'RegistrationInfoType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -208,6 +218,7 @@ def registration_info_type__from_string(xml_string):
 class PublishersType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:dri:PublishersType element """
 
+    __slots__ = ['publisher']
     c_tag = 'PublishersType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -240,6 +251,7 @@ def publishers_type__from_string(xml_string):
 class RegistrationInfo(RegistrationInfoType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:dri:RegistrationInfo element """
 
+    __slots__ = []
     c_tag = 'RegistrationInfo'
     c_namespace = NAMESPACE
     c_children = RegistrationInfoType_.c_children.copy()
@@ -255,6 +267,7 @@ def registration_info_from_string(xml_string):
 class Publishers(PublishersType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:dri:Publishers element """
 
+    __slots__ = []
     c_tag = 'Publishers'
     c_namespace = NAMESPACE
     c_children = PublishersType_.c_children.copy()
@@ -270,6 +283,8 @@ def publishers_from_string(xml_string):
 class DocumentInfoType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:dri:DocumentInfoType element """
 
+    __slots__ = ['creation_instant', 'serial_number', 'usage_policy',
+                 'publishers']
     c_tag = 'DocumentInfoType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -318,6 +333,7 @@ def document_info_type__from_string(xml_string):
 class DocumentInfo(DocumentInfoType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:dri:DocumentInfo element """
 
+    __slots__ = []
     c_tag = 'DocumentInfo'
     c_namespace = NAMESPACE
     c_children = DocumentInfoType_.c_children.copy()
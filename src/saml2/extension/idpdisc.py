@@ -15,6 +15,7 @@ class DiscoveryResponse(md.IndexedEndpointType_):
     """The urn:oasis:names:tc:SAML:profiles:SSO:idp-discovery-protocol:
     DiscoveryResponse element """
 
+    __slots__ = []
     c_tag = 'DiscoveryResponse'
     c_namespace = NAMESPACE
     c_children = md.IndexedEndpointType_.c_children.copy()
@@ -14,6 +14,7 @@ NAMESPACE = 'urn:oasis:names:tc:SAML:metadata:attribute'
 class EntityAttributesType_(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:attribute:EntityAttributesType element """
 
+    __slots__ = ['attribute', 'assertion']
     c_tag = 'EntityAttributesType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -48,6 +49,7 @@ def entity_attributes_type__from_string(xml_string):
 class EntityAttributes(EntityAttributesType_):
     """The urn:oasis:names:tc:SAML:metadata:attribute:EntityAttributes element """
 
+    __slots__ = []
     c_tag = 'EntityAttributes'
     c_namespace = NAMESPACE
     c_children = EntityAttributesType_.c_children.copy()
@@ -15,6 +15,7 @@ NAMESPACE = 'urn:oasis:names:tc:SAML:metadata:rpi'
 class RegistrationPolicy(md.LocalizedURIType_):
     """The urn:oasis:names:tc:SAML:metadata:rpi:RegistrationPolicy element """
 
+    __slots__ = []
     c_tag = 'RegistrationPolicy'
     c_namespace = NAMESPACE
     c_children = md.LocalizedURIType_.c_children.copy()
@@ -30,6 +31,7 @@ def registration_policy_from_string(xml_string):
 class UsagePolicy(md.LocalizedURIType_):
     """The urn:oasis:names:tc:SAML:metadata:rpi:UsagePolicy element """
 
+    __slots__ = []
     c_tag = 'UsagePolicy'
     c_namespace = NAMESPACE
     c_children = md.LocalizedURIType_.c_children.copy()
@@ -45,6 +47,7 @@ def usage_policy_from_string(xml_string):
 class PublicationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:rpi:PublicationType element """
 
+    __slots__ = ['publisher', 'creation_instant', 'publication_id']
     c_tag = 'PublicationType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -78,6 +81,8 @@ def publication_type__from_string(xml_string):
 class RegistrationInfoType_(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:rpi:RegistrationInfoType element """
 
+    __slots__ = ['registration_authority', 'registration_instant',
+                 'registration_policy']
     c_tag = 'RegistrationInfoType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -116,6 +121,8 @@ def registration_info_type__from_string(xml_string):
 class PublicationInfoType_(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:rpi:PublicationInfoType element """
 
+    __slots__ = ['publisher', 'creation_instant', 'publication_id',
+                 'usage_policy']
     c_tag = 'PublicationInfoType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -155,6 +162,7 @@ def publication_info_type__from_string(xml_string):
 class Publication(PublicationType_):
     """The urn:oasis:names:tc:SAML:metadata:rpi:Publication element """
 
+    __slots__ = []
     c_tag = 'Publication'
     c_namespace = NAMESPACE
     c_children = PublicationType_.c_children.copy()
@@ -170,6 +178,7 @@ def publication_from_string(xml_string):
 class RegistrationInfo(RegistrationInfoType_):
     """The urn:oasis:names:tc:SAML:metadata:rpi:RegistrationInfo element """
 
+    __slots__ = []
     c_tag = 'RegistrationInfo'
     c_namespace = NAMESPACE
     c_children = RegistrationInfoType_.c_children.copy()
@@ -185,6 +194,7 @@ def registration_info_from_string(xml_string):
 class PublicationInfo(PublicationInfoType_):
     """The urn:oasis:names:tc:SAML:metadata:rpi:PublicationInfo element """
 
+    __slots__ = []
     c_tag = 'PublicationInfo'
     c_namespace = NAMESPACE
     c_children = PublicationInfoType_.c_children.copy()
@@ -200,6 +210,7 @@ def publication_info_from_string(xml_string):
 class PublicationPathType_(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:rpi:PublicationPathType element """
 
+    __slots__ = ['publication']
     c_tag = 'PublicationPathType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -230,6 +241,7 @@ def publication_path_type__from_string(xml_string):
 class PublicationPath(PublicationPathType_):
     """The urn:oasis:names:tc:SAML:metadata:rpi:PublicationPath element """
 
+    __slots__ = []
     c_tag = 'PublicationPath'
     c_namespace = NAMESPACE
     c_children = PublicationPathType_.c_children.copy()
@@ -15,6 +15,7 @@ NAMESPACE = 'urn:oasis:names:tc:SAML:metadata:ui'
 class DisplayName(md.LocalizedNameType_):
     """The urn:oasis:names:tc:SAML:metadata:ui:DisplayName element """
 
+    __slots__ = []
     c_tag = 'DisplayName'
     c_namespace = NAMESPACE
     c_children = md.LocalizedNameType_.c_children.copy()
@@ -30,6 +31,7 @@ def display_name_from_string(xml_string):
 class Description(md.LocalizedNameType_):
     """The urn:oasis:names:tc:SAML:metadata:ui:Description element """
 
+    __slots__ = []
     c_tag = 'Description'
     c_namespace = NAMESPACE
     c_children = md.LocalizedNameType_.c_children.copy()
@@ -45,6 +47,7 @@ def description_from_string(xml_string):
 class InformationURL(md.LocalizedURIType_):
     """The urn:oasis:names:tc:SAML:metadata:ui:InformationURL element """
 
+    __slots__ = []
     c_tag = 'InformationURL'
     c_namespace = NAMESPACE
     c_children = md.LocalizedURIType_.c_children.copy()
@@ -60,6 +63,7 @@ def information_url_from_string(xml_string):
 class PrivacyStatementURL(md.LocalizedURIType_):
     """The urn:oasis:names:tc:SAML:metadata:ui:PrivacyStatementURL element """
 
+    __slots__ = []
     c_tag = 'PrivacyStatementURL'
     c_namespace = NAMESPACE
     c_children = md.LocalizedURIType_.c_children.copy()
@@ -75,6 +79,7 @@ def privacy_statement_url_from_string(xml_string):
 class ListOfStrings_(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:ui:listOfStrings element """
 
+    __slots__ = []
     c_tag = 'listOfStrings'
     c_namespace = NAMESPACE
     c_value_type = {'member': 'string', 'base': 'list'}
@@ -91,6 +96,7 @@ def list_of_strings__from_string(xml_string):
 class KeywordsType_(ListOfStrings_):
     """The urn:oasis:names:tc:SAML:metadata:ui:KeywordsType element """
 
+    __slots__ = ['lang']
     c_tag = 'KeywordsType'
     c_namespace = NAMESPACE
     c_children = ListOfStrings_.c_children.copy()
@@ -119,6 +125,7 @@ def keywords_type__from_string(xml_string):
 class LogoType_(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:ui:LogoType element """
 
+    __slots__ = ['height', 'width', 'lang']
     c_tag = 'LogoType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -154,6 +161,7 @@ def logo_type__from_string(xml_string):
 class IPHint(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:ui:IPHint element """
 
+    __slots__ = []
     c_tag = 'IPHint'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -170,6 +178,7 @@ def ip_hint_from_string(xml_string):
 class DomainHint(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:ui:DomainHint element """
 
+    __slots__ = []
     c_tag = 'DomainHint'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -186,6 +195,7 @@ def domain_hint_from_string(xml_string):
 class GeolocationHint(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:ui:GeolocationHint element """
 
+    __slots__ = []
     c_tag = 'GeolocationHint'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -202,6 +212,7 @@ def geolocation_hint_from_string(xml_string):
 class Keywords(KeywordsType_):
     """The urn:oasis:names:tc:SAML:metadata:ui:Keywords element """
 
+    __slots__ = []
     c_tag = 'Keywords'
     c_namespace = NAMESPACE
     c_children = KeywordsType_.c_children.copy()
@@ -217,6 +228,7 @@ def keywords_from_string(xml_string):
 class Logo(LogoType_):
     """The urn:oasis:names:tc:SAML:metadata:ui:Logo element """
 
+    __slots__ = []
     c_tag = 'Logo'
     c_namespace = NAMESPACE
     c_children = LogoType_.c_children.copy()
@@ -232,6 +244,7 @@ def logo_from_string(xml_string):
 class DiscoHintsType_(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:ui:DiscoHintsType element """
 
+    __slots__ = ['ip_hint', 'domain_hint', 'geolocation_hint']
     c_tag = 'DiscoHintsType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -272,6 +285,8 @@ def disco_hints_type__from_string(xml_string):
 class UIInfoType_(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:ui:UIInfoType element """
 
+    __slots__ = ['display_name', 'description', 'keywords', 'logo',
+                 'information_url', 'privacy_statement_url']
     c_tag = 'UIInfoType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -328,6 +343,7 @@ def ui_info_type__from_string(xml_string):
 class DiscoHints(DiscoHintsType_):
     """The urn:oasis:names:tc:SAML:metadata:ui:DiscoHints element """
 
+    __slots__ = []
     c_tag = 'DiscoHints'
     c_namespace = NAMESPACE
     c_children = DiscoHintsType_.c_children.copy()
@@ -343,6 +359,7 @@ def disco_hints_from_string(xml_string):
 class UIInfo(UIInfoType_):
     """The urn:oasis:names:tc:SAML:metadata:ui:UIInfo element """
 
+    __slots__ = []
     c_tag = 'UIInfo'
     c_namespace = NAMESPACE
     c_children = UIInfoType_.c_children.copy()
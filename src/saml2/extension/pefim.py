@@ -10,6 +10,7 @@ NAMESPACE = 'urn:net:eustix:names:tc:PEFIM:0.0:assertion'
 class SPCertEncType_(SamlBase):
     """The urn:net:eustix:names:tc:PEFIM:0.0:assertion:SPCertEncType element """
 
+    __slots__ = ['x509_data']
     c_tag = 'SPCertEncType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -38,6 +39,7 @@ def spcertenc_type__from_string(xml_string):
 class SPCertEnc(SPCertEncType_):
     """The urn:net:eustix:names:tc:PEFIM:0.0:assertion:SPCertEnc element """
 
+    __slots__ = []
     c_tag = 'SPCertEnc'
     c_namespace = NAMESPACE
     c_children = SPCertEncType_.c_children.copy()
@@ -15,6 +15,7 @@ class RequestInitiator(md.EndpointType_):
     """The urn:oasis:names:tc:SAML:profiles:SSO:request-init:RequestInitiator
     element """
 
+    __slots__ = []
     c_tag = 'RequestInitiator'
     c_namespace = NAMESPACE
     c_children = md.EndpointType_.c_children.copy()
@@ -15,6 +15,7 @@ NAMESPACE = 'urn:mace:shibboleth:metadata:1.0'
 class Scope(SamlBase):
     """The urn:mace:shibboleth:metadata:1.0:Scope element """
 
+    __slots__ = ['regexp']
     c_tag = 'Scope'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -43,6 +44,7 @@ def scope_from_string(xml_string):
 class KeyAuthority(SamlBase):
     """The urn:mace:shibboleth:metadata:1.0:KeyAuthority element """
 
+    __slots__ = ['verify_depth', 'key_info']
     c_tag = 'KeyAuthority'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
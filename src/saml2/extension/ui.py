@@ -15,6 +15,7 @@ NAMESPACE = 'urn:oasis:names:tc:SAML:metadata:ui'
 class DisplayName(md.LocalizedNameType_):
     """The urn:oasis:names:tc:SAML:metadata:ui:DisplayName element """
 
+    __slots__ = []
     c_tag = 'DisplayName'
     c_namespace = NAMESPACE
     c_children = md.LocalizedNameType_.c_children.copy()
@@ -30,6 +31,7 @@ def display_name_from_string(xml_string):
 class Description(md.LocalizedNameType_):
     """The urn:oasis:names:tc:SAML:metadata:ui:Description element """
 
+    __slots__ = []
     c_tag = 'Description'
     c_namespace = NAMESPACE
     c_children = md.LocalizedNameType_.c_children.copy()
@@ -45,6 +47,7 @@ def description_from_string(xml_string):
 class InformationURL(md.LocalizedURIType_):
     """The urn:oasis:names:tc:SAML:metadata:ui:InformationURL element """
 
+    __slots__ = []
     c_tag = 'InformationURL'
     c_namespace = NAMESPACE
     c_children = md.LocalizedURIType_.c_children.copy()
@@ -60,6 +63,7 @@ def information_url_from_string(xml_string):
 class PrivacyStatementURL(md.LocalizedURIType_):
     """The urn:oasis:names:tc:SAML:metadata:ui:PrivacyStatementURL element """
 
+    __slots__ = []
     c_tag = 'PrivacyStatementURL'
     c_namespace = NAMESPACE
     c_children = md.LocalizedURIType_.c_children.copy()
@@ -75,6 +79,7 @@ def privacy_statement_url_from_string(xml_string):
 class LogoType_(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:ui:LogoType element """
 
+    __slots__ = ['height', 'width', 'lang']
     c_tag = 'LogoType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -110,6 +115,7 @@ def logo_type__from_string(xml_string):
 class IPHint(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:ui:IPHint element """
 
+    __slots__ = []
     c_tag = 'IPHint'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -126,6 +132,7 @@ def ip_hint_from_string(xml_string):
 class DomainHint(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:ui:DomainHint element """
 
+    __slots__ = []
     c_tag = 'DomainHint'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -142,6 +149,7 @@ def domain_hint_from_string(xml_string):
 class GeolocationHint(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:ui:GeolocationHint element """
 
+    __slots__ = []
     c_tag = 'GeolocationHint'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -158,6 +166,7 @@ def geolocation_hint_from_string(xml_string):
 class Logo(LogoType_):
     """The urn:oasis:names:tc:SAML:metadata:ui:Logo element """
 
+    __slots__ = []
     c_tag = 'Logo'
     c_namespace = NAMESPACE
     c_children = LogoType_.c_children.copy()
@@ -173,6 +182,7 @@ def logo_from_string(xml_string):
 class DiscoHintsType_(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:ui:DiscoHintsType element """
 
+    __slots__ = ['ip_hint', 'domain_hint', 'geolocation_hint']
     c_tag = 'DiscoHintsType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -213,6 +223,8 @@ def disco_hints_type__from_string(xml_string):
 class UIInfoType_(SamlBase):
     """The urn:oasis:names:tc:SAML:metadata:ui:UIInfoType element """
 
+    __slots__ = ['display_name', 'description', 'logo', 'information_url',
+                 'privacy_statement_url']
     c_tag = 'UIInfoType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -264,6 +276,7 @@ def ui_info_type__from_string(xml_string):
 class DiscoHints(DiscoHintsType_):
     """The urn:oasis:names:tc:SAML:metadata:ui:DiscoHints element """
 
+    __slots__ = []
     c_tag = 'DiscoHints'
     c_namespace = NAMESPACE
     c_children = DiscoHintsType_.c_children.copy()
@@ -279,6 +292,7 @@ def disco_hints_from_string(xml_string):
 class UIInfo(UIInfoType_):
     """The urn:oasis:names:tc:SAML:metadata:ui:UIInfo element """
 
+    __slots__ = []
     c_tag = 'UIInfo'
     c_namespace = NAMESPACE
     c_children = UIInfoType_.c_children.copy()
@@ -1,11 +1,11 @@
 import calendar
 import cookielib
 import copy
-import re
 import urllib
 import urlparse
 import requests
 import time
+from requests.adapters import HTTPAdapter
 from Cookie import SimpleCookie
 from saml2.time_util import utc_now
 from saml2 import class_name, SAMLError
@@ -49,6 +49,12 @@ PAIRS = {
 }
 
 
+# Number of hosts to keep connection pools for
+POOL_CONNECTIONS = 10
+# Max number of connections to keep per host
+POOL_MAXSIZE = 10
+
+
 class ConnectionError(SAMLError):
     pass
 
@@ -93,13 +99,50 @@ def dict2set_list(dic):
     return [(k, v) for k, v in dic.items()]
 
 
+class NoCookiesPolicy(cookielib.DefaultCookiePolicy):
+    """
+    Cookies are handled by HTTPBase, the session shouldn't keep any.
+    """
+
+    def set_ok(self, cookie, request):
+        return False
+
+    def return_ok(self, cookie, request):
+        return False
+
+
 class HTTPBase(object):
     def __init__(self, verify=True, ca_bundle=None, key_file=None,
-                 cert_file=None):
+                 cert_file=None, pool_connections=POOL_CONNECTIONS,
+                 pool_maxsize=POOL_MAXSIZE, pool_block=False, timeout=None):
+        """
+        :param verify: Whether the servers certificates should be verified
+        :param ca_bundle: CA certificates to use when verifying
+        :param key_file: Client key
+        :param cert_file: Client certificate
+        :param pool_connections: Number of hosts to keep connection pools
+            for
+        :param pool_maxsize: Max number of connections to keep per host
+        :param pool_block: If True no more than pool_maxsize connections
+            are made to a host at the same time
+        :param timeout: Seconds to wait for the server, or a 2-tuple of
+            connect and read timeouts
+        """
         self.request_args = {"allow_redirects": False}
         #self.cookies = {}
         self.cookiejar = cookielib.CookieJar()
 
+        # Keeps connections alive between requests
+        self.session = requests.Session()
+        self.session.cookies.set_policy(NoCookiesPolicy())
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              pool_block=pool_block)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if timeout:
+            self.request_args["timeout"] = timeout
+
         self.request_args["verify"] = verify
         if verify:
             if ca_bundle:
@@ -125,21 +168,41 @@ class HTTPBase(object):
         #else:
         _domain = part.hostname
 
+        # The jar keeps cookies per domain and path so instead of looking
+        # at every cookie only the domains that are suffixes of the
+        # hostname are looked up. Shorter domains and paths first so the
+        # most specific cookie wins when more than one has the same name.
+        jar = self.cookiejar._cookies
         cookie_dict = {}
+        expired = []
         now = utc_now()
-        for _, a in list(self.cookiejar._cookies.items()):
-            for _, b in a.items():
-                for cookie in list(b.values()):
-                    # print cookie
+        for i in range(len(_domain) - 1, -1, -1):
+            try:
+                paths = jar[_domain[i:]]
+            except KeyError:
+                continue
+
+            for path in sorted(paths.keys(), key=len):
+                if not part.path.startswith(path):
+                    continue
+                for cookie in paths[path].values():
                     if cookie.expires and cookie.expires <= now:
-                        continue
-                    if not re.search("%s$" % cookie.domain, _domain):
-                        continue
-                    if not re.match(cookie.path, part.path):
+                        expired.append(cookie)
                         continue
 
                     cookie_dict[cookie.name] = cookie.value
 
+        # Get rid of the expired ones as they are found
+        for cookie in expired:
+            try:
+                self.cookiejar.clear(cookie.domain, cookie.path, cookie.name)
+            except KeyError:
+                continue
+            if not jar[cookie.domain][cookie.path]:
+                del jar[cookie.domain][cookie.path]
+                if not jar[cookie.domain]:
+                    del jar[cookie.domain]
+
         return cookie_dict
 
     def set_cookie(self, kaka, request):
@@ -208,11 +271,30 @@ class HTTPBase(object):
                 new_cookie = cookielib.Cookie(**std_attr)
                 self.cookiejar.set_cookie(new_cookie)
 
-    def send(self, url, method="GET", **kwargs):
+    def send(self, url, method="GET", etag=None, last_modified=None,
+             **kwargs):
+        """
+        :param url: Where to send the request
+        :param method: The HTTP method
+        :param etag: If given the request is made conditional, the ETag of
+            the last response from the URL
+        :param last_modified: If given the request is made conditional,
+            the Last-Modified time of the last response from the URL
+        :return: The response
+        """
         _kwargs = copy.copy(self.request_args)
         if kwargs:
             _kwargs.update(kwargs)
 
+        if etag or last_modified:
+            # conditional request, a 304 response means no change
+            _headers = dict(_kwargs.get("headers") or {})
+            if etag:
+                _headers["If-None-Match"] = etag
+            if last_modified:
+                _headers["If-Modified-Since"] = last_modified
+            _kwargs["headers"] = _headers
+
         if self.cookiejar:
             _cd = self.cookies(url)
             if _cd:
@@ -233,7 +315,7 @@ class HTTPBase(object):
                     logger.debug("%s: %s" % (arg.upper(), _kwargs[arg]))
                 except KeyError:
                     pass
-            r = requests.request(method, url, **_kwargs)
+            r = self.session.request(method, url, **_kwargs)
             logger.debug("Response status: %s" % r.status_code)
         except requests.ConnectionError, exc:
             raise ConnectionError("%s" % exc)
@@ -344,7 +426,8 @@ class HTTPBase(object):
         return {"url": destination, "method": "POST",
                 "data": soap_message, "headers": headers}
 
-    def send_using_soap(self, request, destination, headers=None, sign=False):
+    def send_using_soap(self, request, destination, headers=None, sign=False,
+                        timeout=None):
         """
         Send a message using SOAP+POST
 
@@ -352,6 +435,8 @@ class HTTPBase(object):
         :param destination:
         :param headers:
         :param sign:
+        :param timeout: Seconds to wait for the server, overrides the
+            timeout given when the instance was created
         :return:
         """
 
@@ -359,6 +444,8 @@ class HTTPBase(object):
         try:
             args = self.use_soap(request, destination, headers, sign)
             args["headers"] = dict(args["headers"])
+            if timeout is not None:
+                args["timeout"] = timeout
             response = self.send(**args)
         except Exception, exc:
             logger.info("HTTPClient exception: %s" % (exc,))
@@ -373,3 +460,37 @@ class HTTPBase(object):
     def add_credentials(self, user, passwd):
         self.user = user
         self.passwd = passwd
+
+    def pool_stats(self):
+        """
+        Statistics for the connection pools, per host.
+
+        :return: dictionary keyed on scheme://host:port with the number of
+            connections made, requests sent and idle connections
+        """
+        res = {}
+        for adapter in set(self.session.adapters.values()):
+            try:
+                pools = adapter.poolmanager.pools
+                keys = pools.keys()
+            except AttributeError:
+                continue
+
+            for key in keys:
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                try:
+                    # Empty slots in the pool are None
+                    idle = len([c for c in pool.pool.queue if c is not None])
+                except AttributeError:  # closed
+                    idle = 0
+                res["%s://%s:%s" % (pool.scheme, pool.host, pool.port)] = {
+                    "connections": pool.num_connections,
+                    "requests": pool.num_requests,
+                    "idle": idle}
+        return res
+
+    def close(self):
+        """ Closes all pooled connections """
+        self.session.close()
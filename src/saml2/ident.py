@@ -1,6 +1,9 @@
 import copy
+import re
 import shelve
 import logging
+import sqlite3
+import threading
 
 from hashlib import sha256
 from urllib import quote
@@ -21,6 +24,10 @@ ATTR = ["name_qualifier", "sp_name_qualifier", "format", "sp_provided_id",
         "text"]
 
 
+# What a key in a IdentDB database that is a coded NameID looks like
+CODE_PAT = re.compile(r"^\d=[^,]*(,\d=[^,]*)*$")
+
+
 class Unknown(SAMLError):
     pass
 
@@ -336,3 +343,165 @@ class IdentDB(object):
     def close(self):
         if hasattr(self.db, 'close'):
             self.db.close()
+
+
+class IdentSQLite(IdentDB):
+    """
+    An IdentDB that keeps the identifiers in a SQLite database.
+
+    There is one row per NameID. It is indexed on the local identifier,
+    on the coded NameID and on the NameID value, so none of the lookups
+    have to go through all the NameIDs of a user or all the users.
+    The database is run in WAL mode which allows readers in other
+    processes while one is writing.
+    """
+
+    def __init__(self, database, domain="", name_qualifier=""):
+        IdentDB.__init__(self, None, domain, name_qualifier)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(database, check_same_thread=False)
+        self.conn.text_factory = str
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS nameid ("
+                "id INTEGER PRIMARY KEY, "
+                "userid TEXT NOT NULL, "
+                "code TEXT NOT NULL UNIQUE, "
+                "name_qualifier TEXT, "
+                "sp_name_qualifier TEXT, "
+                "format TEXT, "
+                "sp_provided_id TEXT, "
+                "text TEXT)")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS nameid_userid ON "
+                "nameid (userid, sp_name_qualifier)")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS nameid_text ON nameid (text)")
+
+    def _query(self, sql, args=()):
+        with self.lock:
+            return self.conn.execute(sql, args).fetchall()
+
+    def _update(self, sql, args=()):
+        with self.lock:
+            with self.conn:
+                return self.conn.execute(sql, args).rowcount
+
+    def create_id(self, nformat, name_qualifier="", sp_name_qualifier=""):
+        _id = self._create_id(nformat, name_qualifier, sp_name_qualifier)
+        while self._query("SELECT 1 FROM nameid WHERE text = ?", (_id,)):
+            _id = self._create_id(nformat, name_qualifier, sp_name_qualifier)
+        return _id
+
+    def store(self, ident, name_id):
+        if isinstance(ident, unicode):
+            ident = ident.encode("utf-8")
+
+        args = [ident, code(name_id)]
+        args.extend([getattr(name_id, attr) or None for attr in ATTR])
+        self._update("INSERT OR REPLACE INTO nameid (userid, code, %s) "
+                     "VALUES (?, ?, ?, ?, ?, ?, ?)" % ", ".join(ATTR), args)
+
+    def remove_remote(self, name_id):
+        if not self._update("DELETE FROM nameid WHERE code = ?",
+                            (code(name_id),)):
+            raise KeyError(code(name_id))
+
+    def remove_local(self, sid):
+        if isinstance(sid, unicode):
+            sid = sid.encode("utf-8")
+
+        self._update("DELETE FROM nameid WHERE userid = ?", (sid,))
+
+    def find_nameid(self, userid, **kwargs):
+        sql = "SELECT code FROM nameid WHERE userid = ?"
+        args = [userid]
+        for key, val in kwargs.items():
+            if key not in ATTR:
+                # Not an attribute of a NameID
+                if val is not None:
+                    return []
+                continue
+            # IS also matches NULL with None
+            sql += " AND %s IS ?" % key
+            args.append(val)
+
+        return [decode(row[0]) for row in
+                self._query(sql + " ORDER BY id", args)]
+
+    def find_local_id(self, name_id):
+        res = self._query("SELECT userid FROM nameid WHERE code = ?",
+                          (code(name_id),))
+        if res:
+            return res[0][0]
+
+        logger.debug("name: %s" % code(name_id))
+        return None
+
+    def match_local_id(self, userid, sp_name_qualifier, name_qualifier):
+        res = self._query(
+            "SELECT code FROM nameid WHERE userid = ? AND "
+            "sp_name_qualifier IS ? AND name_qualifier IS ? AND "
+            "(format IS NULL OR format != ?) ORDER BY id LIMIT 1",
+            (userid, sp_name_qualifier or None, name_qualifier or None,
+             NAMEID_FORMAT_TRANSIENT))
+        if res:
+            return decode(res[0][0])
+        return None
+
+    def handle_name_id_mapping_request(self, name_id, name_id_policy):
+        _id = self.find_local_id(name_id)
+        if not _id:
+            raise Unknown("Unknown entity")
+
+        # return an old one if present
+        for _nid in self.find_nameid(
+                _id, format=name_id_policy.format,
+                sp_name_qualifier=name_id_policy.sp_name_qualifier):
+            return _nid
+
+        if name_id_policy.allow_create == "false":
+            raise PolicyError("Not allowed to create new identifier")
+
+        # else create and return a new one
+        return self.construct_nameid(_id, name_id_policy=name_id_policy)
+
+    def migrate(self, db):
+        """
+        Copy the identifiers from a database used by IdentDB.
+
+        :param db: A shelve file name or a dictionary like object
+        :return: The number of NameIDs copied
+        """
+        if isinstance(db, basestring):
+            db = shelve.open(db, flag="r")
+            opened = True
+        else:
+            opened = False
+
+        rows = []
+        try:
+            for key in db.keys():
+                if CODE_PAT.match(key):
+                    continue
+                # key is a local identifier, the value its coded NameIDs
+                for _cn in db[key].split(" "):
+                    if not _cn:
+                        continue
+                    nid = decode(_cn)
+                    rows.append([key, _cn] + [getattr(nid, attr) or None
+                                              for attr in ATTR])
+        finally:
+            if opened:
+                db.close()
+
+        with self.lock:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO nameid (userid, code, %s) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)" % ", ".join(ATTR), rows)
+        return len(rows)
+
+    def close(self):
+        self.conn.close()
@@ -3,7 +3,7 @@ import logging
 
 import memcache
 from saml2 import time_util
-from saml2.cache import ToOld, CacheError
+from saml2.cache import ToOld, CacheError, expiry_time
 
 # The assumption is that any subject may consist of data
 # gathered from several different sources, all with their own
@@ -17,6 +17,8 @@ def _key(prefix, name):
 class Cache(object):
     def __init__(self, servers, debug=0):
         self._cache = memcache.Client(servers, debug)
+        # Where in the list of subjects sweep() should continue
+        self._sweep_pos = 0
 
     def delete(self, subject_id):
         entities = self.entities(subject_id)
@@ -117,10 +119,61 @@ class Cache(object):
             if not self._cache.set(subject_id, entities):
                 raise CacheError("set failed")
 
-        # Should use memcache's expire
-        if not self._cache.set(_key(subject_id, entity_id), (timestamp, info)):
+        # memcache removes the entry when it expires, an expiry time that
+        # large is taken as seconds since the epoch
+        if timestamp:
+            expires = int(expiry_time(timestamp))
+        else:
+            expires = 0
+        if not self._cache.set(_key(subject_id, entity_id), (timestamp, info),
+                               expires):
             raise CacheError("set failed")
 
+    def sweep(self, limit=None):
+        """ memcache removes the session information when it expires but
+        not the lists of entities per subject or the list of subjects.
+        This removes the entities whose information is gone from the first
+        and the subjects with no entities left from the later.
+
+        :param limit: The max number of subjects to look at, the next call
+            continues where this one stopped. None means all of them.
+        :return: The number of subjects removed
+        """
+        subjects = self._cache.get("subjects")
+        if not subjects:
+            return 0
+
+        if limit is None or limit >= len(subjects):
+            todo = subjects
+            self._sweep_pos = 0
+        else:
+            if self._sweep_pos >= len(subjects):
+                self._sweep_pos = 0
+            todo = subjects[self._sweep_pos:self._sweep_pos + limit]
+            self._sweep_pos += limit
+
+        gone = []
+        for subject_id in todo:
+            entities = self._cache.get(subject_id)
+            if entities:
+                live = self._cache.get_multi(entities, subject_id + '_')
+                if len(live) == len(entities):
+                    continue
+                entities = [e for e in entities if e in live]
+            if entities:
+                if not self._cache.set(subject_id, entities):
+                    raise CacheError("set failed")
+            else:
+                self._cache.delete(subject_id)
+                gone.append(subject_id)
+
+        if gone:
+            subjects = [s for s in self._cache.get("subjects") or []
+                        if s not in gone]
+            if not self._cache.set("subjects", subjects):
+                raise CacheError("Set operation failed")
+        return len(gone)
+
     def reset(self, subject_id, entity_id):
         """ Scrap the assertions received from a IdP or an AA about a special
         subject.
@@ -198,5 +251,10 @@ class Cache(object):
         except TypeError:
             info = {}
 
-        if not self._cache.set(_key(subject_id, entity_id), (newtime, info)):
+        if newtime:
+            expires = int(expiry_time(newtime))
+        else:
+            expires = 0
+        if not self._cache.set(_key(subject_id, entity_id), (newtime, info),
+                               expires):
             raise CacheError("valid_to failed")
@@ -17,6 +17,7 @@ NAMESPACE = 'urn:oasis:names:tc:SAML:2.0:metadata'
 class EntityIDType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:entityIDType element """
 
+    __slots__ = []
     c_tag = 'entityIDType'
     c_namespace = NAMESPACE
     c_value_type = {'maxlen': '1024', 'base': 'anyURI'}
@@ -33,6 +34,7 @@ def entity_id_type__from_string(xml_string):
 class LocalizedNameType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:localizedNameType element """
 
+    __slots__ = ['lang']
     c_tag = 'localizedNameType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -63,6 +65,7 @@ def localized_name_type__from_string(xml_string):
 class LocalizedURIType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:localizedURIType element """
 
+    __slots__ = ['lang']
     c_tag = 'localizedURIType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -93,6 +96,7 @@ def localized_uri_type__from_string(xml_string):
 class ExtensionsType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:ExtensionsType element """
 
+    __slots__ = []
     c_tag = 'ExtensionsType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -108,6 +112,7 @@ def extensions_type__from_string(xml_string):
 class EndpointType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:EndpointType element """
 
+    __slots__ = ['binding', 'location', 'response_location']
     c_tag = 'EndpointType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -141,6 +146,7 @@ def endpoint_type__from_string(xml_string):
 class IndexedEndpointType_(EndpointType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:IndexedEndpointType element """
 
+    __slots__ = ['index', 'is_default']
     c_tag = 'IndexedEndpointType'
     c_namespace = NAMESPACE
     c_children = EndpointType_.c_children.copy()
@@ -177,6 +183,7 @@ def indexed_endpoint_type__from_string(xml_string):
 class OrganizationName(LocalizedNameType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:OrganizationName element """
 
+    __slots__ = []
     c_tag = 'OrganizationName'
     c_namespace = NAMESPACE
     c_children = LocalizedNameType_.c_children.copy()
@@ -193,6 +200,7 @@ class OrganizationDisplayName(LocalizedNameType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:OrganizationDisplayName
     element """
 
+    __slots__ = []
     c_tag = 'OrganizationDisplayName'
     c_namespace = NAMESPACE
     c_children = LocalizedNameType_.c_children.copy()
@@ -209,6 +217,7 @@ def organization_display_name_from_string(xml_string):
 class OrganizationURL(LocalizedURIType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:OrganizationURL element """
 
+    __slots__ = []
     c_tag = 'OrganizationURL'
     c_namespace = NAMESPACE
     c_children = LocalizedURIType_.c_children.copy()
@@ -224,6 +233,7 @@ def organization_url_from_string(xml_string):
 class Company(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:Company element """
 
+    __slots__ = []
     c_tag = 'Company'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -240,6 +250,7 @@ def company_from_string(xml_string):
 class GivenName(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:GivenName element """
 
+    __slots__ = []
     c_tag = 'GivenName'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -256,6 +267,7 @@ def given_name_from_string(xml_string):
 class SurName(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:SurName element """
 
+    __slots__ = []
     c_tag = 'SurName'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -272,6 +284,7 @@ def sur_name_from_string(xml_string):
 class EmailAddress(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:EmailAddress element """
 
+    __slots__ = []
     c_tag = 'EmailAddress'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -288,6 +301,7 @@ def email_address_from_string(xml_string):
 class TelephoneNumber(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:TelephoneNumber element """
 
+    __slots__ = []
     c_tag = 'TelephoneNumber'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -304,6 +318,7 @@ def telephone_number_from_string(xml_string):
 class ContactTypeType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:ContactTypeType element """
 
+    __slots__ = []
     c_tag = 'ContactTypeType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string', 'enumeration': ['technical', 'support',
@@ -323,6 +338,7 @@ class AdditionalMetadataLocationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AdditionalMetadataLocationType
     element """
 
+    __slots__ = ['namespace']
     c_tag = 'AdditionalMetadataLocationType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -348,6 +364,7 @@ def additional_metadata_location_type__from_string(xml_string):
 class AnyURIListType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:anyURIListType element """
 
+    __slots__ = []
     c_tag = 'anyURIListType'
     c_namespace = NAMESPACE
     c_value_type = {'member': 'anyURI', 'base': 'list'}
@@ -364,6 +381,7 @@ def any_uri_list_type__from_string(xml_string):
 class KeyTypes_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:KeyTypes element """
 
+    __slots__ = []
     c_tag = 'KeyTypes'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string', 'enumeration': ['encryption', 'signing']}
@@ -380,6 +398,7 @@ def key_types__from_string(xml_string):
 class EncryptionMethod(xenc.EncryptionMethodType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:EncryptionMethod element """
 
+    __slots__ = []
     c_tag = 'EncryptionMethod'
     c_namespace = NAMESPACE
     c_children = xenc.EncryptionMethodType_.c_children.copy()
@@ -396,6 +415,7 @@ class ArtifactResolutionService(IndexedEndpointType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:ArtifactResolutionService
     element """
 
+    __slots__ = []
     c_tag = 'ArtifactResolutionService'
     c_namespace = NAMESPACE
     c_children = IndexedEndpointType_.c_children.copy()
@@ -412,6 +432,7 @@ def artifact_resolution_service_from_string(xml_string):
 class SingleLogoutService(EndpointType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:SingleLogoutService element """
 
+    __slots__ = []
     c_tag = 'SingleLogoutService'
     c_namespace = NAMESPACE
     c_children = EndpointType_.c_children.copy()
@@ -427,6 +448,7 @@ def single_logout_service_from_string(xml_string):
 class ManageNameIDService(EndpointType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:ManageNameIDService element """
 
+    __slots__ = []
     c_tag = 'ManageNameIDService'
     c_namespace = NAMESPACE
     c_children = EndpointType_.c_children.copy()
@@ -442,6 +464,7 @@ def manage_name_id_service_from_string(xml_string):
 class NameIDFormat(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:NameIDFormat element """
 
+    __slots__ = []
     c_tag = 'NameIDFormat'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -458,6 +481,7 @@ def name_id_format_from_string(xml_string):
 class SingleSignOnService(EndpointType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:SingleSignOnService element """
 
+    __slots__ = []
     c_tag = 'SingleSignOnService'
     c_namespace = NAMESPACE
     c_children = EndpointType_.c_children.copy()
@@ -473,6 +497,7 @@ def single_sign_on_service_from_string(xml_string):
 class NameIDMappingService(EndpointType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:NameIDMappingService element """
 
+    __slots__ = []
     c_tag = 'NameIDMappingService'
     c_namespace = NAMESPACE
     c_children = EndpointType_.c_children.copy()
@@ -489,6 +514,7 @@ class AssertionIDRequestService(EndpointType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AssertionIDRequestService
     element """
 
+    __slots__ = []
     c_tag = 'AssertionIDRequestService'
     c_namespace = NAMESPACE
     c_children = EndpointType_.c_children.copy()
@@ -505,6 +531,7 @@ def assertion_id_request_service_from_string(xml_string):
 class AttributeProfile(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AttributeProfile element """
 
+    __slots__ = []
     c_tag = 'AttributeProfile'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -522,6 +549,7 @@ class AssertionConsumerService(IndexedEndpointType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AssertionConsumerService
     element """
 
+    __slots__ = []
     c_tag = 'AssertionConsumerService'
     c_namespace = NAMESPACE
     c_children = IndexedEndpointType_.c_children.copy()
@@ -538,6 +566,7 @@ def assertion_consumer_service_from_string(xml_string):
 class ServiceName(LocalizedNameType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:ServiceName element """
 
+    __slots__ = []
     c_tag = 'ServiceName'
     c_namespace = NAMESPACE
     c_children = LocalizedNameType_.c_children.copy()
@@ -553,6 +582,7 @@ def service_name_from_string(xml_string):
 class ServiceDescription(LocalizedNameType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:ServiceDescription element """
 
+    __slots__ = []
     c_tag = 'ServiceDescription'
     c_namespace = NAMESPACE
     c_children = LocalizedNameType_.c_children.copy()
@@ -569,6 +599,7 @@ class RequestedAttributeType_(saml.AttributeType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:RequestedAttributeType
     element """
 
+    __slots__ = ['is_required']
     c_tag = 'RequestedAttributeType'
     c_namespace = NAMESPACE
     c_children = saml.AttributeType_.c_children.copy()
@@ -597,6 +628,7 @@ def requested_attribute_type__from_string(xml_string):
 class AuthnQueryService(EndpointType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AuthnQueryService element """
 
+    __slots__ = []
     c_tag = 'AuthnQueryService'
     c_namespace = NAMESPACE
     c_children = EndpointType_.c_children.copy()
@@ -612,6 +644,7 @@ def authn_query_service_from_string(xml_string):
 class AuthzService(EndpointType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AuthzService element """
 
+    __slots__ = []
     c_tag = 'AuthzService'
     c_namespace = NAMESPACE
     c_children = EndpointType_.c_children.copy()
@@ -627,6 +660,7 @@ def authz_service_from_string(xml_string):
 class AttributeService(EndpointType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AttributeService element """
 
+    __slots__ = []
     c_tag = 'AttributeService'
     c_namespace = NAMESPACE
     c_children = EndpointType_.c_children.copy()
@@ -642,6 +676,7 @@ def attribute_service_from_string(xml_string):
 class AffiliateMember(EntityIDType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AffiliateMember element """
 
+    __slots__ = []
     c_tag = 'AffiliateMember'
     c_namespace = NAMESPACE
     c_children = EntityIDType_.c_children.copy()
@@ -657,6 +692,7 @@ def affiliate_member_from_string(xml_string):
 class Extensions(ExtensionsType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:Extensions element """
 
+    __slots__ = []
     c_tag = 'Extensions'
     c_namespace = NAMESPACE
     c_children = ExtensionsType_.c_children.copy()
@@ -672,6 +708,8 @@ def extensions_from_string(xml_string):
 class OrganizationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:OrganizationType element """
 
+    __slots__ = ['extensions', 'organization_name',
+                 'organization_display_name', 'organization_url']
     c_tag = 'OrganizationType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -713,6 +751,8 @@ def organization_type__from_string(xml_string):
 class ContactType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:ContactType element """
 
+    __slots__ = ['contact_type', 'extensions', 'company', 'given_name',
+                 'sur_name', 'email_address', 'telephone_number']
     c_tag = 'ContactType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -775,6 +815,7 @@ class AdditionalMetadataLocation(AdditionalMetadataLocationType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AdditionalMetadataLocation
     element """
 
+    __slots__ = []
     c_tag = 'AdditionalMetadataLocation'
     c_namespace = NAMESPACE
     c_children = AdditionalMetadataLocationType_.c_children.copy()
@@ -791,6 +832,7 @@ def additional_metadata_location_from_string(xml_string):
 class KeyDescriptorType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:KeyDescriptorType element """
 
+    __slots__ = ['use', 'key_info', 'encryption_method']
     c_tag = 'KeyDescriptorType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -828,6 +870,7 @@ def key_descriptor_type__from_string(xml_string):
 class RequestedAttribute(RequestedAttributeType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:RequestedAttribute element """
 
+    __slots__ = []
     c_tag = 'RequestedAttribute'
     c_namespace = NAMESPACE
     c_children = RequestedAttributeType_.c_children.copy()
@@ -843,6 +886,7 @@ def requested_attribute_from_string(xml_string):
 class Organization(OrganizationType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:Organization element """
 
+    __slots__ = []
     c_tag = 'Organization'
     c_namespace = NAMESPACE
     c_children = OrganizationType_.c_children.copy()
@@ -858,6 +902,7 @@ def organization_from_string(xml_string):
 class ContactPerson(ContactType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:ContactPerson element """
 
+    __slots__ = []
     c_tag = 'ContactPerson'
     c_namespace = NAMESPACE
     c_children = ContactType_.c_children.copy()
@@ -873,6 +918,7 @@ def contact_person_from_string(xml_string):
 class KeyDescriptor(KeyDescriptorType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:KeyDescriptor element """
 
+    __slots__ = []
     c_tag = 'KeyDescriptor'
     c_namespace = NAMESPACE
     c_children = KeyDescriptorType_.c_children.copy()
@@ -888,6 +934,10 @@ def key_descriptor_from_string(xml_string):
 class RoleDescriptorType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:RoleDescriptorType element """
 
+    __slots__ = ['id', 'valid_until', 'cache_duration',
+                 'protocol_support_enumeration', 'error_url', 'signature',
+                 'extensions', 'key_descriptor', 'organization',
+                 'contact_person']
     c_tag = 'RoleDescriptorType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -951,6 +1001,8 @@ class RoleDescriptorType_(SamlBase):
 class SSODescriptorType_(RoleDescriptorType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:SSODescriptorType element """
 
+    __slots__ = ['artifact_resolution_service', 'single_logout_service',
+                 'manage_name_id_service', 'name_id_format']
     c_tag = 'SSODescriptorType'
     c_namespace = NAMESPACE
     c_children = RoleDescriptorType_.c_children.copy()
@@ -1017,6 +1069,10 @@ class SSODescriptorType_(RoleDescriptorType_):
 class IDPSSODescriptorType_(SSODescriptorType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:IDPSSODescriptorType element """
 
+    __slots__ = ['want_authn_requests_signed', 'single_sign_on_service',
+                 'name_id_mapping_service', 'assertion_id_request_service',
+                 'attribute_profile', 'attribute',
+                 'want_authn_requests_only_with_valid_cert']
     c_tag = 'IDPSSODescriptorType'
     c_namespace = NAMESPACE
     c_children = SSODescriptorType_.c_children.copy()
@@ -1107,6 +1163,8 @@ class AttributeConsumingServiceType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AttributeConsumingServiceType
     element """
 
+    __slots__ = ['index', 'is_default', 'service_name', 'service_description',
+                 'requested_attribute']
     c_tag = 'AttributeConsumingServiceType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1161,6 +1219,8 @@ class AuthnAuthorityDescriptorType_(RoleDescriptorType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AuthnAuthorityDescriptorType
     element """
 
+    __slots__ = ['authn_query_service', 'assertion_id_request_service',
+                 'name_id_format']
     c_tag = 'AuthnAuthorityDescriptorType'
     c_namespace = NAMESPACE
     c_children = RoleDescriptorType_.c_children.copy()
@@ -1229,6 +1289,8 @@ def authn_authority_descriptor_type__from_string(xml_string):
 class PDPDescriptorType_(RoleDescriptorType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:PDPDescriptorType element """
 
+    __slots__ = ['authz_service', 'assertion_id_request_service',
+                 'name_id_format']
     c_tag = 'PDPDescriptorType'
     c_namespace = NAMESPACE
     c_children = RoleDescriptorType_.c_children.copy()
@@ -1297,6 +1359,8 @@ class AttributeAuthorityDescriptorType_(RoleDescriptorType_):
     """The urn:oasis:names:tc:SAML:2
     .0:metadata:AttributeAuthorityDescriptorType element """
 
+    __slots__ = ['attribute_service', 'assertion_id_request_service',
+                 'name_id_format', 'attribute_profile', 'attribute']
     c_tag = 'AttributeAuthorityDescriptorType'
     c_namespace = NAMESPACE
     c_children = RoleDescriptorType_.c_children.copy()
@@ -1378,6 +1442,9 @@ class AffiliationDescriptorType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AffiliationDescriptorType
     element """
 
+    __slots__ = ['affiliation_owner_id', 'valid_until', 'cache_duration', 'id',
+                 'signature', 'extensions', 'affiliate_member',
+                 'key_descriptor']
     c_tag = 'AffiliationDescriptorType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1443,6 +1510,7 @@ def affiliation_descriptor_type__from_string(xml_string):
 class RoleDescriptor(RoleDescriptorType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:RoleDescriptor element """
 
+    __slots__ = []
     c_tag = 'RoleDescriptor'
     c_namespace = NAMESPACE
     c_children = RoleDescriptorType_.c_children.copy()
@@ -1458,6 +1526,7 @@ def role_descriptor_from_string(xml_string):
 class IDPSSODescriptor(IDPSSODescriptorType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:IDPSSODescriptor element """
 
+    __slots__ = []
     c_tag = 'IDPSSODescriptor'
     c_namespace = NAMESPACE
     c_children = IDPSSODescriptorType_.c_children.copy()
@@ -1474,6 +1543,7 @@ class AttributeConsumingService(AttributeConsumingServiceType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AttributeConsumingService
     element """
 
+    __slots__ = []
     c_tag = 'AttributeConsumingService'
     c_namespace = NAMESPACE
     c_children = AttributeConsumingServiceType_.c_children.copy()
@@ -1491,6 +1561,7 @@ class AuthnAuthorityDescriptor(AuthnAuthorityDescriptorType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AuthnAuthorityDescriptor
     element """
 
+    __slots__ = []
     c_tag = 'AuthnAuthorityDescriptor'
     c_namespace = NAMESPACE
     c_children = AuthnAuthorityDescriptorType_.c_children.copy()
@@ -1507,6 +1578,7 @@ def authn_authority_descriptor_from_string(xml_string):
 class PDPDescriptor(PDPDescriptorType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:PDPDescriptor element """
 
+    __slots__ = []
     c_tag = 'PDPDescriptor'
     c_namespace = NAMESPACE
     c_children = PDPDescriptorType_.c_children.copy()
@@ -1523,6 +1595,7 @@ class AttributeAuthorityDescriptor(AttributeAuthorityDescriptorType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AttributeAuthorityDescriptor
     element """
 
+    __slots__ = []
     c_tag = 'AttributeAuthorityDescriptor'
     c_namespace = NAMESPACE
     c_children = AttributeAuthorityDescriptorType_.c_children.copy()
@@ -1540,6 +1613,7 @@ class AffiliationDescriptor(AffiliationDescriptorType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:AffiliationDescriptor element
     """
 
+    __slots__ = []
     c_tag = 'AffiliationDescriptor'
     c_namespace = NAMESPACE
     c_children = AffiliationDescriptorType_.c_children.copy()
@@ -1555,6 +1629,8 @@ def affiliation_descriptor_from_string(xml_string):
 class SPSSODescriptorType_(SSODescriptorType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:SPSSODescriptorType element """
 
+    __slots__ = ['authn_requests_signed', 'want_assertions_signed',
+                 'assertion_consumer_service', 'attribute_consuming_service']
     c_tag = 'SPSSODescriptorType'
     c_namespace = NAMESPACE
     c_children = SSODescriptorType_.c_children.copy()
@@ -1633,6 +1709,7 @@ def spsso_descriptor_type__from_string(xml_string):
 class SPSSODescriptor(SPSSODescriptorType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:SPSSODescriptor element """
 
+    __slots__ = []
     c_tag = 'SPSSODescriptor'
     c_namespace = NAMESPACE
     c_children = SPSSODescriptorType_.c_children.copy()
@@ -1648,6 +1725,13 @@ def spsso_descriptor_from_string(xml_string):
 class EntityDescriptorType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:EntityDescriptorType element """
 
+    __slots__ = ['entity_id', 'valid_until', 'cache_duration', 'id',
+                 'signature', 'extensions', 'role_descriptor',
+                 'idpsso_descriptor', 'spsso_descriptor',
+                 'authn_authority_descriptor',
+                 'attribute_authority_descriptor', 'pdp_descriptor',
+                 'affiliation_descriptor', 'organization', 'contact_person',
+                 'additional_metadata_location']
     c_tag = 'EntityDescriptorType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1769,6 +1853,7 @@ def entity_descriptor_type__from_string(xml_string):
 class EntityDescriptor(EntityDescriptorType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:EntityDescriptor element """
 
+    __slots__ = []
     c_tag = 'EntityDescriptor'
     c_namespace = NAMESPACE
     c_children = EntityDescriptorType_.c_children.copy()
@@ -1787,6 +1872,8 @@ class EntitiesDescriptorType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:metadata:EntitiesDescriptorType
     element """
 
+    __slots__ = ['valid_until', 'cache_duration', 'id', 'name', 'signature',
+                 'extensions', 'entity_descriptor', 'entities_descriptor']
     c_tag = 'EntitiesDescriptorType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1848,6 +1935,7 @@ def entities_descriptor_type__from_string(xml_string):
 class EntitiesDescriptor(EntitiesDescriptorType_):
     """The urn:oasis:names:tc:SAML:2.0:metadata:EntitiesDescriptor element """
 
+    __slots__ = []
     c_tag = 'EntitiesDescriptor'
     c_namespace = NAMESPACE
     c_children = EntitiesDescriptorType_.c_children.copy()
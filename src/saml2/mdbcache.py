@@ -10,6 +10,7 @@ from datetime import datetime
 
 from saml2 import time_util
 from saml2.cache import ToOld
+from saml2.cache import expiry_time
 from saml2.time_util import TIME_FORMAT
 
 logger = logging.getLogger(__name__)
@@ -28,6 +29,8 @@ class Cache(object):
             self._db = connection.pysaml2
 
         self._cache = self._db.collection
+        # MongoDB removes documents when the time in 'expires' has passed
+        self._cache.ensure_index("expires", expireAfterSeconds=0)
         self.debug = debug
 
     def delete(self, subject_id):
@@ -123,6 +126,9 @@ class Cache(object):
                "entity_id": entity_id,
                "info": info,
                "timestamp": timestamp}
+        if timestamp:
+            doc["expires"] = datetime.utcfromtimestamp(
+                expiry_time(timestamp))
 
         _ = self._cache.insert(doc)
 
@@ -192,8 +198,20 @@ class Cache(object):
 
     def valid_to(self, subject_id, entity_id, newtime):
         """ """
+        _set = {"timestamp": newtime}
+        if newtime:
+            _set["expires"] = datetime.utcfromtimestamp(expiry_time(newtime))
         self._cache.update({"subject_id": subject_id, "entity_id": entity_id},
-                           {"$set": {"timestamp": newtime}})
+                           {"$set": _set})
+
+    def sweep(self, limit=None):
+        """ MongoDB removes expired documents by itself, about once a
+        minute. This removes the ones that have expired since then.
+
+        :param limit: Not used, there for compatibility with the other
+            caches
+        """
+        self._cache.remove({"expires": {"$lt": datetime.utcnow()}})
 
     def clear(self):
         self._cache.remove()
\ No newline at end of file
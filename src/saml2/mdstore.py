@@ -1,10 +1,19 @@
+import calendar
 import logging
+import mmap
+import os
+import struct
 import sys
 import json
+import threading
+import time
 
+from collections import OrderedDict
 from hashlib import sha1
+from StringIO import StringIO
 from urllib import urlencode, quote_plus
 from saml2.httpbase import HTTPBase
+from saml2.httpbase import POOL_MAXSIZE
 from saml2.extension.idpdisc import BINDING_DISCO
 from saml2.extension.idpdisc import DiscoveryResponse
 from saml2.md import EntitiesDescriptor
@@ -13,6 +22,8 @@ from saml2.mdie import to_dict
 
 from saml2 import md
 from saml2 import samlp
+from saml2 import ElementTree
+from saml2 import create_class_from_element_tree
 from saml2 import SAMLError
 from saml2 import BINDING_HTTP_REDIRECT
 from saml2 import BINDING_HTTP_POST
@@ -21,6 +32,8 @@ from saml2.s_utils import UnsupportedBinding, UnknownSystemEntity
 from saml2.sigver import split_len
 from saml2.validate import valid_instance
 from saml2.time_util import valid
+from saml2.time_util import parse_duration
+from saml2.time_util import str_to_time
 from saml2.validate import NotValid
 from saml2.sigver import security_context
 from importlib import import_module
@@ -61,6 +74,52 @@ ENTITYATTRIBUTES = "urn:oasis:names:tc:SAML:metadata:attribute&EntityAttributes"
 ENTITY_CATEGORY = "http://macedir.org/entity-category"
 ENTITY_CATEGORY_SUPPORT = "http://macedir.org/entity-category-support"
 
+# Number of converted entities kept in memory by lazy metadata sources
+LAZY_CACHE_SIZE = 1000
+
+ROLE_DESCRIPTORS = ["{%s}%s" % (md.NAMESPACE, d.c_tag) for d in [
+    md.SPSSODescriptor, md.IDPSSODescriptor, md.RoleDescriptor,
+    md.AuthnAuthorityDescriptor, md.AttributeAuthorityDescriptor,
+    md.PDPDescriptor]]
+AFFILIATION_DESCRIPTOR = "{%s}%s" % (md.NAMESPACE,
+                                     md.AffiliationDescriptor.c_tag)
+SSO_DESCRIPTORS = ["{%s}%s" % (md.NAMESPACE, d.c_tag) for d in [
+    md.SPSSODescriptor, md.IDPSSODescriptor]]
+ARTIFACT_RESOLUTION_SERVICE = "{%s}%s" % (
+    md.NAMESPACE, md.ArtifactResolutionService.c_tag)
+# The key in the dictionary form of an entity of each type of descriptor
+DESCRIPTOR_KEYS = dict(
+    [(tag, spec[0]) for tag, spec in md.EntityDescriptor.c_children.items()
+     if tag in ROLE_DESCRIPTORS or tag == AFFILIATION_DESCRIPTOR])
+
+# Metadata snapshot file format:
+#   header: magic, format version, offset and length of the index
+#   records: per entity, the entity in JSON followed by its lookup tables in
+#       JSON, the services per descriptor and the certificates per
+#       descriptor
+#   index: JSON object mapping entity id to [offset, length, table offset,
+#       table length, has artifact resolution service, descriptor types]
+SNAPSHOT_MAGIC = "PS2MDSNP"
+SNAPSHOT_VERSION = 2
+SNAPSHOT_HEADER = struct.Struct("<8sHQQ")
+
+# Max number of seconds between metadata refreshes, unless validUntil or
+# cacheDuration says it should be done sooner
+REFRESH_INTERVAL = 3600
+# Number of seconds between refresh attempts after a failed one
+REFRESH_RETRY = 300
+
+# How long, in seconds, an entity fetched from a MDX server is kept unless
+# validUntil or cacheDuration says otherwise
+MDX_TTL = 3600
+# How long, in seconds, an entity unknown to the MDX server is remembered
+MDX_NEGATIVE_TTL = 300
+# How long, in seconds, to wait before asking the MDX server again about an
+# entity after a failed request, like a server error or a bad signature
+MDX_ERROR_BACKOFF = 10
+# Max number of entities kept by a MDX client
+MDX_CACHE_SIZE = 1000
+
 # ---------------------------------------------------
 
 
@@ -100,6 +159,93 @@ def name(ent, langpref="en"):
     return None
 
 
+def _entity_tables(ent):
+    """
+    The lookup tables stored with an entity in a metadata snapshot.
+
+    :param ent: The entity in dictionary form
+    :return: 2-tuple of the tables and whether the entity has an artifact
+        resolution service
+    """
+    services = {}
+    certs = {}
+    artifact = False
+    for typ, descs in ent.items():
+        if not typ.endswith("_descriptor") or not isinstance(descs, list):
+            continue
+
+        _srvs = services[typ] = {}
+        _certs = certs[typ[:-len("_descriptor")]] = []
+        for desc in descs:
+            for srv_name, srvs in desc.items():
+                if not isinstance(srvs, list):
+                    continue
+                if srv_name == "key_descriptor":
+                    for key in srvs:
+                        for dat in key["key_info"]["x509_data"]:
+                            _certs.append([key.get("use"),
+                                           dat["x509_certificate"]["text"]])
+                elif srvs and isinstance(srvs[0], dict) and \
+                        "binding" in srvs[0]:
+                    _srvs.setdefault(srv_name, []).extend(srvs)
+
+        if typ in ["spsso_descriptor", "idpsso_descriptor"] and \
+                "artifact_resolution_service" in _srvs:
+            artifact = True
+
+    return {"services": services, "certs": certs}, artifact
+
+
+def _descriptor_types(ent):
+    """
+    :param ent: The entity in dictionary form
+    :return: The keys of the descriptors the entity has
+    """
+    return [typ for typ, descs in ent.items()
+            if typ.endswith("_descriptor") and isinstance(descs, list)]
+
+
+def snapshot(items):
+    """
+    Creates a metadata snapshot.
+
+    :param items: list of (entity id, entity) tuples
+    :return: The snapshot as a string
+    """
+    records = []
+    index = {}
+    offset = SNAPSHOT_HEADER.size
+    for entity_id, ent in items:
+        rec = json.dumps(ent, separators=(",", ":"))
+        tables, artifact = _entity_tables(ent)
+        _tables = json.dumps(tables, separators=(",", ":"))
+        index[entity_id] = [offset, len(rec), offset + len(rec),
+                            len(_tables), artifact, _descriptor_types(ent)]
+        records.extend([rec, _tables])
+        offset += len(rec) + len(_tables)
+
+    _index = json.dumps(index, separators=(",", ":"))
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, offset,
+                                  len(_index))
+    return "".join([header] + records + [_index])
+
+
+def duration_in_seconds(duration):
+    """
+    Approximates the length of a xs:duration.
+
+    :param duration: A xs:duration, like 'PT6H'
+    :return: number of seconds
+    """
+    sign, dur = parse_duration(duration)
+    secs = dur["tm_sec"] + 60 * (dur["tm_min"] + 60 * (
+        dur["tm_hour"] + 24 * (dur["tm_mday"] + 30 * dur["tm_mon"] +
+                               365 * dur["tm_year"])))
+    if sign == "-":
+        return -secs
+    return secs
+
+
 def repack_cert(cert):
     part = cert.split("\n")
     if len(part) == 1:
@@ -109,19 +255,162 @@ def repack_cert(cert):
         return "\n".join([s.strip() for s in part])
 
 
+class SourceIds(dict):
+    """
+    Maps the SHA-1 digest of an entity id, as used as source id in SAML
+    artifacts, to the entity description. For entities in lazy metadata
+    sources the value is a 2-tuple of metadata source and entity id, which
+    is resolved when looked up with [] or get().
+    """
+
+    def __getitem__(self, item):
+        val = dict.__getitem__(self, item)
+        if isinstance(val, tuple):
+            _md, entity_id = val
+            return _md[entity_id]
+        return val
+
+    def get(self, item, default=None):
+        try:
+            return self[item]
+        except KeyError:
+            return default
+
+
+class LazyEntities(object):
+    """
+    Holds the raw XML of entity descriptors. An entity descriptor is
+    converted into its dictionary form the first time it is asked for.
+    The converted entities are kept in an LRU cache of bounded size.
+    """
+
+    def __init__(self, convert, size=LAZY_CACHE_SIZE):
+        """
+        :param convert: Function that converts the raw form of an entity
+            descriptor into the dictionary form, returns None if the
+            entity should be ignored. An ignored entity is dropped.
+        :param size: Max number of converted entities to keep
+        """
+        self.convert = convert
+        self.size = size
+        # entity_id -> raw form, or the dictionary if it was set directly
+        self.raw = {}
+        self._cache = OrderedDict()
+        self.lock = threading.Lock()
+
+    def add_raw(self, entity_id, xmlstr):
+        self.raw[entity_id] = xmlstr
+        with self.lock:
+            self._cache.pop(entity_id, None)
+
+    def __getitem__(self, item):
+        val = self.raw[item]
+        if isinstance(val, dict):
+            return val
+
+        with self.lock:
+            try:
+                ent = self._cache.pop(item)
+            except KeyError:
+                pass
+            else:
+                self._cache[item] = ent
+                return ent
+
+        ent = self.convert(val)
+        if ent is None:
+            # Not valid, or not usable. Forget it so that it doesn't
+            # show up in keys() and the like.
+            with self.lock:
+                if self.raw.get(item) is val:
+                    del self.raw[item]
+            raise KeyError(item)
+
+        with self.lock:
+            self._cache[item] = ent
+            while len(self._cache) > self.size:
+                self._cache.popitem(last=False)
+        return ent
+
+    def __setitem__(self, key, value):
+        self.raw[key] = value
+        with self.lock:
+            self._cache.pop(key, None)
+
+    def __delitem__(self, key):
+        del self.raw[key]
+        with self.lock:
+            self._cache.pop(key, None)
+
+    def __contains__(self, item):
+        return item in self.raw
+
+    def __iter__(self):
+        return iter(self.raw)
+
+    def __len__(self):
+        return len(self.raw)
+
+    def get(self, item, default=None):
+        try:
+            return self[item]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self.raw.keys()
+
+    def items(self):
+        res = []
+        for key in self.raw.keys():
+            try:
+                res.append((key, self[key]))
+            except KeyError:
+                pass
+        return res
+
+    def values(self):
+        return [val for _, val in self.items()]
+
+    def clear(self):
+        self.raw.clear()
+        with self.lock:
+            self._cache.clear()
+
+    def cached(self):
+        """ Number of entities that are presently converted """
+        return len(self._cache)
+
+
 class MetaData(object):
     def __init__(self, onts, attrc, metadata="", node_name=None,
-                 check_validity=True, security=None, **kwargs):
+                 check_validity=True, security=None, stream=False,
+                 lazy=False, lazy_cache_size=LAZY_CACHE_SIZE, **kwargs):
         self.onts = onts
         self.attrc = attrc
-        self.entity = {}
+        self.lazy = lazy
+        if lazy:
+            self.entity = LazyEntities(self._convert_raw, lazy_cache_size)
+            # digest of entity id -> entity id, of the entities that have
+            # an artifact resolution service
+            self.source_ids = {}
+            # entity id -> the descriptors the entity has, so that finding
+            # the entities of a kind doesn't mean converting all of them
+            self.descriptors = {}
+        else:
+            self.entity = {}
+            self.source_ids = None
+            self.descriptors = None
         self.metadata = metadata
         self.security = security
         self.node_name = node_name
         self.entities_descr = None
         self.entity_descr = None
         self.check_validity = check_validity
-        
+        self.stream = stream
+        self.valid_until = None
+        self.cache_duration = None
+
     def items(self):
         return self.entity.items()
 
@@ -142,9 +431,13 @@ class MetaData(object):
 
     def __setitem__(self, key, value):
         self.entity[key] = value
+        if self.descriptors is not None:
+            self.descriptors.pop(key, None)
 
     def __delitem__(self, key):
         del self.entity[key]
+        if self.descriptors is not None:
+            self.descriptors.pop(key, None)
 
     def do_entity_descriptor(self, entity_descr):
         if self.check_validity:
@@ -163,6 +456,17 @@ class MetaData(object):
                 entity_descr.entity_id
             return
 
+        _ent = self._entity_to_dict(entity_descr)
+        if _ent:
+            self.entity[entity_descr.entity_id] = _ent
+
+    def _entity_to_dict(self, entity_descr):
+        """
+        Converts an entity descriptor into the dictionary form. Only the
+        role descriptors that support SAML2 are kept.
+
+        :return: The dictionary or None if the entity has no SAML2 support
+        """
         _ent = to_dict(entity_descr, self.onts)
         flag = 0
         # verify support for SAML2
@@ -190,7 +494,60 @@ class MetaData(object):
                 flag += 1
 
         if flag:
-            self.entity[entity_descr.entity_id] = _ent
+            return _ent
+        return None
+
+    def _convert_raw(self, xmlstr):
+        entity_descr = md.entity_descriptor_from_string(xmlstr)
+        try:
+            valid_instance(entity_descr)
+        except (NotValid, ValueError), exc:
+            logger.error(exc.args[0])
+            return None
+        return self._entity_to_dict(entity_descr)
+
+    def _add_raw_entity(self, elem):
+        """
+        Stores the raw XML of an entity descriptor, it's converted when
+        it is first used.
+
+        :param elem: The EntityDescriptor as an ElementTree element
+        """
+        entity_id = elem.get("entityID")
+        if self.check_validity:
+            valid_until = elem.get("validUntil")
+            if valid_until and not valid(valid_until):
+                logger.info("Entity descriptor (entity id:%s) to old" % (
+                    entity_id,))
+                return
+
+        if entity_id in self.entity:
+            print >> sys.stderr, \
+                "Duplicated Entity descriptor (entity id: '%s')" % entity_id
+            return
+
+        # verify support for SAML2, the descriptors kept are the same as
+        # when the entity is converted
+        descriptors = set()
+        artifact = False
+        for child in elem:
+            if child.tag == AFFILIATION_DESCRIPTOR:
+                descriptors.add(DESCRIPTOR_KEYS[child.tag])
+            elif child.tag in ROLE_DESCRIPTORS:
+                prots = child.get("protocolSupportEnumeration", "")
+                if samlp.NAMESPACE in prots.split(" "):
+                    descriptors.add(DESCRIPTOR_KEYS[child.tag])
+                    if child.tag in SSO_DESCRIPTORS and child.find(
+                            ARTIFACT_RESOLUTION_SERVICE) is not None:
+                        artifact = True
+
+        if not descriptors:
+            return
+
+        self.entity.add_raw(entity_id, ElementTree.tostring(elem))
+        self.descriptors[entity_id] = descriptors
+        if artifact:
+            self.source_ids[sha1(entity_id).digest()] = entity_id
 
     def parse(self, xmlstr):
         self.entities_descr = md.entities_descriptor_from_string(xmlstr)
@@ -198,8 +555,13 @@ class MetaData(object):
         if not self.entities_descr:
             self.entity_descr = md.entity_descriptor_from_string(xmlstr)
             if self.entity_descr:
+                self.valid_until = self.entity_descr.valid_until
+                self.cache_duration = self.entity_descr.cache_duration
                 self.do_entity_descriptor(self.entity_descr)
         else:
+            self.valid_until = self.entities_descr.valid_until
+            self.cache_duration = self.entities_descr.cache_duration
+
             try:
                 valid_instance(self.entities_descr)
             except NotValid, exc:
@@ -218,8 +580,134 @@ class MetaData(object):
             for entity_descr in self.entities_descr.entity_descriptor:
                 self.do_entity_descriptor(entity_descr)
 
+    def parse_stream(self, source):
+        """
+        Parses the metadata one EntityDescriptor at a time. Each entity
+        descriptor is converted and then discarded, so the complete object
+        tree of an aggregate is never held in memory.
+
+        As with parse() only the entity descriptors that are children of
+        the top EntitiesDescriptor are used, and if anything in it isn't
+        valid none of them are. In lazy mode entity descriptors are only
+        validated when they are converted.
+
+        :param source: A file name or a file object
+        """
+        entities_tag = "{%s}%s" % (md.EntitiesDescriptor.c_namespace,
+                                   md.EntitiesDescriptor.c_tag)
+        entity_tag = "{%s}%s" % (md.EntityDescriptor.c_namespace,
+                                 md.EntityDescriptor.c_tag)
+
+        stack = []
+        added = []
+        invalid = False
+        for event, elem in ElementTree.iterparse(source,
+                                                 events=("start", "end")):
+            if event == "start":
+                if not stack:
+                    self.valid_until = elem.get("validUntil")
+                    self.cache_duration = elem.get("cacheDuration")
+                if not stack and elem.tag == entities_tag and \
+                        self.check_validity:
+                    valid_until = elem.get("validUntil")
+                    if valid_until and not valid(valid_until):
+                        raise ToOld(
+                            "Metadata not valid anymore, it's only valid "
+                            "until %s" % (valid_until,))
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            if not stack:
+                if elem.tag == entity_tag:
+                    if self.lazy:
+                        self._add_raw_entity(elem)
+                    else:
+                        self.do_entity_descriptor(
+                            create_class_from_element_tree(
+                                md.EntityDescriptor, elem))
+                elif elem.tag == entities_tag and not self.lazy:
+                    # What is left of it, Extensions and Signature
+                    try:
+                        valid_instance(create_class_from_element_tree(
+                            md.EntitiesDescriptor, elem))
+                    except NotValid, exc:
+                        logger.error(exc.args[0])
+                        invalid = True
+                break
+
+            if len(stack) > 1 or stack[0].tag != entities_tag:
+                # Dealt with when the child of the top element ends
+                continue
+
+            if elem.tag == entity_tag:
+                if self.lazy:
+                    self._add_raw_entity(elem)
+                elif not invalid:
+                    entity_descr = create_class_from_element_tree(
+                        md.EntityDescriptor, elem)
+                    try:
+                        valid_instance(entity_descr)
+                    except NotValid, exc:
+                        logger.error(exc.args[0])
+                        invalid = True
+                    else:
+                        known = entity_descr.entity_id in self.entity
+                        self.do_entity_descriptor(entity_descr)
+                        if not known and entity_descr.entity_id in \
+                                self.entity:
+                            added.append(entity_descr.entity_id)
+            elif elem.tag == entities_tag:
+                # Nested aggregates are validated but not used
+                if not self.lazy and not invalid:
+                    try:
+                        valid_instance(create_class_from_element_tree(
+                            md.EntitiesDescriptor, elem))
+                    except NotValid, exc:
+                        logger.error(exc.args[0])
+                        invalid = True
+            else:
+                continue
+
+            # Done with this one, get rid of it
+            elem.clear()
+            stack[0].remove(elem)
+
+        if invalid:
+            for entity_id in added:
+                del self.entity[entity_id]
+
+    def _parse(self, xmlstr):
+        if self.stream or self.lazy:
+            self.parse_stream(StringIO(xmlstr))
+        else:
+            self.parse(xmlstr)
+
     def load(self):
-        self.parse(self.metadata)
+        self._parse(self.metadata)
+
+    def refresh_time(self, interval=REFRESH_INTERVAL):
+        """
+        When the metadata should be refreshed at the latest, according to
+        its validUntil and cacheDuration.
+
+        :param interval: Max number of seconds from now
+        :return: Seconds since the epoch
+        """
+        when = time.time() + interval
+        if self.cache_duration:
+            try:
+                when = min(when, time.time() + duration_in_seconds(
+                    self.cache_duration))
+            except Exception:
+                logger.warning("Bad cacheDuration: %s" % self.cache_duration)
+        if self.valid_until:
+            try:
+                when = min(when,
+                           calendar.timegm(str_to_time(self.valid_until)))
+            except Exception:
+                logger.warning("Bad validUntil: %s" % self.valid_until)
+        return when
 
     def service(self, entity_id, typ, service, binding=None):
         """ Get me all services with a specified
@@ -336,19 +824,67 @@ class MetaData(object):
     def dumps(self):
         return json.dumps(self.items(), indent=2)
 
-    def with_descriptor(self, descriptor):
-        res = {}
-        desc = "%s_descriptor" % descriptor
-        for eid, ent in self.items():
-            if desc in ent:
-                res[eid] = ent
+    def entity_ids_with(self, key):
+        """
+        The identifiers of the entities that have a specific part. In lazy
+        mode what descriptors an entity has was noted when it was loaded,
+        so no entity has to be converted to find out.
+
+        :param key: Key in the dictionary form of an entity, like
+            'idpsso_descriptor'
+        :return: list of entity ids
+        """
+        if self.descriptors is None:
+            return [eid for eid, ent in self.items() if key in ent]
+
+        res = []
+        for eid in self.entity.keys():
+            try:
+                if key in self.descriptors[eid]:
+                    res.append(eid)
+                continue
+            except KeyError:
+                # Set directly, have to look at it
+                pass
+            ent = self.entity.get(eid)
+            if ent is not None and key in ent:
+                res.append(eid)
         return res
 
+    def entities_with(self, key):
+        """
+        The entities that have a specific part. In lazy mode only those
+        entities are converted.
+
+        :param key: Key in the dictionary form of an entity, like
+            'idpsso_descriptor'
+        :return: list of (entity id, entity) tuples
+        """
+        if self.descriptors is None:
+            return [(eid, ent) for eid, ent in self.items() if key in ent]
+
+        res = []
+        for eid in self.entity_ids_with(key):
+            ent = self.entity.get(eid)
+            # None if it turned out not to be valid
+            if ent is not None:
+                res.append((eid, ent))
+        return res
+
+    def with_descriptor(self, descriptor):
+        return dict(self.entities_with("%s_descriptor" % descriptor))
+
     def __str__(self):
         return "%s" % self.items()
 
     def construct_source_id(self):
-        res = {}
+        res = SourceIds()
+        if self.source_ids is not None:
+            # Lazy, don't convert every entity to find out
+            for digest, eid in self.source_ids.items():
+                res[digest] = (self, eid)
+            return res
+
         for eid, ent in self.items():
             for desc in ["spsso_descriptor", "idpsso_descriptor"]:
                 try:
@@ -440,11 +976,31 @@ class MetaDataFile(MetaData):
         MetaData.__init__(self, onts, attrc, **kwargs)
         self.filename = filename
         self.cert = cert
+        self.mtime = None
 
     def get_metadata_content(self):
         return open(self.filename).read()
 
+    def get_metadata_source(self):
+        return self.filename
+
+    def get_mtime(self):
+        try:
+            return os.path.getmtime(self.filename)
+        except (OSError, AttributeError):
+            return None
+
+    def is_modified(self):
+        """ Whether the file has changed since it was loaded """
+        return self.mtime is None or self.get_mtime() != self.mtime
+
     def load(self):
+        self.mtime = self.get_mtime()
+        if (self.stream or self.lazy) and not self.cert:
+            # No need to have the whole document in memory
+            self.parse_stream(self.get_metadata_source())
+            return True
+
         _txt = self.get_metadata_content()
         if self.cert:
             node_name = self.node_name \
@@ -454,10 +1010,10 @@ class MetaDataFile(MetaData):
             if self.security.verify_signature(_txt,
                                               node_name=node_name,
                                               cert_file=self.cert):
-                self.parse(_txt)
+                self._parse(_txt)
                 return True
         else:
-            self.parse(_txt)
+            self._parse(_txt)
             return True
 
 
@@ -503,6 +1059,9 @@ class MetaDataLoader(MetaDataFile):
     def get_metadata_content(self):
         return self.metadata_provider_callable()
 
+    def get_metadata_source(self):
+        return StringIO(self.get_metadata_content())
+
 
 class MetaDataExtern(MetaData):
     """
@@ -524,14 +1083,32 @@ class MetaDataExtern(MetaData):
         self.security = security
         self.cert = cert
         self.http = http
+        # Validators from the last response, used for conditional GET
+        self.etag = None
+        self.last_modified = None
+        self.not_modified = False
 
     def load(self):
         """ Imports metadata by the use of HTTP GET.
         If the fingerprint is known the file will be checked for
         compliance before it is imported.
+        If there are validators from an earlier response a conditional
+        GET is done, if the metadata hasn't changed not_modified is set.
         """
-        response = self.http.send(self.url)
-        if response.status_code == 200:
+        _kwargs = {}
+        if self.etag:
+            _kwargs["etag"] = self.etag
+        if self.last_modified:
+            _kwargs["last_modified"] = self.last_modified
+
+        response = self.http.send(self.url, **_kwargs)
+        if response.status_code == 304:
+            logger.info("Metadata from %s not modified" % self.url)
+            self.not_modified = True
+            return False
+        elif response.status_code == 200:
+            self.etag = response.headers.get("etag")
+            self.last_modified = response.headers.get("last-modified")
             node_name = self.node_name \
                 or "%s:%s" % (md.EntitiesDescriptor.c_namespace,
                               md.EntitiesDescriptor.c_tag)
@@ -541,10 +1118,10 @@ class MetaDataExtern(MetaData):
                 if self.security.verify_signature(_txt,
                                                   node_name=node_name,
                                                   cert_file=self.cert):
-                    self.parse(_txt)
+                    self._parse(_txt)
                     return True
             else:
-                self.parse(_txt)
+                self._parse(_txt)
                 return True
         else:
             logger.info("Response status: %s" % response.status_code)
@@ -565,6 +1142,104 @@ class MetaDataMD(MetaData):
             self.entity[key] = item
 
 
+class MetaDataSnapshot(MetaData):
+    """
+    Handles metadata snapshots as written by MetadataStore.dumps. The file
+    is memory mapped, so processes loading the same snapshot share the
+    pages. Entities are decoded when they are first used.
+
+    Service and certificate lookups are answered from the tables stored
+    with each entity, which are smaller and quicker to decode than the
+    entity. A snapshot source is not part of the MetadataStore index, so
+    a lookup that isn't answered by the index also asks the snapshot.
+    """
+    def __init__(self, onts, attrc, filename,
+                 lazy_cache_size=LAZY_CACHE_SIZE, **kwargs):
+        MetaData.__init__(self, onts, attrc, **kwargs)
+        self.filename = filename
+        self.lazy = True
+        self.entity = LazyEntities(self._decode, lazy_cache_size)
+        self.tables = LazyEntities(self._decode, lazy_cache_size)
+        self.source_ids = {}
+        self.descriptors = {}
+        self._mmap = None
+
+    def _decode(self, pos):
+        offset, length = pos
+        return json.loads(self._mmap[offset:offset + length])
+
+    def load(self):
+        _file = open(self.filename, "rb")
+        try:
+            _mmap = mmap.mmap(_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            raise SAMLError("%s is not a metadata snapshot" % self.filename)
+        finally:
+            _file.close()
+
+        try:
+            magic, version, offset, length = SNAPSHOT_HEADER.unpack(
+                _mmap[:SNAPSHOT_HEADER.size])
+        except struct.error:
+            magic = version = None
+
+        if magic != SNAPSHOT_MAGIC:
+            _mmap.close()
+            raise SAMLError("%s is not a metadata snapshot" % self.filename)
+        if version != SNAPSHOT_VERSION:
+            _mmap.close()
+            raise SAMLError("Unsupported metadata snapshot version %s" % (
+                version,))
+
+        self._mmap = _mmap
+        self.entity.clear()
+        self.tables.clear()
+        self.source_ids.clear()
+        self.descriptors.clear()
+        for entity_id, pos in json.loads(
+                _mmap[offset:offset + length]).items():
+            self.entity.add_raw(entity_id, tuple(pos[0:2]))
+            self.tables.add_raw(entity_id, tuple(pos[2:4]))
+            if pos[4]:
+                self.source_ids[sha1(entity_id).digest()] = entity_id
+            if len(pos) > 5:
+                # Not in snapshots made by earlier versions
+                self.descriptors[entity_id] = set(pos[5])
+
+    def service(self, entity_id, typ, service, binding=None):
+        try:
+            srvs = self.tables[entity_id]["services"][typ].get(service, [])
+        except KeyError:
+            return None
+
+        if not srvs:
+            return srvs
+
+        if binding:
+            return [srv for srv in srvs if srv["binding"] == binding]
+
+        res = {}
+        for srv in srvs:
+            res.setdefault(srv["binding"], []).append(srv)
+        return res
+
+    def certs(self, entity_id, descriptor, use="signing"):
+        certs = self.tables[entity_id]["certs"]
+        if descriptor != "any":
+            return [cert for _use, cert in certs[descriptor]
+                    if _use is None or _use == use]
+
+        res = []
+        for descr in ["spsso", "idpsso", "role", "authn_authority",
+                      "attribute_authority", "pdp"]:
+            for _use, cert in certs.get(descr, []):
+                if _use is None or _use == use:
+                    cert = repack_cert(cert)
+                    if cert not in res:
+                        res.append(cert)
+        return res
+
+
 SAML_METADATA_CONTENT_TYPE = 'application/samlmetadata+xml'
 
 
@@ -572,7 +1247,9 @@ class MetaDataMDX(MetaData):
     """ Uses the md protocol to fetch entity information
     """
     def __init__(self, entity_transform, onts, attrc, url, security, cert,
-                 http, **kwargs):
+                 http, ttl=MDX_TTL, negative_ttl=MDX_NEGATIVE_TTL,
+                 size=MDX_CACHE_SIZE, warmup=None,
+                 error_backoff=MDX_ERROR_BACKOFF, **kwargs):
         """
         :params entity_transform: function transforming (e.g. base64 or sha1
         hash) the entity id. It is applied to the entity id before it is
@@ -583,6 +1260,15 @@ class MetaDataMDX(MetaData):
         :params security: SecurityContext()
         :params cert:
         :params http:
+        :params ttl: Max number of seconds a fetched entity is kept
+        :params negative_ttl: Number of seconds an entity the MDX server
+            doesn't know about is remembered as unknown
+        :params size: Max number of entities to keep
+        :params warmup: File with entity ids, one per line, to fetch when
+            the metadata is loaded
+        :params error_backoff: Number of seconds before an entity is asked
+            for again after a failed request. An entity that was fetched
+            before is used until then.
         """
         MetaData.__init__(self, onts, attrc, **kwargs)
         self.url = url
@@ -590,74 +1276,240 @@ class MetaDataMDX(MetaData):
         self.cert = cert
         self.http = http
         self.entity_transform = entity_transform
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.size = size
+        self.warmup = warmup
+        self.error_backoff = error_backoff
+        # entity_id -> when it expires, oldest first
+        self._expires = OrderedDict()
+        # entity_id -> until when it is known to be unknown, or when to
+        # try again after a failure
+        self._negative = OrderedDict()
+        # entity_id -> Event set when an ongoing fetch is done
+        self._inflight = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
 
     def load(self):
-        pass
+        if self.warmup:
+            entity_ids = []
+            for line in open(self.warmup):
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    entity_ids.append(line)
+            self.prefetch(entity_ids)
+
+    def prefetch(self, entity_ids, workers=4):
+        """
+        Fetches a number of entities, using a couple of threads.
+
+        :param entity_ids: The entity ids
+        :param workers: Number of concurrent fetches
+        """
+        entity_ids = list(entity_ids)
+        lock = threading.Lock()
+
+        def _worker():
+            while True:
+                with lock:
+                    if not entity_ids:
+                        return
+                    entity_id = entity_ids.pop()
+                try:
+                    self[entity_id]
+                except Exception, exc:
+                    logger.info("Prefetching %s failed: %s" % (entity_id,
+                                                              exc))
+
+        threads = [threading.Thread(target=_worker) for _ in
+                   range(min(workers, len(entity_ids)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
 
     def __getitem__(self, item):
+        now = time.time()
+        with self.lock:
+            if item in self.entity and self._expires.get(item, 0) > now:
+                self.hits += 1
+                return self.entity[item]
+            if self._negative.get(item, 0) > now:
+                self.hits += 1
+                raise KeyError(item)
+
+            self.misses += 1
+            try:
+                event = self._inflight[item]
+            except KeyError:
+                event = self._inflight[item] = threading.Event()
+                fetch = True
+            else:
+                fetch = False
+
+        if fetch:
+            try:
+                self._fetch(item)
+            finally:
+                with self.lock:
+                    del self._inflight[item]
+                event.set()
+        else:
+            # Someone else is already fetching it
+            event.wait()
+
+        with self.lock:
+            try:
+                return self.entity[item]
+            except KeyError:
+                raise KeyError(item)
+
+    def _request(self, item):
+        """
+        Asks the MDX server about an entity.
+
+        :return: The metadata in the response, or None if the server doesn't
+            know about the entity
+        :raise: An exception if the request failed or the response couldn't
+            be used
+        """
+        mdx_url = "%s/entities/%s" % (self.url, self.entity_transform(item))
+        response = self.http.send(
+            mdx_url, headers={'Accept': SAML_METADATA_CONTENT_TYPE})
+
+        if response.status_code == 404:
+            return None
+        elif response.status_code != 200:
+            raise SAMLError("Response status: %s" % response.status_code)
+
+        node_name = self.node_name \
+            or "%s:%s" % (md.EntitiesDescriptor.c_namespace,
+                          md.EntitiesDescriptor.c_tag)
+
+        _txt = response.text.encode("utf-8")
+
+        if self.cert and not self.security.verify_signature(
+                _txt, node_name=node_name, cert_file=self.cert):
+            raise SAMLError("Signature verification failed")
+
+        _md = MetaData(self.onts, self.attrc,
+                       check_validity=self.check_validity)
+        _md.parse(_txt)
+        return _md
+
+    def _fetch(self, item):
         try:
-            return self.entity[item]
-        except KeyError:
-            mdx_url = "%s/entities/%s" % (self.url, self.entity_transform(item))
-            response = self.http.send(
-                mdx_url, headers={'Accept': SAML_METADATA_CONTENT_TYPE})
-            if response.status_code == 200:
-                node_name = self.node_name \
-                    or "%s:%s" % (md.EntitiesDescriptor.c_namespace,
-                                  md.EntitiesDescriptor.c_tag)
-
-                _txt = response.text.encode("utf-8")
-
-                if self.cert:
-                    if self.security.verify_signature(_txt,
-                                                      node_name=node_name,
-                                                      cert_file=self.cert):
-                        self.parse(_txt)
-                        return self.entity[item]
-                else:
-                    self.parse(_txt)
-                    return self.entity[item]
+            _md = self._request(item)
+        except Exception, exc:
+            logger.error("Fetching %s from %s failed: %s" % (item, self.url,
+                                                            exc))
+            _md = False
+
+        now = time.time()
+        with self.lock:
+            if _md and item in _md:
+                expires = _md.refresh_time(self.ttl)
+                for entity_id, ent in _md.items():
+                    self.entity[entity_id] = ent
+                    self._expires.pop(entity_id, None)
+                    self._expires[entity_id] = expires
+                    self._negative.pop(entity_id, None)
+            elif _md is False and item in self.entity:
+                # Keep using what we have for a while
+                self.errors += 1
+                self._expires.pop(item, None)
+                self._expires[item] = now + self.error_backoff
             else:
-                logger.info("Response status: %s" % response.status_code)
-            raise KeyError
+                if _md is False:
+                    self.errors += 1
+                    retry = now + self.error_backoff
+                else:
+                    # The server says it doesn't know about it
+                    retry = now + self.negative_ttl
+                self.entity.pop(item, None)
+                self._expires.pop(item, None)
+                self._negative.pop(item, None)
+                self._negative[item] = retry
+
+            while len(self._expires) > self.size:
+                entity_id, _ = self._expires.popitem(last=False)
+                self.entity.pop(entity_id, None)
+            while len(self._negative) > self.size:
+                self._negative.popitem(last=False)
+
+    def stats(self):
+        return {"size": len(self.entity), "unknown": len(self._negative),
+                "hits": self.hits, "misses": self.misses,
+                "errors": self.errors, "inflight": len(self._inflight)}
 
 
 class MetadataStore(object):
     def __init__(self, onts, attrc, config, ca_certs=None,
                  check_validity=True,
-                 disable_ssl_certificate_validation=False):
+                 disable_ssl_certificate_validation=False, stream=False,
+                 lazy=False):
         """
         :params onts:
         :params attrc:
         :params config: Config()
         :params ca_certs:
         :params disable_ssl_certificate_validation:
+        :params stream: Whether SAML metadata should be parsed one entity
+            descriptor at a time
+        :params lazy: Whether entity descriptors in SAML metadata should
+            only be converted when they are used
         """
         self.onts = onts
         self.attrc = attrc
 
+        _kwargs = {"timeout": getattr(config, "http_timeout", None),
+                   "pool_maxsize": getattr(config, "http_pool_maxsize",
+                                           POOL_MAXSIZE)}
         if disable_ssl_certificate_validation:
-            self.http = HTTPBase(verify=False, ca_bundle=ca_certs)
+            self.http = HTTPBase(verify=False, ca_bundle=ca_certs, **_kwargs)
         else:
-            self.http = HTTPBase(verify=True, ca_bundle=ca_certs)
+            self.http = HTTPBase(verify=True, ca_bundle=ca_certs, **_kwargs)
 
         self.security = security_context(config)
         self.ii = 0
-        self.metadata = {}
         self.check_validity = check_validity
+        self.stream = stream
+        self.lazy = lazy
+        # (generation, metadata sources, lookup tables). Replaced as a whole
+        # whenever the set of sources changes and never modified, so a
+        # reader that takes one reference to it gets a consistent view.
+        # The generation is changed every time metadata is loaded, so caches
+        # based on the metadata knows when they have to be invalidated.
+        self._state = (0, {}, self._build_index({}))
+        # Serializes changes to the set of metadata sources
+        self.lock = threading.RLock()
+        # key -> [type, args, kwargs, refresh time] of refreshable sources
+        self._sources = {}
+        self.refresh_interval = REFRESH_INTERVAL
+        self._refresher = None
+        self._stop_refresh = threading.Event()
+
+    def _source(self, typ, *args, **kwargs):
+        """
+        Creates a metadata source.
 
-    def load(self, typ, *args, **kwargs):
+        :return: 2-tuple of key and the MetaData instance
+        """
         if typ == "local":
             key = args[0]
-            _md = MetaDataFile(self.onts, self.attrc, args[0])
+            _md = MetaDataFile(self.onts, self.attrc, args[0],
+                               stream=self.stream, lazy=self.lazy)
         elif typ == "inline":
             self.ii += 1
             key = self.ii
             _md = MetaData(self.onts, self.attrc, args[0], **kwargs)
         elif typ == "remote":
             key = kwargs["url"]
-            _args = {}
-            for _key in ["node_name", "check_validity"]:
+            _args = {"stream": self.stream, "lazy": self.lazy}
+            for _key in ["node_name", "check_validity", "stream", "lazy"]:
                 try:
                     _args[_key] = kwargs[_key]
                 except KeyError:
@@ -669,28 +1521,299 @@ class MetadataStore(object):
         elif typ == "mdfile":
             key = args[0]
             _md = MetaDataMD(self.onts, self.attrc, args[0])
+        elif typ == "snapshot":
+            key = args[0]
+            _md = MetaDataSnapshot(self.onts, self.attrc, args[0])
         elif typ == "loader":
             key = args[0]
-            _md = MetaDataLoader(self.onts, self.attrc, args[0])
+            _md = MetaDataLoader(self.onts, self.attrc, args[0],
+                                 stream=self.stream, lazy=self.lazy)
         else:
             raise SAMLError("Unknown metadata type '%s'" % typ)
 
+        return key, _md
+
+    @property
+    def metadata(self):
+        return self._state[1]
+
+    @metadata.setter
+    def metadata(self, metadata):
+        self._publish(metadata, replace=True)
+
+    @property
+    def generation(self):
+        return self._state[0]
+
+    def _publish(self, new, replace=False):
+        """
+        Makes a new set of metadata sources, and the lookup index built
+        from them, visible to readers at once.
+
+        :param new: Dictionary of metadata sources to add or replace
+        :param replace: Whether new replaces all the present sources
+        """
+        with self.lock:
+            generation, metadata, _ = self._state
+            if replace:
+                metadata = dict(new)
+            else:
+                metadata = dict(metadata)
+                metadata.update(new)
+            self._state = (generation + 1, metadata,
+                           self._build_index(metadata))
+
+    def _load(self, typ, *args, **kwargs):
+        key, _md = self._source(typ, *args, **kwargs)
         _md.load()
-        self.metadata[key] = _md
+        if typ in ["local", "remote"]:
+            with self.lock:
+                self._sources[key] = [typ, args, kwargs, _md.refresh_time(
+                    self.refresh_interval)]
+        return key, _md
+
+    def load(self, typ, *args, **kwargs):
+        key, _md = self._load(typ, *args, **kwargs)
+        self._publish({key: _md})
 
     def imp(self, spec):
+        new = {}
         for key, vals in spec.items():
             for val in vals:
                 if isinstance(val, dict):
                     if not self.check_validity:
                         val["check_validity"] = False
-                    self.load(key, **val)
+                    _key, _md = self._load(key, **val)
                 else:
-                    self.load(key, val)
+                    _key, _md = self._load(key, val)
+                new[_key] = _md
+
+        self._publish(new)
+
+    def _build_index(self, metadata):
+        """
+        Flattens the loaded metadata into lookup tables so that entity,
+        service and certificate lookups don't have to walk every metadata
+        source and the nested entity descriptions on every request.
+
+        :param metadata: The metadata sources
+        :return: dictionary of the lookup tables
+        """
+        entities = {}
+        descriptors = set()
+        services = {}
+        unindexed = False
+        for _md in metadata.values():
+            if getattr(_md, "lazy", False) or isinstance(_md, MetaDataMDX):
+                # Indexing would mean converting every entity, or the
+                # entities come and go
+                unindexed = True
+                continue
+            for entity_id, ent in _md.items():
+                if entity_id not in entities:
+                    entities[entity_id] = _md
+
+                for typ, descs in ent.items():
+                    if not typ.endswith("_descriptor") or \
+                            not isinstance(descs, list):
+                        continue
+                    descriptors.add((entity_id, typ))
+
+                    _srvs = {}
+                    for desc in descs:
+                        for srv_name, srvs in desc.items():
+                            if not isinstance(srvs, list):
+                                continue
+                            _bind = _srvs.setdefault(srv_name, {})
+                            for srv in srvs:
+                                try:
+                                    binding = srv["binding"]
+                                except (KeyError, TypeError):
+                                    continue
+                                _bind.setdefault(binding, []).append(srv)
+
+                    # As when searching the sources one by one, the first
+                    # source that has a matching service wins.
+                    for srv_name, _bind in _srvs.items():
+                        if not _bind:
+                            continue
+                        key = (entity_id, typ, srv_name)
+                        if key not in services:
+                            services[key] = _bind
+                        for binding, srvs in _bind.items():
+                            services.setdefault(key + (binding,), srvs)
+
+        # If there are sources that are not in the index a lookup that
+        # fails in the index must still ask them
+        return {"entity": entities, "descriptor": descriptors,
+                "service": services, "certs": {}, "unindexed": unindexed}
+
+    @staticmethod
+    def _diff(old, new):
+        """
+        Which entities differ between two versions of a metadata source.
+        For lazy sources the raw form is compared.
+
+        :return: dictionary with the entity ids that were added, removed
+            and changed
+        """
+        _old = getattr(old.entity, "raw", old.entity)
+        _new = getattr(new.entity, "raw", new.entity)
+        return {
+            "added": [eid for eid in _new if eid not in _old],
+            "removed": [eid for eid in _old if eid not in _new],
+            "changed": [eid for eid in _new
+                        if eid in _old and _new[eid] != _old[eid]]}
+
+    def refresh(self, force=False):
+        """
+        Reloads the local and remote metadata sources that are due.
+        Local files are reloaded if they have changed, remote metadata is
+        fetched with a conditional GET when its validUntil, cacheDuration
+        or the refresh interval says so. All new metadata is loaded before
+        any of it is used, then the changed sources and a new lookup index
+        are swapped in at once. A source that can't be loaded is kept as it
+        is.
+
+        :param force: Reload all sources regardless of their refresh time
+        :return: per refreshed source, the entity ids that were added,
+            removed and changed
+        """
+        now = time.time()
+        new = {}
+        diff = {}
+        for key, spec in self._sources.items():
+            typ, args, kwargs, when = spec
+            try:
+                _old = self.metadata[key]
+            except KeyError:
+                continue
+
+            if not force:
+                if typ == "local":
+                    if when > now and not _old.is_modified():
+                        continue
+                elif when > now:
+                    continue
+
+            _key, _md = self._source(typ, *args, **kwargs)
+            if typ == "remote":
+                _md.etag = _old.etag
+                _md.last_modified = _old.last_modified
+
+            try:
+                res = _md.load()
+            except Exception, exc:
+                logger.error("Refreshing metadata from %s failed: %s" % (
+                    key, exc))
+                res = False
+
+            if typ == "remote" and _md.not_modified:
+                spec[3] = max(_old.refresh_time(self.refresh_interval),
+                              now + REFRESH_RETRY)
+                continue
+            elif not res:
+                spec[3] = now + REFRESH_RETRY
+                continue
+
+            spec[3] = max(_md.refresh_time(self.refresh_interval),
+                          now + REFRESH_RETRY)
+            new[key] = _md
+            diff[key] = self._diff(_old, _md)
+            logger.info("Refreshed metadata from %s: %s" % (
+                key, ", ".join(["%d %s" % (len(v), k) for k, v in
+                                diff[key].items()])))
+
+        if new:
+            # Readers use the old sources and index until the new ones
+            # are published
+            self._publish(new)
+
+        return diff
+
+    def _refresh_loop(self, check_interval):
+        while not self._stop_refresh.wait(check_interval):
+            try:
+                self.refresh()
+            except Exception, exc:
+                logger.error("Metadata refresh failed: %s" % exc)
+
+    def start_refresh(self, interval=REFRESH_INTERVAL, check_interval=60):
+        """
+        Starts a background thread that keeps the local and remote
+        metadata sources fresh.
+
+        :param interval: Max number of seconds between reloads of a source
+        :param check_interval: Number of seconds between checks whether any
+            source is due
+        """
+        if self._refresher is not None:
+            return
+
+        self.refresh_interval = interval
+        for spec in self._sources.values():
+            spec[3] = min(spec[3], time.time() + interval)
+
+        self._stop_refresh.clear()
+        self._refresher = threading.Thread(target=self._refresh_loop,
+                                           args=(check_interval,))
+        self._refresher.daemon = True
+        self._refresher.start()
+
+    def stop_refresh(self):
+        if self._refresher is None:
+            return
+
+        self._stop_refresh.set()
+        self._refresher.join()
+        self._refresher = None
+
+    @staticmethod
+    def _indexed_service(index, entity_id, typ, service, binding=None):
+        """
+        Service lookup using the flat index.
+
+        :param index: The lookup tables
+        :return: Same as MetaData.service or False if the entity is not
+            in the index
+        """
+        if entity_id not in index["entity"]:
+            return False
+        if (entity_id, typ) not in index["descriptor"]:
+            return None
+
+        if binding:
+            try:
+                return list(index["service"][(entity_id, typ, service,
+                                              binding)])
+            except KeyError:
+                return []
+        else:
+            try:
+                _bind = index["service"][(entity_id, typ, service)]
+            except KeyError:
+                return []
+            return dict([(b, list(srvs)) for b, srvs in _bind.items()])
 
     def service(self, entity_id, typ, service, binding=None):
+        _, metadata, index = self._state
+        srvs = self._indexed_service(index, entity_id, typ, service,
+                                     binding)
+        if srvs:
+            return srvs
+        elif srvs is False or index["unindexed"]:
+            # Not indexed, for instance fetched by MDX on demand, or there
+            # are other sources that may know it
+            pass
+        elif srvs is None:
+            logger.error("Unknown system entity: %s" % entity_id)
+            raise UnknownSystemEntity(entity_id)
+        else:
+            logger.error("Unsupported binding: %s (%s)" % (binding, entity_id))
+            raise UnsupportedBinding(binding)
+
         known_entity = False
-        for key, _md in self.metadata.items():
+        for key, _md in metadata.items():
             srvs = _md.service(entity_id, typ, service, binding)
             if srvs:
                 return srvs
@@ -815,7 +1938,15 @@ class MetadataStore(object):
                                 binding)
 
     def attribute_requirement(self, entity_id, index=None):
-        for _md in self.metadata.values():
+        _, metadata, _index = self._state
+        try:
+            _md = _index["entity"][entity_id]
+        except KeyError:
+            pass
+        else:
+            return _md.attribute_requirement(entity_id, index)
+
+        for _md in metadata.values():
             if entity_id in _md:
                 return _md.attribute_requirement(entity_id, index)
 
@@ -826,7 +1957,13 @@ class MetadataStore(object):
         return res
 
     def __getitem__(self, item):
-        for _md in self.metadata.values():
+        _, metadata, index = self._state
+        try:
+            return index["entity"][item][item]
+        except KeyError:
+            pass
+
+        for _md in metadata.values():
             try:
                 return _md[item]
             except KeyError:
@@ -835,12 +1972,12 @@ class MetadataStore(object):
         raise KeyError(item)
 
     def __setitem__(self, key, value):
-        self.metadata[key] = value
+        self._publish({key: value})
 
     def entities(self):
         num = 0
         for _md in self.metadata.values():
-            num += len(_md.items())
+            num += len(_md)
 
         return num
 
@@ -854,49 +1991,51 @@ class MetadataStore(object):
         return res
 
     def name(self, entity_id, langpref="en"):
-        for _md in self.metadata.values():
+        _, metadata, index = self._state
+        try:
+            return name(index["entity"][entity_id][entity_id], langpref)
+        except KeyError:
+            pass
+
+        for _md in metadata.values():
             if entity_id in _md:
-                return name(_md[entity_id], langpref)
+                try:
+                    return name(_md[entity_id], langpref)
+                except KeyError:  # A lazy entity that wasn't valid
+                    pass
         return None
 
     def certs(self, entity_id, descriptor, use="signing"):
-        ent = self.__getitem__(entity_id)
-        if descriptor == "any":
-            res = []
-            for descr in ["spsso", "idpsso", "role", "authn_authority",
-                          "attribute_authority", "pdp"]:
-                try:
-                    srvs = ent["%s_descriptor" % descr]
-                except KeyError:
-                    continue
+        _, metadata, index = self._state
+        key = (entity_id, descriptor, use)
+        try:
+            return list(index["certs"][key])
+        except KeyError:
+            pass
 
-                for srv in srvs:
-                    for key in srv["key_descriptor"]:
-                        if "use" in key and key["use"] == use:
-                            for dat in key["key_info"]["x509_data"]:
-                                cert = repack_cert(
-                                    dat["x509_certificate"]["text"])
-                                if cert not in res:
-                                    res.append(cert)
-                        elif not "use" in key:
-                            for dat in key["key_info"]["x509_data"]:
-                                cert = repack_cert(
-                                    dat["x509_certificate"]["text"])
-                                if cert not in res:
-                                    res.append(cert)
+        res = self._certs(metadata, index, entity_id, descriptor, use)
+        if entity_id in index["entity"]:
+            index["certs"][key] = res
+        return list(res)
+
+    @staticmethod
+    def _certs(metadata, index, entity_id, descriptor, use="signing"):
+        try:
+            _md = index["entity"][entity_id]
+        except KeyError:
+            pass
         else:
-            srvs = ent["%s_descriptor" % descriptor]
+            return _md.certs(entity_id, descriptor, use)
 
-            res = []
-            for srv in srvs:
-                for key in srv["key_descriptor"]:
-                    if "use" in key and key["use"] == use:
-                        for dat in key["key_info"]["x509_data"]:
-                            res.append(dat["x509_certificate"]["text"])
-                    elif not "use" in key:
-                        for dat in key["key_info"]["x509_data"]:
-                            res.append(dat["x509_certificate"]["text"])
-        return res
+        # Some sources, like snapshots, can answer without converting the
+        # entity
+        for _md in metadata.values():
+            try:
+                return _md.certs(entity_id, descriptor, use)
+            except KeyError:
+                pass
+
+        raise KeyError(entity_id)
 
     def vo_members(self, entity_id):
         ad = self.__getitem__(entity_id)["affiliation_descriptor"]
@@ -958,8 +2097,13 @@ class MetadataStore(object):
         return res
 
     def bindings(self, entity_id, typ, service):
-        for _md in self.metadata.values():
-            if entity_id in _md.items():
+        _, metadata, index = self._state
+        srvs = self._indexed_service(index, entity_id, typ, service)
+        if srvs or (srvs is not False and not index["unindexed"]):
+            return srvs
+
+        for _md in metadata.values():
+            if entity_id in _md:
                 return _md.bindings(entity_id, typ, service)
 
         return None
@@ -972,7 +2116,7 @@ class MetadataStore(object):
         return "\n".join(_str)
 
     def construct_source_id(self):
-        res = {}
+        res = SourceIds()
         for _md in self.metadata.values():
             res.update(_md.construct_source_id())
         return res
@@ -986,13 +2130,12 @@ class MetadataStore(object):
     def _providers(self, descriptor):
         res = []
         for _md in self.metadata.values():
-            for ent_id, ent_desc in _md.items():
-                if descriptor in ent_desc:
-                    if ent_id in res:
-                        #print "duplicated entity_id: %s" % res
-                        pass
-                    else:
-                        res.append(ent_id)
+            for ent_id in _md.entity_ids_with(descriptor):
+                if ent_id in res:
+                    #print "duplicated entity_id: %s" % res
+                    pass
+                else:
+                    res.append(ent_id)
         return res
 
     def service_providers(self):
@@ -1006,8 +2149,8 @@ class MetadataStore(object):
 
     def dumps(self, format="local"):
         """
-        Dumps the content in standard metadata format or the pysaml2 metadata
-        format
+        Dumps the content in standard metadata format, the pysaml2 metadata
+        format or as a metadata snapshot
 
         :param format: Which format to dump in
         :return: a string
@@ -1024,4 +2167,6 @@ class MetadataStore(object):
             return "%s" % res
         elif format == "md":
             return json.dumps(self.items(), indent=2)
+        elif format == "snapshot":
+            return snapshot(self.items())
 
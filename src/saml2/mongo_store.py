@@ -1,5 +1,6 @@
 from hashlib import sha1
 import logging
+import threading
 
 from pymongo import MongoClient
 from pymongo.mongo_replica_set_client import MongoReplicaSetClient
@@ -39,6 +40,11 @@ __author__ = 'rolandh'
 
 logger = logging.getLogger(__name__)
 
+# Max number of connections a client keeps to a MongoDB server
+MAX_POOL_SIZE = 10
+# Number of documents sent to the server in one bulk operation
+BULK_SIZE = 1000
+
 
 class CorruptDatabase(Exception):
     pass
@@ -55,6 +61,9 @@ class SessionStorageMDB(object):
     def __init__(self, database="", collection="assertion", **kwargs):
         db = _mdb_get_database(database, **kwargs)
         self.assertion = db[collection]
+        self.assertion.ensure_index("assertion_id")
+        self.assertion.ensure_index([("name_id_key", pymongo.ASCENDING),
+                                     ("session_index", pymongo.ASCENDING)])
 
     def store_assertion(self, assertion, to_sign):
         name_id = assertion.subject.name_id
@@ -63,20 +72,24 @@ class SessionStorageMDB(object):
         doc = {
             "name_id_key": nkey,
             "assertion_id": assertion.id,
+            "session_index": [s.session_index for s in
+                              assertion.authn_statement if s.session_index],
             "assertion": to_dict(assertion, ONTS.values(), True),
             "to_sign": to_sign
         }
 
-        _ = self.assertion.insert(doc)
+        self.assertion.update({"assertion_id": assertion.id}, doc,
+                              upsert=True)
 
     def get_assertion(self, cid):
         res = []
-        for item in self.assertion.find({"assertion_id": cid}):
+        for item in self.assertion.find({"assertion_id": cid},
+                                        {"assertion": 1, "to_sign": 1}):
             res.append({"assertion": from_dict(item["assertion"], ONTS, True),
                         "to_sign": item["to_sign"]})
         if len(res) == 1:
             return res[0]
-        elif res is []:
+        elif not res:
             return None
         else:
             raise SystemError("More then one assertion with the same ID")
@@ -94,7 +107,12 @@ class SessionStorageMDB(object):
         """
         result = []
         key = sha1(code(name_id)).hexdigest()
-        for item in self.assertion.find({"name_id_key": key}):
+        spec = {"name_id_key": key}
+        if session_index:
+            # Assertions stored before the session indexes were, lacks them
+            spec["$or"] = [{"session_index": session_index},
+                           {"session_index": {"$exists": False}}]
+        for item in self.assertion.find(spec, {"assertion": 1}):
             assertion = from_dict(item["assertion"], ONTS, True)
             if session_index or requested_context:
                 for statement in assertion.authn_statement:
@@ -114,8 +132,7 @@ class SessionStorageMDB(object):
     def remove_authn_statements(self, name_id):
         logger.debug("remove authn about: %s" % name_id)
         key = sha1(code(name_id)).hexdigest()
-        for item in self.assertion.find({"name_id_key": key}):
-            self.assertion.remove(item["_id"])
+        self.assertion.remove({"name_id_key": key})
 
     def get_authn_statements(self, name_id, session_index=None,
                              requested_context=None):
@@ -136,6 +153,8 @@ class IdentMDB(IdentDB):
         IdentDB.__init__(self, None, domain, name_qualifier)
         self.mdb = MDB(database=database, collection=collection)
         self.mdb.primary_key = "user_id"
+        self.mdb.index("user_id")
+        self.mdb.index("name_id")
 
     def in_store(self, _id):
         if [x for x in self.mdb.get(ident_id=_id)]:
@@ -172,9 +191,11 @@ class IdentMDB(IdentDB):
 
     def find_local_id(self, name_id):
         cnid = to_dict(name_id, ONTS.values(), True)
-        for item in self.mdb.get(name_id=cnid):
-            return item[self.mdb.primary_key]
-        return None
+        item = self.mdb.db.find_one({"name_id": cnid},
+                                    {self.mdb.primary_key: 1})
+        if item is None:
+            return None
+        return item[self.mdb.primary_key]
 
     def remove_remote(self, name_id):
         cnid = to_dict(name_id, ONTS.values(), True)
@@ -211,24 +232,65 @@ class MDB(object):
         doc.update(kwargs)
         _ = self.db.insert(doc)
 
-    def get(self, value=None, **kwargs):
+    def replace(self, value, **kwargs):
+        """ Like store but replaces the document with the same key if
+        there is one """
+        doc = {self.primary_key: value}
+        doc.update(kwargs)
+        self.db.update({self.primary_key: value}, doc, upsert=True)
+
+    def bulk_replace(self, items):
+        """ Replaces, or adds, many documents in as few requests as possible.
+
+        :param items: Iterable of (key, dictionary) tuples
+        """
+        bulk = None
+        count = 0
+        for value, kwargs in items:
+            if bulk is None:
+                bulk = self.db.initialize_unordered_bulk_op()
+            doc = {self.primary_key: value}
+            doc.update(kwargs)
+            bulk.find({self.primary_key: value}).upsert().replace_one(doc)
+            count += 1
+            if count == BULK_SIZE:
+                bulk.execute()
+                bulk = None
+                count = 0
+        if bulk is not None:
+            bulk.execute()
+
+    def index(self, key):
+        self.db.ensure_index(key)
+
+    def get(self, value=None, fields=None, **kwargs):
+        """
+        :param value: The value of the primary key
+        :param fields: If given, only these fields are read
+        :return: A list of matching documents
+        """
         if value is not None:
             doc = {self.primary_key: value}
             doc.update(kwargs)
-            return [item for item in self.db.find(doc)]
         elif kwargs:
-            return [item for item in self.db.find(kwargs)]
+            doc = kwargs
+        else:
+            return None
+
+        if fields:
+            return [item for item in
+                    self.db.find(doc, dict([(f, 1) for f in fields]))]
+        else:
+            return [item for item in self.db.find(doc)]
 
     def remove(self, key=None, **kwargs):
         if key is None:
             if kwargs:
-                for item in self.db.find(kwargs):
-                    self.db.remove(item["_id"])
+                self.db.remove(kwargs)
         else:
             doc = {self.primary_key: key}
             doc.update(kwargs)
-            for item in self.db.find(doc):
-                self.db.remove(item["_id"])
+            self.db.remove(doc)
 
     def keys(self):
         for item in self.db.find():
@@ -243,16 +305,34 @@ class MDB(object):
 
     def __contains__(self, key):
         doc = {self.primary_key: key}
-        res = [item for item in self.db.find(doc)]
-        if not res:
-            return False
-        else:
-            return True
+        return self.db.find_one(doc, {"_id": 1}) is not None
 
     def reset(self):
         self.db.drop()
 
 
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _mdb_get_client(factory, uri, **kwargs):
+    """ Returns the client that was created before with the same arguments,
+    or a new one.
+    """
+    key = (factory, uri, tuple(sorted(kwargs.items())))
+    with _clients_lock:
+        try:
+            return _clients[key]
+        except KeyError:
+            pass
+        if uri is None:
+            client = factory(**kwargs)
+        else:
+            client = factory(uri, **kwargs)
+        _clients[key] = client
+        return client
+
+
 def _mdb_get_database(uri, **kwargs):
     """
     Helper-function to connect to MongoDB and return a database object.
@@ -264,6 +344,11 @@ def _mdb_get_database(uri, **kwargs):
     Performs explicit authentication if a username is provided in a connection
     string URI, since PyMongo does not always seem to do that as promised.
 
+    Clients are shared, so all the stores using the same server with the
+    same arguments shares one pool of at the most maxPoolSize connections.
+    The pool size can be set with a maxPoolSize option in the URI, it is
+    MAX_POOL_SIZE by default.
+
     :params database: name as string or (uri, name)
     :returns: pymongo database object
     """
@@ -279,17 +364,21 @@ def _mdb_get_database(uri, **kwargs):
     except pymongo.errors.InvalidURI:
         # assume URI to be just the database name
         db_name = uri
-        _conn = MongoClient()
-        pass
+        if not "maxPoolSize" in kwargs:
+            kwargs["maxPoolSize"] = MAX_POOL_SIZE
+        _conn = _mdb_get_client(MongoClient, None, **kwargs)
     else:
+        _options = [k.lower() for k in _parsed_uri["options"]]
+        if not "maxPoolSize" in kwargs and not "maxpoolsize" in _options:
+            kwargs["maxPoolSize"] = MAX_POOL_SIZE
         if "replicaset" in _parsed_uri["options"]:
             connection_factory = MongoReplicaSetClient
         db_name = _parsed_uri.get("database", "pysaml2")
-        _conn = connection_factory(uri, **kwargs)
+        _conn = _mdb_get_client(connection_factory, uri, **kwargs)
 
     _db = _conn[db_name]
 
-    if "username" in _parsed_uri:
+    if _parsed_uri.get("username"):
         _db.authenticate(
             _parsed_uri.get("username", None),
             _parsed_uri.get("password", None)
@@ -304,9 +393,10 @@ class EptidMDB(Eptid):
         Eptid.__init__(self, secret)
         self.mdb = MDB(database, collection)
         self.mdb.primary_key = "eptid_key"
+        self.mdb.index("eptid_key")
 
     def __getitem__(self, key):
-        res = self.mdb.get(key)
+        res = self.mdb.get(key, fields=["eptid"])
         if not res:
             raise KeyError(key)
         elif len(res) == 1:
@@ -315,7 +405,7 @@ class EptidMDB(Eptid):
             raise CorruptDatabase("Found more than one EPTID document")
 
     def __setitem__(self, key, value):
-        _ = self.mdb.store(key, **{"eptid": value})
+        self.mdb.replace(key, **{"eptid": value})
 
 
 #------------------------------------------------------------------------------
@@ -367,14 +457,24 @@ def unprotect(dic):
 
 
 def export_mdstore_to_mongo_db(mds, database, collection, sub_collection=""):
-    mdb = MDB(database, collection, sub_collection=sub_collection)
-    mdb.reset()
+    """ Replaces the content of the collection with the entities in the
+    metadata store. The collection is updated in place, so readers never
+    see it empty.
+
+    :param sub_collection: Not used
+    """
+    mdb = MDB(database, collection)
     mdb.primary_key = "entity_id"
-    for key, desc in mds.items():
-        kwargs = {
-            "entity_description": protect(desc),
-        }
-        mdb.store(key, **kwargs)
+    mdb.index("entity_id")
+    keys = []
+
+    def _docs():
+        for key, desc in mds.items():
+            keys.append(key)
+            yield key, {"entity_description": protect(desc)}
+
+    mdb.bulk_replace(_docs())
+    mdb.db.remove({"entity_id": {"$nin": keys}})
 
 
 class MetadataMDB(MetaData):
@@ -382,10 +482,19 @@ class MetadataMDB(MetaData):
         MetaData.__init__(self, onts, attrc)
         self.mdb = MDB(database, collection)
         self.mdb.primary_key = "entity_id"
+        self.mdb.index("entity_id")
 
     def _ext_service(self, entity_id, typ, service, binding):
+        # Only read the one descriptor type that is of interest
+        res = self.mdb.get(entity_id,
+                           fields=["entity_description.%s" % typ])
+        if not res:
+            return None
+        elif len(res) > 1:
+            raise CorruptDatabase("More then one document with key %s" %
+                                  entity_id)
         try:
-            srvs = self[entity_id][typ]
+            srvs = unprotect(res[0]["entity_description"])[typ]
         except KeyError:
             return None
 
@@ -420,7 +529,7 @@ class MetadataMDB(MetaData):
         return item in self.mdb
 
     def __getitem__(self, item):
-        res = self.mdb.get(item)
+        res = self.mdb.get(item, fields=["entity_description"])
         if not res:
             raise KeyError(item)
         elif len(res) == 1:
@@ -0,0 +1,151 @@
+"""
+Running back-channel calls concurrently.
+
+A CallPool is a fixed number of long-lived worker threads. Work is handed
+to it with submit() which immediately returns a Call, the result of which
+can be picked up later. Since the workers spend most of their time waiting
+for remote servers, threads are enough to overlap the latencies of calls
+made to different entities.
+"""
+import Queue
+import sys
+import threading
+import time
+
+from saml2 import SAMLError
+
+# Default number of worker threads in a CallPool
+POOL_SIZE = 10
+
+
+class CallTimeout(SAMLError):
+    pass
+
+
+class Call(object):
+    """
+    The pending result of a function submitted to a CallPool.
+    """
+
+    def __init__(self, func, args, kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self._done = threading.Event()
+        self._result = None
+        self._exc_info = None
+
+    def run(self):
+        try:
+            self._result = self.func(*self.args, **self.kwargs)
+        except Exception:
+            self._exc_info = sys.exc_info()
+        self._done.set()
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """
+        :param timeout: Max number of seconds to wait, None means forever
+        :return: True if the call has finished
+        """
+        self._done.wait(timeout)
+        return self._done.is_set()
+
+    def result(self, timeout=None):
+        """
+        Wait for the call to finish and return what the function returned.
+        If the function raised an exception it is raised here.
+
+        :param timeout: Max number of seconds to wait, None means forever
+        :return: What the function returned
+        """
+        if not self.wait(timeout):
+            raise CallTimeout("%s did not finish in %s seconds" % (
+                getattr(self.func, "__name__", self.func), timeout))
+        if self._exc_info is not None:
+            raise self._exc_info[0], self._exc_info[1], self._exc_info[2]
+        return self._result
+
+    def exception(self, timeout=None):
+        """
+        :param timeout: Max number of seconds to wait, None means forever
+        :return: The exception raised by the function or None
+        """
+        if not self.wait(timeout):
+            raise CallTimeout("%s did not finish in %s seconds" % (
+                getattr(self.func, "__name__", self.func), timeout))
+        if self._exc_info is not None:
+            return self._exc_info[1]
+        return None
+
+
+class CallPool(object):
+    """
+    A fixed number of worker threads that runs submitted calls in the order
+    they were submitted. The threads are started when they are first needed.
+    """
+
+    def __init__(self, size=POOL_SIZE):
+        assert size > 0
+        self.size = size
+        self.queue = Queue.Queue()
+        self.workers = []
+        self.lock = threading.Lock()
+
+    def _start(self):
+        with self.lock:
+            while len(self.workers) < self.size:
+                worker = threading.Thread(target=self._work,
+                                          name="call-%d" % len(self.workers))
+                worker.daemon = True
+                worker.start()
+                self.workers.append(worker)
+
+    def _work(self):
+        while True:
+            call = self.queue.get()
+            call.run()
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Have func(*args, **kwargs) run by one of the workers.
+
+        :return: A Call instance
+        """
+        if len(self.workers) < self.size:
+            self._start()
+
+        call = Call(func, args, kwargs)
+        self.queue.put(call)
+        return call
+
+
+def wait(calls, timeout=None):
+    """
+    Wait for a number of calls to finish. The timeout is for all of them
+    together, not per call.
+
+    :param calls: Call instances
+    :param timeout: Max number of seconds to wait, None means forever
+    :return: 2-tuple with the list of finished calls and the list of calls
+        that did not finish in time
+    """
+    if timeout is not None:
+        deadline = time.time() + timeout
+    else:
+        deadline = None
+
+    for call in calls:
+        if deadline is None:
+            call.wait()
+        else:
+            left = deadline - time.time()
+            if left <= 0:
+                break
+            call.wait(left)
+
+    done = [c for c in calls if c.done()]
+    not_done = [c for c in calls if not c.done()]
+    return done, not_done
@@ -16,6 +16,8 @@ NAMESPACE = 'urn:oasis:names:tc:SAML:2.0:profiles:SSO:ecp'
 class RequestType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:profiles:SSO:ecp:RequestType element """
 
+    __slots__ = ['must_understand', 'actor', 'provider_name', 'is_passive',
+                 'issuer', 'idp_list']
     c_tag = 'RequestType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -61,6 +63,7 @@ def request_type__from_string(xml_string):
 class ResponseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:profiles:SSO:ecp:ResponseType element """
 
+    __slots__ = ['must_understand', 'actor', 'assertion_consumer_service_url']
     c_tag = 'ResponseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -95,6 +98,7 @@ def response_type__from_string(xml_string):
 class RelayStateType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:profiles:SSO:ecp:RelayStateType element """
 
+    __slots__ = ['must_understand', 'actor']
     c_tag = 'RelayStateType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -127,6 +131,7 @@ def relay_state_type__from_string(xml_string):
 class Request(RequestType_):
     """The urn:oasis:names:tc:SAML:2.0:profiles:SSO:ecp:Request element """
 
+    __slots__ = []
     c_tag = 'Request'
     c_namespace = NAMESPACE
     c_children = RequestType_.c_children.copy()
@@ -141,6 +146,7 @@ def request_from_string(xml_string):
 class Response(ResponseType_):
     """The urn:oasis:names:tc:SAML:2.0:profiles:SSO:ecp:Response element """
 
+    __slots__ = []
     c_tag = 'Response'
     c_namespace = NAMESPACE
     c_children = ResponseType_.c_children.copy()
@@ -155,6 +161,7 @@ def response_from_string(xml_string):
 class RelayState(RelayStateType_):
     """The urn:oasis:names:tc:SAML:2.0:profiles:SSO:ecp:RelayState element """
 
+    __slots__ = []
     c_tag = 'RelayState'
     c_namespace = NAMESPACE
     c_children = RelayStateType_.c_children.copy()
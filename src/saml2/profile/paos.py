@@ -14,6 +14,8 @@ NAMESPACE = 'urn:liberty:paos:2003-08'
 class RequestType_(SamlBase):
     """The urn:liberty:paos:2003-08:RequestType element """
 
+    __slots__ = ['response_consumer_url', 'service', 'message_id',
+                 'must_understand', 'actor']
     c_tag = 'RequestType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -54,6 +56,7 @@ def request_type__from_string(xml_string):
 class ResponseType_(SamlBase):
     """The urn:liberty:paos:2003-08:ResponseType element """
 
+    __slots__ = ['ref_to_message_id', 'must_understand', 'actor']
     c_tag = 'ResponseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -88,6 +91,7 @@ def response_type__from_string(xml_string):
 class Request(RequestType_):
     """The urn:liberty:paos:2003-08:Request element """
 
+    __slots__ = []
     c_tag = 'Request'
     c_namespace = NAMESPACE
     c_children = RequestType_.c_children.copy()
@@ -102,6 +106,7 @@ def request_from_string(xml_string):
 class Response(ResponseType_):
     """The urn:liberty:paos:2003-08:Response element """
 
+    __slots__ = []
     c_tag = 'Response'
     c_namespace = NAMESPACE
     c_children = ResponseType_.c_children.copy()
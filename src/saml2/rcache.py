@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+"""
+Identity and state caches kept in a Redis server, or a server that
+speaks the same protocol.
+
+A Cache instance can be given to Saml2Client as identity_cache and a
+StateCache instance as state_cache.
+"""
+import cPickle
+import logging
+import time
+
+import redis
+
+from saml2 import time_util
+from saml2.cache import ToOld, expiry_time
+from saml2.ident import code, decode
+
+logger = logging.getLogger(__name__)
+
+# Prefix of all keys used
+PREFIX = "pysaml2:"
+# Seconds a StateCache keeps an entry
+STATE_LIFETIME = 3600
+
+
+def _dumps(item):
+    return cPickle.dumps(item, cPickle.HIGHEST_PROTOCOL)
+
+
+def _loads(data):
+    return cPickle.loads(data)
+
+
+class Cache(object):
+    """
+    All the session information about a subject is kept in one hash with
+    one field per entity, so all of it can be fetched in one round trip.
+    The hash is removed by the server when the information from the last
+    entity has expired.
+    """
+
+    def __init__(self, url="redis://localhost:6379/0", prefix=PREFIX,
+                 client=None):
+        """
+        :param url: Where the server is
+        :param prefix: Prefix of all keys used
+        :param client: A redis.StrictRedis instance to use instead of
+            connecting to url
+        """
+        if client is None:
+            client = redis.StrictRedis.from_url(url)
+        self._redis = client
+        self._subjects = "%ssubjects" % prefix
+        self.prefix = prefix
+
+    def _key(self, cni):
+        return "%ss:%s" % (self.prefix, cni)
+
+    def delete(self, name_id):
+        """
+
+        :param name_id: The subject identifier, a NameID instance
+        """
+        cni = code(name_id)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.delete(self._key(cni))
+        pipe.srem(self._subjects, cni)
+        pipe.execute()
+
+    def get_identity(self, name_id, entities=None,
+                     check_not_on_or_after=True):
+        """ Get all the identity information that has been received and
+        are still valid about the subject.
+
+        :param name_id: The subject identifier, a NameID instance
+        :param entities: The identifiers of the entities whoes assertions are
+            interesting. If the list is empty all entities are interesting.
+        :return: A 2-tuple consisting of the identity information (a
+            dictionary of attributes and values) and the list of entities
+            whoes information has timed out.
+        """
+        key = self._key(code(name_id))
+        if entities:
+            items = zip(entities, self._redis.hmget(key, entities))
+        else:
+            items = self._redis.hgetall(key).items()
+
+        res = {}
+        oldees = []
+        for entity_id, data in items:
+            if data is None:
+                oldees.append(entity_id)
+                continue
+
+            (timestamp, info) = _loads(data)
+            if check_not_on_or_after and time_util.after(timestamp):
+                oldees.append(entity_id)
+                continue
+
+            if not info:
+                oldees.append(entity_id)
+                continue
+
+            for key, vals in info["ava"].items():
+                try:
+                    tmp = set(res[key]).union(set(vals))
+                    res[key] = list(tmp)
+                except KeyError:
+                    res[key] = vals
+        return res, oldees
+
+    def get(self, name_id, entity_id, check_not_on_or_after=True):
+        """ Get session information about a subject gotten from a
+        specified IdP/AA.
+
+        :param name_id: The subject identifier, a NameID instance
+        :param entity_id: The identifier of the entity_id
+        :param check_not_on_or_after: if True it will check if this
+             subject is still valid or if it is too old. Otherwise it
+             will not check this. True by default.
+        :return: The session information
+        """
+        data = self._redis.hget(self._key(code(name_id)), entity_id)
+        if data is None:
+            raise KeyError(entity_id)
+
+        (timestamp, info) = _loads(data)
+        if check_not_on_or_after and time_util.after(timestamp):
+            raise ToOld("past %s" % timestamp)
+
+        return info or None
+
+    def set(self, name_id, entity_id, info, not_on_or_after=0):
+        """ Stores session information in the cache. Assumes that the name_id
+        is unique within the context of the Service Provider.
+
+        :param name_id: The subject identifier, a NameID instance
+        :param entity_id: The identifier of the entity_id/receiver of an
+            assertion
+        :param info: The session info, the assertion is part of this
+        :param not_on_or_after: A time after which the assertion is not valid.
+        """
+        cni = code(name_id)
+        key = self._key(cni)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hset(key, entity_id, _dumps((not_on_or_after, info)))
+        pipe.sadd(self._subjects, cni)
+        pipe.ttl(key)
+        ttl = pipe.execute()[2]
+
+        if not_on_or_after:
+            # The hash should live as long as its longest lived entity
+            expires = int(expiry_time(not_on_or_after))
+            if ttl is None or ttl < 0 or time.time() + ttl < expires:
+                self._redis.expireat(key, expires)
+
+    def reset(self, name_id, entity_id):
+        """ Scrap the assertions received from a IdP or an AA about a special
+        subject.
+
+        :param name_id: The subject identifier, a NameID instance
+        :param entity_id: The identifier of the entity_id of the assertion
+        """
+        self.set(name_id, entity_id, {}, 0)
+
+    def entities(self, name_id):
+        """ Returns all the entities of assertions for a subject, disregarding
+        whether the assertion still is valid or not.
+
+        :param name_id: The subject identifier, a NameID instance
+        :return: A possibly empty list of entity identifiers
+        """
+        res = self._redis.hkeys(self._key(code(name_id)))
+        if not res:
+            raise KeyError("No such subject")
+        return res
+
+    def receivers(self, name_id):
+        """ Another name for entities() just to make it more logic in the IdP
+            scenario """
+        return self.entities(name_id)
+
+    def active(self, name_id, entity_id):
+        """ Returns the status of assertions from a specific entity_id.
+
+        :param name_id: The ID of the subject
+        :param entity_id: The entity ID of the entity_id of the assertion
+        :return: True or False depending on if the assertion is still
+            valid or not.
+        """
+        data = self._redis.hget(self._key(code(name_id)), entity_id)
+        if data is None:
+            return False
+
+        (timestamp, info) = _loads(data)
+        if not info:
+            return False
+        else:
+            return time_util.not_on_or_after(timestamp)
+
+    def _live(self):
+        cnis = list(self._redis.smembers(self._subjects))
+        pipe = self._redis.pipeline(transaction=False)
+        for cni in cnis:
+            pipe.exists(self._key(cni))
+        exists = pipe.execute()
+        live = [c for c, e in zip(cnis, exists) if e]
+        gone = [c for c, e in zip(cnis, exists) if not e]
+        return live, gone
+
+    def subjects(self):
+        """ Return identifiers for all the subjects that are in the cache.
+
+        :return: list of subject identifiers
+        """
+        live, _ = self._live()
+        return [decode(c) for c in live]
+
+    def sweep(self, limit=None):
+        """ The server removes the information about a subject when it has
+        expired but the subject is left in the list of subjects. This
+        removes those.
+
+        :param limit: Not used, there for compatibility with the other
+            caches
+        :return: The number of subjects removed
+        """
+        _, gone = self._live()
+        if gone:
+            self._redis.srem(self._subjects, *gone)
+        return len(gone)
+
+
+class StateCache(object):
+    """
+    A dictionary like object that keeps the values in a Redis server.
+    Values are removed by the server after lifetime seconds.
+    """
+
+    def __init__(self, url="redis://localhost:6379/0", prefix=PREFIX,
+                 lifetime=STATE_LIFETIME, client=None):
+        """
+        :param url: Where the server is
+        :param prefix: Prefix of all keys used
+        :param lifetime: Seconds to keep a value
+        :param client: A redis.StrictRedis instance to use instead of
+            connecting to url
+        """
+        if client is None:
+            client = redis.StrictRedis.from_url(url)
+        self._redis = client
+        self.prefix = prefix
+        self.lifetime = lifetime
+
+    def _key(self, key):
+        return "%sstate:%s" % (self.prefix, key)
+
+    def __setitem__(self, key, value):
+        self._redis.setex(self._key(key), self.lifetime, _dumps(value))
+
+    def __getitem__(self, key):
+        data = self._redis.get(self._key(key))
+        if data is None:
+            raise KeyError(key)
+        return _loads(data)
+
+    def __delitem__(self, key):
+        if not self._redis.delete(self._key(key)):
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return bool(self._redis.exists(self._key(key)))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
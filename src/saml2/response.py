@@ -35,6 +35,7 @@ from saml2 import saml
 from saml2 import extension_elements_to_elements
 from saml2 import SAMLError
 from saml2 import time_util
+from saml2 import XMLDocument
 
 from saml2.s_utils import RequestVersionTooLow
 from saml2.s_utils import RequestVersionTooHigh
@@ -255,6 +256,8 @@ class StatusResponse(object):
 
         self.xmlstr = ""
         self.origxml = ""
+        # The parsed self.xmlstr, shared by all signature checks
+        self.document = None
         self.name_id = None
         self.response = None
         self.not_on_or_after = 0
@@ -267,6 +270,7 @@ class StatusResponse(object):
 
     def _clear(self):
         self.xmlstr = ""
+        self.document = None
         self.name_id = None
         self.response = None
         self.not_on_or_after = 0
@@ -314,10 +318,11 @@ class StatusResponse(object):
             self.origxml = origxml
         else:
             self.origxml = self.xmlstr
+        self.document = XMLDocument(self.xmlstr)
 
         try:
             self.response = self.signature_check(
-                xmldata, origdoc=origxml, must=self.require_signature,
+                self.document, origdoc=origxml, must=self.require_signature,
                 require_response_signature=self.require_response_signature)
 
         except TypeError:
@@ -404,6 +409,7 @@ class StatusResponse(object):
 
     def update(self, mold):
         self.xmlstr = mold.xmlstr
+        self.document = mold.document
         self.in_response_to = mold.in_response_to
         self.response = mold.response
 
@@ -752,7 +758,7 @@ class AuthnResponse(StatusResponse):
             if not verified:
                 try:
                     self.sec.check_signature(assertion, class_name(assertion),
-                                             self.xmlstr)
+                                             self.document or self.xmlstr)
                 except Exception as exc:
                     logger.error("correctly_signed_response: %s" % exc)
                     raise
@@ -822,8 +828,10 @@ class AuthnResponse(StatusResponse):
         if self.response.encrypted_assertion:
             logger.debug("***Encrypted assertion/-s***")
             decr_text = self.sec.decrypt(self.xmlstr, key_file)
-            resp = samlp.response_from_string(decr_text)
-            res = self.decrypt_assertions(resp.encrypted_assertion, decr_text)
+            self.document = XMLDocument(decr_text)
+            resp = samlp.response_from_string(self.document.tree)
+            res = self.decrypt_assertions(resp.encrypted_assertion,
+                                          self.document)
             if self.response.assertion:
                 self.response.assertion.extend(res)
             else:
@@ -122,6 +122,8 @@ def _verify_value_type(typ, val):
 
 
 class AttributeValueBase(SamlBase):
+    __slots__ = ['_extatt']
+
     def __init__(self,
                  text=None,
                  extension_elements=None,
@@ -269,6 +271,7 @@ class AttributeValueBase(SamlBase):
 class BaseIDAbstractType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:BaseIDAbstractType element """
 
+    __slots__ = ['name_qualifier', 'sp_name_qualifier']
     c_tag = 'BaseIDAbstractType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -295,6 +298,8 @@ class BaseIDAbstractType_(SamlBase):
 class NameIDType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:NameIDType element """
 
+    __slots__ = ['name_qualifier', 'sp_name_qualifier', 'format',
+                 'sp_provided_id']
     c_tag = 'NameIDType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -333,6 +338,7 @@ class EncryptedElementType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:EncryptedElementType element
     """
 
+    __slots__ = ['encrypted_data', 'encrypted_key']
     c_tag = 'EncryptedElementType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -369,6 +375,7 @@ def encrypted_element_type__from_string(xml_string):
 class EncryptedID(EncryptedElementType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:EncryptedID element """
 
+    __slots__ = []
     c_tag = 'EncryptedID'
     c_namespace = NAMESPACE
     c_children = EncryptedElementType_.c_children.copy()
@@ -384,6 +391,7 @@ def encrypted_id_from_string(xml_string):
 class Issuer(NameIDType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:Issuer element """
 
+    __slots__ = []
     c_tag = 'Issuer'
     c_namespace = NAMESPACE
     c_children = NameIDType_.c_children.copy()
@@ -399,6 +407,7 @@ def issuer_from_string(xml_string):
 class AssertionIDRef(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AssertionIDRef element """
 
+    __slots__ = []
     c_tag = 'AssertionIDRef'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'NCName'}
@@ -415,6 +424,7 @@ def assertion_id_ref_from_string(xml_string):
 class AssertionURIRef(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AssertionURIRef element """
 
+    __slots__ = []
     c_tag = 'AssertionURIRef'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -432,6 +442,8 @@ class SubjectConfirmationDataType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:SubjectConfirmationDataType
     element """
 
+    __slots__ = ['not_before', 'not_on_or_after', 'recipient',
+                 'in_response_to', 'address']
     c_tag = 'SubjectConfirmationDataType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -476,6 +488,7 @@ class KeyInfoConfirmationDataType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:KeyInfoConfirmationDataType
     element """
 
+    __slots__ = ['key_info']
     c_tag = 'KeyInfoConfirmationDataType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -508,6 +521,7 @@ class ConditionAbstractType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:ConditionAbstractType
     element """
 
+    __slots__ = []
     c_tag = 'ConditionAbstractType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -519,6 +533,7 @@ class ConditionAbstractType_(SamlBase):
 class Audience(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:Audience element """
 
+    __slots__ = []
     c_tag = 'Audience'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -535,6 +550,7 @@ def audience_from_string(xml_string):
 class OneTimeUseType_(ConditionAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:OneTimeUseType element """
 
+    __slots__ = []
     c_tag = 'OneTimeUseType'
     c_namespace = NAMESPACE
     c_children = ConditionAbstractType_.c_children.copy()
@@ -551,6 +567,7 @@ class ProxyRestrictionType_(ConditionAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:ProxyRestrictionType element
     """
 
+    __slots__ = ['count', 'audience']
     c_tag = 'ProxyRestrictionType'
     c_namespace = NAMESPACE
     c_children = ConditionAbstractType_.c_children.copy()
@@ -583,6 +600,7 @@ def proxy_restriction_type__from_string(xml_string):
 class EncryptedAssertion(EncryptedElementType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:EncryptedAssertion element """
 
+    __slots__ = []
     c_tag = 'EncryptedAssertion'
     c_namespace = NAMESPACE
     c_children = EncryptedElementType_.c_children.copy()
@@ -599,6 +617,7 @@ class StatementAbstractType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:StatementAbstractType element
     """
 
+    __slots__ = []
     c_tag = 'StatementAbstractType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -610,6 +629,7 @@ class StatementAbstractType_(SamlBase):
 class SubjectLocalityType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:SubjectLocalityType element """
 
+    __slots__ = ['address', 'dns_name']
     c_tag = 'SubjectLocalityType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -641,6 +661,7 @@ class AuthnContextClassRef(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AuthnContextClassRef element
     """
 
+    __slots__ = []
     c_tag = 'AuthnContextClassRef'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -657,6 +678,7 @@ def authn_context_class_ref_from_string(xml_string):
 class AuthnContextDeclRef(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AuthnContextDeclRef element """
 
+    __slots__ = []
     c_tag = 'AuthnContextDeclRef'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -673,6 +695,7 @@ def authn_context_decl_ref_from_string(xml_string):
 class AuthnContextDecl(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AuthnContextDecl element """
 
+    __slots__ = []
     c_tag = 'AuthnContextDecl'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyType'}
@@ -690,6 +713,7 @@ class AuthenticatingAuthority(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AuthenticatingAuthority
     element """
 
+    __slots__ = []
     c_tag = 'AuthenticatingAuthority'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -707,6 +731,7 @@ def authenticating_authority_from_string(xml_string):
 class DecisionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:DecisionType element """
 
+    __slots__ = []
     c_tag = 'DecisionType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string', 'enumeration': ['Permit', 'Deny',
@@ -724,6 +749,7 @@ def decision_type__from_string(xml_string):
 class ActionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:ActionType element """
 
+    __slots__ = ['namespace']
     c_tag = 'ActionType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -752,6 +778,7 @@ def action_type__from_string(xml_string):
 class AttributeValue(AttributeValueBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AttributeValue element """
 
+    __slots__ = []
     c_tag = 'AttributeValue'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyType'}
@@ -768,6 +795,7 @@ def attribute_value_from_string(xml_string):
 class EncryptedAttribute(EncryptedElementType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:EncryptedAttribute element """
 
+    __slots__ = []
     c_tag = 'EncryptedAttribute'
     c_namespace = NAMESPACE
     c_children = EncryptedElementType_.c_children.copy()
@@ -783,6 +811,7 @@ def encrypted_attribute_from_string(xml_string):
 class BaseID(BaseIDAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:BaseID element """
 
+    __slots__ = []
     c_tag = 'BaseID'
     c_namespace = NAMESPACE
     c_children = BaseIDAbstractType_.c_children.copy()
@@ -798,6 +827,7 @@ def base_id_from_string(xml_string):
 class NameID(NameIDType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:NameID element """
 
+    __slots__ = []
     c_tag = 'NameID'
     c_namespace = NAMESPACE
     c_children = NameIDType_.c_children.copy()
@@ -814,6 +844,7 @@ class SubjectConfirmationData(SubjectConfirmationDataType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:SubjectConfirmationData
     element """
 
+    __slots__ = []
     c_tag = 'SubjectConfirmationData'
     c_namespace = NAMESPACE
     c_children = SubjectConfirmationDataType_.c_children.copy()
@@ -830,6 +861,7 @@ def subject_confirmation_data_from_string(xml_string):
 class Condition(ConditionAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:Condition element """
 
+    __slots__ = []
     c_tag = 'Condition'
     c_namespace = NAMESPACE
     c_children = ConditionAbstractType_.c_children.copy()
@@ -846,6 +878,7 @@ class AudienceRestrictionType_(ConditionAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AudienceRestrictionType
     element """
 
+    __slots__ = ['audience']
     c_tag = 'AudienceRestrictionType'
     c_namespace = NAMESPACE
     c_children = ConditionAbstractType_.c_children.copy()
@@ -876,6 +909,7 @@ def audience_restriction_type__from_string(xml_string):
 class OneTimeUse(OneTimeUseType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:OneTimeUse element """
 
+    __slots__ = []
     c_tag = 'OneTimeUse'
     c_namespace = NAMESPACE
     c_children = OneTimeUseType_.c_children.copy()
@@ -891,6 +925,7 @@ def one_time_use_from_string(xml_string):
 class ProxyRestriction(ProxyRestrictionType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:ProxyRestriction element """
 
+    __slots__ = []
     c_tag = 'ProxyRestriction'
     c_namespace = NAMESPACE
     c_children = ProxyRestrictionType_.c_children.copy()
@@ -906,6 +941,7 @@ def proxy_restriction_from_string(xml_string):
 class Statement(StatementAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:Statement element """
 
+    __slots__ = []
     c_tag = 'Statement'
     c_namespace = NAMESPACE
     c_children = StatementAbstractType_.c_children.copy()
@@ -921,6 +957,7 @@ def statement_from_string(xml_string):
 class SubjectLocality(SubjectLocalityType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:SubjectLocality element """
 
+    __slots__ = []
     c_tag = 'SubjectLocality'
     c_namespace = NAMESPACE
     c_children = SubjectLocalityType_.c_children.copy()
@@ -948,6 +985,8 @@ def subject_locality_from_string(xml_string):
 class AuthnContextType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AuthnContextType element """
 
+    __slots__ = ['authn_context_class_ref', 'authn_context_decl',
+                 'authn_context_decl_ref', 'authenticating_authority']
     c_tag = 'AuthnContextType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1006,6 +1045,7 @@ def authn_context_type__from_string(xml_string):
 class Action(ActionType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:Action element """
 
+    __slots__ = []
     c_tag = 'Action'
     c_namespace = NAMESPACE
     c_children = ActionType_.c_children.copy()
@@ -1021,6 +1061,7 @@ def action_from_string(xml_string):
 class AttributeType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AttributeType element """
 
+    __slots__ = ['name', 'name_format', 'friendly_name', 'attribute_value']
     c_tag = 'AttributeType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1063,6 +1104,8 @@ class SubjectConfirmationType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:SubjectConfirmationType
     element """
 
+    __slots__ = ['method', 'base_id', 'name_id', 'encrypted_id',
+                 'subject_confirmation_data']
     c_tag = 'SubjectConfirmationType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1115,6 +1158,7 @@ def subject_confirmation_type__from_string(xml_string):
 class AudienceRestriction(AudienceRestrictionType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AudienceRestriction element """
 
+    __slots__ = []
     c_tag = 'AudienceRestriction'
     c_namespace = NAMESPACE
     c_children = AudienceRestrictionType_.c_children.copy()
@@ -1130,6 +1174,7 @@ def audience_restriction_from_string(xml_string):
 class AuthnContext(AuthnContextType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AuthnContext element """
 
+    __slots__ = []
     c_tag = 'AuthnContext'
     c_namespace = NAMESPACE
     c_children = AuthnContextType_.c_children.copy()
@@ -1145,6 +1190,7 @@ def authn_context_from_string(xml_string):
 class Attribute(AttributeType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:Attribute element """
 
+    __slots__ = []
     c_tag = 'Attribute'
     c_namespace = NAMESPACE
     c_children = AttributeType_.c_children.copy()
@@ -1160,6 +1206,7 @@ def attribute_from_string(xml_string):
 class SubjectConfirmation(SubjectConfirmationType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:SubjectConfirmation element """
 
+    __slots__ = []
     c_tag = 'SubjectConfirmation'
     c_namespace = NAMESPACE
     c_children = SubjectConfirmationType_.c_children.copy()
@@ -1175,6 +1222,8 @@ def subject_confirmation_from_string(xml_string):
 class ConditionsType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:ConditionsType element """
 
+    __slots__ = ['not_before', 'not_on_or_after', 'condition',
+                 'audience_restriction', 'one_time_use', 'proxy_restriction']
     c_tag = 'ConditionsType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1239,6 +1288,8 @@ def conditions_type__from_string(xml_string):
 class AuthnStatementType_(StatementAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AuthnStatementType element """
 
+    __slots__ = ['authn_instant', 'session_index', 'session_not_on_or_after',
+                 'subject_locality', 'authn_context']
     c_tag = 'AuthnStatementType'
     c_namespace = NAMESPACE
     c_children = StatementAbstractType_.c_children.copy()
@@ -1283,6 +1334,7 @@ class AttributeStatementType_(StatementAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AttributeStatementType
     element """
 
+    __slots__ = ['attribute', 'encrypted_attribute']
     c_tag = 'AttributeStatementType'
     c_namespace = NAMESPACE
     c_children = StatementAbstractType_.c_children.copy()
@@ -1320,6 +1372,7 @@ def attribute_statement_type__from_string(xml_string):
 class SubjectType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:SubjectType element """
 
+    __slots__ = ['base_id', 'name_id', 'encrypted_id', 'subject_confirmation']
     c_tag = 'SubjectType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1366,6 +1419,7 @@ def subject_type__from_string(xml_string):
 class Conditions(ConditionsType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:Conditions element """
 
+    __slots__ = []
     c_tag = 'Conditions'
     c_namespace = NAMESPACE
     c_children = ConditionsType_.c_children.copy()
@@ -1381,6 +1435,7 @@ def conditions_from_string(xml_string):
 class AuthnStatement(AuthnStatementType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AuthnStatement element """
 
+    __slots__ = []
     c_tag = 'AuthnStatement'
     c_namespace = NAMESPACE
     c_children = AuthnStatementType_.c_children.copy()
@@ -1396,6 +1451,7 @@ def authn_statement_from_string(xml_string):
 class AttributeStatement(AttributeStatementType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AttributeStatement element """
 
+    __slots__ = []
     c_tag = 'AttributeStatement'
     c_namespace = NAMESPACE
     c_children = AttributeStatementType_.c_children.copy()
@@ -1411,6 +1467,7 @@ def attribute_statement_from_string(xml_string):
 class Subject(SubjectType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:Subject element """
 
+    __slots__ = []
     c_tag = 'Subject'
     c_namespace = NAMESPACE
     c_children = SubjectType_.c_children.copy()
@@ -1429,6 +1486,8 @@ def subject_from_string(xml_string):
 class EvidenceType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:EvidenceType element """
 
+    __slots__ = ['assertion_id_ref', 'assertion_uri_ref', 'assertion',
+                 'encrypted_assertion']
     c_tag = 'EvidenceType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1473,6 +1532,7 @@ def evidence_type__from_string(xml_string):
 class Evidence(EvidenceType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:Evidence element """
 
+    __slots__ = []
     c_tag = 'Evidence'
     c_namespace = NAMESPACE
     c_children = EvidenceType_.c_children.copy()
@@ -1489,6 +1549,7 @@ class AuthzDecisionStatementType_(StatementAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AuthzDecisionStatementType
     element """
 
+    __slots__ = ['resource', 'decision', 'action', 'evidence']
     c_tag = 'AuthzDecisionStatementType'
     c_namespace = NAMESPACE
     c_children = StatementAbstractType_.c_children.copy()
@@ -1531,6 +1592,7 @@ class AuthzDecisionStatement(AuthzDecisionStatementType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AuthzDecisionStatement
     element """
 
+    __slots__ = []
     c_tag = 'AuthzDecisionStatement'
     c_namespace = NAMESPACE
     c_children = AuthzDecisionStatementType_.c_children.copy()
@@ -1549,6 +1611,10 @@ def authz_decision_statement_from_string(xml_string):
 class AssertionType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AssertionType element """
 
+    __slots__ = ['version', 'id', 'issue_instant', 'issuer', 'signature',
+                 'subject', 'conditions', 'advice', 'statement',
+                 'authn_statement', 'authz_decision_statement',
+                 'attribute_statement']
     c_tag = 'AssertionType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1643,6 +1709,7 @@ def assertion_type__from_string(xml_string):
 class Assertion(AssertionType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:Assertion element """
 
+    __slots__ = []
     c_tag = 'Assertion'
     c_namespace = NAMESPACE
     c_children = AssertionType_.c_children.copy()
@@ -1658,6 +1725,8 @@ def assertion_from_string(xml_string):
 class AdviceType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:assertion:AdviceType element """
 
+    __slots__ = ['assertion_id_ref', 'assertion_uri_ref', 'assertion',
+                 'encrypted_assertion']
     c_tag = 'AdviceType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1705,6 +1774,7 @@ def advice_type__from_string(xml_string):
 class Advice(AdviceType_):
     """The urn:oasis:names:tc:SAML:2.0:assertion:Advice element """
 
+    __slots__ = []
     c_tag = 'Advice'
     c_namespace = NAMESPACE
     c_children = AdviceType_.c_children.copy()
@@ -53,6 +53,7 @@ STATUS_UNSUPPORTED_BINDING = (
 class ExtensionsType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:ExtensionsType element """
 
+    __slots__ = []
     c_tag = 'ExtensionsType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -68,6 +69,7 @@ def extensions_type__from_string(xml_string):
 class StatusMessage(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:StatusMessage element """
 
+    __slots__ = []
     c_tag = 'StatusMessage'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -84,6 +86,7 @@ def status_message_from_string(xml_string):
 class StatusDetailType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:StatusDetailType element """
 
+    __slots__ = []
     c_tag = 'StatusDetailType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -101,6 +104,7 @@ def status_detail_type__from_string(xml_string):
 class AuthnContextComparisonType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:AuthnContextComparisonType element """
 
+    __slots__ = []
     c_tag = 'AuthnContextComparisonType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string', 'enumeration': ['exact', 'minimum',
@@ -119,6 +123,7 @@ def authn_context_comparison_type__from_string(xml_string):
 class NameIDPolicyType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:NameIDPolicyType element """
 
+    __slots__ = ['format', 'sp_name_qualifier', 'allow_create']
     c_tag = 'NameIDPolicyType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -154,6 +159,7 @@ def name_id_policy_type__from_string(xml_string):
 class RequesterID(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:RequesterID element """
 
+    __slots__ = []
     c_tag = 'RequesterID'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -170,6 +176,7 @@ def requester_id_from_string(xml_string):
 class IDPEntryType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:IDPEntryType element """
 
+    __slots__ = ['provider_id', 'name', 'loc']
     c_tag = 'IDPEntryType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -203,6 +210,7 @@ def idp_entry_type__from_string(xml_string):
 class GetComplete(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:GetComplete element """
 
+    __slots__ = []
     c_tag = 'GetComplete'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -219,6 +227,7 @@ def get_complete_from_string(xml_string):
 class Artifact(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:Artifact element """
 
+    __slots__ = []
     c_tag = 'Artifact'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -235,6 +244,7 @@ def artifact_from_string(xml_string):
 class NewID(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:NewID element """
 
+    __slots__ = []
     c_tag = 'NewID'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -251,6 +261,7 @@ def new_id_from_string(xml_string):
 class NewEncryptedID(saml.EncryptedElementType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:NewEncryptedID element """
 
+    __slots__ = []
     c_tag = 'NewEncryptedID'
     c_namespace = NAMESPACE
     c_children = saml.EncryptedElementType_.c_children.copy()
@@ -266,6 +277,7 @@ def new_encrypted_id_from_string(xml_string):
 class TerminateType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:TerminateType element """
 
+    __slots__ = []
     c_tag = 'TerminateType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -281,6 +293,7 @@ def terminate_type__from_string(xml_string):
 class SessionIndex(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:SessionIndex element """
 
+    __slots__ = []
     c_tag = 'SessionIndex'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -297,6 +310,7 @@ def session_index_from_string(xml_string):
 class Extensions(ExtensionsType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:Extensions element """
 
+    __slots__ = []
     c_tag = 'Extensions'
     c_namespace = NAMESPACE
     c_children = ExtensionsType_.c_children.copy()
@@ -312,6 +326,7 @@ def extensions_from_string(xml_string):
 class StatusDetail(StatusDetailType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:StatusDetail element """
 
+    __slots__ = []
     c_tag = 'StatusDetail'
     c_namespace = NAMESPACE
     c_children = StatusDetailType_.c_children.copy()
@@ -327,6 +342,8 @@ def status_detail_from_string(xml_string):
 class RequestAbstractType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:RequestAbstractType element """
 
+    __slots__ = ['id', 'version', 'issue_instant', 'destination', 'consent',
+                 'issuer', 'signature', 'extensions']
     c_tag = 'RequestAbstractType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -378,6 +395,7 @@ class RequestAbstractType_(SamlBase):
 class AssertionIDRequestType_(RequestAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:AssertionIDRequestType element """
 
+    __slots__ = ['assertion_id_ref']
     c_tag = 'AssertionIDRequestType'
     c_namespace = NAMESPACE
     c_children = RequestAbstractType_.c_children.copy()
@@ -425,6 +443,7 @@ def assertion_id_request_type__from_string(xml_string):
 class SubjectQueryAbstractType_(RequestAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:SubjectQueryAbstractType element """
 
+    __slots__ = ['subject']
     c_tag = 'SubjectQueryAbstractType'
     c_namespace = NAMESPACE
     c_children = RequestAbstractType_.c_children.copy()
@@ -466,6 +485,8 @@ class SubjectQueryAbstractType_(RequestAbstractType_):
 class RequestedAuthnContextType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:RequestedAuthnContextType element """
 
+    __slots__ = ['comparison', 'authn_context_class_ref',
+                 'authn_context_decl_ref']
     c_tag = 'RequestedAuthnContextType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -509,6 +530,7 @@ def requested_authn_context_type__from_string(xml_string):
 class AttributeQueryType_(SubjectQueryAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:AttributeQueryType element """
 
+    __slots__ = ['attribute']
     c_tag = 'AttributeQueryType'
     c_namespace = NAMESPACE
     c_children = SubjectQueryAbstractType_.c_children.copy()
@@ -558,6 +580,7 @@ def attribute_query_type__from_string(xml_string):
 class AuthzDecisionQueryType_(SubjectQueryAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:AuthzDecisionQueryType element """
 
+    __slots__ = ['resource', 'action', 'evidence']
     c_tag = 'AuthzDecisionQueryType'
     c_namespace = NAMESPACE
     c_children = SubjectQueryAbstractType_.c_children.copy()
@@ -615,6 +638,7 @@ def authz_decision_query_type__from_string(xml_string):
 class NameIDPolicy(NameIDPolicyType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:NameIDPolicy element """
 
+    __slots__ = []
     c_tag = 'NameIDPolicy'
     c_namespace = NAMESPACE
     c_children = NameIDPolicyType_.c_children.copy()
@@ -630,6 +654,7 @@ def name_id_policy_from_string(xml_string):
 class IDPEntry(IDPEntryType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:IDPEntry element """
 
+    __slots__ = []
     c_tag = 'IDPEntry'
     c_namespace = NAMESPACE
     c_children = IDPEntryType_.c_children.copy()
@@ -645,6 +670,7 @@ def idp_entry_from_string(xml_string):
 class ArtifactResolveType_(RequestAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:ArtifactResolveType element """
 
+    __slots__ = ['artifact']
     c_tag = 'ArtifactResolveType'
     c_namespace = NAMESPACE
     c_children = RequestAbstractType_.c_children.copy()
@@ -690,6 +716,7 @@ def artifact_resolve_type__from_string(xml_string):
 class Terminate(TerminateType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:Terminate element """
 
+    __slots__ = []
     c_tag = 'Terminate'
     c_namespace = NAMESPACE
     c_children = TerminateType_.c_children.copy()
@@ -705,6 +732,8 @@ def terminate_from_string(xml_string):
 class LogoutRequestType_(RequestAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:LogoutRequestType element """
 
+    __slots__ = ['reason', 'not_on_or_after', 'base_id', 'name_id',
+                 'encrypted_id', 'session_index']
     c_tag = 'LogoutRequestType'
     c_namespace = NAMESPACE
     c_children = RequestAbstractType_.c_children.copy()
@@ -774,6 +803,7 @@ class NameIDMappingRequestType_(RequestAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:NameIDMappingRequestType
     element """
 
+    __slots__ = ['base_id', 'name_id', 'encrypted_id', 'name_id_policy']
     c_tag = 'NameIDMappingRequestType'
     c_namespace = NAMESPACE
     c_children = RequestAbstractType_.c_children.copy()
@@ -836,6 +866,7 @@ def name_id_mapping_request_type__from_string(xml_string):
 class AssertionIDRequest(AssertionIDRequestType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:AssertionIDRequest element """
 
+    __slots__ = []
     c_tag = 'AssertionIDRequest'
     c_namespace = NAMESPACE
     c_children = AssertionIDRequestType_.c_children.copy()
@@ -851,6 +882,7 @@ def assertion_id_request_from_string(xml_string):
 class SubjectQuery(SubjectQueryAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:SubjectQuery element """
 
+    __slots__ = []
     c_tag = 'SubjectQuery'
     c_namespace = NAMESPACE
     c_children = SubjectQueryAbstractType_.c_children.copy()
@@ -866,6 +898,7 @@ def subject_query_from_string(xml_string):
 class RequestedAuthnContext(RequestedAuthnContextType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:RequestedAuthnContext element """
 
+    __slots__ = []
     c_tag = 'RequestedAuthnContext'
     c_namespace = NAMESPACE
     c_children = RequestedAuthnContextType_.c_children.copy()
@@ -881,6 +914,7 @@ def requested_authn_context_from_string(xml_string):
 class AttributeQuery(AttributeQueryType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:AttributeQuery element """
 
+    __slots__ = []
     c_tag = 'AttributeQuery'
     c_namespace = NAMESPACE
     c_children = AttributeQueryType_.c_children.copy()
@@ -896,6 +930,7 @@ def attribute_query_from_string(xml_string):
 class AuthzDecisionQuery(AuthzDecisionQueryType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:AuthzDecisionQuery element """
 
+    __slots__ = []
     c_tag = 'AuthzDecisionQuery'
     c_namespace = NAMESPACE
     c_children = AuthzDecisionQueryType_.c_children.copy()
@@ -911,6 +946,7 @@ def authz_decision_query_from_string(xml_string):
 class IDPListType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:IDPListType element """
 
+    __slots__ = ['idp_entry', 'get_complete']
     c_tag = 'IDPListType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -946,6 +982,7 @@ def idp_list_type__from_string(xml_string):
 class ArtifactResolve(ArtifactResolveType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:ArtifactResolve element """
 
+    __slots__ = []
     c_tag = 'ArtifactResolve'
     c_namespace = NAMESPACE
     c_children = ArtifactResolveType_.c_children.copy()
@@ -961,6 +998,8 @@ def artifact_resolve_from_string(xml_string):
 class ManageNameIDRequestType_(RequestAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:ManageNameIDRequestType element """
 
+    __slots__ = ['name_id', 'encrypted_id', 'new_id', 'new_encrypted_id',
+                 'terminate']
     c_tag = 'ManageNameIDRequestType'
     c_namespace = NAMESPACE
     c_children = RequestAbstractType_.c_children.copy()
@@ -1032,6 +1071,7 @@ def manage_name_id_request_type__from_string(xml_string):
 class LogoutRequest(LogoutRequestType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:LogoutRequest element """
 
+    __slots__ = []
     c_tag = 'LogoutRequest'
     c_namespace = NAMESPACE
     c_children = LogoutRequestType_.c_children.copy()
@@ -1047,6 +1087,7 @@ def logout_request_from_string(xml_string):
 class NameIDMappingRequest(NameIDMappingRequestType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:NameIDMappingRequest element """
 
+    __slots__ = []
     c_tag = 'NameIDMappingRequest'
     c_namespace = NAMESPACE
     c_children = NameIDMappingRequestType_.c_children.copy()
@@ -1062,6 +1103,7 @@ def name_id_mapping_request_from_string(xml_string):
 class AuthnQueryType_(SubjectQueryAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:AuthnQueryType element """
 
+    __slots__ = ['session_index', 'requested_authn_context']
     c_tag = 'AuthnQueryType'
     c_namespace = NAMESPACE
     c_children = SubjectQueryAbstractType_.c_children.copy()
@@ -1115,6 +1157,7 @@ def authn_query_type__from_string(xml_string):
 class IDPList(IDPListType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:IDPList element """
 
+    __slots__ = []
     c_tag = 'IDPList'
     c_namespace = NAMESPACE
     c_children = IDPListType_.c_children.copy()
@@ -1130,6 +1173,7 @@ def idp_list_from_string(xml_string):
 class ManageNameIDRequest(ManageNameIDRequestType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:ManageNameIDRequest element """
 
+    __slots__ = []
     c_tag = 'ManageNameIDRequest'
     c_namespace = NAMESPACE
     c_children = ManageNameIDRequestType_.c_children.copy()
@@ -1145,6 +1189,7 @@ def manage_name_id_request_from_string(xml_string):
 class AuthnQuery(AuthnQueryType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:AuthnQuery element """
 
+    __slots__ = []
     c_tag = 'AuthnQuery'
     c_namespace = NAMESPACE
     c_children = AuthnQueryType_.c_children.copy()
@@ -1160,6 +1205,7 @@ def authn_query_from_string(xml_string):
 class ScopingType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:ScopingType element """
 
+    __slots__ = ['proxy_count', 'idp_list', 'requester_id']
     c_tag = 'ScopingType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1198,6 +1244,7 @@ def scoping_type__from_string(xml_string):
 class Scoping(ScopingType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:Scoping element """
 
+    __slots__ = []
     c_tag = 'Scoping'
     c_namespace = NAMESPACE
     c_children = ScopingType_.c_children.copy()
@@ -1213,6 +1260,12 @@ def scoping_from_string(xml_string):
 class AuthnRequestType_(RequestAbstractType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:AuthnRequestType element """
 
+    __slots__ = ['force_authn', 'is_passive', 'protocol_binding',
+                 'assertion_consumer_service_index',
+                 'assertion_consumer_service_url',
+                 'attribute_consuming_service_index', 'provider_name',
+                 'subject', 'name_id_policy', 'conditions',
+                 'requested_authn_context', 'scoping']
     c_tag = 'AuthnRequestType'
     c_namespace = NAMESPACE
     c_children = RequestAbstractType_.c_children.copy()
@@ -1305,6 +1358,7 @@ def authn_request_type__from_string(xml_string):
 class AuthnRequest(AuthnRequestType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:AuthnRequest element """
 
+    __slots__ = []
     c_tag = 'AuthnRequest'
     c_namespace = NAMESPACE
     c_children = AuthnRequestType_.c_children.copy()
@@ -1320,6 +1374,7 @@ def authn_request_from_string(xml_string):
 class StatusType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:StatusType element """
 
+    __slots__ = ['status_code', 'status_message', 'status_detail']
     c_tag = 'StatusType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1360,6 +1415,7 @@ def status_type__from_string(xml_string):
 class Status(StatusType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:Status element """
 
+    __slots__ = []
     c_tag = 'Status'
     c_namespace = NAMESPACE
     c_children = StatusType_.c_children.copy()
@@ -1375,6 +1431,9 @@ def status_from_string(xml_string):
 class StatusResponseType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:StatusResponseType element """
 
+    __slots__ = ['id', 'in_response_to', 'version', 'issue_instant',
+                 'destination', 'consent', 'issuer', 'signature', 'extensions',
+                 'status']
     c_tag = 'StatusResponseType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1437,6 +1496,7 @@ def status_response_type__from_string(xml_string):
 class ResponseType_(StatusResponseType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:ResponseType element """
 
+    __slots__ = ['assertion', 'encrypted_assertion']
     c_tag = 'ResponseType'
     c_namespace = NAMESPACE
     c_children = StatusResponseType_.c_children.copy()
@@ -1492,6 +1552,7 @@ def response_type__from_string(xml_string):
 class ArtifactResponseType_(StatusResponseType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:ArtifactResponseType element """
 
+    __slots__ = []
     c_tag = 'ArtifactResponseType'
     c_namespace = NAMESPACE
     c_children = StatusResponseType_.c_children.copy()
@@ -1508,6 +1569,7 @@ def artifact_response_type__from_string(xml_string):
 class ManageNameIDResponse(StatusResponseType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:ManageNameIDResponse element """
 
+    __slots__ = []
     c_tag = 'ManageNameIDResponse'
     c_namespace = NAMESPACE
     c_children = StatusResponseType_.c_children.copy()
@@ -1523,6 +1585,7 @@ def manage_name_id_response_from_string(xml_string):
 class LogoutResponse(StatusResponseType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:LogoutResponse element """
 
+    __slots__ = []
     c_tag = 'LogoutResponse'
     c_namespace = NAMESPACE
     c_children = StatusResponseType_.c_children.copy()
@@ -1538,6 +1601,7 @@ def logout_response_from_string(xml_string):
 class NameIDMappingResponseType_(StatusResponseType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:NameIDMappingResponseType element """
 
+    __slots__ = ['name_id', 'encrypted_id']
     c_tag = 'NameIDMappingResponseType'
     c_namespace = NAMESPACE
     c_children = StatusResponseType_.c_children.copy()
@@ -1594,6 +1658,7 @@ def name_id_mapping_response_type__from_string(xml_string):
 class Response(ResponseType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:Response element """
 
+    __slots__ = []
     c_tag = 'Response'
     c_namespace = NAMESPACE
     c_children = ResponseType_.c_children.copy()
@@ -1609,6 +1674,7 @@ def response_from_string(xml_string):
 class ArtifactResponse(ArtifactResponseType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:ArtifactResponse element """
 
+    __slots__ = []
     c_tag = 'ArtifactResponse'
     c_namespace = NAMESPACE
     c_children = ArtifactResponseType_.c_children.copy()
@@ -1624,6 +1690,7 @@ def artifact_response_from_string(xml_string):
 class NameIDMappingResponse(NameIDMappingResponseType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:NameIDMappingResponse element """
 
+    __slots__ = []
     c_tag = 'NameIDMappingResponse'
     c_namespace = NAMESPACE
     c_children = NameIDMappingResponseType_.c_children.copy()
@@ -1641,6 +1708,7 @@ def name_id_mapping_response_from_string(xml_string):
 class StatusCodeType_(SamlBase):
     """The urn:oasis:names:tc:SAML:2.0:protocol:StatusCodeType element """
 
+    __slots__ = ['value', 'status_code']
     c_tag = 'StatusCodeType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1672,6 +1740,7 @@ def status_code_type__from_string(xml_string):
 class StatusCode(StatusCodeType_):
     """The urn:oasis:names:tc:SAML:2.0:protocol:StatusCode element """
 
+    __slots__ = []
     c_tag = 'StatusCode'
     c_namespace = NAMESPACE
     c_children = StatusCodeType_.c_children.copy()
@@ -14,6 +14,7 @@ NAMESPACE = 'http://schemas.xmlsoap.org/wsdl/soap/'
 class EncodingStyle_(SamlBase):
     """The http://schemas.xmlsoap.org/wsdl/soap/:encodingStyle element """
 
+    __slots__ = []
     c_tag = 'encodingStyle'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -28,6 +29,7 @@ def encoding_style__from_string(xml_string):
 class TStyleChoice_(SamlBase):
     """The http://schemas.xmlsoap.org/wsdl/soap/:tStyleChoice element """
 
+    __slots__ = []
     c_tag = 'tStyleChoice'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:string', 'enumeration': ['rpc', 'document']}
@@ -43,6 +45,7 @@ def t_style_choice__from_string(xml_string):
 class TOperation_(wsdl.TExtensibilityElement_):
     """The http://schemas.xmlsoap.org/wsdl/soap/:tOperation element """
 
+    __slots__ = ['soap_action', 'style']
     c_tag = 'tOperation'
     c_namespace = NAMESPACE
     c_children = wsdl.TExtensibilityElement_.c_children.copy()
@@ -76,6 +79,7 @@ def t_operation__from_string(xml_string):
 class UseChoice_(SamlBase):
     """The http://schemas.xmlsoap.org/wsdl/soap/:useChoice element """
 
+    __slots__ = []
     c_tag = 'useChoice'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'xs:string', 'enumeration': ['literal', 'encoded']}
@@ -91,6 +95,7 @@ def use_choice__from_string(xml_string):
 class TFaultRes_(SamlBase):
     """The http://schemas.xmlsoap.org/wsdl/soap/:tFaultRes element """
 
+    __slots__ = ['required', 'parts', 'encoding_style', 'use', 'namespace']
     c_tag = 'tFaultRes'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -128,6 +133,7 @@ class TFaultRes_(SamlBase):
 class TFault_(TFaultRes_):
     """The http://schemas.xmlsoap.org/wsdl/soap/:tFault element """
 
+    __slots__ = ['name']
     c_tag = 'tFault'
     c_namespace = NAMESPACE
     c_children = TFaultRes_.c_children.copy()
@@ -166,6 +172,7 @@ def t_fault__from_string(xml_string):
 class THeaderFault_(SamlBase):
     """The http://schemas.xmlsoap.org/wsdl/soap/:tHeaderFault element """
 
+    __slots__ = ['message', 'part', 'use', 'encoding_style', 'namespace']
     c_tag = 'tHeaderFault'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -206,6 +213,7 @@ def t_header_fault__from_string(xml_string):
 class TAddress_(wsdl.TExtensibilityElement_):
     """The http://schemas.xmlsoap.org/wsdl/soap/:tAddress element """
 
+    __slots__ = ['location']
     c_tag = 'tAddress'
     c_namespace = NAMESPACE
     c_children = wsdl.TExtensibilityElement_.c_children.copy()
@@ -236,6 +244,7 @@ def t_address__from_string(xml_string):
 class TBinding_(wsdl.TExtensibilityElement_):
     """The http://schemas.xmlsoap.org/wsdl/soap/:tBinding element """
 
+    __slots__ = ['transport', 'style']
     c_tag = 'tBinding'
     c_namespace = NAMESPACE
     c_children = wsdl.TExtensibilityElement_.c_children.copy()
@@ -269,6 +278,7 @@ def t_binding__from_string(xml_string):
 class Operation(TOperation_):
     """The http://schemas.xmlsoap.org/wsdl/soap/:operation element """
 
+    __slots__ = []
     c_tag = 'operation'
     c_namespace = NAMESPACE
     c_children = TOperation_.c_children.copy()
@@ -283,6 +293,7 @@ def operation_from_string(xml_string):
 class TBody_(wsdl.TExtensibilityElement_):
     """The http://schemas.xmlsoap.org/wsdl/soap/:tBody element """
 
+    __slots__ = ['parts', 'encoding_style', 'use', 'namespace']
     c_tag = 'tBody'
     c_namespace = NAMESPACE
     c_children = wsdl.TExtensibilityElement_.c_children.copy()
@@ -322,6 +333,7 @@ def t_body__from_string(xml_string):
 class Fault(TFault_):
     """The http://schemas.xmlsoap.org/wsdl/soap/:fault element """
 
+    __slots__ = []
     c_tag = 'fault'
     c_namespace = NAMESPACE
     c_children = TFault_.c_children.copy()
@@ -336,6 +348,7 @@ def fault_from_string(xml_string):
 class Headerfault(THeaderFault_):
     """The http://schemas.xmlsoap.org/wsdl/soap/:headerfault element """
 
+    __slots__ = []
     c_tag = 'headerfault'
     c_namespace = NAMESPACE
     c_children = THeaderFault_.c_children.copy()
@@ -350,6 +363,7 @@ def headerfault_from_string(xml_string):
 class Address(TAddress_):
     """The http://schemas.xmlsoap.org/wsdl/soap/:address element """
 
+    __slots__ = []
     c_tag = 'address'
     c_namespace = NAMESPACE
     c_children = TAddress_.c_children.copy()
@@ -364,6 +378,7 @@ def address_from_string(xml_string):
 class Binding(TBinding_):
     """The http://schemas.xmlsoap.org/wsdl/soap/:binding element """
 
+    __slots__ = []
     c_tag = 'binding'
     c_namespace = NAMESPACE
     c_children = TBinding_.c_children.copy()
@@ -378,6 +393,7 @@ def binding_from_string(xml_string):
 class Body(TBody_):
     """The http://schemas.xmlsoap.org/wsdl/soap/:body element """
 
+    __slots__ = []
     c_tag = 'body'
     c_namespace = NAMESPACE
     c_children = TBody_.c_children.copy()
@@ -392,6 +408,8 @@ def body_from_string(xml_string):
 class THeader_(wsdl.TExtensibilityElement_):
     """The http://schemas.xmlsoap.org/wsdl/soap/:tHeader element """
 
+    __slots__ = ['message', 'part', 'use', 'encoding_style', 'namespace',
+                 'headerfault']
     c_tag = 'tHeader'
     c_namespace = NAMESPACE
     c_children = wsdl.TExtensibilityElement_.c_children.copy()
@@ -439,6 +457,7 @@ def t_header__from_string(xml_string):
 class Header(THeader_):
     """The http://schemas.xmlsoap.org/wsdl/soap/:header element """
 
+    __slots__ = []
     c_tag = 'header'
     c_namespace = NAMESPACE
     c_children = THeader_.c_children.copy()
@@ -12,6 +12,7 @@ NAMESPACE = 'http://schemas.xmlsoap.org/soap/envelope/'
 class Header_(SamlBase):
     """The http://schemas.xmlsoap.org/soap/envelope/:Header element """
 
+    __slots__ = []
     c_tag = 'Header'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -26,6 +27,7 @@ def header__from_string(xml_string):
 class Body_(SamlBase):
     """The http://schemas.xmlsoap.org/soap/envelope/:Body element """
 
+    __slots__ = []
     c_tag = 'Body'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -40,6 +42,7 @@ def body__from_string(xml_string):
 class EncodingStyle_(SamlBase):
     """The http://schemas.xmlsoap.org/soap/envelope/:encodingStyle element """
 
+    __slots__ = []
     c_tag = 'encodingStyle'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -53,6 +56,8 @@ def encoding_style__from_string(xml_string):
 
 class Fault_faultcode(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'faultcode'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'QName'}
@@ -67,6 +72,8 @@ def fault_faultcode_from_string(xml_string):
 
 class Fault_faultstring(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'faultstring'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -81,6 +88,8 @@ def fault_faultstring_from_string(xml_string):
 
 class Fault_faultactor(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'faultactor'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'anyURI'}
@@ -96,6 +105,7 @@ def fault_faultactor_from_string(xml_string):
 class Detail_(SamlBase):
     """The http://schemas.xmlsoap.org/soap/envelope/:detail element """
 
+    __slots__ = []
     c_tag = 'detail'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -110,6 +120,7 @@ def detail__from_string(xml_string):
 class Envelope_(SamlBase):
     """The http://schemas.xmlsoap.org/soap/envelope/:Envelope element """
 
+    __slots__ = ['header', 'body']
     c_tag = 'Envelope'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -143,6 +154,7 @@ def envelope__from_string(xml_string):
 class Header(Header_):
     """The http://schemas.xmlsoap.org/soap/envelope/:Header element """
 
+    __slots__ = []
     c_tag = 'Header'
     c_namespace = NAMESPACE
     c_children = Header_.c_children.copy()
@@ -157,6 +169,7 @@ def header_from_string(xml_string):
 class Body(Body_):
     """The http://schemas.xmlsoap.org/soap/envelope/:Body element """
 
+    __slots__ = []
     c_tag = 'Body'
     c_namespace = NAMESPACE
     c_children = Body_.c_children.copy()
@@ -170,6 +183,8 @@ def body_from_string(xml_string):
 
 class Fault_detail(Detail_):
 
+    __slots__ = []
+
     c_tag = 'detail'
     c_namespace = NAMESPACE
     c_children = Detail_.c_children.copy()
@@ -184,6 +199,7 @@ def fault_detail_from_string(xml_string):
 class Fault_(SamlBase):
     """The http://schemas.xmlsoap.org/soap/envelope/:Fault element """
 
+    __slots__ = ['faultcode', 'faultstring', 'faultactor', 'detail']
     c_tag = 'Fault'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -224,6 +240,7 @@ def fault__from_string(xml_string):
 class Envelope(Envelope_):
     """The http://schemas.xmlsoap.org/soap/envelope/:Envelope element """
 
+    __slots__ = []
     c_tag = 'Envelope'
     c_namespace = NAMESPACE
     c_children = Envelope_.c_children.copy()
@@ -238,6 +255,7 @@ def envelope_from_string(xml_string):
 class Fault(Fault_):
     """The http://schemas.xmlsoap.org/soap/envelope/:Fault element """
 
+    __slots__ = []
     c_tag = 'Fault'
     c_namespace = NAMESPACE
     c_children = Fault_.c_children.copy()
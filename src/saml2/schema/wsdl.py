@@ -15,6 +15,7 @@ NAMESPACE = 'http://schemas.xmlsoap.org/wsdl/'
 class TDocumentation_(SamlBase):
     """The http://schemas.xmlsoap.org/wsdl/:tDocumentation element """
 
+    __slots__ = []
     c_tag = 'tDocumentation'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -28,6 +29,8 @@ def t_documentation__from_string(xml_string):
 
 class TDocumented_documentation(TDocumentation_):
 
+    __slots__ = []
+
     c_tag = 'documentation'
     c_namespace = NAMESPACE
     c_children = TDocumentation_.c_children.copy()
@@ -42,6 +45,7 @@ def t_documented_documentation_from_string(xml_string):
 class TDocumented_(SamlBase):
     """The http://schemas.xmlsoap.org/wsdl/:tDocumented element """
 
+    __slots__ = ['documentation']
     c_tag = 'tDocumented'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -72,6 +76,7 @@ def t_documented__from_string(xml_string):
 class TExtensibleAttributesDocumented_(TDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tExtensibleAttributesDocumented element """
 
+    __slots__ = []
     c_tag = 'tExtensibleAttributesDocumented'
     c_namespace = NAMESPACE
     c_children = TDocumented_.c_children.copy()
@@ -83,6 +88,7 @@ class TExtensibleAttributesDocumented_(TDocumented_):
 class TExtensibleDocumented_(TDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tExtensibleDocumented element """
 
+    __slots__ = []
     c_tag = 'tExtensibleDocumented'
     c_namespace = NAMESPACE
     c_children = TDocumented_.c_children.copy()
@@ -94,6 +100,7 @@ class TExtensibleDocumented_(TDocumented_):
 class TImport_(TExtensibleAttributesDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tImport element """
 
+    __slots__ = ['namespace', 'location']
     c_tag = 'tImport'
     c_namespace = NAMESPACE
     c_children = TExtensibleAttributesDocumented_.c_children.copy()
@@ -127,6 +134,7 @@ def t_import__from_string(xml_string):
 class TTypes_(TExtensibleDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tTypes element """
 
+    __slots__ = []
     c_tag = 'tTypes'
     c_namespace = NAMESPACE
     c_children = TExtensibleDocumented_.c_children.copy()
@@ -141,6 +149,7 @@ def t_types__from_string(xml_string):
 class TPart_(TExtensibleAttributesDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tPart element """
 
+    __slots__ = ['name', 'element', 'type']
     c_tag = 'tPart'
     c_namespace = NAMESPACE
     c_children = TExtensibleAttributesDocumented_.c_children.copy()
@@ -177,6 +186,7 @@ def t_part__from_string(xml_string):
 class TOperation_(TExtensibleDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tOperation element """
 
+    __slots__ = ['name', 'parameter_order']
     c_tag = 'tOperation'
     c_namespace = NAMESPACE
     c_children = TExtensibleDocumented_.c_children.copy()
@@ -210,6 +220,7 @@ def t_operation__from_string(xml_string):
 class TParam_(TExtensibleAttributesDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tParam element """
 
+    __slots__ = ['name', 'message']
     c_tag = 'tParam'
     c_namespace = NAMESPACE
     c_children = TExtensibleAttributesDocumented_.c_children.copy()
@@ -243,6 +254,7 @@ def t_param__from_string(xml_string):
 class TFault_(TExtensibleAttributesDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tFault element """
 
+    __slots__ = ['name', 'message']
     c_tag = 'tFault'
     c_namespace = NAMESPACE
     c_children = TExtensibleAttributesDocumented_.c_children.copy()
@@ -276,6 +288,7 @@ def t_fault__from_string(xml_string):
 class TBindingOperationMessage_(TExtensibleDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tBindingOperationMessage element """
 
+    __slots__ = ['name']
     c_tag = 'tBindingOperationMessage'
     c_namespace = NAMESPACE
     c_children = TExtensibleDocumented_.c_children.copy()
@@ -306,6 +319,7 @@ def t_binding_operation_message__from_string(xml_string):
 class TBindingOperationFault_(TExtensibleDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tBindingOperationFault element """
 
+    __slots__ = ['name']
     c_tag = 'tBindingOperationFault'
     c_namespace = NAMESPACE
     c_children = TExtensibleDocumented_.c_children.copy()
@@ -335,6 +349,8 @@ def t_binding_operation_fault__from_string(xml_string):
 
 class TBindingOperation_input(TBindingOperationMessage_):
 
+    __slots__ = []
+
     c_tag = 'input'
     c_namespace = NAMESPACE
     c_children = TBindingOperationMessage_.c_children.copy()
@@ -348,6 +364,8 @@ def t_binding_operation_input_from_string(xml_string):
 
 class TBindingOperation_output(TBindingOperationMessage_):
 
+    __slots__ = []
+
     c_tag = 'output'
     c_namespace = NAMESPACE
     c_children = TBindingOperationMessage_.c_children.copy()
@@ -361,6 +379,8 @@ def t_binding_operation_output_from_string(xml_string):
 
 class TBindingOperation_fault(TBindingOperationFault_):
 
+    __slots__ = []
+
     c_tag = 'fault'
     c_namespace = NAMESPACE
     c_children = TBindingOperationFault_.c_children.copy()
@@ -375,6 +395,7 @@ def t_binding_operation_fault_from_string(xml_string):
 class TBindingOperation_(TExtensibleDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tBindingOperation element """
 
+    __slots__ = ['name', 'input', 'output', 'fault']
     c_tag = 'tBindingOperation'
     c_namespace = NAMESPACE
     c_children = TExtensibleDocumented_.c_children.copy()
@@ -418,6 +439,7 @@ def t_binding_operation__from_string(xml_string):
 class TPort_(TExtensibleDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tPort element """
 
+    __slots__ = ['name', 'binding']
     c_tag = 'tPort'
     c_namespace = NAMESPACE
     c_children = TExtensibleDocumented_.c_children.copy()
@@ -451,6 +473,7 @@ def t_port__from_string(xml_string):
 class TExtensibilityElement_(SamlBase):
     """The http://schemas.xmlsoap.org/wsdl/:tExtensibilityElement element """
 
+    __slots__ = ['required']
     c_tag = 'tExtensibilityElement'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -476,6 +499,7 @@ class TExtensibilityElement_(SamlBase):
 class Import(TImport_):
     """The http://schemas.xmlsoap.org/wsdl/:import element """
 
+    __slots__ = []
     c_tag = 'import'
     c_namespace = NAMESPACE
     c_children = TImport_.c_children.copy()
@@ -490,6 +514,7 @@ def import_from_string(xml_string):
 class Types(TTypes_):
     """The http://schemas.xmlsoap.org/wsdl/:types element """
 
+    __slots__ = []
     c_tag = 'types'
     c_namespace = NAMESPACE
     c_children = TTypes_.c_children.copy()
@@ -503,6 +528,8 @@ def types_from_string(xml_string):
 
 class TMessage_part(TPart_):
 
+    __slots__ = []
+
     c_tag = 'part'
     c_namespace = NAMESPACE
     c_children = TPart_.c_children.copy()
@@ -517,6 +544,7 @@ def t_message_part_from_string(xml_string):
 class TMessage_(TExtensibleDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tMessage element """
 
+    __slots__ = ['name', 'part']
     c_tag = 'tMessage'
     c_namespace = NAMESPACE
     c_children = TExtensibleDocumented_.c_children.copy()
@@ -551,6 +579,8 @@ def t_message__from_string(xml_string):
 
 class TPortType_operation(TOperation_):
 
+    __slots__ = []
+
     c_tag = 'operation'
     c_namespace = NAMESPACE
     c_children = TOperation_.c_children.copy()
@@ -565,6 +595,7 @@ def t_port_type_operation_from_string(xml_string):
 class TPortType_(TExtensibleAttributesDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tPortType element """
 
+    __slots__ = ['name', 'operation']
     c_tag = 'tPortType'
     c_namespace = NAMESPACE
     c_children = TExtensibleAttributesDocumented_.c_children.copy()
@@ -599,6 +630,8 @@ def t_port_type__from_string(xml_string):
 
 class TBinding_operation(TBindingOperation_):
 
+    __slots__ = []
+
     c_tag = 'operation'
     c_namespace = NAMESPACE
     c_children = TBindingOperation_.c_children.copy()
@@ -613,6 +646,7 @@ def t_binding_operation_from_string(xml_string):
 class TBinding_(TExtensibleDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tBinding element """
 
+    __slots__ = ['name', 'type', 'operation']
     c_tag = 'tBinding'
     c_namespace = NAMESPACE
     c_children = TExtensibleDocumented_.c_children.copy()
@@ -650,6 +684,8 @@ def t_binding__from_string(xml_string):
 
 class TService_port(TPort_):
 
+    __slots__ = []
+
     c_tag = 'port'
     c_namespace = NAMESPACE
     c_children = TPort_.c_children.copy()
@@ -664,6 +700,7 @@ def t_service_port_from_string(xml_string):
 class TService_(TExtensibleDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tService element """
 
+    __slots__ = ['name', 'port']
     c_tag = 'tService'
     c_namespace = NAMESPACE
     c_children = TExtensibleDocumented_.c_children.copy()
@@ -699,6 +736,7 @@ def t_service__from_string(xml_string):
 class Message(TMessage_):
     """The http://schemas.xmlsoap.org/wsdl/:message element """
 
+    __slots__ = []
     c_tag = 'message'
     c_namespace = NAMESPACE
     c_children = TMessage_.c_children.copy()
@@ -713,6 +751,7 @@ def message_from_string(xml_string):
 class PortType(TPortType_):
     """The http://schemas.xmlsoap.org/wsdl/:portType element """
 
+    __slots__ = []
     c_tag = 'portType'
     c_namespace = NAMESPACE
     c_children = TPortType_.c_children.copy()
@@ -727,6 +766,7 @@ def port_type_from_string(xml_string):
 class Binding(TBinding_):
     """The http://schemas.xmlsoap.org/wsdl/:binding element """
 
+    __slots__ = []
     c_tag = 'binding'
     c_namespace = NAMESPACE
     c_children = TBinding_.c_children.copy()
@@ -741,6 +781,7 @@ def binding_from_string(xml_string):
 class Service(TService_):
     """The http://schemas.xmlsoap.org/wsdl/:service element """
 
+    __slots__ = []
     c_tag = 'service'
     c_namespace = NAMESPACE
     c_children = TService_.c_children.copy()
@@ -755,6 +796,8 @@ def service_from_string(xml_string):
 class TDefinitions_(TExtensibleDocumented_):
     """The http://schemas.xmlsoap.org/wsdl/:tDefinitions element """
 
+    __slots__ = ['target_namespace', 'name', 'import_', 'types', 'message',
+                 'port_type', 'binding', 'service']
     c_tag = 'tDefinitions'
     c_namespace = NAMESPACE
     c_children = TExtensibleDocumented_.c_children.copy()
@@ -813,6 +856,7 @@ def t_definitions__from_string(xml_string):
 class Definitions(TDefinitions_):
     """The http://schemas.xmlsoap.org/wsdl/:definitions element """
 
+    __slots__ = []
     c_tag = 'definitions'
     c_namespace = NAMESPACE
     c_children = TDefinitions_.c_children.copy()
@@ -1,4 +1,9 @@
+import calendar
+import heapq
 import logging
+import sys
+import threading
+import time
 
 from hashlib import sha1
 
@@ -6,6 +11,8 @@ from saml2.ident import code
 
 from saml2 import md
 from saml2 import saml
+from saml2 import SamlBase
+from saml2 import time_util
 from saml2.extension import mdui
 from saml2.extension import idpdisc
 from saml2.extension import dri
@@ -36,6 +43,43 @@ def context_match(cfilter, cntx):
     # TODO
     return True
 
+
+def _filter_statements(statements, session_index=None,
+                       requested_context=None):
+    """
+    :param statements: A list of lists of authn statements, one list per
+        assertion
+    :return: The lists, with only the statements that matches session_index
+        and requested_context. Lists that become empty are left out.
+    """
+    result = []
+    for _list in statements:
+        if session_index:
+            _list = [s for s in _list if s.session_index == session_index]
+        if requested_context:
+            _list = [s for s in _list
+                     if context_match(requested_context, s.authn_context)]
+        if _list:
+            result.append(_list)
+    return result
+
+
+def _sizeof(item):
+    """ Approximate number of bytes used by a SamlBase instance including
+    everything it refers to """
+    size = sys.getsizeof(item)
+    if isinstance(item, SamlBase):
+        for name, val in item.members():
+            size += _sizeof(val)
+    elif isinstance(item, dict):
+        for key, val in item.items():
+            size += _sizeof(key) + _sizeof(val)
+    elif isinstance(item, (list, tuple)):
+        for val in item:
+            size += _sizeof(val)
+    return size
+
+
 # The key to the stored authn statement is placed encrypted in the cookie
 
 
@@ -67,7 +111,6 @@ class SessionStorage(object):
         :param requested_context:
         :return:
         """
-        result = []
         key = sha1(code(name_id)).hexdigest()
         try:
             statements = self.authn[key]
@@ -75,20 +118,166 @@ class SessionStorage(object):
             logger.info("Unknown subject %s" % name_id)
             return []
 
+        # Every item is the list of authn statements of one assertion
+        return _filter_statements(statements, session_index,
+                                  requested_context)
+
+    def remove_authn_statements(self, name_id):
+        logger.debug("remove authn about: %s" % name_id)
+        nkey = sha1(code(name_id)).hexdigest()
+
+        del self.authn[nkey]
+
+
+# Max number of assertions kept by IndexedSessionStorage
+MAX_ASSERTIONS = 100000
+# Seconds an assertion is kept if it has no NotOnOrAfter
+DEFAULT_LIFETIME = 3600
+
+
+class IndexedSessionStorage(object):
+    """
+    In memory storage of session information with a bounded size.
+
+    Assertions are indexed by subject and by session index. An assertion
+    is removed when both its NotOnOrAfter and the SessionNotOnOrAfter of
+    its authn statements has passed. If there are more than max_assertions
+    the ones that expire first are removed.
+    """
+
+    def __init__(self, max_assertions=MAX_ASSERTIONS,
+                 lifetime=DEFAULT_LIFETIME):
+        """
+        :param max_assertions: Max number of assertions to keep
+        :param lifetime: Seconds to keep an assertion that has no
+            NotOnOrAfter
+        """
+        self.max_assertions = max_assertions
+        self.lifetime = lifetime
+        # assertion id -> (assertion, to_sign)
+        self.assertion = {}
+        # subject key -> {assertion id: list of authn statements}
+        self.authn = {}
+        # session index -> set of assertion ids
+        self.session = {}
+        # (expiry time, assertion id)
+        self._expiry = []
+        # assertion id -> (subject key, approximate size)
+        self._info = {}
+        self._size = 0
+        self.lock = threading.Lock()
+
+    def _expires(self, assertion):
+        times = []
+        if assertion.conditions and assertion.conditions.not_on_or_after:
+            times.append(assertion.conditions.not_on_or_after)
+        for statement in assertion.authn_statement:
+            if statement.session_not_on_or_after:
+                times.append(statement.session_not_on_or_after)
+        if times:
+            return max([calendar.timegm(time_util.str_to_time(t))
+                        for t in times])
+        return time.time() + self.lifetime
+
+    def _remove(self, cid):
+        (assertion, _) = self.assertion.pop(cid)
+        key, size = self._info.pop(cid)
+        self._size -= size
+        self._unindex(key, cid)
+
+    def _unindex(self, key, cid):
+        try:
+            statements = self.authn[key].pop(cid)
+        except KeyError:
+            return
+        if not self.authn[key]:
+            del self.authn[key]
         for statement in statements:
+            ids = self.session.get(statement.session_index)
+            if ids is not None:
+                ids.discard(cid)
+                if not ids:
+                    del self.session[statement.session_index]
+
+    def _evict(self):
+        # Must be called with the lock held
+        now = time.time()
+        while self._expiry:
+            if self._expiry[0][0] >= now and \
+                    len(self.assertion) <= self.max_assertions:
+                break
+            (_, cid) = heapq.heappop(self._expiry)
+            if cid in self.assertion:
+                self._remove(cid)
+
+    def store_assertion(self, assertion, to_sign):
+        key = sha1(code(assertion.subject.name_id)).hexdigest()
+        size = _sizeof(assertion)
+        with self.lock:
+            if assertion.id in self.assertion:
+                self._remove(assertion.id)
+            self.assertion[assertion.id] = (assertion, to_sign)
+            self._info[assertion.id] = (key, size)
+            self._size += size
+            statements = assertion.authn_statement
+            self.authn.setdefault(key, {})[assertion.id] = statements
+            for statement in statements:
+                if statement.session_index:
+                    self.session.setdefault(statement.session_index,
+                                            set()).add(assertion.id)
+            heapq.heappush(self._expiry,
+                           (self._expires(assertion), assertion.id))
+            self._evict()
+
+    def get_assertion(self, cid):
+        with self.lock:
+            self._evict()
+            return self.assertion[cid]
+
+    def get_authn_statements(self, name_id, session_index=None,
+                             requested_context=None):
+        """
+
+        :param name_id:
+        :param session_index:
+        :param requested_context:
+        :return: One list of authn statements per matching assertion
+        """
+        key = sha1(code(name_id)).hexdigest()
+        with self.lock:
+            self._evict()
+            try:
+                per_assertion = self.authn[key]
+            except KeyError:
+                logger.info("Unknown subject %s" % name_id)
+                return []
+
             if session_index:
-                if statement.session_index != session_index:
-                    continue
-            if requested_context:
-                if not context_match(requested_context,
-                                     statement[0].authn_context):
-                    continue
-            result.append(statement)
+                ids = [i for i in self.session.get(session_index, [])
+                       if i in per_assertion]
+            else:
+                ids = per_assertion.keys()
+            statements = [per_assertion[i] for i in ids]
 
-        return result
+        return _filter_statements(statements, session_index,
+                                  requested_context)
 
     def remove_authn_statements(self, name_id):
         logger.debug("remove authn about: %s" % name_id)
-        nkey = sha1(code(name_id)).hexdigest()
+        key = sha1(code(name_id)).hexdigest()
+        with self.lock:
+            for cid in self.authn[key].keys():
+                self._unindex(key, cid)
 
-        del self.authn[nkey]
+    def stats(self):
+        """
+        :return: Dictionary with the number of assertions, subjects and
+            session indexes kept and the approximate number of bytes used
+            by the assertions.
+        """
+        with self.lock:
+            self._evict()
+            return {"assertions": len(self.assertion),
+                    "subjects": len(self.authn),
+                    "session_indexes": len(self.session),
+                    "bytes": self._size}
@@ -14,6 +14,7 @@ import threading
 
 from saml2.eptid import EptidShelve, Eptid
 from saml2.saml import EncryptedAssertion
+from saml2.sdb import IndexedSessionStorage
 from saml2.sdb import SessionStorage
 from saml2.schema import soapenv
 
@@ -41,6 +42,7 @@ from saml2.assertion import restriction_from_attribute_spec
 from saml2.assertion import filter_attribute_value_assertions
 
 from saml2.ident import IdentDB
+from saml2.ident import IdentSQLite
 from saml2.profile import ecp
 
 logger = logging.getLogger(__name__)
@@ -90,12 +92,16 @@ class Server(Entity):
         elif isinstance(_spec, basestring):
             if _spec.lower() == "memory":
                 return SessionStorage()
+            elif _spec.lower() == "indexed":
+                return IndexedSessionStorage()
         else:  # Should be tuple
             typ, data = _spec
             if typ.lower() == "mongodb":
                 from saml2.mongo_store import SessionStorageMDB
 
                 return SessionStorageMDB(database=data, collection="session")
+            elif typ.lower() == "indexed":
+                return IndexedSessionStorage(max_assertions=data)
 
         raise NotImplementedError("No such storage type implemented")
 
@@ -132,12 +138,15 @@ class Server(Entity):
 
                 self.ident = IdentMDB(database=addr, collection="ident")
 
+            elif typ == "sqlite":
+                self.ident = IdentSQLite(addr)
+
             elif typ == "identdb":
                 mod, clas = addr.rsplit('.', 1)
                 mod = importlib.import_module(mod)
                 self.ident = getattr(mod, clas)()
 
-        if typ == "mongodb" or typ == "identdb":
+        if typ in ["mongodb", "identdb", "sqlite"]:
             pass
         elif idb is not None:
             self.ident = IdentDB(idb)
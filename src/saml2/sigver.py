@@ -13,8 +13,12 @@ import logging
 import random
 import os
 import ssl
+import threading
+import time
 from time import mktime
 import urllib
+import Queue
+from collections import OrderedDict
 from Crypto.PublicKey.RSA import importKey
 from Crypto.Signature import PKCS1_v1_5
 from Crypto.Util.asn1 import DerSequence
@@ -24,8 +28,12 @@ from saml2.extension import pefim
 from saml2.saml import EncryptedAssertion
 
 import xmldsig as ds
+import xmlenc
 
 from saml2 import samlp, SamlBase
+from saml2 import parse_xml
+from saml2 import xml_document
+from saml2 import XMLDocument
 from saml2 import SAMLError
 from saml2 import extension_elements_to_elements
 from saml2 import class_name
@@ -192,7 +200,8 @@ def get_xmlsec_binary(paths=None):
     raise SigverError("Can't find %s" % bin_name)
 
 
-def _get_xmlsec_cryptobackend(path=None, search_paths=None, debug=False):
+def _get_xmlsec_cryptobackend(path=None, search_paths=None, debug=False,
+                              pool_size=0):
     """
     Initialize a CryptoBackendXmlSec1 crypto backend.
 
@@ -200,7 +209,7 @@ def _get_xmlsec_cryptobackend(path=None, search_paths=None, debug=False):
     """
     if path is None:
         path = get_xmlsec_binary(paths=search_paths)
-    return CryptoBackendXmlSec1(path, debug=debug)
+    return CryptoBackendXmlSec1(path, debug=debug, pool_size=pool_size)
 
 
 ID_ATTR = "ID"
@@ -690,8 +699,14 @@ def read_cert_from_file(cert_file, cert_type):
 
 
 class CryptoBackend():
+    # Whether validate_signature can be given a saml2.XMLDocument instead
+    # of the text
+    accepts_document = False
+
     def __init__(self, debug=False):
         self.debug = debug
+        # A CertificateCache, set by the SecurityContext using the backend
+        self.cert_cache = None
 
     def version(self):
         raise NotImplementedError()
@@ -719,15 +734,133 @@ ASSERT_XPATH = ''.join(["/*[local-name()=\"%s\"]" % v for v in [
     "Response", "EncryptedAssertion", "Assertion"]])
 
 
+class XmlSecJob(object):
+    def __init__(self, com_list, document):
+        self.com_list = com_list
+        self.document = document
+        self.queued = time.time()
+        self.done = threading.Event()
+        self.result = None
+        self.exception = None
+
+
+class XmlSecWorkerPool(object):
+    """
+    A fixed number of long-lived worker threads that runs xmlsec commands.
+    Every command is still a new xmlsec process. The document is written to
+    the command on stdin and the result is read from stdout so nothing has
+    to be written to disc. Since the workers are the only ones running
+    xmlsec the number of concurrent xmlsec processes is bounded by the size
+    of the pool.
+
+    The counters returned by stats() can be used to size the pool.
+    """
+
+    def __init__(self, size=4):
+        assert size > 0
+        self.size = size
+        self.queue = Queue.Queue()
+        self.workers = []
+        self.lock = threading.Lock()
+        self.counters = {
+            "jobs": 0,
+            "errors": 0,
+            "max_queue_depth": 0,
+            "wait_time": 0.0,
+            "max_wait_time": 0.0,
+            "run_time": 0.0,
+            "max_run_time": 0.0,
+        }
+
+    def _start(self):
+        with self.lock:
+            while len(self.workers) < self.size:
+                worker = threading.Thread(target=self._work,
+                                          name="xmlsec-%d" % len(self.workers))
+                worker.daemon = True
+                worker.start()
+                self.workers.append(worker)
+
+    def _work(self):
+        while True:
+            job = self.queue.get()
+            started = time.time()
+            try:
+                pof = Popen(job.com_list, stdin=PIPE, stdout=PIPE,
+                            stderr=PIPE)
+                job.result = pof.communicate(job.document)
+            except Exception, exc:
+                job.exception = exc
+            finished = time.time()
+            self._count(started - job.queued, finished - started,
+                        job.exception is not None)
+            job.done.set()
+
+    def _count(self, wait_time, run_time, error):
+        with self.lock:
+            _cnt = self.counters
+            _cnt["jobs"] += 1
+            if error:
+                _cnt["errors"] += 1
+            _cnt["wait_time"] += wait_time
+            _cnt["max_wait_time"] = max(_cnt["max_wait_time"], wait_time)
+            _cnt["run_time"] += run_time
+            _cnt["max_run_time"] = max(_cnt["max_run_time"], run_time)
+
+    def run(self, com_list, document):
+        """
+        Run a xmlsec command on one of the workers.
+
+        :param com_list: The command, the document should be read from stdin
+        :param document: The document as a string
+        :return: 2-tuple with what the command wrote on stdout and stderr
+        """
+        if len(self.workers) < self.size:
+            self._start()
+
+        job = XmlSecJob(com_list, document)
+        self.queue.put(job)
+        depth = self.queue.qsize()
+        with self.lock:
+            if depth > self.counters["max_queue_depth"]:
+                self.counters["max_queue_depth"] = depth
+
+        job.done.wait()
+        if job.exception is not None:
+            raise job.exception
+        return job.result
+
+    def stats(self):
+        """
+        :return: Dictionary with the present queue depth and the counters
+            collected since the pool was created. Times are in seconds.
+        """
+        with self.lock:
+            res = self.counters.copy()
+        res["size"] = self.size
+        res["queue_depth"] = self.queue.qsize()
+        if res["jobs"]:
+            res["mean_wait_time"] = res["wait_time"] / res["jobs"]
+            res["mean_run_time"] = res["run_time"] / res["jobs"]
+        else:
+            res["mean_wait_time"] = res["mean_run_time"] = 0.0
+        return res
+
+
 class CryptoBackendXmlSec1(CryptoBackend):
     """
     CryptoBackend implementation using external binary 1 to sign
     and verify XML documents.
+
+    If pool_size is larger than 0 xmlsec is run by a XmlSecWorkerPool and
+    documents are passed to it through pipes instead of temporary files.
+    An xmlsec process is still started for every operation.
     """
 
     __DEBUG = 0
+    accepts_document = True
 
-    def __init__(self, xmlsec_binary, **kwargs):
+    def __init__(self, xmlsec_binary, pool_size=0, **kwargs):
         CryptoBackend.__init__(self, **kwargs)
         assert (isinstance(xmlsec_binary, basestring))
         self.xmlsec = xmlsec_binary
@@ -735,6 +868,30 @@ class CryptoBackendXmlSec1(CryptoBackend):
             self._xmlsec_delete_tmpfiles = False
         else:
             self._xmlsec_delete_tmpfiles = True
+        if pool_size:
+            self.pool = XmlSecWorkerPool(pool_size)
+        else:
+            self.pool = None
+
+    def _document(self, document, delete=True):
+        """
+        Where xmlsec should read the document from. When running in a worker
+        pool that is stdin, otherwise a temporary file.
+
+        :param document: The XML document as a string or a
+            saml2.XMLDocument
+        :return: 2-tuple with file pointer (None if stdin is used) and
+            filename
+        """
+        if self.pool:
+            return None, "-"
+        if isinstance(document, XMLDocument):
+            # Written once, however many certificates are tried
+            if document.tmp_file is None:
+                document.tmp_file = make_temp(document.xml, suffix=".xml",
+                                              decode=False, delete=delete)
+            return document.tmp_file
+        return make_temp(document, suffix=".xml", decode=False, delete=delete)
 
     def version(self):
         com_list = [self.xmlsec, "--version"]
@@ -756,7 +913,8 @@ class CryptoBackendXmlSec1(CryptoBackend):
         :return:
         """
         logger.debug("Encryption input len: %d" % len(text))
-        _, fil = make_temp("%s" % text, decode=False)
+        text = "%s" % text
+        _, fil = self._document(text)
 
         com_list = [self.xmlsec, "--encrypt", "--pubkey-cert-pem", recv_key,
                     "--session-key", session_key_type, "--xml-data", fil]
@@ -766,7 +924,8 @@ class CryptoBackendXmlSec1(CryptoBackend):
 
         (_stdout, _stderr, output) = self._run_xmlsec(com_list, [template],
                                                       exception=DecryptError,
-                                                      validate_output=False)
+                                                      validate_output=False,
+                                                      document=text)
         return output
 
     def encrypt_assertion(self, statement, enc_key, template,
@@ -784,7 +943,8 @@ class CryptoBackendXmlSec1(CryptoBackend):
         if isinstance(statement, SamlBase):
             statement = pre_encrypt_assertion(statement)
 
-        _, fil = make_temp("%s" % statement, decode=False, delete=False)
+        statement = "%s" % statement
+        _fp, fil = self._document(statement, delete=False)
         _, tmpl = make_temp("%s" % template, decode=False)
 
         if not node_xpath:
@@ -795,9 +955,11 @@ class CryptoBackendXmlSec1(CryptoBackend):
                     "--node-xpath", node_xpath]
 
         (_stdout, _stderr, output) = self._run_xmlsec(
-            com_list, [tmpl], exception=EncryptError, validate_output=False)
+            com_list, [tmpl], exception=EncryptError, validate_output=False,
+            document=statement)
 
-        os.unlink(fil)
+        if _fp is not None:
+            os.unlink(fil)
         if not output:
             raise EncryptError(_stderr)
 
@@ -812,14 +974,16 @@ class CryptoBackendXmlSec1(CryptoBackend):
         """
 
         logger.debug("Decrypt input len: %d" % len(enctext))
-        _, fil = make_temp("%s" % enctext, decode=False)
+        enctext = "%s" % enctext
+        _, fil = self._document(enctext)
 
         com_list = [self.xmlsec, "--decrypt", "--privkey-pem",
                     key_file, "--id-attr:%s" % ID_ATTR, ENC_KEY_CLASS]
 
         (_stdout, _stderr, output) = self._run_xmlsec(com_list, [fil],
                                                       exception=DecryptError,
-                                                      validate_output=False)
+                                                      validate_output=False,
+                                                      document=enctext)
         return output
 
     def sign_statement(self, statement, node_name, key_file, node_id,
@@ -836,8 +1000,8 @@ class CryptoBackendXmlSec1(CryptoBackend):
         :return: The signed statement
         """
 
-        _, fil = make_temp("%s" % statement, suffix=".xml", decode=False, 
-                           delete=self._xmlsec_delete_tmpfiles)
+        statement = "%s" % statement
+        _, fil = self._document(statement, self._xmlsec_delete_tmpfiles)
 
         com_list = [self.xmlsec, "--sign",
                     "--privkey-pem", key_file,
@@ -847,7 +1011,8 @@ class CryptoBackendXmlSec1(CryptoBackend):
 
         try:
             (stdout, stderr, signed_statement) = \
-                self._run_xmlsec(com_list, [fil], validate_output=False)
+                self._run_xmlsec(com_list, [fil], validate_output=False,
+                                 document=statement)
             # this doesn't work if --store-signatures are used
             if stdout == "":
                 if signed_statement:
@@ -864,7 +1029,8 @@ class CryptoBackendXmlSec1(CryptoBackend):
         """
         Validate signature on XML document.
 
-        :param signedtext: The XML document as a string
+        :param signedtext: The XML document as a string or a
+            saml2.XMLDocument
         :param cert_file: The public key that was used to sign the document
         :param cert_type: The file type of the certificate
         :param node_name: The name of the class that is signed
@@ -872,8 +1038,9 @@ class CryptoBackendXmlSec1(CryptoBackend):
         :param id_attr: Should normally be one of "id", "Id" or "ID"
         :return: Boolean True if the signature was correct otherwise False.
         """
-        _, fil = make_temp(signedtext, suffix=".xml",
-                           decode=False, delete=self._xmlsec_delete_tmpfiles)
+        _, fil = self._document(signedtext, self._xmlsec_delete_tmpfiles)
+        if isinstance(signedtext, XMLDocument):
+            signedtext = signedtext.xml
 
         com_list = [self.xmlsec, "--verify",
                     "--pubkey-cert-%s" % cert_type, cert_file,
@@ -898,11 +1065,12 @@ class CryptoBackendXmlSec1(CryptoBackend):
             print "%s: %s" % (fil, os.access(fil, os.F_OK))
 
         (_stdout, stderr, _output) = self._run_xmlsec(com_list, [fil],
-                                                      exception=SignatureError)
+                                                      exception=SignatureError,
+                                                      document=signedtext)
         return parse_xmlsec_output(stderr)
 
     def _run_xmlsec(self, com_list, extra_args, validate_output=True,
-                    exception=XmlsecError):
+                    exception=XmlsecError, document=None):
         """
         Common code to invoke xmlsec and parse the output.
         :param com_list: Key-value parameter list for xmlsec
@@ -910,18 +1078,33 @@ class CryptoBackendXmlSec1(CryptoBackend):
             key-value parameters
         :param validate_output: Parse and validate the output
         :param exception: The exception class to raise on errors
+        :param document: The XML document, written to xmlsec on stdin when
+            a worker pool is used.
         :result: Whatever xmlsec wrote to an --output temporary file
         """
-        ntf = NamedTemporaryFile(suffix=".xml", delete=self._xmlsec_delete_tmpfiles)
-        com_list.extend(["--output", ntf.name])
-        com_list += extra_args
+        if self.pool:
+            com_list += extra_args
+            logger.debug("xmlsec command: %s" % " ".join(com_list))
+            if isinstance(document, unicode):
+                document = document.encode("utf-8")
+            # The result is written to stdout
+            output, p_err = self.pool.run(com_list, document)
+            p_out = ""
+        else:
+            ntf = NamedTemporaryFile(suffix=".xml",
+                                     delete=self._xmlsec_delete_tmpfiles)
+            com_list.extend(["--output", ntf.name])
+            com_list += extra_args
 
-        logger.debug("xmlsec command: %s" % " ".join(com_list))
+            logger.debug("xmlsec command: %s" % " ".join(com_list))
 
-        pof = Popen(com_list, stderr=PIPE, stdout=PIPE)
+            pof = Popen(com_list, stderr=PIPE, stdout=PIPE)
+
+            p_out = pof.stdout.read()
+            p_err = pof.stderr.read()
+            ntf.seek(0)
+            output = ntf.read()
 
-        p_out = pof.stdout.read()
-        p_err = pof.stderr.read()
         try:
             if validate_output:
                 parse_xmlsec_output(p_err)
@@ -929,8 +1112,7 @@ class CryptoBackendXmlSec1(CryptoBackend):
             logger.error(LOG_LINE_2 % (p_out, p_err, exc))
             raise exception("%s" % (exc,))
 
-        ntf.seek(0)
-        return p_out, p_err, ntf.read()
+        return p_out, p_err, output
 
 
 class CryptoBackendXMLSecurity(CryptoBackend):
@@ -1001,6 +1183,332 @@ class CryptoBackendXMLSecurity(CryptoBackend):
             return False
 
 
+# Session key types as understood by the xmlsec1 --session-key option
+SESSION_KEY_SIZE = {
+    "des": [192],
+    "aes": [128, 192, 256],
+}
+
+
+def _get_xmlsec_library():
+    """
+    Import the python-xmlsec binding (https://github.com/mehcode/python-xmlsec)
+    Note that pyXMLSecurity, used by CryptoBackendXMLSecurity, installs a
+    module with the same name, hence the extra check.
+
+    :return: The xmlsec module
+    """
+    try:
+        import xmlsec
+    except ImportError:
+        raise SigverError("The python-xmlsec library is not installed")
+
+    if not hasattr(xmlsec, "SignatureContext"):
+        raise SigverError("The xmlsec module is not python-xmlsec")
+
+    return xmlsec
+
+
+class CryptoBackendXmlSecLib(CryptoBackend):
+    """
+    CryptoBackend implementation using the python-xmlsec binding to
+    libxmlsec1. Does the same things as CryptoBackendXmlSec1 but in-process,
+    so there is no fork of a xmlsec1 binary and no temporary files for the
+    documents.
+    """
+    accepts_document = True
+
+    def __init__(self, **kwargs):
+        CryptoBackend.__init__(self, **kwargs)
+        self.xmlsec = _get_xmlsec_library()
+        from lxml import etree
+
+        self.etree = etree
+
+    def version(self):
+        try:
+            return ".".join(
+                ["%s" % v for v in self.xmlsec.get_libxmlsec_version()])
+        except AttributeError:
+            return getattr(self.xmlsec, "__version__", "")
+
+    def _parse(self, text):
+        # With the same hardened settings as all other parsing
+        return parse_xml(text, use_lxml=True).getroottree()
+
+    def _tostring(self, tree):
+        return self.etree.tostring(tree, xml_declaration=True,
+                                   encoding="UTF-8")
+
+    @staticmethod
+    def _find_node(tree, node_name, node_id, id_attr):
+        """
+        Find the element, of the type given by node_name, with the
+        identifier node_id.
+
+        :param tree: The document as a lxml ElementTree
+        :param node_name: string like 'urn:oasis:names:...:Assertion'
+        :param node_id: The identifier of the node, if None the document
+            root is returned.
+        :param id_attr: The name of the identifier attribute
+        :return: The element or None if no element matched
+        """
+        if not node_id:
+            return tree.getroot()
+
+        namespace, tag = node_name.rsplit(":", 1)
+        for elem in tree.iter("{%s}%s" % (namespace, tag)):
+            if elem.get(id_attr) == node_id:
+                return elem
+        return None
+
+    def _add_ids(self, tree, node_name, id_attr):
+        namespace, tag = node_name.rsplit(":", 1)
+        for elem in tree.iter("{%s}%s" % (namespace, tag)):
+            self.xmlsec.tree.add_ids(elem, [id_attr])
+
+    def _key_from_file(self, key_file, key_format, name=None):
+        try:
+            key = self.xmlsec.Key.from_file(key_file, key_format)
+        except self.xmlsec.Error, exc:
+            raise XmlsecError("Could not load key from %s: %s" % (key_file,
+                                                                  exc))
+        if name:
+            key.name = name
+        return key
+
+    def _session_key(self, session_key_type):
+        try:
+            klass, size = session_key_type.split("-")
+            size = int(size)
+        except ValueError:
+            raise EncryptError("Unknown session key type: %s" % (
+                session_key_type,))
+
+        if size not in SESSION_KEY_SIZE.get(klass, []):
+            raise EncryptError("Unknown session key type: %s" % (
+                session_key_type,))
+
+        consts = self.xmlsec.constants
+        if klass == "des":
+            key_data = consts.KeyDataDes
+        else:
+            key_data = consts.KeyDataAes
+        return self.xmlsec.Key.generate(key_data, size,
+                                        consts.KeyDataTypeSession)
+
+    def _key_name(self, node):
+        """ The name of the key the template/encrypted data refers to """
+        _name = node.find(".//{%s}KeyName" % ds.NAMESPACE)
+        if _name is not None and _name.text:
+            return _name.text.strip()
+        return None
+
+    def _encrypt(self, data, recv_key, template, session_key_type, xpath):
+        """
+        Encrypt the node pointed to by xpath in the document data.
+
+        :param data: The document as a lxml ElementTree
+        :param recv_key: Filename of a file where the key resides
+        :param template: The encryption template as a lxml ElementTree
+        :param session_key_type: Type and size of a new session key
+        :param xpath: What should be encrypted, if not given the root
+        :return: The encrypted document as a string
+        """
+        if xpath:
+            nodes = data.xpath(xpath)
+            if not nodes:
+                raise EncryptError("Found nothing at %s" % xpath)
+            node = nodes[0]
+        else:
+            node = data.getroot()
+
+        enc_data = template.getroot()
+        manager = self.xmlsec.KeysManager()
+        manager.add_key(self._key_from_file(
+            recv_key, self.xmlsec.KeyFormat.CERT_PEM,
+            self._key_name(enc_data)))
+
+        enc_ctx = self.xmlsec.EncryptionContext(manager)
+        enc_ctx.key = self._session_key(session_key_type)
+        try:
+            enc_data = enc_ctx.encrypt_xml(enc_data, node)
+        except self.xmlsec.Error, exc:
+            raise EncryptError("%s" % exc)
+
+        if node is data.getroot():
+            return self._tostring(enc_data.getroottree())
+        return self._tostring(data)
+
+    def encrypt(self, text, recv_key, template, session_key_type, xpath=""):
+        """
+
+        :param text: The text to be compiled
+        :param recv_key: Filename of a file where the key resides
+        :param template: Filename of a file with the pre-encryption part
+        :param session_key_type: Type and size of a new session key
+            "des-192" generates a new 192 bits DES key for DES3 encryption
+        :param xpath: What should be encrypted
+        :return:
+        """
+        logger.debug("Encryption input len: %d" % len(text))
+        return self._encrypt(self._parse("%s" % text), recv_key,
+                             self._parse(read_file(template)),
+                             session_key_type, xpath)
+
+    def encrypt_assertion(self, statement, enc_key, template,
+                          key_type="des-192", node_xpath=None):
+        """
+        Will encrypt an assertion
+
+        :param statement: A XML document that contains the assertion to encrypt
+        :param enc_key: File name of a file containing the encryption key
+        :param template: A template for the encryption part to be added.
+        :param key_type: The type of session key to use.
+        :return: The encrypted text
+        """
+        if isinstance(statement, SamlBase):
+            statement = pre_encrypt_assertion(statement)
+
+        if not node_xpath:
+            node_xpath = ASSERT_XPATH
+
+        return self._encrypt(self._parse("%s" % statement), enc_key,
+                             self._parse("%s" % template), key_type,
+                             node_xpath)
+
+    def decrypt(self, enctext, key_file):
+        """
+
+        :param enctext: XML document containing an encrypted part
+        :param key_file: The key to use for the decryption
+        :return: The decrypted document
+        """
+        logger.debug("Decrypt input len: %d" % len(enctext))
+        doc = self._parse(enctext)
+        self._add_ids(doc, "%s:%s" % (xmlenc.NAMESPACE, ENC_KEY_CLASS),
+                      ID_ATTR)
+
+        enc_data = self.xmlsec.tree.find_node(
+            doc.getroot(), self.xmlsec.constants.NodeEncryptedData,
+            self.xmlsec.constants.EncNs)
+        if enc_data is None:
+            raise DecryptError("No EncryptedData in document")
+
+        manager = self.xmlsec.KeysManager()
+        manager.add_key(self._key_from_file(
+            key_file, self.xmlsec.KeyFormat.PEM, self._key_name(enc_data)))
+
+        enc_ctx = self.xmlsec.EncryptionContext(manager)
+        try:
+            decrypted = enc_ctx.decrypt(enc_data)
+        except self.xmlsec.Error, exc:
+            raise DecryptError("%s" % exc)
+
+        if enc_data is doc.getroot():
+            if isinstance(decrypted, basestring):
+                return decrypted
+            return self._tostring(decrypted.getroottree())
+        return self._tostring(doc)
+
+    def sign_statement(self, statement, node_name, key_file, node_id,
+                       id_attr):
+        """
+        Sign an XML statement.
+
+        :param statement: The statement to be signed
+        :param node_name: string like 'urn:oasis:names:...:Assertion'
+        :param key_file: The file where the key can be found
+        :param node_id:
+        :param id_attr: The attribute name for the identifier, normally one of
+            'id','Id' or 'ID'
+        :return: The signed statement
+        """
+        doc = self._parse("%s" % statement)
+        self._add_ids(doc, node_name, id_attr)
+
+        node = self._find_node(doc, node_name, node_id, id_attr)
+        if node is None:
+            raise SigverError("Signing failed, no node with id %s" % node_id)
+
+        sign_node = self.xmlsec.tree.find_node(
+            node, self.xmlsec.constants.NodeSignature)
+        if sign_node is None:
+            raise SigverError("Signing failed, no Signature template")
+
+        ctx = self.xmlsec.SignatureContext()
+        ctx.key = self._key_from_file(key_file, self.xmlsec.KeyFormat.PEM)
+        try:
+            ctx.sign(sign_node)
+        except self.xmlsec.Error, exc:
+            logger.error("Signing operation failed: %s" % exc)
+            raise SigverError("Signing failed")
+
+        return self._tostring(doc)
+
+    def validate_signature(self, signedtext, cert_file, cert_type, node_name,
+                           node_id, id_attr):
+        """
+        Validate signature on XML document.
+
+        :param signedtext: The XML document as a string or a
+            saml2.XMLDocument
+        :param cert_file: The public key that was used to sign the document
+        :param cert_type: The file type of the certificate
+        :param node_name: The name of the class that is signed
+        :param node_id: The identifier of the node
+        :param id_attr: Should normally be one of "id", "Id" or "ID"
+        :return: Boolean True if the signature was correct otherwise False.
+        """
+        if cert_type == "pem":
+            key_format = self.xmlsec.KeyFormat.CERT_PEM
+        elif cert_type == "der":
+            key_format = self.xmlsec.KeyFormat.CERT_DER
+        else:
+            raise Unsupported("Certificate type: %s" % cert_type)
+
+        if (isinstance(signedtext, XMLDocument) and
+                self.etree.iselement(signedtext.tree)):
+            # Parsed already, verification doesn't change the tree
+            doc = signedtext.tree.getroottree()
+            self._add_ids(doc, node_name, id_attr)
+            if node_id:
+                namespace, tag = node_name.rsplit(":", 1)
+                node = signedtext.element("{%s}%s" % (namespace, tag),
+                                          node_id, id_attr)
+            else:
+                node = doc.getroot()
+        else:
+            if isinstance(signedtext, XMLDocument):
+                signedtext = signedtext.xml
+            doc = self._parse(signedtext)
+            self._add_ids(doc, node_name, id_attr)
+            node = self._find_node(doc, node_name, node_id, id_attr)
+        if node is None:
+            raise SignatureError("No %s node with id %s" % (node_name,
+                                                            node_id))
+
+        sign_node = self.xmlsec.tree.find_node(
+            node, self.xmlsec.constants.NodeSignature)
+        if sign_node is None:
+            raise SignatureError("No signature in %s" % node_name)
+
+        ctx = self.xmlsec.SignatureContext()
+        if self.cert_cache is not None:
+            # The context works on a copy of the key, so it can be reused
+            ctx.key = self.cert_cache.key_handle(cert_file, key_format,
+                                                 self._key_from_file)
+        else:
+            ctx.key = self._key_from_file(cert_file, key_format)
+        try:
+            ctx.verify(sign_node)
+        except self.xmlsec.Error, exc:
+            logger.error("Signature verification failed: %s" % exc)
+            raise SignatureError("%s" % exc)
+
+        return True
+
+
 def security_context(conf, debug=None):
     """ Creates a security context based on the configuration
 
@@ -1038,14 +1546,30 @@ def security_context(conf, debug=None):
             #if not os.access(, os.F_OK):
             raise SigverError(
                 "xmlsec binary not in '%s' !" % xmlsec_binary)
-        crypto = _get_xmlsec_cryptobackend(xmlsec_binary, debug=debug)
+        try:
+            _pool_size = conf.xmlsec_pool_size
+        except AttributeError:
+            _pool_size = 0
+        crypto = _get_xmlsec_cryptobackend(xmlsec_binary, debug=debug,
+                                           pool_size=_pool_size)
     elif conf.crypto_backend == 'XMLSecurity':
         # new and somewhat untested pyXMLSecurity crypto backend.
         crypto = CryptoBackendXMLSecurity(debug=debug)
+    elif conf.crypto_backend == 'xmlseclib':
+        crypto = CryptoBackendXmlSecLib(debug=debug)
     else:
         raise SigverError('Unknown crypto_backend %s' % (
             repr(conf.crypto_backend)))
 
+    _cache_args = {}
+    for arg in ["cert_cache_size", "verify_cache_size", "verify_cache_ttl"]:
+        try:
+            _val = getattr(conf, arg)
+        except AttributeError:
+            continue
+        if _val is not None:
+            _cache_args[arg] = _val
+
     return SecurityContext(
         crypto, conf.key_file, cert_file=conf.cert_file, metadata=metadata,
         debug=debug, only_use_keys_in_metadata=_only_md,
@@ -1053,7 +1577,7 @@ def security_context(conf, debug=None):
         generate_cert_info=conf.generate_cert_info,
         tmp_cert_file=conf.tmp_cert_file,
         tmp_key_file=conf.tmp_key_file,
-        validate_certificate=conf.validate_certificate)
+        validate_certificate=conf.validate_certificate, **_cache_args)
 
 
 def encrypt_cert_from_item(item):
@@ -1158,9 +1682,10 @@ class CertHandler(object):
                 self._cert_info = generate_cert_info
                 self._cert_handler_extra_class = cert_handler_extra_class
 
-    def verify_cert(self, cert_file):
+    def verify_cert(self, cert_file, cert_str=None):
         if self._verify_cert:
-            cert_str = self._osw.read_str_from_file(cert_file, "pem")
+            if cert_str is None:
+                cert_str = self._osw.read_str_from_file(cert_file, "pem")
             self._last_validated_cert = cert_str
             if self._cert_handler_extra_class is not None and \
                     self._cert_handler_extra_class.use_validate_cert_func():
@@ -1205,6 +1730,213 @@ class CertHandler(object):
                 self._security_context.cert_type)
 
 
+CERT_CACHE_SIZE = 512
+
+
+class CertificateCache(object):
+    """
+    A cache of certificates keyed by the SHA-1 fingerprint of the
+    certificate. For every cached certificate a PEM file is kept on disc,
+    so the same certificate doesn't have to be written to a new temporary
+    file every time a message is verified. Key handles the crypto backend
+    has loaded from the file are kept together with it.
+
+    Certificates from the metadata are kept until the metadata is reloaded.
+    Certificates picked up from messages are kept in a bounded LRU cache
+    so they can't push the metadata certificates out.
+    """
+
+    def __init__(self, size=CERT_CACHE_SIZE, delete_tmpfiles=True):
+        self.size = size
+        self.delete_tmpfiles = delete_tmpfiles
+        self.generation = None
+        self.hits = 0
+        self.misses = 0
+        self._metadata = {}
+        self._cache = OrderedDict()
+        self._pem = {}
+        self._handles = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(cert):
+        """
+        :param cert: A base64 encoded DER certificate
+        :return: The SHA-1 fingerprint as a hex string
+        """
+        cert = "".join(cert.split())
+        try:
+            return hashlib.sha1(base64.b64decode(cert)).hexdigest()
+        except TypeError:  # Not proper base64, use the text as it is
+            return hashlib.sha1(cert).hexdigest()
+
+    def _forget(self, entry):
+        _name = entry[1]
+        self._pem.pop(_name, None)
+        self._handles.pop(_name, None)
+
+    def pem_file(self, cert, metadata=False):
+        """
+        Returns the PEM file for a certificate, creating it if it isn't
+        already in the cache.
+
+        :param cert: A base64 encoded DER certificate
+        :param metadata: Whether the certificate comes from the metadata
+        :return: 2-tuple with file pointer and filename as make_temp returns
+            it. As long as the file pointer is referenced the file exists
+            even if the certificate has been evicted from the cache.
+        """
+        fpr = self.fingerprint(cert)
+        with self.lock:
+            try:
+                entry = self._metadata[fpr]
+                self.hits += 1
+                return entry
+            except KeyError:
+                pass
+
+            try:
+                entry = self._cache.pop(fpr)
+                self.hits += 1
+            except KeyError:
+                self.misses += 1
+                pem = pem_format(cert)
+                entry = make_temp(pem, suffix=".pem", decode=False,
+                                  delete=self.delete_tmpfiles)
+                self._pem[entry[1]] = pem
+
+            if metadata:
+                self._metadata[fpr] = entry
+                return entry
+
+            if not self.size:
+                self._forget(entry)
+                return entry
+
+            self._cache[fpr] = entry
+            while len(self._cache) > self.size:
+                _, _entry = self._cache.popitem(last=False)
+                self._forget(_entry)
+        return entry
+
+    def pem(self, cert_file):
+        """
+        :param cert_file: A filename returned by pem_file()
+        :return: The PEM text of the certificate or None if the file isn't
+            in the cache.
+        """
+        return self._pem.get(cert_file)
+
+    def key_handle(self, cert_file, key_format, load):
+        """
+        Returns what the crypto backend has loaded from a certificate file,
+        loading it if it hasn't been done before. Handles are only kept for
+        files that are in the cache.
+
+        :param cert_file: A filename returned by pem_file()
+        :param key_format: Distinguishes between handles of the same file
+        :param load: Function that given the filename and the key format
+            returns the handle.
+        :return: The handle
+        """
+        try:
+            return self._handles[cert_file][key_format]
+        except KeyError:
+            pass
+
+        handle = load(cert_file, key_format)
+        with self.lock:
+            if cert_file in self._pem:
+                self._handles.setdefault(cert_file, {})[key_format] = handle
+        return handle
+
+    def check_generation(self, generation):
+        """
+        Empty the cache if the metadata has been reloaded since the cache
+        was last used.
+
+        :param generation: The present generation of the metadata
+        """
+        if generation != self.generation:
+            self.clear()
+            self.generation = generation
+
+    def clear(self):
+        with self.lock:
+            self._metadata.clear()
+            self._cache.clear()
+            self._pem.clear()
+            self._handles.clear()
+
+    def __len__(self):
+        return len(self._metadata) + len(self._cache)
+
+    def stats(self):
+        return {"size": len(self), "metadata": len(self._metadata),
+                "hits": self.hits, "misses": self.misses}
+
+
+VERIFY_CACHE_SIZE = 1024
+VERIFY_CACHE_TTL = 300  # seconds
+
+
+class VerifiedSignatureCache(object):
+    """
+    Remembers successful signature verifications for a while, so identical
+    signed documents don't have to be verified again. A result is keyed on
+    the digest of the document, the fingerprint of the certificate and
+    the node that was verified. Only successful verifications are cached.
+    """
+
+    def __init__(self, size=VERIFY_CACHE_SIZE, ttl=VERIFY_CACHE_TTL):
+        self.size = size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(signedtext, cert_fingerprint, node_name, node_id, id_attr):
+        return (xml_document(signedtext).digest(), cert_fingerprint,
+                node_name, node_id, id_attr)
+
+    def __contains__(self, key):
+        now = time.time()
+        with self.lock:
+            try:
+                expires = self._cache.pop(key)
+            except KeyError:
+                self.misses += 1
+                return False
+
+            if expires <= now:
+                self.misses += 1
+                return False
+
+            self._cache[key] = expires
+            self.hits += 1
+            return True
+
+    def add(self, key):
+        with self.lock:
+            self._cache.pop(key, None)
+            self._cache[key] = time.time() + self.ttl
+            while len(self._cache) > self.size:
+                self._cache.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self._cache.clear()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def stats(self):
+        return {"size": len(self._cache), "hits": self.hits,
+                "misses": self.misses}
+
+
 # How to get a rsa pub key fingerprint from a certificate
 # openssl x509 -inform pem -noout -in server.crt -pubkey > publickey.pem
 # openssl rsa -inform pem -noout -in publickey.pem -pubin -modulus
@@ -1216,7 +1948,10 @@ class SecurityContext(object):
                  debug=False, template="", encrypt_key_type="des-192",
                  only_use_keys_in_metadata=False, cert_handler_extra_class=None,
                  generate_cert_info=None, tmp_cert_file=None,
-                 tmp_key_file=None, validate_certificate=None):
+                 tmp_key_file=None, validate_certificate=None,
+                 cert_cache_size=CERT_CACHE_SIZE,
+                 verify_cache_size=VERIFY_CACHE_SIZE,
+                 verify_cache_ttl=VERIFY_CACHE_TTL):
 
         self.crypto = crypto
         assert (isinstance(self.crypto, CryptoBackend))
@@ -1255,6 +1990,15 @@ class SecurityContext(object):
         else:
             self._xmlsec_delete_tmpfiles = True
 
+        self.cert_cache = CertificateCache(cert_cache_size,
+                                           self._xmlsec_delete_tmpfiles)
+        self.crypto.cert_cache = self.cert_cache
+        if verify_cache_size:
+            self.verify_cache = VerifiedSignatureCache(verify_cache_size,
+                                                       verify_cache_ttl)
+        else:
+            self.verify_cache = None
+
     def correctly_signed(self, xml, must=False):
         logger.debug("verify correct signature")
         return self.correctly_signed_response(xml, must)
@@ -1305,7 +2049,9 @@ class SecurityContext(object):
                          node_name=NODE_NAME, node_id=None, id_attr=""):
         """ Verifies the signature of a XML document.
 
-        :param signedtext: The XML document as a string
+        :param signedtext: The XML document as a string or a
+            saml2.XMLDocument. A XMLDocument is given to backends that can
+            use it, so the document isn't parsed again.
         :param cert_file: The public key that was used to sign the document
         :param cert_type: The file type of the certificate
         :param node_name: The name of the class that is signed
@@ -1322,10 +2068,41 @@ class SecurityContext(object):
         if not id_attr:
             id_attr = ID_ATTR
 
-        return self.crypto.validate_signature(signedtext, cert_file=cert_file,
-                                              cert_type=cert_type,
-                                              node_name=node_name,
-                                              node_id=node_id, id_attr=id_attr)
+        if (isinstance(signedtext, XMLDocument) and
+                not self.crypto.accepts_document):
+            document = signedtext.xml
+        else:
+            document = signedtext
+
+        if self.verify_cache is None:
+            return self.crypto.validate_signature(
+                document, cert_file=cert_file, cert_type=cert_type,
+                node_name=node_name, node_id=node_id, id_attr=id_attr)
+
+        key = self.verify_cache.key(
+            signedtext, self._cert_fingerprint(cert_file, cert_type),
+            node_name, node_id, id_attr)
+        if key in self.verify_cache:
+            return True
+
+        res = self.crypto.validate_signature(document, cert_file=cert_file,
+                                             cert_type=cert_type,
+                                             node_name=node_name,
+                                             node_id=node_id, id_attr=id_attr)
+        if res:
+            self.verify_cache.add(key)
+        return res
+
+    def _cert_fingerprint(self, cert_file, cert_type="pem"):
+        """ Fingerprint of the certificate in a file """
+        pem = self.cert_cache.pem(cert_file)
+        if pem is None:
+            try:
+                pem = read_file(cert_file, "rb")
+            except (IOError, TypeError):
+                # Not a file, some backends accept other key specifications
+                pem = "%s" % cert_file
+        return "%s:%s" % (cert_type, hashlib.sha1(pem).hexdigest())
 
     def _check_signature(self, decoded_xml, item, node_name=NODE_NAME,
                          origdoc=None, id_attr="", must=False,
@@ -1338,6 +2115,8 @@ class SecurityContext(object):
 
         # More trust in certs from metadata then certs in the XML document
         if self.metadata:
+            self.cert_cache.check_generation(
+                getattr(self.metadata, "generation", None))
             try:
                 _certs = self.metadata.certs(issuer, "any", "signing")
             except KeyError:
@@ -1345,9 +2124,8 @@ class SecurityContext(object):
             certs = []
             for cert in _certs:
                 if isinstance(cert, basestring):
-                    certs.append(make_temp(pem_format(cert), suffix=".pem",
-                                           decode=False,
-                                           delete=self._xmlsec_delete_tmpfiles))
+                    certs.append(self.cert_cache.pem_file(cert,
+                                                          metadata=True))
                 else:
                     certs.append(cert)
         else:
@@ -1355,9 +2133,8 @@ class SecurityContext(object):
 
         if not certs and not self.only_use_keys_in_metadata:
             logger.debug("==== Certs from instance ====")
-            certs = [make_temp(pem_format(cert), suffix=".pem",
-                               decode=False, delete=self._xmlsec_delete_tmpfiles)
-                    for cert in cert_from_instance(item)]
+            certs = [self.cert_cache.pem_file(cert)
+                     for cert in cert_from_instance(item)]
         else:
             logger.debug("==== Certs from metadata ==== %s: %s ====" % (issuer,
                                                                         certs))
@@ -1365,6 +2142,15 @@ class SecurityContext(object):
         if not certs:
             raise MissingKey("%s" % issuer)
 
+        # Parsed at most once, however many certificates are tried
+        if decoded_xml is not None:
+            same = origdoc is decoded_xml
+            decoded_xml = xml_document(decoded_xml)
+            if same:
+                origdoc = decoded_xml
+        if origdoc is not None:
+            origdoc = xml_document(origdoc)
+
         #print certs
 
         verified = False
@@ -1406,7 +2192,8 @@ class SecurityContext(object):
         if (not verified) and (not only_valid_cert):
             raise SignatureError("Failed to verify signature")
         else:
-            if not self.cert_handler.verify_cert(last_pem_file):
+            if not self.cert_handler.verify_cert(
+                    last_pem_file, self.cert_cache.pem(last_pem_file)):
                 raise CertificateError("Invalid certificate!")
 
         return item
@@ -1417,7 +2204,7 @@ class SecurityContext(object):
 
         :param item: Parsed entity
         :param node_name: The name of the node/class/element that is signed
-        :param origdoc: The original XML string
+        :param origdoc: The original XML string or a saml2.XMLDocument
         :param id_attr:
         :param must:
         :return:
@@ -1431,7 +2218,8 @@ class SecurityContext(object):
         the entity that sent the info use that, if not use the key that are in
         the message if any.
 
-        :param decoded_xml: The SAML message as an XML infoset (a string)
+        :param decoded_xml: The SAML message as an XML infoset (a string or a
+            saml2.XMLDocument)
         :param msgtype: SAML protocol message type
         :param must: Whether there must be a signature
         :param origdoc:
@@ -1443,7 +2231,9 @@ class SecurityContext(object):
         except AttributeError:
             _func = getattr(saml, "%s_from_string" % msgtype)
 
-        msg = _func(decoded_xml)
+        # Parsed once, for the mapping to an instance and the verification
+        decoded_xml = xml_document(decoded_xml)
+        msg = _func(decoded_xml.tree)
         if not msg:
             raise TypeError("Not a %s" % msgtype)
 
@@ -1571,7 +2361,8 @@ class SecurityContext(object):
         the IdP that sent the info use that, if not use the key that are in
         the message if any.
 
-        :param decoded_xml: The SAML message as a XML string
+        :param decoded_xml: The SAML message as a XML string or a
+            saml2.XMLDocument
         :param must: Whether there must be a signature
         :param origdoc:
         :param only_valid_cert:
@@ -1579,7 +2370,10 @@ class SecurityContext(object):
         :return: None if the signature can not be verified otherwise an instance
         """
 
-        response = samlp.any_response_from_string(decoded_xml)
+        # Parsed once, not once per response type tried and once more for
+        # the verification
+        decoded_xml = xml_document(decoded_xml)
+        response = samlp.any_response_from_string(decoded_xml.tree)
         if not response:
             raise TypeError("Not a Response")
 
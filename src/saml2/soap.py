@@ -8,6 +8,7 @@ Suppport for the client part of the SAML2.0 SOAP binding.
 import logging
 
 from saml2 import create_class_from_element_tree
+from saml2 import parse_xml
 from saml2.samlp import NAMESPACE as SAMLP_NAMESPACE
 from saml2.schema import soapenv
 
@@ -183,7 +184,7 @@ def class_instances_from_soap_enveloped_saml_thingies(text, modules):
     :return: The body and headers as class instances
     """
     try:
-        envelope = ElementTree.fromstring(text)
+        envelope = parse_xml(text)
     except Exception, exc:
         raise XmlParseError("%s" % exc)
 
@@ -18,6 +18,11 @@ class VirtualOrg(object):
             self.nameid_format = cnf["nameid_format"]
         except KeyError:
             self.nameid_format = NAMEID_FORMAT_PERSISTENT
+        # Seconds to wait for the members to answer an attribute query
+        try:
+            self.timeout = cnf["timeout"]
+        except KeyError:
+            self.timeout = None
 
     def _cache_session(self, session_info):
         return True
@@ -69,7 +74,8 @@ class VirtualOrg(object):
             resolver = AttributeResolver(self.sp)
             # extends returns a list of session_infos
             for session_info in resolver.extend(
-                    com_identifier, self.sp.config.entityid, to_ask):
+                    com_identifier, self.sp.config.entityid, to_ask,
+                    nameid_format=self.nameid_format, timeout=self.timeout):
                 _ = self._cache_session(session_info)
 
             logger.info(">Issuers: %s" % self.sp.users.issuers_of_info(name_id))
@@ -66,6 +66,7 @@ TRANSFORM_ENVELOPED = 'http://www.w3.org/2000/09/xmldsig#enveloped-signature'
 class CryptoBinary_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:CryptoBinary element """
 
+    __slots__ = []
     c_tag = 'CryptoBinary'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'base64Binary'}
@@ -81,6 +82,7 @@ def crypto_binary__from_string(xml_string):
 class SignatureValueType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:SignatureValueType element """
 
+    __slots__ = ['id']
     c_tag = 'SignatureValueType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'base64Binary'}
@@ -110,6 +112,7 @@ def signature_value_type__from_string(xml_string):
 class CanonicalizationMethodType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:CanonicalizationMethodType element """
 
+    __slots__ = ['algorithm']
     c_tag = 'CanonicalizationMethodType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -138,6 +141,8 @@ def canonicalization_method_type__from_string(xml_string):
 
 class TransformType_XPath(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'XPath'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -153,6 +158,7 @@ def transform_type__x_path_from_string(xml_string):
 class TransformType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:TransformType element """
 
+    __slots__ = ['algorithm', 'x_path']
     c_tag = 'TransformType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -187,6 +193,7 @@ def transform_type__from_string(xml_string):
 class DigestMethodType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:DigestMethodType element """
 
+    __slots__ = ['algorithm']
     c_tag = 'DigestMethodType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -215,6 +222,7 @@ def digest_method_type__from_string(xml_string):
 class DigestValueType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:DigestValueType element """
 
+    __slots__ = []
     c_tag = 'DigestValueType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'base64Binary'}
@@ -230,6 +238,7 @@ def digest_value_type__from_string(xml_string):
 class KeyName(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:KeyName element """
 
+    __slots__ = []
     c_tag = 'KeyName'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -245,6 +254,7 @@ def key_name_from_string(xml_string):
 class MgmtData(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:MgmtData element """
 
+    __slots__ = []
     c_tag = 'MgmtData'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -259,6 +269,8 @@ def mgmt_data_from_string(xml_string):
 
 class X509IssuerName(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'X509IssuerName'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -273,6 +285,8 @@ def x509_issuer_name_from_string(xml_string):
 
 class X509SerialNumber(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'X509SerialNumber'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'integer'}
@@ -288,6 +302,7 @@ def x509_serial_number_from_string(xml_string):
 class X509IssuerSerialType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:X509IssuerSerialType element """
 
+    __slots__ = ['x509_issuer_name', 'x509_serial_number']
     c_tag = 'X509IssuerSerialType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -319,6 +334,8 @@ def x509_issuer_serial_type__from_string(xml_string):
 
 class PGPKeyID(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'PGPKeyID'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'base64Binary'}
@@ -333,6 +350,8 @@ def pgp_key_id_from_string(xml_string):
 
 class PGPKeyPacket(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'PGPKeyPacket'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'base64Binary'}
@@ -348,6 +367,7 @@ def pgp_key_packet_from_string(xml_string):
 class PGPDataType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:PGPDataType element """
 
+    __slots__ = ['pgp_key_id', 'pgp_key_packet']
     c_tag = 'PGPDataType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -380,6 +400,8 @@ def pgp_data_type__from_string(xml_string):
 
 class SPKISexp(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'SPKISexp'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'base64Binary'}
@@ -395,6 +417,7 @@ def spki_sexp_from_string(xml_string):
 class SPKIDataType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:SPKIDataType element """
 
+    __slots__ = ['spki_sexp']
     c_tag = 'SPKIDataType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -426,6 +449,7 @@ def spki_data_type__from_string(xml_string):
 class ObjectType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:ObjectType element """
 
+    __slots__ = ['id', 'mime_type', 'encoding']
     c_tag = 'ObjectType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -460,6 +484,7 @@ def object_type__from_string(xml_string):
 class SignaturePropertyType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:SignaturePropertyType element """
 
+    __slots__ = ['target', 'id']
     c_tag = 'SignaturePropertyType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -491,6 +516,7 @@ def signature_property_type__from_string(xml_string):
 class HMACOutputLengthType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:HMACOutputLengthType element """
 
+    __slots__ = []
     c_tag = 'HMACOutputLengthType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'integer'}
@@ -505,6 +531,8 @@ def hmac_output_length_type__from_string(xml_string):
 
 class P(CryptoBinary_):
 
+    __slots__ = []
+
     c_tag = 'P'
     c_namespace = NAMESPACE
     c_children = CryptoBinary_.c_children.copy()
@@ -518,6 +546,8 @@ def p_from_string(xml_string):
 
 class Q(CryptoBinary_):
 
+    __slots__ = []
+
     c_tag = 'Q'
     c_namespace = NAMESPACE
     c_children = CryptoBinary_.c_children.copy()
@@ -531,6 +561,8 @@ def q_from_string(xml_string):
 
 class G(CryptoBinary_):
 
+    __slots__ = []
+
     c_tag = 'G'
     c_namespace = NAMESPACE
     c_children = CryptoBinary_.c_children.copy()
@@ -544,6 +576,8 @@ def g_from_string(xml_string):
 
 class Y(CryptoBinary_):
 
+    __slots__ = []
+
     c_tag = 'Y'
     c_namespace = NAMESPACE
     c_children = CryptoBinary_.c_children.copy()
@@ -557,6 +591,8 @@ def y_from_string(xml_string):
 
 class J(CryptoBinary_):
 
+    __slots__ = []
+
     c_tag = 'J'
     c_namespace = NAMESPACE
     c_children = CryptoBinary_.c_children.copy()
@@ -570,6 +606,8 @@ def j_from_string(xml_string):
 
 class Seed(CryptoBinary_):
 
+    __slots__ = []
+
     c_tag = 'Seed'
     c_namespace = NAMESPACE
     c_children = CryptoBinary_.c_children.copy()
@@ -583,6 +621,8 @@ def seed_from_string(xml_string):
 
 class PgenCounter(CryptoBinary_):
 
+    __slots__ = []
+
     c_tag = 'PgenCounter'
     c_namespace = NAMESPACE
     c_children = CryptoBinary_.c_children.copy()
@@ -597,6 +637,7 @@ def pgen_counter_from_string(xml_string):
 class DSAKeyValueType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:DSAKeyValueType element """
 
+    __slots__ = ['p', 'q', 'g', 'y', 'j', 'seed', 'pgen_counter']
     c_tag = 'DSAKeyValueType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -650,6 +691,8 @@ def dsa_key_value_type__from_string(xml_string):
 
 class Modulus(CryptoBinary_):
 
+    __slots__ = []
+
     c_tag = 'Modulus'
     c_namespace = NAMESPACE
     c_children = CryptoBinary_.c_children.copy()
@@ -663,6 +706,8 @@ def modulus_from_string(xml_string):
 
 class Exponent(CryptoBinary_):
 
+    __slots__ = []
+
     c_tag = 'Exponent'
     c_namespace = NAMESPACE
     c_children = CryptoBinary_.c_children.copy()
@@ -677,6 +722,7 @@ def exponent_from_string(xml_string):
 class RSAKeyValueType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:RSAKeyValueType element """
 
+    __slots__ = ['modulus', 'exponent']
     c_tag = 'RSAKeyValueType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -711,6 +757,7 @@ def rsa_key_value_type__from_string(xml_string):
 class SignatureValue(SignatureValueType_):
     """The http://www.w3.org/2000/09/xmldsig#:SignatureValue element """
 
+    __slots__ = []
     c_tag = 'SignatureValue'
     c_namespace = NAMESPACE
     c_children = SignatureValueType_.c_children.copy()
@@ -725,6 +772,7 @@ def signature_value_from_string(xml_string):
 class CanonicalizationMethod(CanonicalizationMethodType_):
     """The http://www.w3.org/2000/09/xmldsig#:CanonicalizationMethod element """
 
+    __slots__ = []
     c_tag = 'CanonicalizationMethod'
     c_namespace = NAMESPACE
     c_children = CanonicalizationMethodType_.c_children.copy()
@@ -739,6 +787,8 @@ def canonicalization_method_from_string(xml_string):
 
 class HMACOutputLength(HMACOutputLengthType_):
 
+    __slots__ = []
+
     c_tag = 'HMACOutputLength'
     c_namespace = NAMESPACE
     c_children = HMACOutputLengthType_.c_children.copy()
@@ -753,6 +803,7 @@ def hmac_output_length_from_string(xml_string):
 class SignatureMethodType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:SignatureMethodType element """
 
+    __slots__ = ['algorithm', 'hmac_output_length']
     c_tag = 'SignatureMethodType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -786,6 +837,7 @@ def signature_method_type__from_string(xml_string):
 class Transform(TransformType_):
     """The http://www.w3.org/2000/09/xmldsig#:Transform element """
 
+    __slots__ = []
     c_tag = 'Transform'
     c_namespace = NAMESPACE
     c_children = TransformType_.c_children.copy()
@@ -800,6 +852,7 @@ def transform_from_string(xml_string):
 class DigestMethod(DigestMethodType_):
     """The http://www.w3.org/2000/09/xmldsig#:DigestMethod element """
 
+    __slots__ = []
     c_tag = 'DigestMethod'
     c_namespace = NAMESPACE
     c_children = DigestMethodType_.c_children.copy()
@@ -814,6 +867,7 @@ def digest_method_from_string(xml_string):
 class DigestValue(DigestValueType_):
     """The http://www.w3.org/2000/09/xmldsig#:DigestValue element """
 
+    __slots__ = []
     c_tag = 'DigestValue'
     c_namespace = NAMESPACE
     c_children = DigestValueType_.c_children.copy()
@@ -827,6 +881,8 @@ def digest_value_from_string(xml_string):
 
 class X509IssuerSerial(X509IssuerSerialType_):
 
+    __slots__ = []
+
     c_tag = 'X509IssuerSerial'
     c_namespace = NAMESPACE
     c_children = X509IssuerSerialType_.c_children.copy()
@@ -840,6 +896,8 @@ def x509_issuer_serial_from_string(xml_string):
 
 class X509SKI(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'X509SKI'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'base64Binary'}
@@ -854,6 +912,8 @@ def x509_ski_from_string(xml_string):
 
 class X509SubjectName(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'X509SubjectName'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -868,6 +928,8 @@ def x509_subject_name_from_string(xml_string):
 
 class X509Certificate(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'X509Certificate'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'base64Binary'}
@@ -882,6 +944,8 @@ def x509_certificate_from_string(xml_string):
 
 class X509CRL(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'X509CRL'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'base64Binary'}
@@ -897,6 +961,8 @@ def x509_crl_from_string(xml_string):
 class X509DataType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:X509DataType element """
 
+    __slots__ = ['x509_issuer_serial', 'x509_ski', 'x509_subject_name',
+                 'x509_certificate', 'x509_crl']
     c_tag = 'X509DataType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -949,6 +1015,7 @@ def x509_data_type__from_string(xml_string):
 class PGPData(PGPDataType_):
     """The http://www.w3.org/2000/09/xmldsig#:PGPData element """
 
+    __slots__ = []
     c_tag = 'PGPData'
     c_namespace = NAMESPACE
     c_children = PGPDataType_.c_children.copy()
@@ -963,6 +1030,7 @@ def pgp_data_from_string(xml_string):
 class SPKIData(SPKIDataType_):
     """The http://www.w3.org/2000/09/xmldsig#:SPKIData element """
 
+    __slots__ = []
     c_tag = 'SPKIData'
     c_namespace = NAMESPACE
     c_children = SPKIDataType_.c_children.copy()
@@ -977,6 +1045,7 @@ def spki_data_from_string(xml_string):
 class Object(ObjectType_):
     """The http://www.w3.org/2000/09/xmldsig#:Object element """
 
+    __slots__ = []
     c_tag = 'Object'
     c_namespace = NAMESPACE
     c_children = ObjectType_.c_children.copy()
@@ -991,6 +1060,7 @@ def object_from_string(xml_string):
 class SignatureProperty(SignaturePropertyType_):
     """The http://www.w3.org/2000/09/xmldsig#:SignatureProperty element """
 
+    __slots__ = []
     c_tag = 'SignatureProperty'
     c_namespace = NAMESPACE
     c_children = SignaturePropertyType_.c_children.copy()
@@ -1005,6 +1075,7 @@ def signature_property_from_string(xml_string):
 class DSAKeyValue(DSAKeyValueType_):
     """The http://www.w3.org/2000/09/xmldsig#:DSAKeyValue element """
 
+    __slots__ = []
     c_tag = 'DSAKeyValue'
     c_namespace = NAMESPACE
     c_children = DSAKeyValueType_.c_children.copy()
@@ -1019,6 +1090,7 @@ def dsa_key_value_from_string(xml_string):
 class RSAKeyValue(RSAKeyValueType_):
     """The http://www.w3.org/2000/09/xmldsig#:RSAKeyValue element """
 
+    __slots__ = []
     c_tag = 'RSAKeyValue'
     c_namespace = NAMESPACE
     c_children = RSAKeyValueType_.c_children.copy()
@@ -1033,6 +1105,7 @@ def rsa_key_value_from_string(xml_string):
 class SignatureMethod(SignatureMethodType_):
     """The http://www.w3.org/2000/09/xmldsig#:SignatureMethod element """
 
+    __slots__ = []
     c_tag = 'SignatureMethod'
     c_namespace = NAMESPACE
     c_children = SignatureMethodType_.c_children.copy()
@@ -1047,6 +1120,7 @@ def signature_method_from_string(xml_string):
 class TransformsType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:TransformsType element """
 
+    __slots__ = ['transform']
     c_tag = 'TransformsType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1078,6 +1152,7 @@ def transforms_type__from_string(xml_string):
 class KeyValueType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:KeyValueType element """
 
+    __slots__ = ['dsa_key_value', 'rsa_key_value']
     c_tag = 'KeyValueType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1114,6 +1189,7 @@ def key_value_type__from_string(xml_string):
 class X509Data(X509DataType_):
     """The http://www.w3.org/2000/09/xmldsig#:X509Data element """
 
+    __slots__ = []
     c_tag = 'X509Data'
     c_namespace = NAMESPACE
     c_children = X509DataType_.c_children.copy()
@@ -1128,6 +1204,7 @@ def x509_data_from_string(xml_string):
 class SignaturePropertiesType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:SignaturePropertiesType element """
 
+    __slots__ = ['id', 'signature_property']
     c_tag = 'SignaturePropertiesType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1161,6 +1238,7 @@ def signature_properties_type__from_string(xml_string):
 class Transforms(TransformsType_):
     """The http://www.w3.org/2000/09/xmldsig#:Transforms element """
 
+    __slots__ = []
     c_tag = 'Transforms'
     c_namespace = NAMESPACE
     c_children = TransformsType_.c_children.copy()
@@ -1175,6 +1253,7 @@ def transforms_from_string(xml_string):
 class KeyValue(KeyValueType_):
     """The http://www.w3.org/2000/09/xmldsig#:KeyValue element """
 
+    __slots__ = []
     c_tag = 'KeyValue'
     c_namespace = NAMESPACE
     c_children = KeyValueType_.c_children.copy()
@@ -1189,6 +1268,7 @@ def key_value_from_string(xml_string):
 class RetrievalMethodType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:RetrievalMethodType element """
 
+    __slots__ = ['uri', 'type', 'transforms']
     c_tag = 'RetrievalMethodType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1227,6 +1307,7 @@ def retrieval_method_type__from_string(xml_string):
 class SignatureProperties(SignaturePropertiesType_):
     """The http://www.w3.org/2000/09/xmldsig#:SignatureProperties element """
 
+    __slots__ = []
     c_tag = 'SignatureProperties'
     c_namespace = NAMESPACE
     c_children = SignaturePropertiesType_.c_children.copy()
@@ -1242,6 +1323,8 @@ def signature_properties_from_string(xml_string):
 class ReferenceType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:ReferenceType element """
 
+    __slots__ = ['id', 'uri', 'type', 'transforms', 'digest_method',
+                 'digest_value']
     c_tag = 'ReferenceType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1291,6 +1374,7 @@ def reference_type__from_string(xml_string):
 class RetrievalMethod(RetrievalMethodType_):
     """The http://www.w3.org/2000/09/xmldsig#:RetrievalMethod element """
 
+    __slots__ = []
     c_tag = 'RetrievalMethod'
     c_namespace = NAMESPACE
     c_children = RetrievalMethodType_.c_children.copy()
@@ -1306,6 +1390,7 @@ def retrieval_method_from_string(xml_string):
 class Reference(ReferenceType_):
     """The http://www.w3.org/2000/09/xmldsig#:Reference element """
 
+    __slots__ = []
     c_tag = 'Reference'
     c_namespace = NAMESPACE
     c_children = ReferenceType_.c_children.copy()
@@ -1323,6 +1408,9 @@ def reference_from_string(xml_string):
 class KeyInfoType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:KeyInfoType element """
 
+    __slots__ = ['id', 'key_name', 'key_value', 'retrieval_method',
+                 'x509_data', 'pgp_data', 'spki_data', 'mgmt_data',
+                 'encrypted_key']
     c_tag = 'KeyInfoType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1394,6 +1482,7 @@ def key_info_type__from_string(xml_string):
 class ManifestType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:ManifestType element """
 
+    __slots__ = ['id', 'reference']
     c_tag = 'ManifestType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1428,6 +1517,8 @@ def manifest_type__from_string(xml_string):
 class SignedInfoType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:SignedInfoType element """
 
+    __slots__ = ['id', 'canonicalization_method', 'signature_method',
+                 'reference']
     c_tag = 'SignedInfoType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1470,6 +1561,7 @@ def signed_info_type__from_string(xml_string):
 class KeyInfo(KeyInfoType_):
     """The http://www.w3.org/2000/09/xmldsig#:KeyInfo element """
 
+    __slots__ = []
     c_tag = 'KeyInfo'
     c_namespace = NAMESPACE
     c_children = KeyInfoType_.c_children.copy()
@@ -1484,6 +1576,7 @@ def key_info_from_string(xml_string):
 class Manifest(ManifestType_):
     """The http://www.w3.org/2000/09/xmldsig#:Manifest element """
 
+    __slots__ = []
     c_tag = 'Manifest'
     c_namespace = NAMESPACE
     c_children = ManifestType_.c_children.copy()
@@ -1498,6 +1591,7 @@ def manifest_from_string(xml_string):
 class SignedInfo(SignedInfoType_):
     """The http://www.w3.org/2000/09/xmldsig#:SignedInfo element """
 
+    __slots__ = []
     c_tag = 'SignedInfo'
     c_namespace = NAMESPACE
     c_children = SignedInfoType_.c_children.copy()
@@ -1512,6 +1606,7 @@ def signed_info_from_string(xml_string):
 class SignatureType_(SamlBase):
     """The http://www.w3.org/2000/09/xmldsig#:SignatureType element """
 
+    __slots__ = ['id', 'signed_info', 'signature_value', 'key_info', 'object']
     c_tag = 'SignatureType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -1559,6 +1654,7 @@ def signature_type__from_string(xml_string):
 class Signature(SignatureType_):
     """The http://www.w3.org/2000/09/xmldsig#:Signature element """
 
+    __slots__ = []
     c_tag = 'Signature'
     c_namespace = NAMESPACE
     c_children = SignatureType_.c_children.copy()
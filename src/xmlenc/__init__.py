@@ -14,6 +14,7 @@ NAMESPACE = 'http://www.w3.org/2001/04/xmlenc#'
 class KeySizeType_(SamlBase):
     """The http://www.w3.org/2001/04/xmlenc#:KeySizeType element """
 
+    __slots__ = []
     c_tag = 'KeySizeType'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'integer'}
@@ -28,6 +29,8 @@ def key_size_type__from_string(xml_string):
 
 class CipherValue(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'CipherValue'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'base64Binary'}
@@ -43,6 +46,7 @@ def cipher_value_from_string(xml_string):
 class TransformsType_(SamlBase):
     """The http://www.w3.org/2001/04/xmlenc#:TransformsType element """
 
+    __slots__ = ['transform']
     c_tag = 'TransformsType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -72,6 +76,8 @@ def transforms_type__from_string(xml_string):
 
 class KA_Nonce(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'KA_Nonce'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'base64Binary'}
@@ -86,6 +92,8 @@ def k_a__nonce_from_string(xml_string):
 
 class OriginatorKeyInfo(ds.KeyInfo):
 
+    __slots__ = []
+
     c_tag = 'OriginatorKeyInfo'
     c_namespace = NAMESPACE
     c_children = ds.KeyInfo.c_children.copy()
@@ -99,6 +107,8 @@ def originator_key_info_from_string(xml_string):
 
 class RecipientKeyInfo(ds.KeyInfo):
 
+    __slots__ = []
+
     c_tag = 'RecipientKeyInfo'
     c_namespace = NAMESPACE
     c_children = ds.KeyInfo.c_children.copy()
@@ -113,6 +123,8 @@ def recipient_key_info_from_string(xml_string):
 class AgreementMethodType_(SamlBase):
     """The http://www.w3.org/2001/04/xmlenc#:AgreementMethodType element """
 
+    __slots__ = ['algorithm', 'k_a__nonce', 'originator_key_info',
+                 'recipient_key_info']
     c_tag = 'AgreementMethodType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -154,6 +166,7 @@ def agreement_method_type__from_string(xml_string):
 class ReferenceType_(SamlBase):
     """The http://www.w3.org/2001/04/xmlenc#:ReferenceType element """
 
+    __slots__ = ['uri']
     c_tag = 'ReferenceType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -182,6 +195,7 @@ def reference_type__from_string(xml_string):
 class EncryptionPropertyType_(SamlBase):
     """The http://www.w3.org/2001/04/xmlenc#:EncryptionPropertyType element """
 
+    __slots__ = ['target', 'id']
     c_tag = 'EncryptionPropertyType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -212,6 +226,8 @@ def encryption_property_type__from_string(xml_string):
 
 class KeySize(KeySizeType_):
 
+    __slots__ = []
+
     c_tag = 'KeySize'
     c_namespace = NAMESPACE
     c_children = KeySizeType_.c_children.copy()
@@ -225,6 +241,8 @@ def key_size_from_string(xml_string):
 
 class OAEPparams(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'OAEPparams'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'base64Binary'}
@@ -240,6 +258,7 @@ def oae_pparams_from_string(xml_string):
 class EncryptionMethodType_(SamlBase):
     """The http://www.w3.org/2001/04/xmlenc#:EncryptionMethodType element """
 
+    __slots__ = ['algorithm', 'key_size', 'oae_pparams']
     c_tag = 'EncryptionMethodType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -276,6 +295,8 @@ def encryption_method_type__from_string(xml_string):
 
 class Transforms(TransformsType_):
 
+    __slots__ = []
+
     c_tag = 'Transforms'
     c_namespace = NAMESPACE
     c_children = TransformsType_.c_children.copy()
@@ -290,6 +311,7 @@ def transforms_from_string(xml_string):
 class CipherReferenceType_(SamlBase):
     """The http://www.w3.org/2001/04/xmlenc#:CipherReferenceType element """
 
+    __slots__ = ['uri', 'transforms']
     c_tag = 'CipherReferenceType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -322,6 +344,8 @@ def cipher_reference_type__from_string(xml_string):
 
 class EncryptionMethod(EncryptionMethodType_):
 
+    __slots__ = []
+
     c_tag = 'EncryptionMethod'
     c_namespace = NAMESPACE
     c_children = EncryptionMethodType_.c_children.copy()
@@ -337,6 +361,7 @@ def encryption_method_from_string(xml_string):
 class AgreementMethod(AgreementMethodType_):
     """The http://www.w3.org/2001/04/xmlenc#:AgreementMethod element """
 
+    __slots__ = []
     c_tag = 'AgreementMethod'
     c_namespace = NAMESPACE
     c_children = AgreementMethodType_.c_children.copy()
@@ -350,6 +375,8 @@ def agreement_method_from_string(xml_string):
 
 class DataReference(ReferenceType_):
 
+    __slots__ = []
+
     c_tag = 'DataReference'
     c_namespace = NAMESPACE
     c_children = ReferenceType_.c_children.copy()
@@ -363,6 +390,8 @@ def data_reference_from_string(xml_string):
 
 class KeyReference(ReferenceType_):
 
+    __slots__ = []
+
     c_tag = 'KeyReference'
     c_namespace = NAMESPACE
     c_children = ReferenceType_.c_children.copy()
@@ -377,6 +406,7 @@ def key_reference_from_string(xml_string):
 class ReferenceList(SamlBase):
     """The http://www.w3.org/2001/04/xmlenc#:ReferenceList element """
 
+    __slots__ = ['data_reference', 'key_reference']
     c_tag = 'ReferenceList'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -411,6 +441,7 @@ def reference_list_from_string(xml_string):
 class EncryptionProperty(EncryptionPropertyType_):
     """The http://www.w3.org/2001/04/xmlenc#:EncryptionProperty element """
 
+    __slots__ = []
     c_tag = 'EncryptionProperty'
     c_namespace = NAMESPACE
     c_children = EncryptionPropertyType_.c_children.copy()
@@ -425,6 +456,7 @@ def encryption_property_from_string(xml_string):
 class CipherReference(CipherReferenceType_):
     """The http://www.w3.org/2001/04/xmlenc#:CipherReference element """
 
+    __slots__ = []
     c_tag = 'CipherReference'
     c_namespace = NAMESPACE
     c_children = CipherReferenceType_.c_children.copy()
@@ -439,6 +471,7 @@ def cipher_reference_from_string(xml_string):
 class EncryptionPropertiesType_(SamlBase):
     """The http://www.w3.org/2001/04/xmlenc#:EncryptionPropertiesType element """
 
+    __slots__ = ['id', 'encryption_property']
     c_tag = 'EncryptionPropertiesType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -472,6 +505,7 @@ def encryption_properties_type__from_string(xml_string):
 class CipherDataType_(SamlBase):
     """The http://www.w3.org/2001/04/xmlenc#:CipherDataType element """
 
+    __slots__ = ['cipher_value', 'cipher_reference']
     c_tag = 'CipherDataType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -506,6 +540,7 @@ def cipher_data_type__from_string(xml_string):
 class EncryptionProperties(EncryptionPropertiesType_):
     """The http://www.w3.org/2001/04/xmlenc#:EncryptionProperties element """
 
+    __slots__ = []
     c_tag = 'EncryptionProperties'
     c_namespace = NAMESPACE
     c_children = EncryptionPropertiesType_.c_children.copy()
@@ -520,6 +555,7 @@ def encryption_properties_from_string(xml_string):
 class CipherData(CipherDataType_):
     """The http://www.w3.org/2001/04/xmlenc#:CipherData element """
 
+    __slots__ = []
     c_tag = 'CipherData'
     c_namespace = NAMESPACE
     c_children = CipherDataType_.c_children.copy()
@@ -534,6 +570,8 @@ def cipher_data_from_string(xml_string):
 class EncryptedType_(SamlBase):
     """The http://www.w3.org/2001/04/xmlenc#:EncryptedType element """
 
+    __slots__ = ['id', 'type', 'mime_type', 'encoding', 'encryption_method',
+                 'key_info', 'cipher_data', 'encryption_properties']
     c_tag = 'EncryptedType'
     c_namespace = NAMESPACE
     c_children = SamlBase.c_children.copy()
@@ -584,6 +622,7 @@ class EncryptedType_(SamlBase):
 class EncryptedDataType_(EncryptedType_):
     """The http://www.w3.org/2001/04/xmlenc#:EncryptedDataType element """
 
+    __slots__ = []
     c_tag = 'EncryptedDataType'
     c_namespace = NAMESPACE
     c_children = EncryptedType_.c_children.copy()
@@ -597,6 +636,8 @@ def encrypted_data_type__from_string(xml_string):
 
 class CarriedKeyName(SamlBase):
 
+    __slots__ = []
+
     c_tag = 'CarriedKeyName'
     c_namespace = NAMESPACE
     c_value_type = {'base': 'string'}
@@ -612,6 +653,7 @@ def carried_key_name_from_string(xml_string):
 class EncryptedKeyType_(EncryptedType_):
     """The http://www.w3.org/2001/04/xmlenc#:EncryptedKeyType element """
 
+    __slots__ = ['recipient', 'reference_list', 'carried_key_name']
     c_tag = 'EncryptedKeyType'
     c_namespace = NAMESPACE
     c_children = EncryptedType_.c_children.copy()
@@ -665,6 +707,7 @@ def encrypted_key_type__from_string(xml_string):
 class EncryptedData(EncryptedDataType_):
     """The http://www.w3.org/2001/04/xmlenc#:EncryptedData element """
 
+    __slots__ = []
     c_tag = 'EncryptedData'
     c_namespace = NAMESPACE
     c_children = EncryptedDataType_.c_children.copy()
@@ -679,6 +722,7 @@ def encrypted_data_from_string(xml_string):
 class EncryptedKey(EncryptedKeyType_):
     """The http://www.w3.org/2001/04/xmlenc#:EncryptedKey element """
 
+    __slots__ = []
     c_tag = 'EncryptedKey'
     c_namespace = NAMESPACE
     c_children = EncryptedKeyType_.c_children.copy()
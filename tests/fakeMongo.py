@@ -0,0 +1,166 @@
+import copy
+import itertools
+
+
+def _value(doc, key):
+    for part in key.split("."):
+        if not isinstance(doc, dict) or part not in doc:
+            return None
+        doc = doc[part]
+    return doc
+
+
+def _match(doc, spec):
+    for key, cond in spec.items():
+        if key == "$or":
+            if not [s for s in cond if _match(doc, s)]:
+                return False
+            continue
+
+        val = _value(doc, key)
+        if isinstance(cond, dict) and [k for k in cond if k.startswith("$")]:
+            for op, arg in cond.items():
+                if op == "$exists":
+                    if (key in doc) != arg:
+                        return False
+                elif op == "$in":
+                    if val not in arg:
+                        return False
+                elif op == "$nin":
+                    if val in arg:
+                        return False
+                else:
+                    raise NotImplementedError(op)
+        elif isinstance(val, list) and not isinstance(cond, list):
+            if cond not in val:
+                return False
+        elif val != cond:
+            return False
+    return True
+
+
+def _project(doc, fields):
+    if not fields:
+        return copy.deepcopy(doc)
+    res = {"_id": doc["_id"]}
+    for key in fields:
+        src = doc
+        dst = res
+        parts = key.split(".")
+        for part in parts[:-1]:
+            if part not in src:
+                break
+            src = src[part]
+            dst = dst.setdefault(part, {})
+        else:
+            if parts[-1] in src:
+                dst[parts[-1]] = copy.deepcopy(src[parts[-1]])
+    return res
+
+
+class Cursor(list):
+    def limit(self, num):
+        return Cursor(self[:num])
+
+
+class BulkOperation(object):
+    def __init__(self, collection):
+        self.collection = collection
+        self.ops = []
+        self._spec = None
+
+    def find(self, spec):
+        self._spec = spec
+        return self
+
+    def upsert(self):
+        return self
+
+    def replace_one(self, doc):
+        self.ops.append((self._spec, doc))
+
+    def execute(self):
+        self.collection.requests.append("bulk")
+        for spec, doc in self.ops:
+            self.collection._update(spec, doc, True)
+
+
+class FakeCollection(object):
+    def __init__(self):
+        self.docs = []
+        self.indexes = []
+        # The kind of requests received
+        self.requests = []
+        self._ids = itertools.count(1)
+
+    def ensure_index(self, key, **kwargs):
+        self.indexes.append(key)
+
+    create_index = ensure_index
+
+    def insert(self, doc):
+        self.requests.append("insert")
+        doc = copy.deepcopy(doc)
+        doc["_id"] = next(self._ids)
+        self.docs.append(doc)
+        return doc["_id"]
+
+    def _update(self, spec, doc, upsert):
+        for item in self.docs:
+            if _match(item, spec):
+                _id = item["_id"]
+                item.clear()
+                item.update(copy.deepcopy(doc))
+                item["_id"] = _id
+                return
+        if upsert:
+            doc = copy.deepcopy(doc)
+            doc["_id"] = next(self._ids)
+            self.docs.append(doc)
+
+    def update(self, spec, doc, upsert=False):
+        self.requests.append("update")
+        self._update(spec, doc, upsert)
+
+    def find(self, spec=None, fields=None):
+        self.requests.append("find")
+        return Cursor([_project(d, fields) for d in self.docs
+                       if _match(d, spec or {})])
+
+    def find_one(self, spec=None, fields=None):
+        res = self.find(spec, fields)
+        if res:
+            return res[0]
+        return None
+
+    def remove(self, spec):
+        self.requests.append("remove")
+        self.docs = [d for d in self.docs if not _match(d, spec)]
+
+    def drop(self):
+        self.docs = []
+        self.indexes = []
+
+    def initialize_unordered_bulk_op(self):
+        return BulkOperation(self)
+
+
+class FakeDatabase(dict):
+    def __missing__(self, name):
+        self[name] = FakeCollection()
+        return self[name]
+
+
+class FakeMongoClient(dict):
+    """
+    Just enough of a pymongo MongoClient to test the MongoDB stores with.
+    """
+
+    def __init__(self, uri=None, **kwargs):
+        dict.__init__(self)
+        self.uri = uri
+        self.kwargs = kwargs
+
+    def __missing__(self, name):
+        self[name] = FakeDatabase()
+        return self[name]
@@ -0,0 +1,137 @@
+import threading
+import time
+from SocketServer import StreamRequestHandler
+from SocketServer import TCPServer
+from SocketServer import ThreadingMixIn
+
+
+class Handler(StreamRequestHandler):
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        assert line[0] == "*"
+        args = []
+        for _ in range(int(line[1:])):
+            size = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(size + 2)[:-2])
+        return args
+
+    def reply(self, res):
+        if res is True:
+            return "+OK\r\n"
+        elif res is None:
+            return "$-1\r\n"
+        elif isinstance(res, int):
+            return ":%d\r\n" % res
+        elif isinstance(res, str):
+            return "$%d\r\n%s\r\n" % (len(res), res)
+        else:
+            return "*%d\r\n%s" % (len(res),
+                                  "".join([self.reply(r) for r in res]))
+
+    def handle(self):
+        while True:
+            args = self.read_command()
+            if args is None:
+                break
+            self.server.commands.append(args[0].upper())
+            with self.server.lock:
+                res = self.server.execute(args[0].upper(), *args[1:])
+            self.wfile.write(self.reply(res))
+            self.wfile.flush()
+
+
+class FakeRedisServer(ThreadingMixIn, TCPServer):
+    """
+    Just enough of a Redis server to test the Redis caches with.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        TCPServer.__init__(self, ("127.0.0.1", 0), Handler)
+        self.lock = threading.Lock()
+        self.data = {}
+        self.expires = {}
+        # The names of the commands received
+        self.commands = []
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    @property
+    def url(self):
+        return "redis://127.0.0.1:%d/0" % self.server_address[1]
+
+    def close(self):
+        self.shutdown()
+        self.server_close()
+
+    def _get(self, key):
+        if key in self.expires and self.expires[key] <= time.time():
+            del self.data[key]
+            del self.expires[key]
+        return self.data.get(key)
+
+    def _delete(self, key):
+        self.expires.pop(key, None)
+        return self.data.pop(key, None) is not None
+
+    def execute(self, cmd, *args):
+        if cmd == "GET":
+            return self._get(args[0])
+        elif cmd == "SETEX":
+            self._delete(args[0])
+            self.data[args[0]] = args[2]
+            self.expires[args[0]] = time.time() + int(args[1])
+            return True
+        elif cmd == "DEL":
+            return len([k for k in args if self._delete(k)])
+        elif cmd == "EXISTS":
+            return int(self._get(args[0]) is not None)
+        elif cmd == "EXPIREAT":
+            if self._get(args[0]) is None:
+                return 0
+            self.expires[args[0]] = int(args[1])
+            return 1
+        elif cmd == "TTL":
+            if self._get(args[0]) is None:
+                return -2
+            elif args[0] not in self.expires:
+                return -1
+            return int(self.expires[args[0]] - time.time())
+        elif cmd == "HSET":
+            _hash = self._get(args[0])
+            if _hash is None:
+                _hash = self.data[args[0]] = {}
+            new = args[1] not in _hash
+            _hash[args[1]] = args[2]
+            return int(new)
+        elif cmd == "HGET":
+            return (self._get(args[0]) or {}).get(args[1])
+        elif cmd == "HMGET":
+            _hash = self._get(args[0]) or {}
+            return [_hash.get(f) for f in args[1:]]
+        elif cmd == "HGETALL":
+            res = []
+            for item in (self._get(args[0]) or {}).items():
+                res.extend(item)
+            return res
+        elif cmd == "HKEYS":
+            return (self._get(args[0]) or {}).keys()
+        elif cmd == "SADD":
+            _set = self._get(args[0])
+            if _set is None:
+                _set = self.data[args[0]] = set()
+            new = [m for m in args[1:] if m not in _set]
+            _set.update(new)
+            return len(new)
+        elif cmd == "SREM":
+            _set = self._get(args[0]) or set()
+            gone = [m for m in args[1:] if m in _set]
+            _set.difference_update(gone)
+            return len(gone)
+        elif cmd == "SMEMBERS":
+            return list(self._get(args[0]) or [])
+        raise NotImplementedError(cmd)
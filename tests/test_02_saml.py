@@ -11,6 +11,8 @@ try:
 except ImportError:
     from elementtree import ElementTree
 
+import cPickle
+
 import saml2
 import saml2_data, ds_data
 
@@ -26,6 +28,10 @@ from saml2.saml import AttributeValue
 from saml2.saml import NAMEID_FORMAT_EMAILADDRESS
 
 
+def _eq(l1, l2):
+    return set(l1) == set(l2)
+
+
 class TestExtensionElement:
     def test_loadd(self):
         ava = {
@@ -251,6 +257,109 @@ class TestSAMLBase:
         foo = saml2.make_vals(False, AttributeValue, part=True)
         assert foo.text == "false"
 
+    def test_parse_table(self):
+        class Foo(saml2.SamlBase):
+            c_tag = "Foo"
+            c_namespace = "urn:foo"
+            c_children = saml2.SamlBase.c_children.copy()
+            c_attributes = saml2.SamlBase.c_attributes.copy()
+            c_children["{%s}Issuer" % saml.NAMESPACE] = ("issuer",
+                                                         [Issuer])
+            c_attributes["Name"] = ("name", "string", False)
+
+            def __init__(self, issuer=None, name=None, subject=None,
+                         **kwargs):
+                saml2.SamlBase.__init__(self, **kwargs)
+                self.issuer = issuer or []
+                self.name = name
+                self.subject = subject
+
+        xml = '<ns0:Foo xmlns:ns0="urn:foo" xmlns:ns1="%s" Name="a" ' \
+              'Other="b"><ns1:Issuer>x</ns1:Issuer><ns1:Issuer>y' \
+              '</ns1:Issuer><ns1:Subject/></ns0:Foo>' % saml.NAMESPACE
+
+        assert Foo.c_qname() == "{urn:foo}Foo"
+        foo = saml2.create_class_from_xml_string(Foo, xml)
+        assert [i.text for i in foo.issuer] == ["x", "y"]
+        assert foo.name == "a"
+        assert foo.extension_attributes == {"Other": "b"}
+        assert foo.subject is None
+        assert len(foo.extension_elements) == 1
+
+        # Children added after the first parse are known from then on
+        Foo.c_children["{%s}Subject" % saml.NAMESPACE] = ("subject",
+                                                          saml.Subject)
+        foo = saml2.create_class_from_xml_string(Foo, xml)
+        assert isinstance(foo.subject, saml.Subject)
+        assert foo.extension_elements == []
+
+        # A child element that does not match its class becomes None, as it
+        # always has
+        Foo.c_children["{urn:foo}Bar"] = ("issuer", [Issuer])
+        foo = saml2.create_class_from_xml_string(
+            Foo, '<ns0:Foo xmlns:ns0="urn:foo"><ns0:Bar/></ns0:Foo>')
+        assert foo.issuer == [None]
+
+    def test_slots(self):
+        nid = saml.NameID(format=NAMEID_FORMAT_EMAILADDRESS,
+                          sp_name_qualifier="sp", text="foo@example.com")
+        assert "sp_name_qualifier" in saml.NameID.c_slots()
+        assert "__dict__" not in saml.NameID.c_slots()
+        # All the members are in slots
+        assert nid.__dict__ == {}
+
+        # Other attributes can still be set
+        nid.foo = "bar"
+        assert _eq(nid.keyswv(), ["format", "sp_name_qualifier", "text",
+                                  "foo"])
+
+        for protocol in range(cPickle.HIGHEST_PROTOCOL + 1):
+            _nid = cPickle.loads(cPickle.dumps(nid, protocol))
+            assert _nid == nid
+            assert _nid.foo == "bar"
+
+        av = cPickle.loads(cPickle.dumps(AttributeValue(text="1234"), 0))
+        assert av.text == "1234"
+
+    def test_to_string(self):
+        attr = Attribute(name="a<b", friendly_name=u"r\xe4k\"s\"\n",
+                         attribute_value=[AttributeValue(text="x & y"),
+                                          AttributeValue(text=u"☃")])
+        attr.extension_attributes["{urn:foo}bar"] = "1"
+        attr.extension_elements.append(saml2.ExtensionElement(
+            "Foo", namespace="urn:foo", attributes={"x": "y"},
+            children=[saml2.ExtensionElement("Bar", text="z")]))
+
+        # The same as ElementTree would have given
+        xml = attr.to_string()
+        assert xml == ElementTree.tostring(attr._to_element_tree(),
+                                           encoding="UTF-8")
+        assert 'Name="a&lt;b"' in xml
+        assert "&amp;" in xml
+        assert "&#10;" in xml
+
+        # Prefixes given are used, but not registered with ElementTree
+        xml = attr.to_string({"foo": "urn:foo", "saml": saml.NAMESPACE})
+        assert 'xmlns:foo="urn:foo"' in xml
+        assert "<foo:Foo " in xml
+        assert "<saml:Attribute " in xml
+        assert "urn:foo" not in saml2.namespace_map()
+
+    def test_parse_xml(self):
+        xml = '<?xml version="1.0"?><!DOCTYPE x [<!ENTITY e "ee">]>' \
+              '<ns0:Issuer xmlns:ns0="%s">&e;</ns0:Issuer>' % saml.NAMESPACE
+        for use_lxml in set([False, saml2.USE_LXML]):
+            raises(saml2.XMLParseError, saml2.parse_xml, xml, use_lxml)
+            raises(saml2.XMLParseError, saml2.parse_xml, "<a>", use_lxml)
+
+            # Comments are dropped
+            tree = saml2.parse_xml(
+                '<ns0:Issuer xmlns:ns0="%s">a<!-- b -->c</ns0:Issuer>' %
+                saml.NAMESPACE, use_lxml)
+            issuer = saml2.create_class_from_xml_string(Issuer, tree)
+            assert issuer.text == "ac"
+            assert issuer.extension_elements == []
+
 
 class TestNameID:
     def setup_class(self):
@@ -1,8 +1,13 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import datetime
+import json
+import os
 import re
+import threading
+import time
 from urllib import quote_plus
+from urllib import unquote_plus
 from saml2.httpbase import HTTPBase
 
 from saml2.mdstore import MetadataStore, MetaDataMDX
@@ -11,6 +16,7 @@ from saml2.mdstore import name
 
 from saml2 import md
 from saml2 import sigver
+from saml2 import SAMLError
 from saml2 import BINDING_SOAP
 from saml2 import BINDING_HTTP_REDIRECT
 from saml2 import BINDING_HTTP_POST
@@ -26,7 +32,10 @@ from saml2.extension import dri
 from saml2.extension import mdattr
 from saml2.extension import ui
 from saml2.s_utils import UnknownPrincipal
+from saml2.s_utils import UnknownSystemEntity
+from saml2.s_utils import UnsupportedBinding
 import xmldsig
+from py.test import raises
 import xmlenc
 
 from pathutils import full_path
@@ -252,5 +261,491 @@ def test_mdx_certs():
 
     assert len(foo) == 1
 
+
+def test_generation():
+    mds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                        disable_ssl_certificate_validation=True)
+    assert mds.generation == 0
+    mds.imp(METADATACONF["3"])
+    assert mds.generation == 1
+    # Reloading the same source
+    mds.imp(METADATACONF["3"])
+    assert mds.generation == 2
+    assert len(mds) == 1
+    # All the sources in a specification are published at once
+    mds.imp({"local": [full_path("metadata_sp_1.xml"),
+                       full_path("metadata_example.xml")]})
+    assert mds.generation == 3
+    assert len(mds) == 3
+
+
+def test_index():
+    UMU_IDP = 'https://idp.umu.se/saml2/idp/metadata.php'
+    mds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                        disable_ssl_certificate_validation=True)
+    mds.imp(METADATACONF["1"])
+
+    # The indexed lookups must give the same result as asking the source
+    _md = mds.metadata.values()[0]
+    for eid in _md.keys():
+        for typ in ["idpsso_descriptor", "spsso_descriptor"]:
+            for srv in ["single_sign_on_service", "single_logout_service",
+                        "assertion_consumer_service"]:
+                assert mds.bindings(eid, typ, srv) == _md.service(eid, typ,
+                                                                  srv)
+                for binding in [BINDING_HTTP_REDIRECT, BINDING_HTTP_POST,
+                                BINDING_SOAP]:
+                    expected = _md.service(eid, typ, srv, binding)
+                    try:
+                        res = mds.service(eid, typ, srv, binding)
+                    except UnsupportedBinding:
+                        assert expected == []
+                    except UnknownSystemEntity:
+                        assert expected is None
+                    else:
+                        assert res == expected
+
+    assert mds.certs(UMU_IDP, "idpsso", "signing") == _md.certs(
+        UMU_IDP, "idpsso", "signing")
+    assert mds.certs(UMU_IDP, "any", "signing")
+    # Cached copies can't be changed by the caller
+    mds.certs(UMU_IDP, "any", "signing").append("foo")
+    assert "foo" not in mds.certs(UMU_IDP, "any", "signing")
+
+    raises(UnknownSystemEntity, "mds.single_sign_on_service('urn:foo')")
+    raises(KeyError, "mds['urn:foo']")
+
+    # Loading more metadata invalidates the index
+    sp_id = "urn:mace:example.com:saml:roland:sp"
+    raises(KeyError, "mds[sp_id]")
+    mds.load("local", full_path("metadata_sp_1.xml"))
+    assert mds[sp_id]
+    assert mds.assertion_consumer_service(sp_id)
+
+
+def test_index_with_unindexed_sources():
+    sp_id = "urn:mace:example.com:saml:roland:sp"
+    xmlstr = open(full_path("metadata_sp_1.xml")).read()
+    mds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                        disable_ssl_certificate_validation=True)
+    mds.load("inline", xmlstr)
+    assert not mds._state[2]["unindexed"]
+    raises(UnsupportedBinding,
+           "mds.assertion_consumer_service(sp_id, BINDING_HTTP_REDIRECT)")
+
+    # The same entity in a lazy source, which isn't indexed, with another
+    # binding
+    mds.load("inline", xmlstr.replace(BINDING_HTTP_POST,
+                                      BINDING_HTTP_REDIRECT), lazy=True)
+    assert mds._state[2]["unindexed"]
+    srvs = mds.assertion_consumer_service(sp_id, BINDING_HTTP_REDIRECT)
+    assert srvs[0]["binding"] == BINDING_HTTP_REDIRECT
+    srvs = mds.assertion_consumer_service(sp_id, BINDING_HTTP_POST)
+    assert srvs[0]["binding"] == BINDING_HTTP_POST
+    raises(UnknownSystemEntity,
+           "mds.single_sign_on_service('urn:example.com:unknown')")
+
+    # Only in a lazy source
+    mds.load("inline", xmlstr.replace(sp_id, "urn:example.com:lazy"),
+             lazy=True)
+    srvs = mds.bindings("urn:example.com:lazy", "spsso_descriptor",
+                        "assertion_consumer_service")
+    assert srvs.keys() == [BINDING_HTTP_POST]
+
+
+def test_stream():
+    for conf in [METADATACONF["1"], METADATACONF["3"], METADATACONF["4"]]:
+        mds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                            disable_ssl_certificate_validation=True)
+        mds.imp(conf)
+        smds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                             disable_ssl_certificate_validation=True,
+                             stream=True)
+        smds.imp(conf)
+
+        assert smds.metadata.values()[0].stream
+        assert smds.entities() == mds.entities()
+        assert dict(smds.items()) == dict(mds.items())
+
+    # A single entity descriptor
+    mds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                        disable_ssl_certificate_validation=True, stream=True)
+    mds.load("local", full_path("metadata_sp_1.xml"))
+    assert mds.entities() == 1
+
+
+AGGREGATE = """<?xml version="1.0" encoding="utf-8"?>
+<md:EntitiesDescriptor xmlns:md="urn:oasis:names:tc:SAML:2.0:metadata">
+%s
+<md:EntitiesDescriptor>%s</md:EntitiesDescriptor>
+</md:EntitiesDescriptor>"""
+
+SP = """<md:EntityDescriptor entityID="%s">
+<md:SPSSODescriptor
+  protocolSupportEnumeration="urn:oasis:names:tc:SAML:2.0:protocol">
+<md:AssertionConsumerService index="%s"
+  Binding="urn:oasis:names:tc:SAML:2.0:bindings:HTTP-POST" %s/>
+</md:SPSSODescriptor>
+</md:EntityDescriptor>"""
+
+VALID_SP = SP % ("urn:example:sp1", "0",
+                 'Location="https://sp1.example.com/acs"')
+NESTED_SP = SP % ("urn:example:sp2", "0",
+                  'Location="https://sp2.example.com/acs"')
+# index must be a number
+INVALID_SP = SP % ("urn:example:sp3", "first",
+                   'Location="https://sp3.example.com/acs"')
+
+
+def test_stream_like_parse():
+    for xmlstr, keys in [
+            (AGGREGATE % (VALID_SP, NESTED_SP), ["urn:example:sp1"]),
+            (AGGREGATE % (VALID_SP + INVALID_SP, NESTED_SP), []),
+            (AGGREGATE % (VALID_SP, INVALID_SP), [])]:
+        res = []
+        for stream in [False, True]:
+            mds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                                disable_ssl_certificate_validation=True)
+            mds.load("inline", xmlstr, stream=stream)
+            res.append(dict(mds.items()))
+            assert _eq(mds.keys(), keys)
+        assert res[0] == res[1]
+
+    # Lazy validates when an entity is used
+    mds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                        disable_ssl_certificate_validation=True)
+    mds.load("inline", AGGREGATE % (VALID_SP + INVALID_SP, NESTED_SP),
+             lazy=True)
+    assert mds["urn:example:sp1"]
+    assert _eq(mds.keys(), ["urn:example:sp1", "urn:example:sp3"])
+    assert mds.name("urn:example:sp3") is None
+    raises(KeyError, 'mds["urn:example:sp3"]')
+    raises(KeyError, 'mds["urn:example:sp2"]')
+    # Once found to be invalid it's gone
+    assert _eq(mds.keys(), ["urn:example:sp1"])
+    assert "urn:example:sp3" not in mds.metadata.values()[0]
+
+
+def test_lazy():
+    UMU_IDP = 'https://idp.umu.se/saml2/idp/metadata.php'
+    mds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                        disable_ssl_certificate_validation=True)
+    mds.imp(METADATACONF["1"])
+    lmds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                         disable_ssl_certificate_validation=True, lazy=True)
+    lmds.imp(METADATACONF["1"])
+
+    _md = lmds.metadata.values()[0]
+    assert _md.entity.cached() == 0
+    assert _eq(lmds.keys(), mds.keys())
+
+    assert lmds.single_sign_on_service(UMU_IDP) == \
+        mds.single_sign_on_service(UMU_IDP)
+    assert lmds.certs(UMU_IDP, "idpsso", "signing") == \
+        mds.certs(UMU_IDP, "idpsso", "signing")
+    assert name(lmds[UMU_IDP]) == name(mds[UMU_IDP])
+    assert _md.entity.cached() == 1
+
+    _md.entity.size = 10
+    assert dict(lmds.items()) == dict(mds.items())
+    assert _md.entity.cached() == 10
+
+
+def test_lazy_descriptors():
+    mds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                        disable_ssl_certificate_validation=True)
+    mds.imp(METADATACONF["1"])
+    lmds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                         disable_ssl_certificate_validation=True, lazy=True)
+    lmds.imp(METADATACONF["1"])
+    _md = lmds.metadata.values()[0]
+
+    # Answered without converting any entity
+    assert lmds.entities() == mds.entities()
+    assert _eq(lmds.identity_providers(), mds.identity_providers())
+    assert _eq(lmds.service_providers(), mds.service_providers())
+    assert lmds.with_descriptor("pdp") == {}
+    assert _md.entity.cached() == 0
+
+    # Only the entities returned are converted
+    idps = lmds.with_descriptor("idpsso")
+    assert idps == mds.with_descriptor("idpsso")
+    assert _md.entity.cached() == len(idps) < len(_md)
+
+
+def test_snapshot():
+    UMU_IDP = 'https://idp.umu.se/saml2/idp/metadata.php'
+    mds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                        disable_ssl_certificate_validation=True)
+    mds.imp(METADATACONF["1"])
+
+    _snapshot = full_path("swamid.snapshot")
+    f = open(_snapshot, "wb")
+    f.write(mds.dumps(format="snapshot"))
+    f.close()
+
+    try:
+        smds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                             disable_ssl_certificate_validation=True)
+        smds.load("snapshot", _snapshot)
+        assert _eq(smds.keys(), mds.keys())
+        assert smds.single_sign_on_service(UMU_IDP) == \
+            mds.single_sign_on_service(UMU_IDP)
+        assert smds.single_sign_on_service(UMU_IDP, BINDING_HTTP_REDIRECT) \
+            == mds.single_sign_on_service(UMU_IDP, BINDING_HTTP_REDIRECT)
+        for descriptor in ["idpsso", "any"]:
+            for use in ["signing", "encryption"]:
+                assert smds.certs(UMU_IDP, descriptor, use) == \
+                    mds.certs(UMU_IDP, descriptor, use)
+        raises(UnknownSystemEntity,
+               "smds.single_sign_on_service('urn:example.com:unknown')")
+        raises(KeyError, "smds.certs('urn:example.com:unknown', 'idpsso')")
+        assert _eq(smds.construct_source_id().keys(),
+                   mds.construct_source_id().keys())
+
+        # Answered from the lookup tables, no entity was decoded
+        _md = smds.metadata.values()[0]
+        assert _md.entity.cached() == 0
+        assert _md.tables.cached() == 1
+
+        assert json.loads(json.dumps(dict(mds.items()))) == \
+            dict(smds.items())
+
+        raises(SAMLError, 'smds.load("snapshot", full_path("test.pem"))')
+    finally:
+        os.unlink(_snapshot)
+
+
+def test_refresh_local():
+    _file = full_path("refresh_metadata.xml")
+    f = open(_file, "w")
+    f.write(open(full_path("metadata_sp_1.xml")).read())
+    f.close()
+
+    try:
+        mds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                            disable_ssl_certificate_validation=True)
+        mds.load("local", _file)
+        sp_id = "urn:mace:example.com:saml:roland:sp"
+        assert mds.assertion_consumer_service(sp_id)
+        generation = mds.generation
+
+        # Not changed
+        assert mds.refresh() == {}
+        assert mds.generation == generation
+
+        f = open(_file, "w")
+        f.write(open(full_path("metadata_example.xml")).read())
+        f.close()
+        mtime = os.path.getmtime(_file) + 10
+        os.utime(_file, (mtime, mtime))
+
+        # What a reader got hold of before the refresh stays consistent
+        _generation, _metadata, _index = mds._state
+        diff = mds.refresh()
+        assert _generation == generation
+        assert sp_id in _metadata[_file]
+        assert _index["entity"][sp_id] is _metadata[_file]
+        assert diff[_file]["removed"] == [sp_id]
+        assert len(diff[_file]["added"]) == mds.entities()
+        assert mds.generation == generation + 1
+        raises(UnknownSystemEntity, "mds.assertion_consumer_service(sp_id)")
+        assert _eq(mds.keys(), diff[_file]["added"])
+
+        # A broken file doesn't replace what's loaded
+        keys = mds.keys()
+        f = open(_file, "w")
+        f.write("<broken")
+        f.close()
+        assert mds.refresh(force=True) == {}
+        assert _eq(mds.keys(), keys)
+        assert mds.generation == generation + 1
+    finally:
+        os.unlink(_file)
+
+
+class FakeResponse(object):
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+
+class FakeHTTP(object):
+    def __init__(self, text, etag):
+        self.text = text
+        self.etag = etag
+        self.requests = []
+
+    def send(self, url, **kwargs):
+        self.requests.append(kwargs)
+        if kwargs.get("etag") == self.etag:
+            return FakeResponse(304)
+        return FakeResponse(200, self.text, {"etag": self.etag})
+
+
+def test_refresh_remote():
+    url = "http://md.example.com/metadata.xml"
+    mds = MetadataStore(ONTS.values(), ATTRCONV, sec_config,
+                        disable_ssl_certificate_validation=True)
+    mds.http = FakeHTTP(
+        open(full_path("metadata_sp_1.xml")).read().decode("utf-8"), '"1"')
+    mds.load("remote", url=url, cert=None)
+    assert mds.entities() == 1
+    assert mds.http.requests == [{}]
+
+    generation = mds.generation
+    assert mds.refresh(force=True) == {}
+    assert mds.http.requests[-1] == {"etag": '"1"'}
+    assert mds.generation == generation
+
+    mds.http.text = open(full_path("metadata_example.xml")).read().decode(
+        "utf-8")
+    mds.http.etag = '"2"'
+    diff = mds.refresh(force=True)
+    assert diff[url]["removed"] == ["urn:mace:example.com:saml:roland:sp"]
+    assert mds.generation == generation + 1
+    assert mds.metadata[url].etag == '"2"'
+
+
+class FakeMDXServer(object):
+    def __init__(self, entities):
+        self.entities = entities
+        self.requests = []
+        self.release = threading.Event()
+        self.release.set()
+        self.status = None
+
+    def send(self, url, **kwargs):
+        self.release.wait()
+        self.requests.append(url)
+        entity_id = unquote_plus(url.split("/entities/")[1])
+        if self.status:
+            return FakeResponse(self.status)
+        try:
+            return FakeResponse(200, self.entities[entity_id])
+        except KeyError:
+            return FakeResponse(404)
+
+
+def test_mdx_cache():
+    sp_id = "urn:mace:example.com:saml:roland:sp"
+    http = FakeMDXServer({
+        sp_id: open(full_path("metadata_sp_1.xml")).read().decode("utf-8")})
+    mdx = MetaDataMDX(quote_plus, ONTS.values(), ATTRCONV,
+                      "http://mdx.example.com", sec_config, None, http)
+
+    assert mdx.service(sp_id, "spsso_descriptor",
+                       "assertion_consumer_service")
+    assert mdx[sp_id]
+    assert len(http.requests) == 1
+
+    # Unknown entities are remembered
+    raises(KeyError, "mdx['urn:foo']")
+    raises(KeyError, "mdx['urn:foo']")
+    assert len(http.requests) == 2
+    assert mdx.stats()["unknown"] == 1
+    assert mdx.stats()["hits"] == 2
+
+    # Expired
+    mdx = MetaDataMDX(quote_plus, ONTS.values(), ATTRCONV,
+                      "http://mdx.example.com", sec_config, None, http,
+                      ttl=-1, negative_ttl=-1)
+    mdx[sp_id]
+    mdx[sp_id]
+    raises(KeyError, "mdx['urn:foo']")
+    raises(KeyError, "mdx['urn:foo']")
+    assert len(http.requests) == 6
+
+    # Bounded
+    mdx = MetaDataMDX(quote_plus, ONTS.values(), ATTRCONV,
+                      "http://mdx.example.com", sec_config, None, http,
+                      size=1)
+    for entity_id in ["urn:foo", "urn:bar", "urn:xyz"]:
+        raises(KeyError, "mdx[entity_id]")
+    assert mdx.stats()["unknown"] == 1
+
+
+def test_mdx_errors():
+    sp_id = "urn:mace:example.com:saml:roland:sp"
+    http = FakeMDXServer({
+        sp_id: open(full_path("metadata_sp_1.xml")).read().decode("utf-8")})
+    mdx = MetaDataMDX(quote_plus, ONTS.values(), ATTRCONV,
+                      "http://mdx.example.com", sec_config, None, http,
+                      ttl=-1, negative_ttl=3600, error_backoff=-1)
+
+    # A server error isn't remembered as unknown
+    http.status = 503
+    raises(KeyError, "mdx['urn:foo']")
+    raises(KeyError, "mdx[sp_id]")
+    http.status = None
+    assert mdx[sp_id]
+    assert mdx.stats()["errors"] == 2
+
+    # What was fetched before is used while the server has problems
+    http.status = 500
+    assert mdx[sp_id]
+    assert mdx.stats()["errors"] == 3
+    http.status = 404
+    raises(KeyError, "mdx[sp_id]")
+    http.status = None
+    raises(KeyError, "mdx[sp_id]")
+    assert len(http.requests) == 5
+
+    # Neither is a response that can't be verified
+    mdx = MetaDataMDX(quote_plus, ONTS.values(), ATTRCONV,
+                      "http://mdx.example.com",
+                      sigver.security_context(sec_config),
+                      full_path("test.pem"), http, error_backoff=3600)
+    raises(KeyError, "mdx[sp_id]")
+    raises(KeyError, "mdx[sp_id]")
+    assert mdx.stats()["errors"] == 1
+    assert len(http.requests) == 6
+
+
+def test_mdx_concurrent():
+    sp_id = "urn:mace:example.com:saml:roland:sp"
+    http = FakeMDXServer({
+        sp_id: open(full_path("metadata_sp_1.xml")).read().decode("utf-8")})
+    mdx = MetaDataMDX(quote_plus, ONTS.values(), ATTRCONV,
+                      "http://mdx.example.com", sec_config, None, http)
+
+    http.release.clear()
+    res = []
+    threads = [threading.Thread(target=lambda: res.append(mdx[sp_id]))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    http.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(res) == 5
+    assert len(http.requests) == 1
+
+
+def test_mdx_warmup():
+    sp_id = "urn:mace:example.com:saml:roland:sp"
+    http = FakeMDXServer({
+        sp_id: open(full_path("metadata_sp_1.xml")).read().decode("utf-8")})
+    _file = full_path("mdx_warmup.txt")
+    f = open(_file, "w")
+    f.write("# Our most used SPs\n%s\nurn:foo\n" % sp_id)
+    f.close()
+    try:
+        mdx = MetaDataMDX(quote_plus, ONTS.values(), ATTRCONV,
+                          "http://mdx.example.com", sec_config, None, http,
+                          warmup=_file)
+        mdx.load()
+    finally:
+        os.unlink(_file)
+
+    assert len(http.requests) == 2
+    assert mdx[sp_id]
+    raises(KeyError, "mdx['urn:foo']")
+    assert len(http.requests) == 2
+
+
 if __name__ == "__main__":
     test_mdx_certs()
@@ -1,9 +1,14 @@
 #!/usr/bin/env python
 
+import os
+import shelve
+import shutil
+import tempfile
 import time
 import py
 from saml2.saml import NameID, NAMEID_FORMAT_TRANSIENT
 from saml2.cache import Cache
+from saml2.cache import ShelveCache
 from saml2.time_util import in_a_while, str_to_time
 from saml2.ident import code
 
@@ -122,3 +127,100 @@ class TestClass:
         assert inactive == ["bcde"]
         assert ava == {}
 
+
+
+class TestShelveCache(TestClass):
+    def setup_class(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache = ShelveCache(os.path.join(self.tmpdir, "cache"),
+                                 flush_every=3)
+
+    def teardown_class(self):
+        self.cache.close()
+        shutil.rmtree(self.tmpdir)
+
+
+def test_shelve_cache_flush():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tmpdir, "cache")
+        cache = ShelveCache(filename, flush_every=10, flush_interval=3600)
+        session_info = SESSION_INFO_PATTERN.copy()
+        session_info["ava"] = {"givenName": ["Derek"]}
+        not_on_or_after = str_to_time(in_a_while(days=1))
+        cache.set(nid[0], "abcd", session_info, not_on_or_after)
+        cache.set(nid[0], "bcde", session_info, not_on_or_after)
+        assert _eq(cache.entities(nid[0]), ["abcd", "bcde"])
+
+        # Nothing written yet
+        _db = shelve.open(filename)
+        assert _db.keys() == []
+        _db.close()
+
+        cache.flush()
+        _db = shelve.open(filename)
+        # one entry per subject and one per subject and entity
+        assert len(_db.keys()) == 3
+        _db.close()
+
+        cache.delete(nid[0])
+        assert cache.subjects() == []
+        cache.close()
+
+        cache = ShelveCache(filename)
+        assert cache.subjects() == []
+        cache.set(nid[1], "abcd", session_info, not_on_or_after)
+        cache.close()
+
+        cache = ShelveCache(filename)
+        assert nid_eq(cache.subjects(), [nid[1]])
+        assert cache.get(nid[1], "abcd")["ava"] == {"givenName": ["Derek"]}
+        assert cache.active(nid[1], "abcd")
+        cache.close()
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_sweep():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        for cache in [Cache(), ShelveCache(os.path.join(tmpdir, "cache"))]:
+            session_info = SESSION_INFO_PATTERN.copy()
+            session_info["ava"] = {"givenName": ["Derek"]}
+            soon = int(time.time()) + 1
+            later = int(time.time()) + 3600
+            old = [NameID(text="old%d" % i) for i in range(25)]
+            for _nid in old:
+                cache.set(_nid, "abcd", session_info, soon)
+            # given a new expiry time before it expired
+            cache.set(old[0], "abcd", session_info, later)
+            time.sleep(2)
+
+            # Looks at no more than 10 index entries, one of them may be
+            # the outdated entry for old[0]
+            cache.set(nid[0], "abcd", session_info, later)
+            left = len(cache.subjects())
+            assert left in [16, 17]
+            assert cache.sweep() == left - 2
+            assert nid_eq(cache.subjects(), [nid[0], old[0]])
+            assert cache.sweep() == 0
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_sweep_reopened_shelve():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tmpdir, "cache")
+        cache = ShelveCache(filename)
+        cache.set(nid[0], "abcd", SESSION_INFO_PATTERN.copy(),
+                  int(time.time()) + 1)
+        cache.close()
+        time.sleep(2)
+
+        cache = ShelveCache(filename)
+        assert cache.sweep() == 1
+        assert cache.subjects() == []
+        cache.close()
+    finally:
+        shutil.rmtree(tmpdir)
@@ -5,6 +5,9 @@ from saml2 import samlp
 from saml2.saml import NAMEID_FORMAT_PERSISTENT, NAMEID_FORMAT_TRANSIENT
 from saml2.config import IdPConfig
 from saml2.ident import IdentDB
+from saml2.ident import IdentSQLite
+from saml2.ident import code
+from saml2.saml import NameID
 from saml2.assertion import Policy
 
 def _eq(l1,l2):
@@ -175,3 +178,49 @@ class TestIdentifier():
         if os.path.exists("foobar.db"):
             os.unlink("foobar.db")
 
+
+
+class TestIdentSQLite(TestIdentifier):
+    def setup_class(self):
+        self.id = IdentSQLite(":memory:", "example.com", "example")
+
+    def test_find_nameid(self):
+        sp_id = "urn:mace:umu.se:sp2"
+        pnid = self.id.persistent_nameid("efgh0001", sp_id)
+        tnid = self.id.transient_nameid("efgh0001", sp_id)
+        res = self.id.find_nameid("efgh0001")
+        assert [code(n) for n in res] == [code(pnid), code(tnid)]
+        res = self.id.find_nameid("efgh0001", format=NAMEID_FORMAT_TRANSIENT)
+        assert [code(n) for n in res] == [code(tnid)]
+        assert self.id.find_nameid("efgh0001", sp_name_qualifier="other") == []
+
+        self.id.remove_remote(tnid)
+        assert self.id.find_local_id(tnid) is None
+        assert len(self.id.find_nameid("efgh0001")) == 1
+        self.id.remove_local("efgh0001")
+        assert self.id.find_nameid("efgh0001") == []
+        assert self.id.find_local_id(pnid) is None
+
+    def teardown_class(self):
+        self.id.close()
+
+
+def test_migrate():
+    old = IdentDB({}, "example.com", "example")
+    sp_id = "urn:mace:umu.se:sp"
+    pnid = old.persistent_nameid("abcd0001", sp_id)
+    tnid = old.transient_nameid("abcd0001", sp_id)
+    nid = NameID(format=NAMEID_FORMAT_PERSISTENT, sp_name_qualifier=sp_id,
+                 text="a b,c")
+    old.store("efgh0001", nid)
+
+    new = IdentSQLite(":memory:", "example.com", "example")
+    assert new.migrate(old.db) == 3
+    for _nid in [pnid, tnid]:
+        assert new.find_local_id(_nid) == "abcd0001"
+    assert new.find_local_id(nid) == "efgh0001"
+    assert [code(n) for n in new.find_nameid("abcd0001")] == [code(pnid),
+                                                              code(tnid)]
+    # Same persistent NameID as before
+    assert code(new.persistent_nameid("abcd0001", sp_id)) == code(pnid)
+    new.close()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+import time
+
+import py
+from saml2 import rcache
+from saml2.config import SPConfig
+from saml2.client import Saml2Client
+from saml2.ident import code
+from saml2.saml import NameID, NAMEID_FORMAT_TRANSIENT
+from saml2.time_util import in_a_while, str_to_time
+
+from fakeRedis import FakeRedisServer
+
+SESSION_INFO_PATTERN = {"ava": {}, "came from": "", "not_on_or_after": 0,
+                        "issuer": "", "session_id": -1}
+
+
+def _eq(l1, l2):
+    return set(l1) == set(l2)
+
+
+def nid_eq(l1, l2):
+    return _eq([code(c) for c in l1], [code(c) for c in l2])
+
+nid = [
+    NameID(name_qualifier="foo", format=NAMEID_FORMAT_TRANSIENT, text="1234"),
+    NameID(name_qualifier="foo", format=NAMEID_FORMAT_TRANSIENT, text="9876"),
+    NameID(name_qualifier="foo", format=NAMEID_FORMAT_TRANSIENT, text="1000")]
+
+
+class TestRedisCache():
+    def setup_class(self):
+        self.server = FakeRedisServer()
+        self.cache = rcache.Cache(self.server.url)
+
+    def teardown_class(self):
+        self.server.close()
+
+    def test_set(self):
+        not_on_or_after = str_to_time(in_a_while(days=1))
+        session_info = SESSION_INFO_PATTERN.copy()
+        session_info["ava"] = {"givenName": ["Derek"]}
+        self.cache.set(nid[0], "abcd", session_info, not_on_or_after)
+
+        session_info = SESSION_INFO_PATTERN.copy()
+        session_info["ava"] = {"surName": ["Jeter"]}
+        self.cache.set(nid[0], "bcde", session_info, not_on_or_after)
+
+        (ava, inactive) = self.cache.get_identity(nid[0])
+        assert inactive == []
+        assert ava == {"givenName": ["Derek"], "surName": ["Jeter"]}
+
+    def test_one_round_trip(self):
+        del self.server.commands[:]
+        (ava, inactive) = self.cache.get_identity(nid[0])
+        assert _eq(ava.keys(), ["givenName", "surName"])
+        assert self.server.commands == ["HGETALL"]
+
+        del self.server.commands[:]
+        (ava, inactive) = self.cache.get_identity(nid[0], ["bcde", "cdef"])
+        assert ava == {"surName": ["Jeter"]}
+        assert inactive == ["cdef"]
+        assert self.server.commands == ["HMGET"]
+
+    def test_get(self):
+        session_info = self.cache.get(nid[0], "bcde")
+        assert session_info["ava"] == {"surName": ["Jeter"]}
+        py.test.raises(KeyError, self.cache.get, nid[0], "cdef")
+
+    def test_entities(self):
+        assert _eq(self.cache.entities(nid[0]), ["abcd", "bcde"])
+        py.test.raises(KeyError, self.cache.entities, nid[2])
+
+    def test_remove_info(self):
+        self.cache.reset(nid[0], "bcde")
+        assert self.cache.active(nid[0], "bcde") is False
+        assert self.cache.active(nid[0], "abcd")
+
+        (ava, inactive) = self.cache.get_identity(nid[0])
+        assert inactive == ["bcde"]
+        assert ava == {"givenName": ["Derek"]}
+
+    def test_expiry(self):
+        session_info = SESSION_INFO_PATTERN.copy()
+        session_info["ava"] = {"givenName": ["Ichiro"]}
+        self.cache.set(nid[1], "abcd", session_info, int(time.time()) + 1)
+        assert nid_eq(self.cache.subjects(), nid[0:2])
+
+        time.sleep(2)
+        # Removed by the server
+        assert nid_eq(self.cache.subjects(), [nid[0]])
+        assert self.cache.get_identity(nid[1]) == ({}, [])
+        assert self.cache.sweep() == 1
+
+    def test_delete(self):
+        self.cache.delete(nid[0])
+        assert self.cache.subjects() == []
+        assert self.cache.get_identity(nid[0]) == ({}, [])
+
+
+def test_state_cache():
+    server = FakeRedisServer()
+    try:
+        state = rcache.StateCache(server.url, lifetime=1)
+        state["id1"] = {"entity_id": "urn:mace:example.com:saml:roland:idp",
+                        "operation": "SLO"}
+        assert "id1" in state
+        assert state["id1"]["operation"] == "SLO"
+        del state["id1"]
+        assert "id1" not in state
+        py.test.raises(KeyError, state.__getitem__, "id1")
+        py.test.raises(KeyError, state.__delitem__, "id1")
+
+        state["id2"] = "foo"
+        time.sleep(2)
+        assert state.get("id2") is None
+
+        # Used by a client
+        conf = SPConfig()
+        conf.load_file("servera_conf")
+        client = Saml2Client(conf, identity_cache=rcache.Cache(server.url),
+                             state_cache=rcache.StateCache(server.url))
+        session_info = {
+            "name_id": nid[2],
+            "issuer": "urn:mace:example.com:saml:roland:idp",
+            "not_on_or_after": str_to_time(in_a_while(minutes=15)),
+            "ava": {"givenName": ["Anders"]}
+        }
+        client.users.add_information_about_person(session_info)
+        assert client.users.issuers_of_info(nid[2]) == [
+            "urn:mace:example.com:saml:roland:idp"]
+        assert client.is_logged_in(nid[2])
+    finally:
+        server.close()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+import time
+
+from saml2 import saml
+from saml2.config import IdPConfig
+from saml2.saml import AUTHN_PASSWORD
+from saml2.saml import NAMEID_FORMAT_TRANSIENT
+from saml2.saml import NameID
+from saml2.sdb import IndexedSessionStorage
+from saml2.sdb import SessionStorage
+from saml2.sdb import _sizeof
+from saml2.server import Server
+from saml2.time_util import a_while_ago
+from saml2.time_util import in_a_while
+from saml2.authn_context import INTERNETPROTOCOLPASSWORD
+from saml2.authn_context import requested_authn_context
+
+import py
+
+nid = [
+    NameID(name_qualifier="foo", format=NAMEID_FORMAT_TRANSIENT, text="1234"),
+    NameID(name_qualifier="foo", format=NAMEID_FORMAT_TRANSIENT, text="9876")]
+
+
+def _assertion(aid, name_id, session_index, not_on_or_after=None):
+    if not_on_or_after is None:
+        not_on_or_after = in_a_while(minutes=15)
+    statement = saml.AuthnStatement(
+        authn_instant=a_while_ago(minutes=1),
+        session_index=session_index,
+        authn_context=saml.AuthnContext(
+            authn_context_class_ref=saml.AuthnContextClassRef(
+                text=AUTHN_PASSWORD)))
+    return saml.Assertion(
+        id=aid, subject=saml.Subject(name_id=name_id),
+        conditions=saml.Conditions(not_on_or_after=not_on_or_after),
+        authn_statement=[statement])
+
+
+def test_session_index():
+    # The plain storage used to compare a list of statements with the
+    # session index
+    for sdb in [SessionStorage(), IndexedSessionStorage()]:
+        sdb.store_assertion(_assertion("id1", nid[0], "s1"), None)
+        sdb.store_assertion(_assertion("id2", nid[0], "s2"), None)
+
+        res = sdb.get_authn_statements(nid[0])
+        assert len(res) == 2
+        res = sdb.get_authn_statements(nid[0], session_index="s2")
+        assert len(res) == 1
+        assert res[0][0].session_index == "s2"
+        assert sdb.get_authn_statements(nid[0], session_index="s3") == []
+        assert sdb.get_authn_statements(nid[1]) == []
+
+        ctx = requested_authn_context(INTERNETPROTOCOLPASSWORD)
+        res = sdb.get_authn_statements(nid[0], session_index="s1",
+                                       requested_context=ctx)
+        assert res[0][0].session_index == "s1"
+
+
+def test_expiry():
+    sdb = IndexedSessionStorage()
+    sdb.store_assertion(_assertion("id1", nid[0], "s1"), None)
+    sdb.store_assertion(
+        _assertion("id2", nid[1], "s2", in_a_while(seconds=1)), None)
+    assert sdb.get_assertion("id2")[0].id == "id2"
+
+    time.sleep(2)
+    py.test.raises(KeyError, sdb.get_assertion, "id2")
+    assert sdb.get_authn_statements(nid[1]) == []
+    assert sdb.get_authn_statements(nid[0], session_index="s1")
+    stats = sdb.stats()
+    assert stats["assertions"] == 1
+    assert stats["subjects"] == 1
+    assert stats["session_indexes"] == 1
+
+
+def test_max_assertions():
+    sdb = IndexedSessionStorage(max_assertions=2)
+    keep = [_assertion("id1", nid[0], "s1", in_a_while(minutes=5)),
+            _assertion("id3", nid[1], "s3", in_a_while(minutes=10))]
+    sdb.store_assertion(keep[0], None)
+    sdb.store_assertion(
+        _assertion("id2", nid[0], "s2", in_a_while(minutes=1)), None)
+    sdb.store_assertion(keep[1], None)
+
+    # The one that expires first is gone
+    py.test.raises(KeyError, sdb.get_assertion, "id2")
+    assert sdb.get_assertion("id1")
+    assert sdb.get_assertion("id3")
+    assert sdb.get_authn_statements(nid[0], session_index="s2") == []
+    stats = sdb.stats()
+    assert stats["assertions"] == 2
+    assert stats["session_indexes"] == 2
+    assert stats["bytes"] == sum([_sizeof(a) for a in keep])
+
+
+def test_remove_authn_statements():
+    sdb = IndexedSessionStorage()
+    sdb.store_assertion(_assertion("id1", nid[0], "s1"), None)
+    sdb.remove_authn_statements(nid[0])
+    assert sdb.get_authn_statements(nid[0]) == []
+    assert sdb.stats()["session_indexes"] == 0
+    # The assertion can still be asked for by its ID
+    assert sdb.get_assertion("id1")
+
+
+def test_choose_session_storage():
+    conf = IdPConfig()
+    conf.load_file("idp_conf")
+    conf.setattr("idp", "session_storage", ("indexed", 10))
+    server = Server(config=conf)
+    assert isinstance(server.session_db, IndexedSessionStorage)
+    assert server.session_db.max_assertions == 10
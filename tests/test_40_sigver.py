@@ -1,11 +1,14 @@
 #!/usr/bin/env python
 
 import base64
+import os
+import threading
 from saml2.sigver import pre_encryption_part, make_temp
 from saml2.mdstore import MetadataStore
 from saml2.saml import assertion_from_string, EncryptedAssertion
 from saml2.samlp import response_from_string
 
+import saml2
 from saml2 import sigver, extension_elements_to_elements
 from saml2 import class_name
 from saml2 import time_util
@@ -13,6 +16,7 @@ from saml2 import saml, samlp
 from saml2 import config
 from saml2.s_utils import factory, do_attribute_statement
 
+import pytest
 from py.test import raises
 
 from pathutils import full_path
@@ -105,6 +109,8 @@ class FakeConfig():
 
 
 class TestSecurity():
+    fake_config = FakeConfig
+
     def setup_class(self):
         # This would be one way to initialize the security context :
         #
@@ -117,7 +123,7 @@ class TestSecurity():
         # (TestSecurityMetadata below) excersise the SPConfig() mechanism.
         #
         conf = FakeConfig()
-        self.sec = sigver.security_context(FakeConfig())
+        self.sec = sigver.security_context(self.fake_config())
 
         self._assertion = factory(
             saml.Assertion,
@@ -397,6 +403,95 @@ class TestSecurity():
 
 
 
+class FakeConfigXmlSecLib(FakeConfig):
+    crypto_backend = 'xmlseclib'
+
+
+try:
+    sigver._get_xmlsec_library()
+    HAVE_XMLSECLIB = True
+except sigver.SigverError:
+    HAVE_XMLSECLIB = False
+
+
+class TestSecurityXmlSecLib(TestSecurity):
+    """ Same tests as above but using the in-process crypto backend """
+    fake_config = FakeConfigXmlSecLib
+
+    def setup_class(self):
+        # Not a skipif mark, that would end up on the inherited tests too
+        if not HAVE_XMLSECLIB:
+            pytest.skip("python-xmlsec not available")
+        TestSecurity.setup_class.im_func(self)
+
+    def test_backend(self):
+        assert isinstance(self.sec.crypto, sigver.CryptoBackendXmlSecLib)
+
+    def test_encrypt_decrypt(self):
+        sigass = self.sec.sign_statement("%s" % self._assertion,
+                                         class_name(self._assertion),
+                                         node_id=self._assertion.id)
+        encrypted_assertion = EncryptedAssertion()
+        encrypted_assertion.add_extension_element(
+            saml.assertion_from_string(sigass))
+
+        _, pre = make_temp("%s" % pre_encryption_part(), decode=False)
+        enctext = self.sec.crypto.encrypt(
+            "%s" % encrypted_assertion, PUB_KEY, pre, "des-192",
+            '/*[local-name()="EncryptedAssertion"]/*[local-name()="Assertion"]')
+        assert "11111" not in enctext
+
+        decr_text = self.sec.decrypt(enctext)
+        _seass = saml.encrypted_assertion_from_string(decr_text)
+        assers = extension_elements_to_elements(_seass.extension_elements,
+                                                [saml, samlp])
+        assert len(assers) == 1
+        assert assers[0].id == "11111"
+        assert self.sec.verify_signature("%s" % assers[0], PUB_KEY,
+                                         node_name=class_name(assers[0]))
+
+    def _signed_response(self):
+        response = factory(samlp.Response, assertion=self._assertion,
+                           id="22222",
+                           signature=sigver.pre_signature_part(
+                               "22222", self.sec.my_cert))
+        to_sign = [(class_name(self._assertion), self._assertion.id),
+                   (class_name(response), response.id)]
+        return sigver.signed_instance_factory(response, self.sec, to_sign)
+
+    def test_parsed_once(self):
+        s_response = self._signed_response()
+        parsed = []
+        _parse_xml = saml2.parse_xml
+
+        def parse_xml(xml_string, **kwargs):
+            parsed.append(xml_string)
+            return _parse_xml(xml_string, **kwargs)
+
+        self.sec.verify_cache.clear()
+        saml2.parse_xml = sigver.parse_xml = parse_xml
+        try:
+            response = self.sec.correctly_signed_response(s_response)
+        finally:
+            saml2.parse_xml = sigver.parse_xml = _parse_xml
+        assert response.id == "22222"
+        # The same tree was used for the instance and the verification
+        assert len(parsed) == 1
+
+    def test_document(self):
+        doc = saml2.XMLDocument(self._signed_response())
+        assert doc.element("{%s}Assertion" % saml.NAMESPACE, "22222",
+                           "ID") is None
+        elem = doc.element("{%s}Assertion" % saml.NAMESPACE, "11111", "ID")
+        assert elem.get("Version") == "2.0"
+
+        self.sec.verify_cache.clear()
+        response = self.sec.correctly_signed_response(doc)
+        assert self.sec.check_signature(response.assertion[0],
+                                        class_name(self._assertion), doc)
+        assert len(self.sec.verify_cache) == 2
+
+
 class TestSecurityMetadata():
     def setup_class(self):
         conf = config.SPConfig()
@@ -471,6 +566,223 @@ def test_xbox():
     print assertions
 
 
+def test_certificate_cache():
+    cache = sigver.CertificateCache(size=1)
+    assert cache.fingerprint(CERT1) == cache.fingerprint("".join(
+        CERT1.split()))
+
+    fp1, name1 = cache.pem_file(CERT1)
+    assert open(name1).read() == sigver.pem_format(CERT1)
+    assert cache.pem_file(CERT1)[1] == name1
+    assert cache.pem(name1) == sigver.pem_format(CERT1)
+    assert cache.stats() == {"size": 1, "metadata": 0, "hits": 1,
+                             "misses": 1}
+
+    # Evicts CERT1 but the file stays as long as it's used
+    _, name2 = cache.pem_file(CERT_SSP)
+    assert name2 != name1
+    assert len(cache) == 1
+    assert cache.pem(name1) is None
+    assert os.path.exists(name1)
+    del fp1
+    assert not os.path.exists(name1)
+
+    cache.check_generation(1)
+    assert len(cache) == 0
+    cache.pem_file(CERT_SSP)
+    cache.check_generation(1)
+    assert len(cache) == 1
+
+
+def test_certificate_cache_metadata():
+    cache = sigver.CertificateCache(size=1)
+    _, name1 = cache.pem_file(CERT1, metadata=True)
+
+    # Certificates from messages don't push out the metadata certificates
+    _, name2 = cache.pem_file(CERT_SSP)
+    assert cache.pem_file(CERT1)[1] == name1
+    assert cache.pem(name1) == sigver.pem_format(CERT1)
+    assert cache.stats()["metadata"] == 1
+
+    loaded = []
+
+    def load(cert_file, key_format):
+        loaded.append((cert_file, key_format))
+        return object()
+
+    handle = cache.key_handle(name1, "pem", load)
+    assert cache.key_handle(name1, "pem", load) is handle
+    assert cache.key_handle(name1, "der", load) is not handle
+    assert len(loaded) == 2
+
+    # Handles are only kept for files in the cache
+    cache.pem_file(sigver.read_cert_from_file(full_path("pubkey.pem"),
+                                              "pem"))
+    assert cache.pem(name2) is None
+    cache.key_handle(name2, "pem", load)
+    cache.key_handle(name2, "pem", load)
+    assert len(loaded) == 4
+
+    # A reload of the metadata drops them
+    cache.check_generation(1)
+    assert len(cache) == 0
+    assert cache.pem(name1) is None
+    cache.pem_file(CERT1, metadata=True)
+    cache.key_handle(name1, "pem", load)
+    assert len(loaded) == 5
+
+
+class CountingCryptoBackend(sigver.CryptoBackend):
+    def __init__(self, result=True):
+        sigver.CryptoBackend.__init__(self)
+        self.result = result
+        self.calls = 0
+
+    def validate_signature(self, signedtext, cert_file, cert_type, node_name,
+                           node_id, id_attr):
+        self.calls += 1
+        return self.result
+
+
+def test_verified_signature_cache():
+    crypto = CountingCryptoBackend()
+    sec = sigver.SecurityContext(crypto, PRIV_KEY, cert_file=PUB_KEY)
+    signed = open(SIGNED).read()
+
+    assert sec.verify_signature(signed, PUB_KEY, node_id="id1")
+    assert sec.verify_signature(signed, PUB_KEY, node_id="id1")
+    assert crypto.calls == 1
+    assert sec.verify_cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+    # Anything that differs must be verified
+    assert sec.verify_signature(signed, PUB_KEY, node_id="id2")
+    assert sec.verify_signature(signed + " ", PUB_KEY, node_id="id1")
+    assert sec.verify_signature(signed, full_path("pubkey.pem"),
+                                node_id="id1")
+    assert crypto.calls == 4
+
+    # Failures are not cached
+    crypto.result = False
+    assert not sec.verify_signature(signed, PUB_KEY, node_id="id3")
+    assert not sec.verify_signature(signed, PUB_KEY, node_id="id3")
+    assert crypto.calls == 6
+
+
+def test_verified_signature_cache_bounds():
+    crypto = CountingCryptoBackend()
+    sec = sigver.SecurityContext(crypto, PRIV_KEY, cert_file=PUB_KEY,
+                                 verify_cache_size=2, verify_cache_ttl=-1)
+    signed = open(SIGNED).read()
+
+    assert sec.verify_signature(signed, PUB_KEY, node_id="id1")
+    assert sec.verify_signature(signed, PUB_KEY, node_id="id1")
+    # Has expired
+    assert crypto.calls == 2
+
+    for _id in ["id1", "id2", "id3"]:
+        sec.verify_signature(signed, PUB_KEY, node_id=_id)
+    assert len(sec.verify_cache) == 2
+
+    sec = sigver.SecurityContext(crypto, PRIV_KEY, cert_file=PUB_KEY,
+                                 verify_cache_size=0)
+    assert sec.verify_cache is None
+    assert sec.verify_signature(signed, PUB_KEY, node_id="id1")
+
+
+class FakeConfigXmlSecPool(FakeConfig):
+    xmlsec_pool_size = 2
+
+
+try:
+    sigver.get_xmlsec_binary()
+    HAVE_XMLSEC1 = True
+except sigver.SigverError:
+    HAVE_XMLSEC1 = False
+
+
+class TestSecurityXmlSecPool(TestSecurity):
+    """ Same tests as above but running xmlsec1 through a worker pool """
+    fake_config = FakeConfigXmlSecPool
+
+    def setup_class(self):
+        # Not a skipif mark, that would end up on the inherited tests too
+        if not HAVE_XMLSEC1:
+            pytest.skip("xmlsec1 not available")
+        TestSecurity.setup_class.im_func(self)
+
+    def test_backend(self):
+        assert isinstance(self.sec.crypto, sigver.CryptoBackendXmlSec1)
+        assert self.sec.crypto.pool.size == 2
+
+    def test_pool_used(self):
+        jobs = self.sec.crypto.pool.stats()["jobs"]
+        self.sec.sign_statement("%s" % self._assertion,
+                                class_name(self._assertion),
+                                node_id=self._assertion.id)
+        assert self.sec.crypto.pool.stats()["jobs"] > jobs
+
+
+@pytest.mark.skipif(not HAVE_XMLSECLIB, reason="python-xmlsec not available")
+def test_cache_config():
+    sec = sigver.security_context(FakeConfigXmlSecLib())
+    assert sec.cert_cache.size == sigver.CERT_CACHE_SIZE
+    assert sec.verify_cache.size == sigver.VERIFY_CACHE_SIZE
+    assert sec.verify_cache.ttl == sigver.VERIFY_CACHE_TTL
+
+    class Conf(FakeConfigXmlSecLib):
+        cert_cache_size = 16
+        verify_cache_size = 0
+
+    sec = sigver.security_context(Conf())
+    assert sec.cert_cache.size == 16
+    assert sec.verify_cache is None
+
+
+def test_xmlsec1_document_file():
+    crypto = sigver.CryptoBackendXmlSec1("xmlsec1")
+    doc = saml2.XMLDocument(open(SIGNED).read())
+    _, fil = crypto._document(doc)
+    # Written once, however many certificates are tried
+    assert crypto._document(doc)[1] == fil
+    assert open(fil).read() == doc.xml
+    assert crypto._document(doc.xml)[1] != fil
+
+
+def test_xmlsec_worker_pool():
+    pool = sigver.XmlSecWorkerPool(2)
+    out, err = pool.run(["cat"], "<foo/>")
+    assert out == "<foo/>"
+    assert err == ""
+
+    res = []
+
+    def _run(num):
+        res.append(pool.run(["cat"], "<foo id='%d'/>" % num)[0])
+
+    threads = [threading.Thread(target=_run, args=(i,)) for i in range(8)]
+    for thr in threads:
+        thr.start()
+    for thr in threads:
+        thr.join()
+
+    assert _eq(res, ["<foo id='%d'/>" % i for i in range(8)])
+    assert len(pool.workers) == 2
+
+    stats = pool.stats()
+    assert stats["jobs"] == 9
+    assert stats["errors"] == 0
+    assert stats["queue_depth"] == 0
+    assert stats["max_queue_depth"] >= 1
+    assert stats["size"] == 2
+    assert stats["max_run_time"] >= stats["mean_run_time"]
+
+
+def test_xmlsec_worker_pool_error():
+    pool = sigver.XmlSecWorkerPool(1)
+    raises(OSError, pool.run, ["/non/existing/xmlsec1"], "<foo/>")
+    assert pool.stats()["errors"] == 1
+
+
 if __name__ == "__main__":
     t = TestSecurity()
     t.setup_class()
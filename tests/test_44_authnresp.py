@@ -3,6 +3,8 @@
 from contextlib import closing
 from saml2.authn_context import INTERNETPROTOCOLPASSWORD
 
+import saml2
+from saml2 import sigver
 from saml2.server import Server
 from saml2.response import authn_response
 from saml2.config import config_factory
@@ -126,6 +128,27 @@ class TestAuthnResponse:
         session_info = self.ar.session_info()
         assert session_info["authn_info"] == authn_info
 
+    def test_parsed_once(self):
+        parsed = []
+        _parse_xml = saml2.parse_xml
+
+        def parse_xml(xml_string, **kwargs):
+            parsed.append(xml_string)
+            return _parse_xml(xml_string, **kwargs)
+
+        if self.ar.sec.verify_cache is not None:
+            self.ar.sec.verify_cache.clear()
+        self.ar.outstanding_queries = {"id12": "http://localhost:8088/sso"}
+        self.ar.timeslack = 10000
+        saml2.parse_xml = sigver.parse_xml = parse_xml
+        try:
+            self.ar.loads(self._sign_resp_, decode=False)
+            assert self.ar.verify()
+        finally:
+            saml2.parse_xml = sigver.parse_xml = _parse_xml
+        assert self.ar.response.assertion[0].signature
+        assert len(parsed) == 1
+
 if __name__ == "__main__":
     t = TestAuthnResponse()
     t.setup_class()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import cookielib
+import threading
+from BaseHTTPServer import BaseHTTPRequestHandler
+from BaseHTTPServer import HTTPServer
+from SocketServer import ThreadingMixIn
+
+from saml2.httpbase import ATTRS
+from saml2.httpbase import HTTPBase
+from saml2.time_util import utc_now
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = "Hello"
+        if self.path == "/cookie":
+            self.send_response(200)
+            self.send_header("Set-Cookie", "foo=bar; Path=/")
+        elif self.headers.get("If-None-Match") == '"1"':
+            self.send_response(304)
+            body = ""
+        else:
+            self.send_response(200)
+            self.send_header("ETag", '"1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class TestHTTPBase():
+    def setup_class(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = "http://127.0.0.1:%s" % self.server.server_port
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def teardown_class(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_keep_alive(self):
+        http = HTTPBase(timeout=5)
+        try:
+            for _ in range(3):
+                resp = http.send(self.url + "/")
+                assert resp.status_code == 200
+                assert resp.text == "Hello"
+
+            stats = http.pool_stats()["http://127.0.0.1:%s" %
+                                      self.server.server_port]
+            assert stats["connections"] == 1
+            assert stats["requests"] == 3
+            assert stats["idle"] == 1
+        finally:
+            http.close()
+
+    def test_conditional(self):
+        http = HTTPBase(timeout=5)
+        try:
+            resp = http.send(self.url + "/")
+            assert resp.status_code == 200
+            resp = http.send(self.url + "/", etag=resp.headers["etag"])
+            assert resp.status_code == 304
+        finally:
+            http.close()
+
+    def test_cookies(self):
+        http = HTTPBase(timeout=5)
+        try:
+            http.send(self.url + "/cookie")
+            # Cookies are kept by HTTPBase not by the session
+            assert http.cookies(self.url + "/") == {"foo": "bar"}
+            assert len(http.session.cookies) == 0
+        finally:
+            http.close()
+
+
+def _cookie(name, value, domain, path="/", expires=None):
+    std_attr = ATTRS.copy()
+    std_attr.update({"name": name, "value": value, "domain": domain,
+                     "domain_specified": True, "path": path,
+                     "path_specified": True, "expires": expires,
+                     "version": 0})
+    return cookielib.Cookie(**std_attr)
+
+
+def test_cookie_matching():
+    http = HTTPBase()
+    jar = http.cookiejar
+    jar.set_cookie(_cookie("sid", "fed", ".example.com"))
+    jar.set_cookie(_cookie("sid", "sp", "sp.example.com", "/sso"))
+    jar.set_cookie(_cookie("lang", "sv", "sp.example.com"))
+    jar.set_cookie(_cookie("old", "x", "sp.example.com",
+                           expires=utc_now() - 10))
+    jar.set_cookie(_cookie("other", "y", "sp.example.org"))
+
+    # the most specific cookie wins
+    assert http.cookies("https://sp.example.com/sso/redirect") == {
+        "sid": "sp", "lang": "sv"}
+    assert http.cookies("https://sp.example.com/") == {
+        "sid": "fed", "lang": "sv"}
+    assert http.cookies("https://idp.example.com/") == {"sid": "fed"}
+    assert http.cookies("https://example.com/") == {}
+
+    # the expired cookie has been removed
+    assert [c.name for c in jar if c.name == "old"] == []
+    assert len(jar) == 4
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import base64
+import threading
 import urllib
 import urlparse
 from saml2 import BINDING_HTTP_POST
@@ -17,6 +18,7 @@ from saml2.assertion import Assertion
 
 from saml2.authn_context import INTERNETPROTOCOLPASSWORD
 from saml2.client import Saml2Client
+from saml2.client import logout_status
 from saml2.config import SPConfig
 from saml2.response import LogoutResponse
 from saml2.saml import NAMEID_FORMAT_PERSISTENT, EncryptedAssertion
@@ -531,6 +533,20 @@ class TestClientWithDummy():
             attribute={"eduPersonAffiliation": None},
             nameid_format=NAMEID_FORMAT_TRANSIENT)
 
+    def test_do_attribute_query_async(self):
+        call = self.client.do_attribute_query_async(
+            IDP, "_e7b68a04488f715cda642fbdd90099f5",
+            attribute={"eduPersonAffiliation": None},
+            nameid_format=NAMEID_FORMAT_TRANSIENT, timeout=10)
+        response = call.result(10)
+        assert response.ava == {"eduPersonAffiliation": ["faculty"]}
+
+        # No such attribute authority
+        call = self.client.do_attribute_query_async(
+            "urn:mace:example.com:saml:unknown",
+            "_e7b68a04488f715cda642fbdd90099f5")
+        assert call.exception(10) is not None
+
     def test_logout_1(self):
         """ one IdP/AA logout from"""
 
@@ -556,6 +572,42 @@ class TestClientWithDummy():
         response = resp[entity_ids[0]]
         assert isinstance(response, LogoutResponse)
 
+    def test_logout_concurrent(self):
+        conf = SPConfig()
+        conf.load_file("servera_conf")
+        client = Saml2Client(conf)
+        client.send = self.server.receive
+
+        session_info = {
+            "name_id": nid,
+            "issuer": IDP,
+            "not_on_or_after": in_a_while(minutes=15),
+            "ava": {"givenName": "Anders"}
+        }
+        client.users.add_information_about_person(session_info)
+
+        resp = client.global_logout(nid, "Tired", in_a_while(minutes=5),
+                                    timeout=10)
+        assert resp.keys() == [IDP]
+        assert isinstance(resp[IDP], LogoutResponse)
+        assert logout_status(resp) == samlp.STATUS_SUCCESS
+
+        # An IdP that doesn't answer in time
+        release = threading.Event()
+
+        def hang(*args, **kwargs):
+            release.wait(5)
+            return self.server.receive(*args, **kwargs)
+
+        client.send = hang
+        try:
+            resp = client.global_logout(nid, "Tired",
+                                        in_a_while(minutes=5), timeout=0.5)
+        finally:
+            release.set()
+        assert resp == {IDP: None}
+        assert logout_status(resp) == samlp.STATUS_PARTIAL_LOGOUT
+
     def test_post_sso(self):
         binding = BINDING_HTTP_POST
         response_binding = BINDING_HTTP_POST
@@ -1,3 +1,5 @@
+import threading
+from saml2.attribute_resolver import AttributeResolver
 from saml2.saml import NameID
 from saml2.saml import NAMEID_FORMAT_TRANSIENT
 
@@ -6,6 +8,8 @@ __author__ = 'rolandh'
 from saml2 import config
 from saml2.client import Saml2Client
 from saml2.time_util import str_to_time, in_a_while
+from saml2.virtual_org import VirtualOrg
+from fakeIDP import FakeIDP
 
 SESSION_INFO_PATTERN = {"ava": {}, "came from": "", "not_on_or_after": 0,
                         "issuer": "", "session_id": -1}
@@ -85,3 +89,89 @@ class TestVirtualOrg_2():
     def test_id_unknown(self):
         cid = self.sp.vorg.get_common_identifier(nid0)
         assert cid is None
+
+
+IDP = "urn:mace:example.com:saml:roland:idp"
+
+
+class FakeAA(object):
+    """
+    Answers attribute queries when released, keeps track of how many
+    queries it is working on at the same time.
+    """
+
+    def __init__(self, concurrent=1):
+        self.server = FakeIDP("idp_all_conf")
+        self.concurrent = concurrent
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.queries = []
+        self.release = threading.Event()
+
+    def receive(self, url, method="GET", **kwargs):
+        with self.lock:
+            self.queries.append(kwargs["data"])
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            if self.active >= self.concurrent:
+                self.release.set()
+        try:
+            self.release.wait(5)
+            return self.server.receive(url, method, **kwargs)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class TestAggregation():
+    def setup_method(self, method):
+        conf = config.SPConfig()
+        conf.load_file("servera_conf")
+        self.sp = Saml2Client(conf)
+
+    def test_concurrent(self):
+        aa = FakeAA(concurrent=2)
+        self.sp.send = aa.receive
+
+        resolver = AttributeResolver(self.sp)
+        # The second IdP isn't in the metadata so that query fails at once
+        res = resolver.extend("deje0001", self.sp.config.entityid,
+                              [IDP, "urn:mace:example.com:saml:aa", IDP],
+                              nameid_format=NAMEID_FORMAT_TRANSIENT,
+                              timeout=10)
+        assert len(res) == 2
+        # The fake AA only answers when it has both queries
+        assert aa.max_active == 2
+        for session_info in res:
+            assert session_info["issuer"] == IDP
+            assert session_info["ava"] == {
+                "eduPersonAffiliation": ["faculty"]}
+
+    def test_timeout(self):
+        aa = FakeAA(concurrent=3)
+        self.sp.send = aa.receive
+
+        resolver = AttributeResolver(self.sp)
+        try:
+            res = resolver.extend("deje0001", self.sp.config.entityid,
+                                  [IDP, IDP],
+                                  nameid_format=NAMEID_FORMAT_TRANSIENT,
+                                  timeout=0.5)
+            assert res == []
+            assert len(aa.queries) == 2
+        finally:
+            aa.release.set()
+
+    def test_do_aggregation(self):
+        aa = FakeAA()
+        self.sp.send = aa.receive
+        add_derek_info(self.sp)
+
+        vo = VirtualOrg(self.sp, "urn:mace:example.com:it:tek",
+                        {"common_identifier": "umuselin", "member": [IDP],
+                         "nameid_format": NAMEID_FORMAT_TRANSIENT,
+                         "timeout": 10})
+        assert vo.do_aggregation(nid)
+        assert len(aa.queries) == 1
+        assert "deje0001" in aa.queries[0]
@@ -8,6 +8,7 @@ from saml2 import BINDING_SOAP
 from saml2 import BINDING_HTTP_POST
 from saml2.authn_context import INTERNETPROTOCOLPASSWORD
 from saml2.client import Saml2Client
+from saml2.config import IdPConfig
 
 from saml2.entity import create_artifact
 from saml2.entity import ARTIFACT_TYPECODE
@@ -98,6 +99,22 @@ def test_create_artifact_resolve():
         assert ar.artifact.text == b64art
 
 
+def test_artifact_lazy_metadata():
+    import idp_all_conf
+
+    conf = IdPConfig().load(dict(idp_all_conf.CONFIG, metadata_lazy=True))
+    with closing(Server(config=conf)) as idp:
+        sources = idp.metadata.metadata.values()
+        assert sources[0].lazy
+        # Finding the entities with artifact resolution services doesn't
+        # mean converting them
+        assert sum([_md.entity.cached() for _md in sources]) == 0
+
+        b64art = create_artifact(SP, "aabbccddeeffgghhiijj", 1)
+        assert idp.artifact2destination(b64art, "spsso")
+        assert sum([_md.entity.cached() for _md in sources]) == 1
+
+
 def test_artifact_flow():
     #SP = 'urn:mace:example.com:saml:roland:sp'
     sp = Saml2Client(config_file="servera_conf")
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+from saml2 import mongo_store
+from saml2 import saml
+from saml2.attribute_converter import ac_factory
+from saml2.mongo_store import EptidMDB
+from saml2.mongo_store import IdentMDB
+from saml2.mongo_store import MetadataMDB
+from saml2.mongo_store import SessionStorageMDB
+from saml2.mongo_store import export_mdstore_to_mongo_db
+from saml2.saml import NAMEID_FORMAT_TRANSIENT
+from saml2.saml import NameID
+from saml2.time_util import in_a_while
+
+from fakeMongo import FakeMongoClient
+from pathutils import full_path
+
+nid = NameID(name_qualifier="foo", format=NAMEID_FORMAT_TRANSIENT,
+             text="1234")
+
+_MongoClient = mongo_store.MongoClient
+
+
+def _eq(l1, l2):
+    return set(l1) == set(l2)
+
+
+def setup_module(module):
+    mongo_store.MongoClient = FakeMongoClient
+    mongo_store._clients.clear()
+
+
+def teardown_module(module):
+    mongo_store.MongoClient = _MongoClient
+    mongo_store._clients.clear()
+
+
+def _assertion(aid, session_index):
+    statement = saml.AuthnStatement(
+        authn_instant=in_a_while(minutes=-1), session_index=session_index)
+    return saml.Assertion(
+        id=aid, subject=saml.Subject(name_id=nid),
+        conditions=saml.Conditions(not_on_or_after=in_a_while(minutes=15)),
+        authn_statement=[statement])
+
+
+def test_session_storage():
+    sdb = SessionStorageMDB("session_test", "session")
+    coll = sdb.assertion
+    assert "assertion_id" in coll.indexes
+
+    sdb.store_assertion(_assertion("id1", "s1"), "to_sign")
+    sdb.store_assertion(_assertion("id2", "s2"), "to_sign")
+    # Storing the same assertion again does not add a document
+    sdb.store_assertion(_assertion("id2", "s2"), "to_sign")
+    assert len(coll.docs) == 2
+    assert "insert" not in coll.requests
+
+    info = sdb.get_assertion("id1")
+    assert info["assertion"].id == "id1"
+    assert info["to_sign"] == "to_sign"
+    assert sdb.get_assertion("id3") is None
+
+    res = sdb.get_assertions_by_subject(nid, session_index="s2")
+    assert [a.id for a in res] == ["id2"]
+    statements = sdb.get_authn_statements(nid, session_index="s1")
+    assert statements[0][0].session_index == "s1"
+
+    # Stored before session indexes were
+    del coll.docs[0]["session_index"]
+    res = sdb.get_assertions_by_subject(nid, session_index="s1")
+    assert [a.id for a in res] == ["id1"]
+
+    del coll.requests[:]
+    sdb.remove_authn_statements(nid)
+    assert coll.docs == []
+    assert coll.requests == ["remove"]
+
+
+def test_shared_client():
+    sdb = SessionStorageMDB("pool_test", "session")
+    idb = IdentMDB("pool_test", "ident")
+    assert len(mongo_store._clients) == 1
+    client = mongo_store._clients.values()[0]
+    assert client.kwargs["maxPoolSize"] == mongo_store.MAX_POOL_SIZE
+    assert sdb.assertion is client["pool_test"]["session"]
+    assert idb.mdb.db is client["pool_test"]["ident"]
+
+
+def test_ident():
+    idb = IdentMDB("ident_test", "ident")
+    assert _eq(idb.mdb.db.indexes, ["user_id", "name_id"])
+    idb.store("jeter", nid)
+    assert idb.find_local_id(nid) == "jeter"
+    assert [n.text for n in idb.find_nameid("jeter")] == ["1234"]
+    idb.remove_remote(nid)
+    assert idb.find_local_id(nid) is None
+
+
+def test_eptid():
+    edb = EptidMDB("secret", "eptid_test")
+    e1 = edb.get("idp_entity_id", "sp_entity_id", "user_id", "other")
+    assert edb.get("idp_entity_id", "sp_entity_id", "user_id", "other") == e1
+    edb["key"] = "value1"
+    edb["key"] = "value2"
+    assert edb["key"] == "value2"
+    assert len(edb.mdb.db.docs) == 2
+
+
+def test_export_metadata():
+    disco = "urn:oasis:names:tc:SAML:profiles:SSO:idp-discovery-protocol" \
+            "&DiscoveryResponse"
+    mds = {}
+    for i in range(mongo_store.BULK_SIZE + 1):
+        mds["https://sp%d.example.com" % i] = {
+            "spsso_descriptor": [{
+                "extensions": {"extension_elements": [
+                    {"__class__": disco, "binding": "binding",
+                     "location": "https://sp%d.example.com/disco" % i}]}}]}
+
+    coll = mongo_store._mdb_get_database("md_test")["md"]
+    coll.insert({"entity_id": "https://old.example.com",
+                 "entity_description": {}})
+    del coll.requests[:]
+
+    export_mdstore_to_mongo_db(mds, "md_test", "md")
+    assert coll.requests == ["bulk", "bulk", "remove"]
+    assert len(coll.docs) == len(mds)
+
+    mdb = MetadataMDB(None, ac_factory(full_path("attributemaps")),
+                      "md_test", "md")
+    assert "https://old.example.com" not in mdb
+    assert "https://sp1.example.com" in mdb
+    res = mdb._ext_service("https://sp1.example.com", "spsso_descriptor",
+                           disco, "binding")
+    assert res[0]["location"] == "https://sp1.example.com/disco"
+    assert mdb._ext_service("https://sp1.example.com", "idpsso_descriptor",
+                            disco, "binding") is None
+    assert mdb._ext_service("https://sp.example.org", "spsso_descriptor",
+                            disco, "binding") is None
+
+    # Export again, nothing changes
+    export_mdstore_to_mongo_db(mds, "md_test", "md")
+    assert len(coll.docs) == len(mds)
+
+
+def test_pool_size_in_uri():
+    mongo_store._mdb_get_database("mongodb://localhost/uri_test")
+    mongo_store._mdb_get_database(
+        "mongodb://localhost/uri_test?maxPoolSize=2")
+    sizes = [c.kwargs.get("maxPoolSize") for c in
+             mongo_store._clients.values() if c.uri]
+    assert _eq(sizes, [mongo_store.MAX_POOL_SIZE, None])
@@ -17,13 +17,13 @@ import xmlenc
 
 import argparse
 
-from saml2.mdstore import MetaDataFile, MetaDataExtern
+from saml2.mdstore import MetaDataFile, MetaDataExtern, snapshot
 
 __author__ = 'rolandh'
 
 """
 A script that imports and verifies metadata and then dumps it in a basic
-dictionary format.
+dictionary format or as a metadata snapshot.
 """
 
 
@@ -49,6 +49,8 @@ parser.add_argument('-c', dest='cert')
 parser.add_argument('-a', dest='attrsmap')
 parser.add_argument('-o', dest='output')
 parser.add_argument('-x', dest='xmlsec')
+parser.add_argument('-f', dest='format', default="md",
+                    help="md or snapshot")
 parser.add_argument(dest="item")
 args = parser.parse_args()
 
@@ -67,9 +69,12 @@ elif args.type == "external":
 
 if metad is not None:
     metad.load()
-    txt = metad.dumps()
+    if args.format == "snapshot":
+        txt = snapshot(metad.items())
+    else:
+        txt = metad.dumps()
     if args.output:
-        f = open(args.output, "w")
+        f = open(args.output, "wb")
         f.write(txt)
         f.close()
     else:
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+"""
+A script that measures how long it takes to turn XML documents into
+instances of the schema classes.
+
+The documents are parsed into element trees before the clock starts, so
+it is only the mapping from element trees to objects that is measured.
+The time reported is processor time, the best of a number of rounds.
+
+With -p parsing is included, lxml is then used if it is installed unless
+-e is given. With -s the time it takes to serialize the instances back
+into XML is measured instead. With -m the memory used by the objects is
+reported instead of the time.
+"""
+import gc
+import glob
+import os
+import sys
+import time
+
+import saml2
+from saml2 import create_class_from_element_tree
+from saml2 import create_class_from_xml_string
+from saml2 import md
+from saml2 import saml
+from saml2 import samlp
+from saml2.extension import algsupport
+from saml2.extension import dri
+from saml2.extension import idpdisc
+from saml2.extension import mdattr
+from saml2.extension import mdrpi
+from saml2.extension import mdui
+from saml2.extension import shibmd
+from saml2.extension import ui
+import xmldsig
+import xmlenc
+
+import argparse
+
+try:
+    from xml.etree import cElementTree as ElementTree
+except ImportError:
+    from xml.etree import ElementTree
+
+ONTS = {
+    saml.NAMESPACE: saml,
+    samlp.NAMESPACE: samlp,
+    mdui.NAMESPACE: mdui,
+    mdattr.NAMESPACE: mdattr,
+    mdrpi.NAMESPACE: mdrpi,
+    dri.NAMESPACE: dri,
+    ui.NAMESPACE: ui,
+    idpdisc.NAMESPACE: idpdisc,
+    md.NAMESPACE: md,
+    xmldsig.NAMESPACE: xmldsig,
+    xmlenc.NAMESPACE: xmlenc,
+    shibmd.NAMESPACE: shibmd,
+    algsupport.NAMESPACE: algsupport
+}
+
+
+def target_class(tree):
+    namespace, tag = tree.tag[1:].split("}")
+    try:
+        return ONTS[namespace].ELEMENT_BY_TAG[tag]
+    except KeyError:
+        return None
+
+
+def load(paths):
+    docs = []
+    for path in paths:
+        try:
+            text = open(path).read()
+            tree = ElementTree.fromstring(text)
+        except Exception:
+            continue
+        klass = target_class(tree)
+        if klass is not None:
+            docs.append((os.path.basename(path), klass, tree, text))
+    return docs
+
+
+def bench(func, rounds):
+    """ The shortest time of a number of rounds, the others are assumed to
+    have been disturbed by something else running """
+    best = None
+    for _ in range(rounds):
+        start = time.clock()
+        func()
+        used = time.clock() - start
+        if best is None or used < best:
+            best = used
+    return best
+
+
+def footprint(obj):
+    """ The number of bytes used by an object and everything it refers to,
+    classes and modules not included """
+    size = 0
+    seen = set()
+    todo = [obj]
+    while todo:
+        item = todo.pop()
+        if id(item) in seen or isinstance(item, (type, type(sys))):
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        # Does not create a __dict__ when there is none, unlike __dict__
+        todo.extend(gc.get_referents(item))
+    return size
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument('-r', dest='rounds', type=int, default=20)
+parser.add_argument('-m', dest='memory', action='store_true')
+parser.add_argument('-s', dest='serialize', action='store_true')
+parser.add_argument('-p', dest='parse', action='store_true')
+parser.add_argument('-e', dest='elementtree', action='store_true')
+parser.add_argument(dest="paths", nargs="*")
+args = parser.parse_args()
+
+paths = args.paths or glob.glob(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "tests", "*.xml"))
+
+if args.elementtree:
+    saml2.USE_LXML = False
+
+total = 0
+for name, klass, tree, text in sorted(load(paths)):
+    if args.memory:
+        used = footprint(create_class_from_element_tree(klass, tree))
+        total += used
+        print "%-48s %-20s %10d kB" % (name, klass.__name__, used / 1024)
+    elif args.serialize:
+        used = bench(create_class_from_element_tree(klass, tree).to_string,
+                     args.rounds)
+        total += used
+        print "%-48s %-20s %10.3f ms" % (name, klass.__name__, used * 1000)
+    elif args.parse:
+        used = bench(lambda: create_class_from_xml_string(klass, text),
+                     args.rounds)
+        total += used
+        print "%-48s %-20s %10.3f ms" % (name, klass.__name__, used * 1000)
+    else:
+        used = bench(lambda: create_class_from_element_tree(klass, tree),
+                     args.rounds)
+        total += used
+        print "%-48s %-20s %10.3f ms" % (name, klass.__name__, used * 1000)
+if args.memory:
+    print "%-65s %10d kB" % ("total", total / 1024)
+else:
+    print "%-65s %10.3f ms" % ("total", total * 1000)
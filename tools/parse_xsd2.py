@@ -120,6 +120,40 @@ def initialize(attributes):
     return line
 
 
+def slots(attributes, children):
+    """ The members are kept in slots, attributes first then children, so
+    instances does not need a __dict__ """
+    attrs = []
+    childs = []
+    for prop, _val, _default in attributes:
+        if prop in PROTECTED_KEYWORDS:
+            _name = prop + "_"
+        else:
+            _name = prop
+        if prop in children:
+            childs.append(_name)
+        else:
+            attrs.append(_name)
+    names = attrs + childs
+
+    head = "%s__slots__ = [" % INDENT
+    if not names:
+        return [head + "]"]
+    line = []
+    cur = head
+    for i, name in enumerate(names):
+        if i == len(names) - 1:
+            item = "'%s']" % name
+        else:
+            item = "'%s', " % name
+        if cur != head and len(cur) + len(item.rstrip()) > 79:
+            line.append(cur.rstrip())
+            cur = " " * len(head)
+        cur += item
+    line.append(cur)
+    return line
+
+
 def _mod_typ(prop):
     try:
         (mod, typ) = prop.type
@@ -351,6 +385,8 @@ class PyObj(object):
                                                         target_namespace,
                                                         self.name))
         line.append("")
+        # Filled in when the members are known
+        slots_at = len(line)
         line.append("%sc_tag = '%s'" % (INDENT, self.name))
         line.append("%sc_namespace = NAMESPACE" % (INDENT,))
         try:
@@ -375,6 +411,7 @@ class PyObj(object):
 
         (args, child, inh) = self._do_properties(line, cdict, ignore, 
                                                 target_namespace)
+        line[slots_at:slots_at] = slots(args, child)
         
         if child:
             line.append("%sc_child_order.extend([%s])" % (INDENT,